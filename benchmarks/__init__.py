@@ -0,0 +1 @@
+"""Benchmarks for measuring the performance of Yamlator"""
@@ -0,0 +1,63 @@
+"""Benchmarks the start up time of the `yamlator` CLI on a trivial schema
+when the precompiled parser artifact is used compared to building the
+parser from the grammar file, and when a compiled schema is used, which
+does not import the parser
+
+Usage:
+    python -m benchmarks.bench_cli_startup
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+from yamlator.parser.core import build_schema_parser_artifact
+
+_YAML_PATH = './tests/files/valid/valid.yaml'
+_SCHEMA_PATH = './tests/files/valid/valid.ys'
+_COMPILED_SCHEMA_PATH = './tests/files/valid/valid.ysc'
+_ITERATIONS = 10
+
+_WITH_COMPILED_SCHEMA = [sys.executable, '-m', 'yamlator', _YAML_PATH,
+                         '-s', _COMPILED_SCHEMA_PATH]
+
+
+def _create_command(artifact_path: str) -> list:
+    # The artifact path is set before the CLI runs so the benchmark
+    # never writes an artifact into the installed package
+    return [sys.executable, '-c', (
+        'import sys\n'
+        'import yamlator.parser.core as core\n'
+        'from yamlator.cmd import main\n'
+        f'core._PARSER_ARTIFACT = {artifact_path!r}\n'
+        f'sys.argv = ["yamlator", "{_YAML_PATH}", "-s", "{_SCHEMA_PATH}"]\n'
+        'sys.exit(main())\n'
+    )]
+
+
+def _time_command(command: list) -> float:
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) / _ITERATIONS
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        artifact_path = os.path.join(tmp_dir, 'grammar.lark.pickle')
+        missing_path = os.path.join(tmp_dir, 'missing.pickle')
+        build_schema_parser_artifact(artifact_path)
+
+        without_artifact = _time_command(_create_command(missing_path))
+        with_artifact = _time_command(_create_command(artifact_path))
+    with_compiled_schema = _time_command(_WITH_COMPILED_SCHEMA)
+
+    print(f'Grammar analysed:  {without_artifact * 1000:.1f} ms per run')
+    print(f'Parser artifact:   {with_artifact * 1000:.1f} ms per run')
+    print(f'Compiled schema:   {with_compiled_schema * 1000:.1f} ms per run')
+
+
+if __name__ == '__main__':
+    main()
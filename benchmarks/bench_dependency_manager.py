@@ -0,0 +1,60 @@
+"""Benchmarks cycle detection in the `DependencyManager` with synthetic
+graphs of 10,000 nodes. The import graph checks for a cycle after every
+child is added, which is how the schema imports are loaded. The inheritance
+graph builds a chain of rulesets that each inherit from the previous ruleset
+and reads the graph, which is how ruleset inheritance is resolved
+
+Usage:
+    python -m benchmarks.bench_dependency_manager
+"""
+
+import random
+import time
+
+from yamlator.parser.dependency import DependencyManager
+
+_NODES = 10_000
+_CHILDREN_PER_NODE = 3
+
+
+def _bench_import_graph() -> float:
+    generator = random.Random(0)
+    dependencies = DependencyManager()
+    nodes = [dependencies.add(f'schema{i}') for i in range(_NODES)]
+
+    start = time.perf_counter()
+    for index, parent in enumerate(nodes[:-1]):
+        for _ in range(_CHILDREN_PER_NODE):
+            child = nodes[generator.randrange(index + 1, _NODES)]
+            dependencies.add_child(parent, child)
+            if dependencies.has_cycle():
+                raise RuntimeError('The import graph should not have a cycle')
+    return time.perf_counter() - start
+
+
+def _bench_inheritance_graph() -> float:
+    dependencies = DependencyManager()
+
+    start = time.perf_counter()
+    for index in range(1, _NODES):
+        dependencies.add_child(f'Ruleset{index}', f'Ruleset{index - 1}')
+
+    if dependencies.has_cycle():
+        raise RuntimeError('The inheritance graph should not have a cycle')
+
+    graph = dependencies.graph
+    for node in graph:
+        _ = graph[node][0]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    import_duration = _bench_import_graph()
+    inheritance_duration = _bench_inheritance_graph()
+
+    print(f'Import graph:      {import_duration * 1000:.1f} ms')
+    print(f'Inheritance graph: {inheritance_duration * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmarks loading a schema whose imports form a layered diamond, where
+every schema in a layer imports both schemas in the next layer. Without
+sharing the loaded child schemas, the number of files loaded doubles with
+each layer
+
+Usage:
+    python -m benchmarks.bench_diamond_imports
+"""
+
+import os
+import shutil
+import timeit
+import tempfile
+
+from unittest.mock import patch
+
+from yamlator.utils import load_schema
+from yamlator.parser import clear_schema_cache
+from yamlator.parser import parse_yamlator_schema
+
+_LAYERS = 12
+_ITERATIONS = 5
+
+
+def _write_layered_schemas(schema_dir: str) -> str:
+    for layer in range(_LAYERS):
+        for side in ('Left', 'Right'):
+            name = f'{side}{layer}'
+            lines = []
+            rules = ['    name str']
+            if layer + 1 < _LAYERS:
+                lines.append(f'import Left{layer + 1}, Right{layer + 1} '
+                             f'from "layer{layer + 1}.ys"')
+                rules.append(f'    left Left{layer + 1}')
+                rules.append(f'    right Right{layer + 1}')
+            lines.append(f'ruleset {name} {{')
+            lines.extend(rules)
+            lines.append('}')
+
+            path = os.path.join(schema_dir, f'{side.lower()}{layer}.ys')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+
+        # Each layer file re-exports both sides of the layer
+        layer_path = os.path.join(schema_dir, f'layer{layer}.ys')
+        with open(layer_path, 'w', encoding='utf-8') as f:
+            f.write(f'import Left{layer} from "left{layer}.ys"\n'
+                    f'import Right{layer} from "right{layer}.ys"\n')
+
+    root_path = os.path.join(schema_dir, 'root.ys')
+    with open(root_path, 'w', encoding='utf-8') as f:
+        f.write('import Left0, Right0 from "layer0.ys"\n\n'
+                'schema {\n    left Left0\n    right Right0\n}\n')
+    return root_path
+
+
+def _load(root_path: str) -> None:
+    clear_schema_cache()
+    parse_yamlator_schema(root_path)
+
+
+def main() -> None:
+    schema_dir = os.path.relpath(tempfile.mkdtemp())
+    try:
+        root_path = _write_layered_schemas(schema_dir)
+        with patch('yamlator.parser.loaders.load_schema',
+                   wraps=load_schema) as mock_load_schema:
+            _load(root_path)
+            loads = mock_load_schema.call_count
+
+        duration = timeit.timeit(lambda: _load(root_path), number=_ITERATIONS)
+    finally:
+        shutil.rmtree(schema_dir)
+
+    print(f'Schema files:  {_LAYERS * 3 + 1}')
+    print(f'Files loaded:  {loads}')
+    print(f'Load time:     {duration / _ITERATIONS * 1000:.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Benchmarks checking whether documents are valid with `is_valid`
+against counting the violations detected by `validate_yaml`, for a
+corpus of valid documents and corpora where the documents fail early,
+fail late or contain a violation in every record
+
+Usage:
+    python -m benchmarks.bench_is_valid
+"""
+
+import time
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import is_valid
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import ENGINES
+
+_RECORDS = 10000
+_REPEATS = 3
+
+_SCHEMA = '''
+enum Status {
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]{1,2} [0-9][A-Z]{2}$")
+}
+
+ruleset Person {
+    name str
+    age int
+    status Status
+    address Address
+    tags list(str)
+    scores map(float)
+    manager str optional
+}
+
+schema {
+    version str
+    people list(Person)
+}
+'''
+
+
+def _create_person(index: int) -> dict:
+    return {
+        'name': f'Person {index}',
+        'age': index % 90,
+        'status': 'active' if index % 2 else 'inactive',
+        'address': {
+            'number': index if index % 3 else f'{index}a',
+            'street': 'High Street',
+            'postcode': 'AB1 2CD'
+        },
+        'tags': ['one', 'two', 'three'],
+        'scores': {'maths': 1.0, 'english': 2.5}
+    }
+
+
+def _create_corpora() -> dict:
+    people = [_create_person(index) for index in range(_RECORDS)]
+    invalid_person = dict(people[0], age='unknown')
+    return {
+        'valid': {'version': '1', 'people': people},
+        'fails early': {'version': '1',
+                        'people': [invalid_person] + people[1:]},
+        'fails late': {'version': '1',
+                       'people': people[:-1] + [invalid_person]},
+        'all invalid': {'version': '1',
+                        'people': [invalid_person] * _RECORDS},
+    }
+
+
+def _has_no_violations(data: dict, schema, engine: str) -> bool:
+    return len(validate_yaml(data, schema, engine)) == 0
+
+
+def _time(func, *args) -> float:
+    durations = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    validator = yamlator.compile(schema)
+
+    for name, data in _create_corpora().items():
+        expected = len(validate_yaml(data, schema)) == 0
+        if is_valid(data, schema) != expected:
+            raise RuntimeError(f'is_valid does not match validate_yaml '
+                               f'for the {name} corpus')
+
+        results = {
+            'is_valid': _time(is_valid, data, schema),
+            'compiled is_valid': _time(validator.is_valid, data),
+        }
+        for engine in ENGINES:
+            results[f'{engine} validate_yaml'] = _time(
+                _has_no_violations, data, schema, engine)
+
+        baseline = results['is_valid']
+        for label, duration in results.items():
+            print(f'{name:>12}, {label:>20}: '
+                  f'{duration * 1000:8.2f} ms '
+                  f'({duration / baseline:6.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Benchmarks parsing a large generated schema with the LALR parser used by
+`parse_schema` against the Earley parser built from the same grammar
+
+Usage:
+    python -m benchmarks.bench_large_schema
+"""
+
+import time
+
+from lark import Lark
+
+from yamlator.parser import parse_schema
+from yamlator.parser import SchemaTransformer
+from yamlator.parser.core import _GRAMMAR_FILE
+
+_RULESET_COUNT = 300
+
+
+def generate_schema(ruleset_count: int) -> str:
+    """Generates a schema with `ruleset_count` rulesets and enums that
+    reference each other, which is roughly 10 lines per ruleset
+    """
+    lines = []
+    for idx in range(ruleset_count):
+        lines.append(f'enum Status{idx} {{')
+        lines.append('    ACTIVE = "active"')
+        lines.append('    DELETED = 0')
+        lines.append('}')
+        lines.append(f'ruleset Item{idx} {{')
+        lines.append('    name str')
+        lines.append('    "display name" str optional')
+        lines.append(f'    status Status{idx} required')
+        lines.append('    tags list(regex("^[a-z]+$")) optional')
+        lines.append(f'    items map(union(int, str, Item{idx}))')
+        lines.append('}')
+
+    lines.append('schema {')
+    lines.append(f'    items list(Item{ruleset_count - 1})')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    schema_content = generate_schema(_RULESET_COUNT)
+    line_count = schema_content.count('\n')
+
+    earley_parser = Lark.open(_GRAMMAR_FILE, parser='earley')
+
+    start = time.perf_counter()
+    tree = earley_parser.parse(schema_content)
+    SchemaTransformer().transform(tree)
+    earley_time = time.perf_counter() - start
+
+    # Warm up the shared parser so only the parse is measured
+    parse_schema('schema {\n    message str\n}\n')
+
+    start = time.perf_counter()
+    parse_schema(schema_content)
+    lalr_time = time.perf_counter() - start
+
+    print(f'Schema size:   {line_count} lines')
+    print(f'Earley parser: {earley_time * 1000:.1f} ms')
+    print(f'LALR parser:   {lalr_time * 1000:.1f} ms')
+    print(f'Speed up:      {earley_time / lalr_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Benchmarks validating a document that is mostly payload by loading it
+with the libyaml loader and then validating it, compared to loading it
+with `load_yaml_for_schema`, which does not construct the `any` values
+and the fields that are not in a ruleset. The peak memory is measured
+with `tracemalloc` in a separate run from the timings
+
+Usage:
+    python -m benchmarks.bench_lazy_load
+"""
+
+import os
+import time
+import tempfile
+import tracemalloc
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.lazy import load_yaml_for_schema
+from yamlator.yaml_loader import load_yaml
+
+_RECORD_COUNTS = (5000, 20000)
+
+_SCHEMA = '''
+ruleset Event {
+    id int
+    kind str
+    payload any
+}
+
+schema {
+    version str
+    events list(Event)
+}
+'''
+
+# Each event has a large payload and fields that are not in the ruleset
+_EVENT = '''\
+  - id: {index}
+    kind: {kind}
+    payload:
+      source: {{host: host-{index}, region: eu-west-1, zone: a}}
+      samples: [1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5]
+      attributes:
+        - {{name: cpu, value: 0.5, unit: cores}}
+        - {{name: memory, value: 512, unit: Mi}}
+        - {{name: disk, value: 20, unit: Gi}}
+    trace:
+      spans: [a, b, c, d, e, f]
+      tags: {{team: core, tier: backend}}
+'''
+
+
+def _write_document(path: str, records: int) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('version: "1"\nevents:\n')
+        for index in range(records):
+            # Every 100th event has an invalid kind
+            kind = '[1]' if index % 100 == 0 else 'sample'
+            f.write(_EVENT.format(index=index, kind=kind))
+
+
+def _load_then_validate(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = load_yaml(f)
+    return len(validate_yaml(data, schema))
+
+
+def _lazy_load_then_validate(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = load_yaml_for_schema(f, schema)
+    return len(validate_yaml(data, schema))
+
+
+def _measure(func, path: str, schema) -> tuple:
+    start = time.perf_counter()
+    count = func(path, schema)
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(path, schema)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, duration, peak
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    os.close(fd)
+    try:
+        for records in _RECORD_COUNTS:
+            _write_document(path, records)
+            size = os.path.getsize(path) / 1024 / 1024
+            print(f'{records} records, {size:.1f} MB')
+
+            for name, func in (('load then validate', _load_then_validate),
+                               ('lazy load then validate',
+                                _lazy_load_then_validate)):
+                count, duration, peak = _measure(func, path, schema)
+                print(f'{name:>24}: {duration:7.2f} s, '
+                      f'peak {peak / 1024 / 1024:8.2f} MB, '
+                      f'{count} violations')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
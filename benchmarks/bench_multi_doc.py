@@ -0,0 +1,121 @@
+"""Benchmarks validating a bundle of manifests separated by `---` by
+loading every document with `yaml.load_all` and then validating them,
+compared to validating the documents in turn with `validate_yaml_stream`.
+The peak memory is measured with `tracemalloc` in a separate run from the
+timings
+
+Usage:
+    python -m benchmarks.bench_multi_doc
+"""
+
+import os
+import time
+import tempfile
+import tracemalloc
+
+import yaml
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.documents import validate_yaml_stream
+from yamlator.yaml_loader import get_yaml_loader
+
+_DOCUMENT_COUNTS = (5000, 20000)
+
+_SCHEMA = '''
+ruleset Metadata {
+    name str
+    namespace str
+    labels map(str) optional
+}
+
+ruleset Container {
+    name str
+    image str
+    ports list(int) optional
+}
+
+ruleset Spec {
+    replicas int
+    containers list(Container)
+}
+
+schema {
+    apiVersion str
+    kind str
+    metadata Metadata
+    spec Spec
+}
+'''
+
+_MANIFEST = '''\
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: service-{index}
+  namespace: default
+  labels: {{app: service-{index}, tier: backend}}
+spec:
+  replicas: {replicas}
+  containers:
+    - name: service-{index}
+      image: registry.example.com/service:1.{index}
+      ports: [8080, 8443]
+'''
+
+
+def _write_bundle(path: str, documents: int) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(documents):
+            # Every 100th manifest has an invalid number of replicas
+            replicas = 'many' if index % 100 == 0 else index % 5
+            f.write(_MANIFEST.format(index=index, replicas=replicas))
+
+
+def _load_all_then_validate(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        documents = list(yaml.load_all(f, Loader=get_yaml_loader()))
+    return sum(len(validate_yaml(data, schema)) for data in documents)
+
+
+def _validate_stream(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for _ in validate_yaml_stream(f, schema))
+
+
+def _measure(func, path: str, schema) -> tuple:
+    start = time.perf_counter()
+    count = func(path, schema)
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(path, schema)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, duration, peak
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    os.close(fd)
+    try:
+        for documents in _DOCUMENT_COUNTS:
+            _write_bundle(path, documents)
+            size = os.path.getsize(path) / 1024 / 1024
+            print(f'{documents} documents, {size:.1f} MB')
+
+            for name, func in (('load all then validate',
+                                _load_all_then_validate),
+                               ('validate_yaml_stream', _validate_stream)):
+                count, duration, peak = _measure(func, path, schema)
+                print(f'{name:>24}: {duration:7.2f} s, '
+                      f'peak {peak / 1024 / 1024:8.2f} MB, '
+                      f'{count} violations')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
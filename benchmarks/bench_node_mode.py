@@ -0,0 +1,120 @@
+"""Benchmarks validating a YAML file by loading it with the libyaml loader
+and then validating it, compared to validating the composed nodes of the
+file with `validate_yaml_nodes`. Each document is measured with and
+without a large `any` payload in each record, which node mode does not
+construct
+
+Usage:
+    python -m benchmarks.bench_node_mode
+"""
+
+import os
+import time
+import tempfile
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.nodes import validate_yaml_nodes
+from yamlator.yaml_loader import load_yaml
+
+_RECORDS = 25000
+
+_SCHEMA = '''
+enum Status {
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+}
+
+ruleset Address {
+    number int
+    street str
+    postcode regex("^[A-Z]{2}[0-9]{1,2} [0-9][A-Z]{2}$")
+}
+
+ruleset Person {
+    name str
+    age int
+    status Status
+    address Address
+    tags list(str)
+    metadata any optional
+}
+
+schema {
+    version str
+    people list(Person)
+}
+'''
+
+_PERSON = '''\
+  - name: Person {index}
+    age: {age}
+    status: {status}
+    address:
+      number: {index}
+      street: High Street
+      postcode: AB1 2CD
+    tags: [one, two, three]
+'''
+
+_METADATA = '''\
+    metadata:
+      created: 2024-01-01T10:00:00Z
+      notes: [a, b, c, d, e, f, g, h]
+      history:
+        - {version: 1, author: a, changes: [x, y, z]}
+        - {version: 2, author: b, changes: [x, y, z]}
+        - {version: 3, author: c, changes: [x, y, z]}
+'''
+
+
+def _write_document(path: str, with_metadata: bool) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('version: "1"\npeople:\n')
+        for index in range(_RECORDS):
+            # Every 100th person has an invalid age
+            age = 'unknown' if index % 100 == 0 else index % 90
+            status = 'active' if index % 2 else 'inactive'
+            f.write(_PERSON.format(index=index, age=age, status=status))
+            if with_metadata:
+                f.write(_METADATA)
+
+
+def _load_then_validate(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = load_yaml(f)
+    return len(validate_yaml(data, schema))
+
+
+def _node_mode(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        return len(validate_yaml_nodes(f, schema))
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    os.close(fd)
+    try:
+        for with_metadata in (False, True):
+            _write_document(path, with_metadata)
+            size = os.path.getsize(path) / 1024 / 1024
+            payload = 'with' if with_metadata else 'without'
+            print(f'{_RECORDS} records {payload} any payloads, '
+                  f'{size:.1f} MB')
+
+            baseline = None
+            for name, func in (('load then validate', _load_then_validate),
+                               ('node mode', _node_mode)):
+                start = time.perf_counter()
+                count = func(path, schema)
+                duration = time.perf_counter() - start
+                baseline = baseline or duration
+                print(f'{name:>20}: {duration:7.2f} s '
+                      f'({baseline / duration:4.1f}x), {count} violations')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmarks a cold load of a schema that imports 80 independent schema
+files when the imported files are loaded one at a time compared to
+loading them with a pool of processes. The fastest of several cold
+loads is reported for each number of workers
+
+Usage:
+    python -m benchmarks.bench_parallel_imports
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+from yamlator.parser import clear_schema_cache
+from yamlator.parser import parse_yamlator_schema
+
+_IMPORTED_FILES = 80
+_RULESETS_PER_FILE = 20
+_RULES_PER_RULESET = 10
+_WORKERS = (None, 2, 4, os.cpu_count())
+_REPEATS = 5
+
+
+def _write_schemas(schema_dir: str) -> str:
+    root_imports = []
+    root_rules = []
+    for index in range(_IMPORTED_FILES):
+        lines = []
+        for ruleset in range(_RULESETS_PER_FILE):
+            lines.append(f'ruleset File{index}Ruleset{ruleset} {{')
+            for rule in range(_RULES_PER_RULESET):
+                lines.append(f'    field{rule} list(map(str)) optional')
+            lines.append('}\n')
+
+        path = os.path.join(schema_dir, f'file{index}.ys')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+
+        root_imports.append(f'import File{index}Ruleset0 '
+                            f'from "file{index}.ys"')
+        root_rules.append(f'    item{index} File{index}Ruleset0')
+
+    root_path = os.path.join(schema_dir, 'root.ys')
+    with open(root_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(root_imports))
+        f.write('\n\nschema {\n' + '\n'.join(root_rules) + '\n}\n')
+    return root_path
+
+
+def main() -> None:
+    schema_dir = os.path.relpath(tempfile.mkdtemp())
+    try:
+        root_path = _write_schemas(schema_dir)
+        print(f'CPUs: {os.cpu_count()}')
+        for workers in _WORKERS:
+            durations = []
+            for _ in range(_REPEATS):
+                clear_schema_cache()
+                start = time.perf_counter()
+                parse_yamlator_schema(root_path, workers=workers)
+                durations.append(time.perf_counter() - start)
+
+            duration = min(durations)
+            print(f'Workers {str(workers):>4}: {duration * 1000:.1f} ms')
+    finally:
+        shutil.rmtree(schema_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmarks the cost of a single `parse_schema` call when the Lark parser
+is rebuilt for every call compared to reusing the shared parser
+
+Usage:
+    python -m benchmarks.bench_parse_schema
+"""
+
+import timeit
+
+from yamlator.utils import load_schema
+from yamlator.parser import parse_schema
+from yamlator.parser import clear_schema_cache
+from yamlator.parser import reset_schema_parser
+
+_SCHEMA_PATH = './tests/files/valid/valid.ys'
+_ITERATIONS = 50
+
+
+# Parsed schemas are cached by their content, so the cache is cleared
+# before each call to measure the parse rather than a cache hit
+def _parse_with_new_parser(schema_content: str) -> None:
+    reset_schema_parser()
+    clear_schema_cache()
+    parse_schema(schema_content)
+
+
+def _parse_with_shared_parser(schema_content: str) -> None:
+    clear_schema_cache()
+    parse_schema(schema_content)
+
+
+def main() -> None:
+    schema_content = load_schema(_SCHEMA_PATH)
+
+    uncached = timeit.timeit(lambda: _parse_with_new_parser(schema_content),
+                             number=_ITERATIONS)
+
+    # Warm up the shared parser so only the parse is measured
+    parse_schema(schema_content)
+    cached = timeit.timeit(lambda: _parse_with_shared_parser(schema_content),
+                           number=_ITERATIONS)
+
+    print(f'Rebuilt parser: {uncached / _ITERATIONS * 1000:.3f} ms per call')
+    print(f'Shared parser:  {cached / _ITERATIONS * 1000:.3f} ms per call')
+    print(f'Speed up:       {uncached / cached:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
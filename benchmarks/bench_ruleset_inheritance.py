@@ -0,0 +1,67 @@
+"""Benchmarks resolving ruleset inheritance for long inheritance chains
+and large forests of rulesets to check that the time to resolve the
+rulesets grows with the number of rulesets
+
+Usage:
+    python -m benchmarks.bench_ruleset_inheritance
+"""
+
+import time
+
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorRuleset
+from yamlator.parser.loaders import resolve_ruleset_inheritance
+
+_CHAIN_DEPTHS = (250, 500, 1000)
+_FOREST_SIZES = (2500, 5000, 10000)
+_TREE_SIZE = 100
+
+
+def _create_ruleset(name: str, parent: str = None) -> YamlatorRuleset:
+    rules = [Rule(f'{name}_field', RuleType(SchemaTypes.STR), True)]
+    if parent is not None:
+        parent = RuleType(SchemaTypes.RULESET, lookup=parent)
+    return YamlatorRuleset(name, rules, parent=parent)
+
+
+def _create_chain(depth: int) -> dict:
+    rulesets = {}
+    for level in reversed(range(depth)):
+        parent = f'Ruleset{level - 1}' if level > 0 else None
+        rulesets[f'Ruleset{level}'] = _create_ruleset(f'Ruleset{level}',
+                                                      parent)
+    return rulesets
+
+
+def _create_forest(size: int) -> dict:
+    rulesets = {}
+    for index in range(size):
+        tree, position = divmod(index, _TREE_SIZE)
+        parent = None
+        if position > 0:
+            parent = f'Tree{tree}Ruleset{(position - 1) // 2}'
+        name = f'Tree{tree}Ruleset{position}'
+        rulesets[name] = _create_ruleset(name, parent)
+    return rulesets
+
+
+def _time(rulesets: dict) -> float:
+    start = time.perf_counter()
+    resolve_ruleset_inheritance(rulesets)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for depth in _CHAIN_DEPTHS:
+        duration = _time(_create_chain(depth))
+        print(f'Chain of {depth:>5} rulesets: {duration * 1000:8.1f} ms')
+
+    for size in _FOREST_SIZES:
+        duration = _time(_create_forest(size))
+        print(f'Forest of {size:>5} rulesets: {duration * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Benchmarks loading a schema with imports from the schema files compared
+to loading the fully resolved schema from the persistent schema cache
+
+Usage:
+    python -m benchmarks.bench_schema_cache
+"""
+
+import shutil
+import timeit
+import tempfile
+
+from yamlator.parser import parse_yamlator_schema
+
+_SCHEMA_PATH = './tests/files/valid/with_import_and_namespaces.ys'
+_ITERATIONS = 200
+
+
+def main() -> None:
+    cache_dir = tempfile.mkdtemp()
+    try:
+        # Warm up the shared parser so only the schema loading is measured
+        parse_yamlator_schema(_SCHEMA_PATH)
+        uncached = timeit.timeit(lambda: parse_yamlator_schema(_SCHEMA_PATH),
+                                 number=_ITERATIONS)
+
+        parse_yamlator_schema(_SCHEMA_PATH, cache_dir)
+        cached = timeit.timeit(
+            lambda: parse_yamlator_schema(_SCHEMA_PATH, cache_dir),
+            number=_ITERATIONS)
+    finally:
+        shutil.rmtree(cache_dir)
+
+    print(f'Parsed schema: {uncached / _ITERATIONS * 1000:.3f} ms per load')
+    print(f'Cached schema: {cached / _ITERATIONS * 1000:.3f} ms per load')
+    print(f'Speed up:      {uncached / cached:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
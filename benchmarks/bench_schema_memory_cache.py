@@ -0,0 +1,38 @@
+"""Benchmarks repeated validations against the same schema file with and
+without the in-memory schema cache
+
+Usage:
+    python -m benchmarks.bench_schema_memory_cache
+"""
+
+import timeit
+
+from yamlator.cmd import validate_yaml_data_from_file
+from yamlator.parser import set_schema_cache_size
+from yamlator.parser.cache import DEFAULT_SCHEMA_CACHE_SIZE
+
+_YAML_PATH = './tests/files/valid/valid.yaml'
+_SCHEMA_PATH = './tests/files/valid/valid.ys'
+_ITERATIONS = 200
+
+
+def _validate() -> None:
+    list(validate_yaml_data_from_file(_YAML_PATH, _SCHEMA_PATH))
+
+
+def main() -> None:
+    set_schema_cache_size(0)
+    _validate()
+    uncached = timeit.timeit(_validate, number=_ITERATIONS)
+
+    set_schema_cache_size(DEFAULT_SCHEMA_CACHE_SIZE)
+    _validate()
+    cached = timeit.timeit(_validate, number=_ITERATIONS)
+
+    print(f'Without cache: {uncached / _ITERATIONS * 1000:.3f} ms per file')
+    print(f'With cache:    {cached / _ITERATIONS * 1000:.3f} ms per file')
+    print(f'Speed up:      {uncached / cached:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Benchmarks validating a large YAML file by loading it with the libyaml
+loader and then validating it, compared to validating it from the events
+of the parser with `validate_yaml_events`. The peak memory is measured
+with `tracemalloc` in a separate run from the timings
+
+Usage:
+    python -m benchmarks.bench_streaming
+"""
+
+import os
+import time
+import tempfile
+import tracemalloc
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.streaming import validate_yaml_events
+from yamlator.yaml_loader import load_yaml
+
+_RECORD_COUNTS = (25000, 100000)
+
+_SCHEMA = '''
+enum Status {
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+}
+
+ruleset Address {
+    number int
+    street str
+    postcode regex("^[A-Z]{2}[0-9]{1,2} [0-9][A-Z]{2}$")
+}
+
+ruleset Person {
+    name str
+    age int
+    status Status
+    address Address
+    tags list(str)
+    metadata any optional
+}
+
+schema {
+    version str
+    people list(Person)
+}
+'''
+
+_PERSON = '''\
+  - name: Person {index}
+    age: {age}
+    status: {status}
+    address:
+      number: {index}
+      street: High Street
+      postcode: AB1 2CD
+    tags: [one, two, three]
+    metadata:
+      created: 2024-01-01
+      notes: [a, b, c]
+'''
+
+
+def _write_document(path: str, records: int) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('version: "1"\npeople:\n')
+        for index in range(records):
+            # Every 100th person has an invalid age
+            age = 'unknown' if index % 100 == 0 else index % 90
+            status = 'active' if index % 2 else 'inactive'
+            f.write(_PERSON.format(index=index, age=age, status=status))
+
+
+def _load_then_validate(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = load_yaml(f)
+    return len(validate_yaml(data, schema))
+
+
+def _stream(path: str, schema) -> int:
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for _ in validate_yaml_events(f, schema))
+
+
+def _measure(func, path: str, schema) -> tuple:
+    start = time.perf_counter()
+    count = func(path, schema)
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(path, schema)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, duration, peak
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    os.close(fd)
+    try:
+        for records in _RECORD_COUNTS:
+            _write_document(path, records)
+            size = os.path.getsize(path) / 1024 / 1024
+            print(f'{records} records, {size:.1f} MB')
+
+            for name, func in (('load then validate', _load_then_validate),
+                               ('streaming', _stream)):
+                count, duration, peak = _measure(func, path, schema)
+                print(f'{name:>20}: {duration:7.2f} s, '
+                      f'peak {peak / 1024 / 1024:8.2f} MB, '
+                      f'{count} violations')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmarks validating a large list of unions of rulesets with each
+validation engine, where the items match the first type, the last type
+or none of the types in the union. The rulesets are validated with and
+without an enum field that discriminates them
+
+Usage:
+    python -m benchmarks.bench_unions
+"""
+
+import time
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import ENGINES
+
+_ITEMS = 5000
+_RULESETS = 8
+_FIELDS = 10
+_REPEATS = 3
+
+
+def _create_schema(is_discriminated: bool) -> str:
+    enums = []
+    rulesets = []
+    for ruleset in range(_RULESETS):
+        kind_type = 'str'
+        if is_discriminated:
+            kind_type = f'Kind{ruleset}Type'
+            enums.append(f'enum {kind_type} {{\n'
+                         f'    KIND = "kind{ruleset}"\n}}')
+
+        fields = '\n'.join(f'    field{field} int'
+                           for field in range(_FIELDS))
+        rulesets.append(f'ruleset Kind{ruleset} {{\n'
+                        f'    kind {kind_type}\n'
+                        f'    kind{ruleset} str\n{fields}\n}}')
+
+    sub_types = ', '.join(f'Kind{ruleset}' for ruleset in range(_RULESETS))
+    return '\n\n'.join(enums + rulesets) + \
+        f'\n\nschema {{\n    items list(union({sub_types}))\n}}\n'
+
+
+def _create_item(ruleset: int) -> dict:
+    item = {f'field{field}': field for field in range(_FIELDS)}
+    item['kind'] = f'kind{ruleset}'
+    item[f'kind{ruleset}'] = 'kind'
+    return item
+
+
+def _create_corpora() -> dict:
+    invalid_item = dict(_create_item(0), field0='a')
+    return {
+        'first type': {'items': [_create_item(0)] * _ITEMS},
+        'last type': {'items': [_create_item(_RULESETS - 1)] * _ITEMS},
+        'no type': {'items': [invalid_item] * _ITEMS},
+    }
+
+
+def _time(data: dict, schema, engine: str) -> float:
+    durations = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        validate_yaml(data, schema, engine=engine)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    for is_discriminated in (False, True):
+        schema = parse_schema(_create_schema(is_discriminated))
+        label = 'discriminated' if is_discriminated else 'plain'
+        for name, data in _create_corpora().items():
+            for engine in ENGINES:
+                duration = _time(data, schema, engine)
+                print(f'{label:>13}, {name:>10}, {engine:>8} engine: '
+                      f'{duration * 1000:8.1f} ms, '
+                      f'{duration * 1e6 / _ITEMS:8.2f} us/item')
+
+
+if __name__ == '__main__':
+    main()
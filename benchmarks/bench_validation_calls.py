@@ -0,0 +1,92 @@
+"""Microbenchmarks the validation engines on documents that each stress
+a single rule type, and reports the number of Python function calls and
+the time each engine spends per data node
+
+Usage:
+    python -m benchmarks.bench_validation_calls
+"""
+
+import time
+import cProfile
+import pstats
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import ENGINES
+
+_ITEMS = 20000
+_REPEATS = 3
+
+_SCHEMA = '''
+enum Status {
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+}
+
+ruleset Point {
+    x int
+    y int
+}
+
+schema {
+    ints list(int) optional
+    bools list(bool) optional
+    strs list(str) optional
+    enums list(Status) optional
+    regexes list(regex("^id-[0-9]+$")) optional
+    maps map(float) optional
+    points list(Point) optional
+    unions list(union(int, str, Point)) optional
+}
+'''
+
+_DOCUMENTS = {
+    'int': {'ints': list(range(_ITEMS))},
+    'bool': {'bools': [bool(i % 2) for i in range(_ITEMS)]},
+    'str': {'strs': [str(i) for i in range(_ITEMS)]},
+    'enum': {'enums': ['active', 'inactive'] * (_ITEMS // 2)},
+    'regex': {'regexes': [f'id-{i}' for i in range(_ITEMS)]},
+    'map': {'maps': {str(i): float(i) for i in range(_ITEMS)}},
+    'ruleset': {'points': [{'x': i, 'y': i} for i in range(_ITEMS)]},
+    'union': {'unions': [{'x': i, 'y': i} if i % 2 else str(i)
+                         for i in range(_ITEMS)]},
+}
+
+
+def _count_nodes(data) -> int:
+    if isinstance(data, dict):
+        return 1 + sum(_count_nodes(value) for value in data.values())
+    if isinstance(data, list):
+        return 1 + sum(_count_nodes(item) for item in data)
+    return 1
+
+
+def _count_calls(data: dict, schema, engine: str) -> int:
+    profile = cProfile.Profile()
+    profile.runcall(validate_yaml, data, schema, engine=engine)
+    return pstats.Stats(profile).total_calls
+
+
+def _time(data: dict, schema, engine: str) -> float:
+    durations = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        validate_yaml(data, schema, engine=engine)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    for name, data in _DOCUMENTS.items():
+        nodes = _count_nodes(data)
+        for engine in ENGINES:
+            calls = _count_calls(data, schema, engine)
+            duration = _time(data, schema, engine)
+            print(f'{name:>8}, {engine:>8} engine: '
+                  f'{calls / nodes:6.2f} calls/node, '
+                  f'{duration * 1e9 / nodes:8.1f} ns/node')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmarks the validation engines against large generated documents
+and reports the number of data nodes each engine validates per second
+
+Usage:
+    python -m benchmarks.bench_validation_engines
+"""
+
+import time
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import ENGINES
+
+_DOCUMENT_SIZES = (1000, 10000, 50000)
+_REPEATS = 3
+
+_SCHEMA = '''
+enum Status {
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]{1,2} [0-9][A-Z]{2}$")
+}
+
+ruleset Person {
+    name str
+    age int
+    status Status
+    address Address
+    tags list(str)
+    scores map(float)
+    manager str optional
+}
+
+schema {
+    version str
+    people list(Person)
+}
+'''
+
+
+def _create_document(size: int) -> dict:
+    people = []
+    for index in range(size):
+        people.append({
+            'name': f'Person {index}',
+            'age': index % 90,
+            'status': 'active' if index % 2 else 'inactive',
+            'address': {
+                'number': index if index % 3 else f'{index}a',
+                'street': 'High Street',
+                'postcode': 'AB1 2CD'
+            },
+            'tags': ['one', 'two', 'three'],
+            'scores': {'maths': 1.0, 'english': 2.5}
+        })
+    return {'version': '1', 'people': people}
+
+
+def _count_nodes(data) -> int:
+    if isinstance(data, dict):
+        return 1 + sum(_count_nodes(value) for value in data.values())
+    if isinstance(data, list):
+        return 1 + sum(_count_nodes(item) for item in data)
+    return 1
+
+
+def _time(data: dict, schema, engine: str) -> float:
+    durations = []
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        validate_yaml(data, schema, engine=engine)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    for size in _DOCUMENT_SIZES:
+        data = _create_document(size)
+        nodes = _count_nodes(data)
+        for engine in ENGINES:
+            duration = _time(data, schema, engine)
+            print(f'{size:>6} records, {engine:>8} engine: '
+                  f'{duration * 1000:8.1f} ms, '
+                  f'{nodes / duration:12,.0f} nodes/s')
+
+
+if __name__ == '__main__':
+    main()
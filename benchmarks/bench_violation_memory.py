@@ -0,0 +1,51 @@
+"""Benchmarks the time and memory used to validate a document that
+produces one million violations
+
+Usage:
+    python -m benchmarks.bench_violation_memory
+"""
+
+import gc
+import time
+import tracemalloc
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+
+_VIOLATIONS = 1000000
+
+_SCHEMA = '''
+schema {
+    values list(int)
+}
+'''
+
+
+def main() -> None:
+    schema = parse_schema(_SCHEMA)
+    data = {'values': ['not an int'] * _VIOLATIONS}
+
+    start = time.perf_counter()
+    violations = validate_yaml(data, schema)
+    duration = time.perf_counter() - start
+    del violations
+    gc.collect()
+
+    tracemalloc.start()
+    violations = validate_yaml(data, schema)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{len(violations):,} violations in {duration:.2f} s, '
+          f'{memory / 2 ** 20:.1f} MiB '
+          f'({memory / len(violations):.0f} bytes per violation)')
+
+    start = time.perf_counter()
+    for violation in violations:
+        _ = violation.message
+    duration = time.perf_counter() - start
+    print(f'Reading every message took {duration:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Benchmarks loading a 50 MB manifest with the full PyYAML loader that
+was previously used by `load_yaml_file`, compared to the safe and minimal
+loaders with the Python and libyaml parsers
+
+Usage:
+    python -m benchmarks.bench_yaml_loaders
+"""
+
+import os
+import time
+import tempfile
+
+import yaml
+
+from yamlator.yaml_loader import CMinimalLoader
+from yamlator.yaml_loader import MinimalLoader
+
+_MANIFEST_MB = 50
+
+_RESOURCE = '''\
+- apiVersion: apps/v1
+  kind: Deployment
+  metadata:
+    name: service-{index}
+    namespace: default
+    creationTimestamp: 2024-01-01T10:00:00Z
+    labels:
+      app: service-{index}
+      tier: backend
+  spec:
+    replicas: {replicas}
+    paused: false
+    template:
+      spec:
+        containers:
+          - name: service-{index}
+            image: registry.example.com/service:1.{index}
+            ports:
+              - containerPort: 8080
+                protocol: TCP
+            resources:
+              limits:
+                cpu: 0.5
+                memory: 512Mi
+            env:
+              - name: LOG_LEVEL
+                value: info
+              - name: TIMEOUT
+                value: null
+'''
+
+
+def _write_manifest(path: str) -> int:
+    size = 0
+    index = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('resources:\n')
+        while size < _MANIFEST_MB * 1024 * 1024:
+            resource = _RESOURCE.format(index=index, replicas=index % 5)
+            size += f.write(resource)
+            index += 1
+    return index
+
+
+def _time_load(path: str, loader: type) -> float:
+    start = time.perf_counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        yaml.load(f, Loader=loader)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    loaders = {
+        'Loader (previous)': yaml.Loader,
+        'SafeLoader': yaml.SafeLoader,
+        'MinimalLoader': MinimalLoader,
+    }
+    if yaml.__with_libyaml__:
+        loaders['CSafeLoader'] = yaml.CSafeLoader
+        loaders['CMinimalLoader'] = CMinimalLoader
+
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    os.close(fd)
+    try:
+        resources = _write_manifest(path)
+        print(f'Manifest: {resources} resources, '
+              f'{os.path.getsize(path) / 1024 / 1024:.1f} MB')
+
+        baseline = None
+        for name, loader in loaders.items():
+            duration = _time_load(path, loader)
+            baseline = baseline or duration
+            print(f'{name:>18}: {duration:7.2f} s '
+                  f'({baseline / duration:5.1f}x)')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
+import os
 import setuptools
 
+from setuptools.command.build_py import build_py
+
 VERSION = '0.4.1'
 PACKAGE_NAME = 'yamlator'
 DESCRIPTION = 'Yamlator is a CLI tool that allows a YAML file to be validated using a lightweight schema language'  # nopep8
@@ -30,6 +33,26 @@ def create_long_description():
         return long_description
 
 
+class BuildPyWithParserArtifact(build_py):
+    """Builds the package and adds a precompiled schema parser so the
+    grammar does not need to be analysed when Yamlator starts
+    """
+
+    def run(self):
+        super().run()
+
+        try:
+            from yamlator.parser.core import build_schema_parser_artifact
+        except ImportError:
+            # The parser will be built from the grammar at runtime
+            # when the build dependencies are not available
+            return
+
+        artifact_path = os.path.join(self.build_lib, PACKAGE_NAME,
+                                     'grammar', 'grammar.lark.pickle')
+        build_schema_parser_artifact(artifact_path)
+
+
 long_description = create_long_description()
 
 setuptools.setup(
@@ -49,7 +72,7 @@ setuptools.setup(
         'yamlator.parser',
     ]),
     install_requires=[
-        'lark>=1.0.0',
+        'lark>=1.0.0,<2.0.0',
         'PyYAML>=5.4.1'
     ],
     python_requires='>=3.6',
@@ -68,5 +91,6 @@ setuptools.setup(
     entry_points={
         'console_scripts': ['yamlator=yamlator.cmd:main']
     },
-    package_data={'yamlator': ['grammar/grammar.lark']}
+    package_data={'yamlator': ['grammar/grammar.lark']},
+    cmdclass={'build_py': BuildPyWithParserArtifact}
 )
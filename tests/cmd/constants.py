@@ -11,10 +11,13 @@ MISSING_RULESET_RULES_SCHEMA = f'{_BASE_INVALID_PATH}/ruleset_missing_rules.ys'
 MISSING_SCHEMA_RULES_SCHEMA = f'{_BASE_INVALID_PATH}/schema_missing_rules.ys'
 SELF_CYCLE_SCHEMA = f'{_BASE_INVALID_PATH}/cycles/self_cycle.ys'
 INVALID_YAML_DATA = f'{_BASE_INVALID_PATH}/invalid.yaml'
+INVALID_COMPILED_SCHEMA = f'{_BASE_INVALID_PATH}/invalid_version.ysc'
+MULTI_DOCUMENT_YAML_DATA = f'{_BASE_INVALID_PATH}/multi_document.yaml'
 
 _BASE_VALID_PATH = './tests/files/valid'
 VALID_YAML_DATA = f'{_BASE_VALID_PATH}/valid.yaml'
 VALID_SCHEMA = f'{_BASE_VALID_PATH}/valid.ys'
+VALID_COMPILED_SCHEMA = f'{_BASE_VALID_PATH}/valid.ysc'
 VALID_KEYLESS_DIRECTIVE_SCHEMA = f'{_BASE_VALID_PATH}/keyless_directive.ys'
 VALID_KEYLESS_RULES_SCHEMA = f'{_BASE_VALID_PATH}/keyless_and_standard_rules.ys'
 VALID_INHERITANCE_SCHEMA = f'{_BASE_VALID_PATH}/inheritance.ys'
@@ -23,5 +26,6 @@ VALID_INHERITANCE_SCHEMA = f'{_BASE_VALID_PATH}/inheritance.ys'
 NONE_PATH = None
 EMPTY_PATH = ''
 NOT_FOUND_SCHEMA = 'not_found.ys'
+NOT_FOUND_COMPILED_SCHEMA = 'not_found.ysc'
 NOT_FOUND_YAML_DATA = 'not_found.yaml'
 INVALID_SCHEMA_EXTENSION = './tests/files/hello.ruleset'
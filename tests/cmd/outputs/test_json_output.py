@@ -22,6 +22,17 @@ from yamlator.violations import TypeViolation
 from yamlator.violations import Violation
 
 
+def _located(violation: Violation, line: int, column: int) -> Violation:
+    violation.line = line
+    violation.column = column
+    return violation
+
+
+def _in_document(violation: Violation, document: int) -> Violation:
+    violation.document = document
+    return violation
+
+
 class TestJSONOutput(unittest.TestCase):
     """Test the JSONOutput display method"""
 
@@ -30,6 +41,16 @@ class TestJSONOutput(unittest.TestCase):
         ('with_violations', [
             RequiredViolation(key='message', parent='-'),
             TypeViolation(key='number', parent='-', message='Invalid number')
+        ], SuccessCode.ERR),
+        ('with_violation_locations', [
+            _located(RequiredViolation(key='message', parent='-'), 1, 1),
+            TypeViolation(key='number', parent='-', message='Invalid number')
+        ], SuccessCode.ERR),
+        ('with_violation_documents', [
+            _in_document(RequiredViolation(key='message', parent='-'), 0),
+            _in_document(_located(TypeViolation(key='number', parent='-',
+                                                message='Invalid number'),
+                                  2, 9), 3)
         ], SuccessCode.ERR)
     ])
     def test_json_output(self, name: str,
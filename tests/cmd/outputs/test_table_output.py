@@ -23,6 +23,17 @@ from yamlator.violations import TypeViolation
 from yamlator.violations import ViolationType
 
 
+def _located(violation: Violation, line: int, column: int) -> Violation:
+    violation.line = line
+    violation.column = column
+    return violation
+
+
+def _in_document(violation: Violation, document: int) -> Violation:
+    violation.document = document
+    return violation
+
+
 class TestTableOutput(unittest.TestCase):
     """Test the `TableOutput` display method"""
 
@@ -31,6 +42,16 @@ class TestTableOutput(unittest.TestCase):
         ('with_violations', [
             RequiredViolation(key='message', parent='-'),
             TypeViolation(key='number', parent='-', message='Invalid number')
+        ], SuccessCode.ERR),
+        ('with_violation_locations', [
+            _located(RequiredViolation(key='message', parent='-'), 1, 1),
+            TypeViolation(key='number', parent='-', message='Invalid number')
+        ], SuccessCode.ERR),
+        ('with_violation_documents', [
+            _in_document(RequiredViolation(key='message', parent='-'), 0),
+            _in_document(_located(TypeViolation(key='number', parent='-',
+                                                message='Invalid number'),
+                                  2, 9), 3)
         ], SuccessCode.ERR)
     ])
     def test_displayed_violation_output(self, name: str,
@@ -28,6 +28,17 @@ from yamlator.violations import StrictRulesetViolation
 from yamlator.violations import StrictEntryPointViolation
 
 
+def _located(violation: Violation, line: int, column: int) -> Violation:
+    violation.line = line
+    violation.column = column
+    return violation
+
+
+def _in_document(violation: Violation, document: int) -> Violation:
+    violation.document = document
+    return violation
+
+
 class TestYAMLOutput(unittest.TestCase):
     """Test the YAMLOutput display method"""
 
@@ -36,6 +47,7 @@ class TestYAMLOutput(unittest.TestCase):
         ('with_violations', deque([
             RequiredViolation(key='message', parent='-'),
             TypeViolation(key='number', parent='-', message='Invalid number'),
+            TypeViolation(key='count', parent='-', expected_type='int'),
             BuiltInTypeViolation(key='name',
                                  parent='-',
                                  expected_type=str),
@@ -51,6 +63,16 @@ class TestYAMLOutput(unittest.TestCase):
                                parent='-',
                                data='1st January 2022',
                                regex_str=r'([0-3][0-9]\/){2}2022')
+        ]), SuccessCode.ERR),
+        ('with_violation_locations', deque([
+            _located(RequiredViolation(key='message', parent='-'), 1, 1),
+            TypeViolation(key='number', parent='-', message='Invalid number')
+        ]), SuccessCode.ERR),
+        ('with_violation_documents', deque([
+            _in_document(RequiredViolation(key='message', parent='-'), 0),
+            _in_document(_located(TypeViolation(key='number', parent='-',
+                                                message='Invalid number'),
+                                  2, 9), 3)
         ]), SuccessCode.ERR)
     ])
     def test_yaml_output(self,
@@ -0,0 +1,85 @@
+"""Test the compile command of the command line
+
+Test Cases:
+    * `test_compile_command` tests that the compile command writes a
+       compiled schema that can be used to validate a YAML file
+    * `test_compile_command_with_default_output` tests that the compiled
+       schema is written next to the schema when an output is not given
+    * `test_compile_command_with_invalid_schema` tests that the compile
+       command returns an error status code if the schema cannot be loaded
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.cmd import main
+from yamlator.cmd import validate_yaml_data_from_file
+from yamlator.cmd.outputs import SuccessCode
+
+from tests.cmd import constants
+
+
+class TestCompileCommand(unittest.TestCase):
+    """Test cases for the `compile` command of the command line"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_compile_command(self):
+        output = os.path.join(self.tmp_dir, 'schema.ysc')
+
+        with patch('sys.stdout', new=io.StringIO()):
+            status_code = main(['compile', constants.VALID_INHERITANCE_SCHEMA,
+                                '-o', output])
+
+        self.assertEqual(SuccessCode.SUCCESS, status_code)
+
+        expected = validate_yaml_data_from_file(
+            constants.VALID_YAML_DATA, constants.VALID_INHERITANCE_SCHEMA)
+        actual = validate_yaml_data_from_file(constants.VALID_YAML_DATA,
+                                              output)
+        self.assertEqual([v.message for v in expected],
+                         [v.message for v in actual])
+
+    def test_compile_command_with_default_output(self):
+        schema_path = os.path.join(self.tmp_dir, 'valid.ys')
+        shutil.copy(constants.VALID_SCHEMA, schema_path)
+
+        with patch('sys.stdout', new=io.StringIO()):
+            status_code = main(['compile', schema_path])
+
+        self.assertEqual(SuccessCode.SUCCESS, status_code)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir,
+                                                    'valid.ysc')))
+
+    @parameterized.expand([
+        ('with_schema_not_found', constants.NOT_FOUND_SCHEMA),
+        ('with_invalid_extension', constants.INVALID_SCHEMA_EXTENSION),
+        ('with_syntax_errors', constants.INVALID_ENUM_NAME_SCHEMA),
+        ('with_ruleset_not_defined', constants.MISSING_RULESET_DEF_SCHEMA),
+        ('with_self_cycle_in_ruleset', constants.SELF_CYCLE_SCHEMA),
+    ])
+    def test_compile_command_with_invalid_schema(self, name: str,
+                                                 schema_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        output = os.path.join(self.tmp_dir, 'schema.ysc')
+        with patch('sys.stdout', new=io.StringIO()):
+            status_code = main(['compile', schema_path, '-o', output])
+
+        self.assertEqual(SuccessCode.ERR, status_code)
+        self.assertFalse(os.path.exists(output))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@
 Test Cases:
     * `test_main` tests the entry point with different arguments
        to validate the correct status code is provided
+    * `test_main_with_many_modes` tests that only one of the validation
+       mode flags can be used
 """
 
 
@@ -10,6 +12,7 @@ import io
 import unittest
 
 from collections import namedtuple
+from typing import List
 from parameterized import parameterized
 from unittest.mock import MagicMock
 from unittest.mock import Mock
@@ -22,7 +25,15 @@ from yamlator.cmd.outputs import SuccessCode
 from tests.cmd import constants
 
 
-ValidateArgs = namedtuple('ValidateArgs', ['file', 'ruleset_schema', 'output'])
+ValidateArgs = namedtuple('ValidateArgs',
+                          ['file', 'ruleset_schema', 'output',
+                           'schema_cache', 'schema_workers',
+                           'max_violations', 'fail_fast', 'loader',
+                           'minimal_types', 'mode'])
+
+# The `defaults` argument of `namedtuple` requires Python 3.7
+ValidateArgs.__new__.__defaults__ = (None, None, None, False, 'auto', False,
+                                     'load')
 
 
 class TestMain(unittest.TestCase):
@@ -78,6 +89,157 @@ class TestMain(unittest.TestCase):
             constants.VALID_YAML_DATA,
             constants.SELF_CYCLE_SCHEMA,
             DisplayMethod.TABLE.value
+        ), SuccessCode.ERR),
+        ('with_schema_workers', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            schema_workers=2
+        ), SuccessCode.SUCCESS),
+        ('with_invalid_schema_workers', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            schema_workers=0
+        ), SuccessCode.ERR),
+        ('with_compiled_schema', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_COMPILED_SCHEMA,
+            DisplayMethod.TABLE.value
+        ), SuccessCode.SUCCESS),
+        ('with_invalid_compiled_schema', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.INVALID_COMPILED_SCHEMA,
+            DisplayMethod.TABLE.value
+        ), SuccessCode.ERR),
+        ('with_max_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            max_violations=2
+        ), SuccessCode.ERR),
+        ('with_invalid_max_violations', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            max_violations=0
+        ), SuccessCode.ERR),
+        ('with_fail_fast', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            fail_fast=True
+        ), SuccessCode.ERR),
+        ('with_python_loader', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            loader='python'
+        ), SuccessCode.SUCCESS),
+        ('with_invalid_loader', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            loader='unknown'
+        ), SuccessCode.ERR),
+        ('with_minimal_types', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            minimal_types=True
+        ), SuccessCode.SUCCESS),
+        ('with_streaming', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='streaming'
+        ), SuccessCode.SUCCESS),
+        ('with_streaming_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='streaming'
+        ), SuccessCode.ERR),
+        ('with_streaming_max_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            max_violations=2,
+            mode='streaming'
+        ), SuccessCode.ERR),
+        ('with_streaming_yaml_data_not_found', ValidateArgs(
+            constants.NOT_FOUND_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='streaming'
+        ), SuccessCode.ERR),
+        ('with_node_mode', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='nodes'
+        ), SuccessCode.SUCCESS),
+        ('with_node_mode_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.JSON.value,
+            mode='nodes'
+        ), SuccessCode.ERR),
+        ('with_node_mode_max_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            max_violations=2,
+            mode='nodes'
+        ), SuccessCode.ERR),
+        ('with_node_mode_empty_yaml_file_path', ValidateArgs(
+            '',
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='nodes'
+        ), SuccessCode.ERR),
+        ('with_multi_doc', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='multi-doc'
+        ), SuccessCode.SUCCESS),
+        ('with_multi_doc_violations', ValidateArgs(
+            constants.MULTI_DOCUMENT_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='multi-doc'
+        ), SuccessCode.ERR),
+        ('with_multi_doc_max_violations', ValidateArgs(
+            constants.MULTI_DOCUMENT_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.YAML.value,
+            max_violations=1,
+            mode='multi-doc'
+        ), SuccessCode.ERR),
+        ('with_invalid_mode', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='unknown'
+        ), SuccessCode.ERR),
+        ('with_lazy_load', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='lazy'
+        ), SuccessCode.SUCCESS),
+        ('with_lazy_load_violations', ValidateArgs(
+            constants.INVALID_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.JSON.value,
+            mode='lazy'
+        ), SuccessCode.ERR),
+        ('with_lazy_load_yaml_data_not_found', ValidateArgs(
+            constants.NOT_FOUND_YAML_DATA,
+            constants.VALID_SCHEMA,
+            DisplayMethod.TABLE.value,
+            mode='lazy'
         ), SuccessCode.ERR)
     ])
     @patch('argparse.ArgumentParser')
@@ -92,9 +254,26 @@ class TestMain(unittest.TestCase):
 
         # Suppress the print statements
         with patch('sys.stdout', new=io.StringIO()):
-            status_code = main()
+            status_code = main([])
             self.assertEqual(expected_status_code, status_code)
 
+    @parameterized.expand([
+        ('with_streaming_and_node_mode', ['--streaming', '--node-mode']),
+        ('with_streaming_and_multi_doc', ['--streaming', '--multi-doc']),
+        ('with_multi_doc_and_lazy_load', ['--multi-doc', '--lazy-load']),
+    ])
+    def test_main_with_many_modes(self, name: str, mode_args: List[str]):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        argv = [constants.VALID_YAML_DATA, '-s', constants.VALID_SCHEMA,
+                *mode_args]
+
+        # Suppress the usage message
+        with patch('sys.stderr', new=io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(argv)
+
 
 if __name__ == '__main__':
     unittest.main()
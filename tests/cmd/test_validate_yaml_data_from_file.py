@@ -5,6 +5,18 @@ Test Cases:
       expected exception is raised when invalid arguments are provided
     * `test_validate_yaml_data_from_file_with_valid_data` with expected
        valid data provides the correct amount of violations
+    * `test_validate_yaml_data_from_file_with_streaming` tests that
+       streaming the YAML file detects the same violations as loading it
+    * `test_validate_yaml_data_from_file_with_node_mode` tests that
+       validating the nodes of the YAML file detects the same violations,
+       in the same order, as loading it
+    * `test_validate_yaml_data_from_file_with_multi_doc` tests that each
+       document in the YAML file is validated
+    * `test_validate_yaml_data_from_file_with_lazy_load` tests that only
+       constructing the values the schema validates detects the same
+       violations as loading the whole YAML file
+    * `test_validate_yaml_data_from_file_with_invalid_mode` tests that a
+       mode that is not supported raises a `ValueError`
 """
 
 
@@ -16,6 +28,7 @@ from parameterized import parameterized
 
 from yamlator.cmd import validate_yaml_data_from_file
 from yamlator.exceptions import InvalidSchemaFilenameError
+from yamlator.exceptions import InvalidCompiledSchemaError
 
 from tests.cmd import constants
 
@@ -65,7 +78,15 @@ class TestValidateYamlDataFromFile(unittest.TestCase):
         ('schema_invalid_file_extension', ValidateArgs(
             constants.VALID_YAML_DATA,
             constants.INVALID_SCHEMA_EXTENSION
-        ), InvalidSchemaFilenameError)
+        ), InvalidSchemaFilenameError),
+        ('compiled_schema_file_not_found', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.NOT_FOUND_COMPILED_SCHEMA
+        ), FileNotFoundError),
+        ('compiled_schema_with_invalid_content', ValidateArgs(
+            constants.VALID_YAML_DATA,
+            constants.INVALID_COMPILED_SCHEMA
+        ), InvalidCompiledSchemaError)
     ])
     def test_validate_yaml_data_from_file_with_invalid_args(self, name: str,
                                                             args: ValidateArgs,
@@ -77,11 +98,19 @@ class TestValidateYamlDataFromFile(unittest.TestCase):
             validate_yaml_data_from_file(args.yaml_filepath,
                                          args.schema_filepath)
 
-    def test_validate_yaml_data_from_file_with_valid_data(self):
+    @parameterized.expand([
+        ('with_schema', constants.VALID_SCHEMA),
+        ('with_compiled_schema', constants.VALID_COMPILED_SCHEMA),
+    ])
+    def test_validate_yaml_data_from_file_with_valid_data(self, name: str,
+                                                          schema_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
         expected_violation_count = 0
         violations = validate_yaml_data_from_file(
             yaml_filepath=constants.VALID_YAML_DATA,
-            schema_filepath=constants.VALID_SCHEMA
+            schema_filepath=schema_path
         )
         actual_violation_count = len(violations)
 
@@ -89,6 +118,90 @@ class TestValidateYamlDataFromFile(unittest.TestCase):
         self.assertEqual(expected_violation_count,
                          actual_violation_count)
 
+    @parameterized.expand([
+        ('with_valid_data', constants.VALID_YAML_DATA),
+        ('with_invalid_data', constants.INVALID_YAML_DATA),
+    ])
+    def test_validate_yaml_data_from_file_with_streaming(self, name: str,
+                                                         yaml_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        expected = validate_yaml_data_from_file(yaml_path,
+                                                constants.VALID_SCHEMA)
+        violations = validate_yaml_data_from_file(yaml_path,
+                                                  constants.VALID_SCHEMA,
+                                                  mode='streaming')
+
+        self.assertCountEqual([(v.key, v.parent, v.message)
+                               for v in expected],
+                              [(v.key, v.parent, v.message)
+                               for v in violations])
+
+    @parameterized.expand([
+        ('with_valid_data', constants.VALID_YAML_DATA),
+        ('with_invalid_data', constants.INVALID_YAML_DATA),
+    ])
+    def test_validate_yaml_data_from_file_with_node_mode(self, name: str,
+                                                         yaml_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        expected = validate_yaml_data_from_file(yaml_path,
+                                                constants.VALID_SCHEMA)
+        violations = validate_yaml_data_from_file(yaml_path,
+                                                  constants.VALID_SCHEMA,
+                                                  mode='nodes')
+
+        self.assertEqual([(v.key, v.parent, v.message) for v in expected],
+                         [(v.key, v.parent, v.message) for v in violations])
+        self.assertTrue(all(v.line is not None for v in violations))
+
+    @parameterized.expand([
+        ('with_single_document', constants.VALID_YAML_DATA, None, []),
+        ('with_many_documents', constants.MULTI_DOCUMENT_YAML_DATA, None,
+         [(1, 'number'), (3, 'message')]),
+        ('with_max_violations', constants.MULTI_DOCUMENT_YAML_DATA, 1,
+         [(1, 'number')]),
+    ])
+    def test_validate_yaml_data_from_file_with_multi_doc(
+            self, name: str, yaml_path: str, max_violations: int,
+            expected_violations: list):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        violations = validate_yaml_data_from_file(yaml_path,
+                                                  constants.VALID_SCHEMA,
+                                                  max_violations=max_violations,
+                                                  mode='multi-doc')
+
+        self.assertEqual(expected_violations,
+                         [(v.document, v.key) for v in violations])
+
+    @parameterized.expand([
+        ('with_valid_data', constants.VALID_YAML_DATA),
+        ('with_invalid_data', constants.INVALID_YAML_DATA),
+    ])
+    def test_validate_yaml_data_from_file_with_lazy_load(self, name: str,
+                                                         yaml_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        expected = validate_yaml_data_from_file(yaml_path,
+                                                constants.VALID_SCHEMA)
+        violations = validate_yaml_data_from_file(yaml_path,
+                                                  constants.VALID_SCHEMA,
+                                                  mode='lazy')
+
+        self.assertEqual([(v.key, v.parent, v.message) for v in expected],
+                         [(v.key, v.parent, v.message) for v in violations])
+
+    def test_validate_yaml_data_from_file_with_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            validate_yaml_data_from_file(constants.VALID_YAML_DATA,
+                                         constants.VALID_SCHEMA,
+                                         mode='unknown')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,146 @@
+"""Test cases for reading and writing compiled schemas
+
+Test cases:
+    * `test_compiled_schema_round_trip` tests that a compiled schema
+       loads into a schema that detects the same violations as the
+       original schema
+    * `test_write_and_load_compiled_schema` tests that a compiled schema
+       can be written to and loaded from the file system
+    * `test_parse_compiled_schema_with_invalid_content` tests that
+       content that is not a supported compiled schema raises an
+       `InvalidCompiledSchemaError`
+    * `test_compiled_schema_with_invalid_args` tests the functions with
+       arguments that are `None` or empty
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from parameterized import parameterized
+
+from yamlator.compiled_schema import dump_compiled_schema
+from yamlator.compiled_schema import load_compiled_schema
+from yamlator.compiled_schema import parse_compiled_schema
+from yamlator.compiled_schema import write_compiled_schema
+from yamlator.exceptions import InvalidCompiledSchemaError
+from yamlator.parser import parse_yamlator_schema
+from yamlator.utils import load_yaml_file
+from yamlator.validators.core import validate_yaml
+
+from tests.cmd import constants
+
+
+def _describe(violations) -> list:
+    return [(type(v), v.key, v.parent, v.message) for v in violations]
+
+
+class TestCompiledSchema(unittest.TestCase):
+    """Tests for reading and writing compiled schemas"""
+
+    @parameterized.expand([
+        ('with_valid_schema', constants.VALID_SCHEMA,
+            constants.VALID_YAML_DATA),
+        ('with_valid_schema_and_invalid_data', constants.VALID_SCHEMA,
+            constants.INVALID_YAML_DATA),
+        ('with_inheritance_and_imports', constants.VALID_INHERITANCE_SCHEMA,
+            constants.VALID_YAML_DATA),
+        ('with_keyless_directive', constants.VALID_KEYLESS_DIRECTIVE_SCHEMA,
+            constants.VALID_YAML_DATA),
+    ])
+    def test_compiled_schema_round_trip(self, name: str, schema_path: str,
+                                        yaml_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_yamlator_schema(schema_path)
+        content = dump_compiled_schema(schema)
+        compiled_schema = parse_compiled_schema(content)
+
+        self.assertEqual(content, dump_compiled_schema(compiled_schema))
+
+        yaml_data = load_yaml_file(yaml_path)
+        self.assertEqual(_describe(validate_yaml(yaml_data, schema)),
+                         _describe(validate_yaml(yaml_data, compiled_schema)))
+
+    def test_write_and_load_compiled_schema(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        compiled_path = os.path.join(tmp_dir, 'schema.ysc')
+
+        schema = parse_yamlator_schema(constants.VALID_SCHEMA)
+        write_compiled_schema(schema, compiled_path)
+        compiled_schema = load_compiled_schema(compiled_path)
+
+        self.assertEqual(list(schema.rulesets), list(compiled_schema.rulesets))
+        self.assertEqual(list(schema.enums), list(compiled_schema.enums))
+
+    @parameterized.expand([
+        ('with_invalid_json', '{"format":'),
+        ('with_json_list', '[]'),
+        ('with_unknown_format', json.dumps({'format': 'other'})),
+        ('with_unsupported_version', json.dumps({
+            'format': 'yamlator-compiled-schema', 'version': 0
+        })),
+        ('with_missing_fields', json.dumps({
+            'format': 'yamlator-compiled-schema', 'version': 1
+        })),
+        ('with_unknown_type', json.dumps({
+            'format': 'yamlator-compiled-schema',
+            'version': 1,
+            'root': {
+                'name': 'main',
+                'rules': [
+                    {'name': 'a', 'type': {'type': 'DATE'}, 'required': True}
+                ],
+                'strict': False,
+                'parent': None
+            },
+            'rulesets': {},
+            'enums': {}
+        })),
+        ('with_invalid_regex', json.dumps({
+            'format': 'yamlator-compiled-schema',
+            'version': 1,
+            'root': {
+                'name': 'main',
+                'rules': [{
+                    'name': 'a',
+                    'type': {'type': 'REGEX', 'regex': '[a-z'},
+                    'required': True
+                }],
+                'strict': False,
+                'parent': None
+            },
+            'rulesets': {},
+            'enums': {}
+        })),
+    ])
+    def test_parse_compiled_schema_with_invalid_content(self, name: str,
+                                                        content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(InvalidCompiledSchemaError):
+            parse_compiled_schema(content)
+
+    @parameterized.expand([
+        ('dump_with_none_schema', dump_compiled_schema, (None,)),
+        ('write_with_empty_filename', write_compiled_schema, (None, '')),
+        ('parse_with_none_content', parse_compiled_schema, (None,)),
+        ('load_with_none_filename', load_compiled_schema, (None,)),
+        ('load_with_empty_filename', load_compiled_schema, ('',)),
+    ])
+    def test_compiled_schema_with_invalid_args(self, name: str, func,
+                                               args: tuple):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            func(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Test cases for importing the public API lazily
+
+Test cases:
+    * `test_import_does_not_import_modules` tests that importing a
+       package does not import the modules that its attributes are
+       defined in
+    * `test_lazy_attribute_is_defined_module_attribute` tests that the
+       lazy attributes are the attributes from the defining module
+    * `test_missing_lazy_attribute` tests that accessing an attribute
+       that is not defined raises an `AttributeError`
+"""
+
+import sys
+import unittest
+import subprocess
+
+from parameterized import parameterized
+
+import yamlator
+import yamlator.parser
+import yamlator.cmd.outputs
+
+from yamlator import compiled_schema
+from yamlator import exceptions
+from yamlator.validators import core
+from yamlator.cmd.outputs import json_output
+
+_OUTPUT_MODULES = [
+    'yamlator.cmd.outputs.json_output',
+    'yamlator.cmd.outputs.table_output',
+    'yamlator.cmd.outputs.yaml_output',
+]
+
+_HEAVY_MODULES = [
+    'lark',
+    'argparse',
+    'yaml',
+    'yamlator.parser.core',
+    'yamlator.cmd.core',
+    *_OUTPUT_MODULES
+]
+
+
+def _imported_modules(code: str) -> set:
+    check = ('import sys\n'
+             f'{code}\n'
+             'print("\\n".join(sys.modules))\n')
+    result = subprocess.run([sys.executable, '-c', check], check=True,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    return set(result.stdout.splitlines())
+
+
+class TestLazyImports(unittest.TestCase):
+    """Tests that the public API is imported lazily"""
+
+    @parameterized.expand([
+        ('yamlator', 'import yamlator', _HEAVY_MODULES),
+        ('yamlator_parser', 'import yamlator.parser', _HEAVY_MODULES),
+        ('yamlator_outputs', 'import yamlator.cmd.outputs',
+         ['lark', 'argparse', 'yamlator.parser.core', *_OUTPUT_MODULES]),
+        ('validate_with_compiled_schema', (
+            'import yamlator\n'
+            'schema = yamlator.load_compiled_schema('
+            '"./tests/files/valid/valid.ysc")\n'
+            'yamlator.validate_yaml({}, schema)'
+        ), _HEAVY_MODULES)
+    ])
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     'module __getattr__ requires 3.7')
+    def test_import_does_not_import_modules(self, name: str, code: str,
+                                            modules: list):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        imported_modules = _imported_modules(code)
+        for module in modules:
+            self.assertNotIn(module, imported_modules)
+
+    @parameterized.expand([
+        ('validate_yaml', yamlator, core),
+        ('load_compiled_schema', yamlator, compiled_schema),
+        ('SchemaSyntaxError', yamlator.parser, exceptions),
+        ('JSONOutput', yamlator.cmd.outputs, json_output)
+    ])
+    def test_lazy_attribute_is_defined_module_attribute(self, name: str,
+                                                        package, module):
+        self.assertIs(getattr(module, name), getattr(package, name))
+        self.assertIn(name, dir(package))
+
+    def test_missing_lazy_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(yamlator, 'not_defined')
+
+
+if __name__ == '__main__':
+    unittest.main()
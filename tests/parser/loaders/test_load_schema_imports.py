@@ -1,7 +1,10 @@
 """Test cases for the load_schema_imports function"""
+import os
 import hashlib
 import unittest
 
+from collections import Counter
+from unittest.mock import patch
 from parameterized import parameterized
 
 from yamlator.types import Rule
@@ -12,10 +15,15 @@ from yamlator.types import YamlatorRuleset
 from yamlator.types import PartiallyLoadedYamlatorSchema
 from yamlator.parser.loaders import load_schema_imports
 from yamlator.parser.dependency import DependencyManager
+from yamlator.parser import parse_schema
+from yamlator.parser import clear_schema_cache
 from yamlator.exceptions import CycleDependencyError
 from yamlator.utils import load_schema
 
 
+_LOAD_SCHEMA = 'yamlator.parser.loaders.load_schema'
+
+
 def create_basic_loaded_schema():
     root = YamlatorRuleset('main', [])
     return PartiallyLoadedYamlatorSchema(
@@ -186,6 +194,43 @@ class TestLoadSchemaImports(unittest.TestCase):
             load_schema_imports(loaded_schema, schema_path,
                                 schema_hash, self.dependencies)
 
+    def test_load_schema_imports_loads_shared_import_once(self):
+        clear_schema_cache()
+        schema_path = './tests/files/valid/diamond'
+
+        # Both left.ys and right.ys import common.ys, which is also
+        # imported directly by the root schema
+        root_content = load_schema(f'{schema_path}/root.ys')
+        loaded_schema = parse_schema(root_content)
+        root_hash = self.dependencies.add(root_content)
+
+        with patch(_LOAD_SCHEMA, wraps=load_schema) as mock_load_schema:
+            schema = load_schema_imports(loaded_schema, schema_path,
+                                         root_hash, self.dependencies)
+
+            loaded_files = Counter(os.path.basename(call.args[0])
+                                   for call in mock_load_schema.call_args_list)
+
+        self.assertEqual({'left.ys': 1, 'right.ys': 1, 'common.ys': 1},
+                         loaded_files)
+        self.assertEqual(['Employee', 'Manager'], sorted(schema.rulesets))
+        self.assertEqual(['Status'], list(schema.enums))
+        self.assertEqual(SchemaTypes.ENUM,
+                         schema.root.rules[2].rtype.schema_type)
+
+    def test_load_schema_imports_indirect_cycle_raises_error(self):
+        schema_path = './tests/files/invalid_files/cycles'
+
+        # indirect_first.ys and indirect_second.ys import each other, which
+        # does not include the root schema in the cycle
+        root_content = load_schema(f'{schema_path}/indirect_root.ys')
+        loaded_schema = parse_schema(root_content)
+        root_hash = self.dependencies.add(root_content)
+
+        with self.assertRaises(CycleDependencyError):
+            load_schema_imports(loaded_schema, schema_path,
+                                root_hash, self.dependencies)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,180 @@
+"""Test cases for loading the imported schema files concurrently
+
+Test cases:
+    * `test_prefetch_schema_imports` tests that every schema file in the
+       import graph is read and parsed
+    * `test_prefetch_schema_imports_skips_invalid_files` tests that schema
+       files that cannot be loaded are left out
+    * `test_prefetch_schema_imports_uses_pool` tests that the pool is only
+       used for a level with enough files when there is more than one CPU
+    * `test_parse_yamlator_schema_with_workers` tests that the schema loaded
+       with workers matches the schema loaded one file at a time
+    * `test_parse_yamlator_schema_with_workers_raises_error` tests that the
+       same error is raised with and without workers
+    * `test_parse_yamlator_schema_with_invalid_workers` tests that an
+       invalid number of workers raises a `ValueError`
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from typing import Any
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.types import YamlatorSchema
+from yamlator.utils import load_schema
+from yamlator.parser import parse_schema
+from yamlator.parser import clear_schema_cache
+from yamlator.parser import parse_yamlator_schema
+from yamlator.parser.cache import fetch_file_stamp
+from yamlator.parser.loaders import ProcessPoolExecutor
+from yamlator.parser.loaders import prefetch_schema_imports
+
+
+_DIAMOND_PATH = './tests/files/valid/diamond'
+_CYCLES_PATH = './tests/files/invalid_files/cycles'
+
+_CPU_COUNT = 'yamlator.parser.loaders.os.cpu_count'
+_PROCESS_POOL = 'yamlator.parser.loaders.ProcessPoolExecutor'
+
+
+def _describe_schema(schema: YamlatorSchema) -> dict:
+    def describe_rules(ruleset):
+        return [(rule.name, str(rule.rtype), rule.is_required)
+                for rule in ruleset.rules]
+
+    return {
+        'root': describe_rules(schema.root),
+        'rulesets': {name: describe_rules(ruleset)
+                     for name, ruleset in schema.rulesets.items()},
+        'enums': {name: dict(enum.items)
+                  for name, enum in schema.enums.items()}
+    }
+
+
+class TestPrefetchSchemaImports(unittest.TestCase):
+    """Tests loading the imported schema files concurrently"""
+
+    def setUp(self):
+        clear_schema_cache()
+
+    def tearDown(self):
+        clear_schema_cache()
+
+    def test_prefetch_schema_imports(self):
+        loaded_schema = parse_schema(load_schema(f'{_DIAMOND_PATH}/root.ys'))
+
+        prefetched_schemas = prefetch_schema_imports(loaded_schema,
+                                                     _DIAMOND_PATH, 2)
+
+        expected_files = ['common.ys', 'left.ys', 'right.ys']
+        actual_files = sorted(os.path.basename(path)
+                              for path in prefetched_schemas)
+        self.assertEqual(expected_files, actual_files)
+
+        for path, prefetched_schema in prefetched_schemas.items():
+            content, parsed_schema, stamp = prefetched_schema
+            self.assertEqual(load_schema(path), content)
+            self.assertIsNotNone(parsed_schema.root)
+            self.assertEqual(fetch_file_stamp(path), stamp)
+
+    def test_prefetch_schema_imports_skips_invalid_files(self):
+        loaded_schema = parse_schema(
+            'import Missing from "not_found.ys"\n'
+            'import Status from "common.ys"\n'
+        )
+
+        prefetched_schemas = prefetch_schema_imports(loaded_schema,
+                                                     _DIAMOND_PATH, 2)
+
+        actual_files = [os.path.basename(path) for path in prefetched_schemas]
+        self.assertEqual(['common.ys'], actual_files)
+
+    @parameterized.expand([
+        ('with_enough_files', 8, 4, True),
+        ('with_too_few_files', 7, 4, False),
+        ('with_one_cpu', 8, 1, False),
+    ])
+    def test_prefetch_schema_imports_uses_pool(self, name: str,
+                                               file_count: int,
+                                               cpu_count: int,
+                                               expected_pool: bool):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, schema_dir)
+
+        imports = []
+        for index in range(file_count):
+            path = os.path.join(schema_dir, f'file{index}.ys')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'ruleset File{index} {{\n    name str\n}}\n')
+            imports.append(f'import File{index} from "file{index}.ys"')
+        loaded_schema = parse_schema('\n'.join(imports))
+
+        with patch(_CPU_COUNT, return_value=cpu_count), \
+                patch(_PROCESS_POOL, wraps=ProcessPoolExecutor) as mock_pool:
+            prefetched_schemas = prefetch_schema_imports(loaded_schema,
+                                                         schema_dir, 4)
+
+        self.assertEqual(expected_pool, mock_pool.called)
+        self.assertEqual(file_count, len(prefetched_schemas))
+
+    @parameterized.expand([
+        ('with_diamond_imports', f'{_DIAMOND_PATH}/root.ys'),
+        ('with_imports', './tests/files/valid/with_imports.ys'),
+        ('with_namespace_imports',
+            './tests/files/valid/with_import_and_namespaces.ys'),
+    ])
+    def test_parse_yamlator_schema_with_workers(self, name: str,
+                                                schema_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        expected_schema = parse_yamlator_schema(schema_path)
+        clear_schema_cache()
+        schema = parse_yamlator_schema(schema_path, workers=2)
+
+        self.assertEqual(_describe_schema(expected_schema),
+                         _describe_schema(schema))
+
+    @parameterized.expand([
+        ('with_cycle', f'{_CYCLES_PATH}/root.ys'),
+        ('with_indirect_cycle', f'{_CYCLES_PATH}/indirect_root.ys'),
+        ('with_self_cycle', f'{_CYCLES_PATH}/self_cycle.ys'),
+        ('with_imported_syntax_error',
+            './tests/files/invalid_files/imports_invalid_syntax.ys'),
+    ])
+    def test_parse_yamlator_schema_with_workers_raises_error(self, name: str,
+                                                             schema_path: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(Exception) as expected:
+            parse_yamlator_schema(schema_path)
+
+        with self.assertRaises(type(expected.exception)) as actual:
+            parse_yamlator_schema(schema_path, workers=2)
+
+        self.assertEqual(str(expected.exception), str(actual.exception))
+
+    @parameterized.expand([
+        ('with_zero_workers', 0),
+        ('with_negative_workers', -1),
+        ('with_str_workers', '2'),
+    ])
+    def test_parse_yamlator_schema_with_invalid_workers(self, name: str,
+                                                        workers: Any):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            parse_yamlator_schema(f'{_DIAMOND_PATH}/root.ys', workers=workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 
 from typing import Any
+from unittest.mock import patch
 from parameterized import parameterized
 
 from yamlator.types import Rule
@@ -12,6 +13,19 @@ from yamlator.types import YamlatorRuleset
 from yamlator.exceptions import ConstructNotFoundError
 from yamlator.exceptions import CycleDependencyError
 from yamlator.parser.loaders import resolve_ruleset_inheritance
+from yamlator.parser.loaders import _merge_rulesets
+
+
+_MERGE_RULESETS = 'yamlator.parser.loaders._merge_rulesets'
+
+
+def create_ruleset(name: str, parent: str = None,
+                   rule_names: list = None) -> YamlatorRuleset:
+    rules = [Rule(rule_name, RuleType(SchemaTypes.STR), True)
+             for rule_name in (rule_names or [])]
+    if parent is not None:
+        parent = RuleType(SchemaTypes.RULESET, lookup=parent)
+    return YamlatorRuleset(name=name, rules=rules, parent=parent)
 
 
 class TestResolveRulesetInheritance(unittest.TestCase):
@@ -264,6 +278,110 @@ class TestResolveRulesetInheritance(unittest.TestCase):
         self.assertEqual(expected_bar_rule_count, actual_bar_rule_count)
         self.assertEqual(expected_baz_rule_count, actual_baz_rule_count)
 
+    def test_resolve_ruleset_inheritance_keeps_rule_order(self):
+        rulesets = {
+            'Foo': create_ruleset('Foo', 'Bar', ['b', 'd']),
+            'Bar': create_ruleset('Bar', rule_names=['a', 'b', 'c'])
+        }
+
+        updated_rules = resolve_ruleset_inheritance(rulesets)
+
+        # Overridden rules keep the position of the parent rule and new
+        # rules are added after the parent rules
+        rule_names = [rule.name for rule in updated_rules['Foo'].rules]
+        self.assertEqual(['a', 'b', 'c', 'd'], rule_names)
+        self.assertIs(rulesets['Foo'].rules[0], updated_rules['Foo'].rules[1])
+
+    def test_resolve_ruleset_inheritance_shares_parent_rules(self):
+        rulesets = {
+            'Foo': create_ruleset('Foo', 'Bar'),
+            'Bar': create_ruleset('Bar', 'Baz', ['b']),
+            'Baz': create_ruleset('Baz', rule_names=['a'])
+        }
+
+        updated_rules = resolve_ruleset_inheritance(rulesets)
+
+        self.assertIs(updated_rules['Bar'].rules, updated_rules['Foo'].rules)
+        self.assertIs(rulesets['Baz'], updated_rules['Baz'])
+
+    def test_resolve_ruleset_inheritance_with_long_chain(self):
+        depth = 1000
+        rulesets = {'Ruleset0': create_ruleset('Ruleset0', rule_names=['r0'])}
+        for level in range(1, depth):
+            rulesets[f'Ruleset{level}'] = create_ruleset(
+                f'Ruleset{level}', f'Ruleset{level - 1}', [f'r{level}'])
+
+        with patch(_MERGE_RULESETS, wraps=_merge_rulesets) as mock_merge:
+            updated_rules = resolve_ruleset_inheritance(rulesets)
+            self.assertEqual(depth - 1, mock_merge.call_count)
+
+        rule_names = [rule.name for rule in updated_rules['Ruleset999'].rules]
+        self.assertEqual([f'r{level}' for level in range(depth)], rule_names)
+
+    def test_resolve_ruleset_inheritance_with_large_forest(self):
+        tree_count = 100
+        tree_size = 100
+
+        # Each tree has a single root ruleset where every other ruleset
+        # inherits from a ruleset that is defined after it
+        rulesets = {}
+        for tree in range(tree_count):
+            for index in range(1, tree_size):
+                parent = f'Tree{tree}Ruleset{index // 2}'
+                name = f'Tree{tree}Ruleset{index}'
+                rulesets[name] = create_ruleset(name, parent, [name])
+            name = f'Tree{tree}Ruleset0'
+            rulesets[name] = create_ruleset(name, rule_names=[name])
+
+        with patch(_MERGE_RULESETS, wraps=_merge_rulesets) as mock_merge:
+            updated_rules = resolve_ruleset_inheritance(rulesets)
+            self.assertEqual(tree_count * (tree_size - 1),
+                             mock_merge.call_count)
+
+        self.assertEqual(tree_count * tree_size, len(updated_rules))
+        ruleset = updated_rules['Tree0Ruleset99']
+        rule_names = [rule.name for rule in ruleset.rules]
+        self.assertEqual(['Tree0Ruleset0', 'Tree0Ruleset1', 'Tree0Ruleset3',
+                          'Tree0Ruleset6', 'Tree0Ruleset12', 'Tree0Ruleset24',
+                          'Tree0Ruleset49', 'Tree0Ruleset99'], rule_names)
+
+    def test_resolve_ruleset_inheritance_with_repeated_sibling_rules(self):
+        depth = 100
+        sibling_count = 10
+
+        # Every sibling defines the same rule names, so each rule name is
+        # defined in many rulesets without overriding a parent rule
+        rulesets = {'Root': create_ruleset('Root', rule_names=['root'])}
+        parent = 'Root'
+        for level in range(depth):
+            for sibling in range(sibling_count):
+                name = f'Level{level}Sibling{sibling}'
+                rulesets[name] = create_ruleset(
+                    name, parent, [f'level{level}', 'shared'])
+            parent = f'Level{level}Sibling0'
+
+        # The last child overrides the shared rule of its parent
+        rulesets['Leaf'] = create_ruleset('Leaf', parent, ['root', 'leaf'])
+
+        with patch(_MERGE_RULESETS, wraps=_merge_rulesets) as mock_merge:
+            updated_rules = resolve_ruleset_inheritance(rulesets)
+            self.assertEqual(len(rulesets) - 1, mock_merge.call_count)
+
+        ruleset = updated_rules['Level0Sibling9']
+        rule_names = [rule.name for rule in ruleset.rules]
+        self.assertEqual(['root', 'level0', 'shared'], rule_names)
+
+        ruleset = updated_rules['Level1Sibling9']
+        rule_names = [rule.name for rule in ruleset.rules]
+        self.assertEqual(['root', 'level0', 'shared', 'level1'], rule_names)
+
+        expected_names = ['root', 'level0', 'shared']
+        expected_names.extend(f'level{level}' for level in range(1, depth))
+        expected_names.append('leaf')
+        rule_names = [rule.name for rule in updated_rules['Leaf'].rules]
+        self.assertEqual(expected_names, rule_names)
+        self.assertIs(rulesets['Leaf'].rules[0], updated_rules['Leaf'].rules[0])
+
 
 if __name__ == '__main__':
     unittest.main()
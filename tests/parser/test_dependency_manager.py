@@ -2,6 +2,8 @@
 
 import unittest
 
+from parameterized import parameterized
+
 from yamlator.parser.dependency import DependencyManager
 
 
@@ -63,6 +65,62 @@ class TestDependencyManager(unittest.TestCase):
         has_cycle = self.dependencies.has_cycle()
         self.assertTrue(has_cycle)
 
+    def test_dependency_mgmr_add_existing_node_keeps_children(self):
+        n1 = self.dependencies.add('n1')
+        n2 = self.dependencies.add('n2')
+        self.dependencies.add_child(n1, n2)
+
+        self.dependencies.add('n1')
+        self.dependencies.add_child(n2, n1)
+
+        has_cycle = self.dependencies.has_cycle()
+        self.assertTrue(has_cycle)
+
+    @parameterized.expand([
+        ('with_chain_added_in_order', False),
+        ('with_chain_added_in_reverse', True),
+    ])
+    def test_dependency_mgmr_has_cycle_with_long_chain(self, name: str,
+                                                       reverse: bool):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        nodes = [self.dependencies.add(f'n{i}') for i in range(5000)]
+        edges = list(zip(nodes, nodes[1:]))
+        if reverse:
+            edges.reverse()
+
+        for parent, child in edges:
+            self.dependencies.add_child(parent, child)
+        self.assertFalse(self.dependencies.has_cycle())
+
+        self.dependencies.add_child(nodes[-1], nodes[0])
+        self.assertTrue(self.dependencies.has_cycle())
+
+    def test_dependency_mgmr_has_cycle_after_reordering_returns_false(self):
+        n1 = self.dependencies.add('n1')
+        n2 = self.dependencies.add('n2')
+        n3 = self.dependencies.add('n3')
+
+        self.dependencies.add_child(n3, n1)
+        self.dependencies.add_child(n2, n3)
+        self.dependencies.add_child(n3, n1)
+
+        has_cycle = self.dependencies.has_cycle()
+        self.assertFalse(has_cycle)
+
+    def test_dependency_mgmr_graph_is_read_only_view(self):
+        n1 = self.dependencies.add('n1')
+        n2 = self.dependencies.add('n2')
+        graph = self.dependencies.graph
+
+        self.dependencies.add_child(n1, n2)
+
+        self.assertEqual((n2,), graph[n1])
+        self.assertEqual([n1, n2], list(graph))
+        with self.assertRaises(TypeError):
+            graph[n1] = []  # pylint: disable=unsupported-assignment-operation
+
 
 if __name__ == '__main__':
     unittest.main()
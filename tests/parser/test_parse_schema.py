@@ -9,6 +9,8 @@ Test cases:
        valid content returns the expected rule count
     * `test_parse_syntax_errors` tests the parse function with a range
        of different syntax errors using multiple test files
+    * `test_parse_rule_names_matching_keywords` tests that rules can be
+       named after keywords used in the grammar
 """
 
 
@@ -25,6 +27,8 @@ from yamlator.parser import MissingRulesError
 from yamlator.parser import SchemaParseError
 from yamlator.parser import SchemaSyntaxError
 
+from yamlator.types import SchemaTypes
+
 from tests.cmd import constants
 
 
@@ -104,6 +108,24 @@ class TestParseSchema(unittest.TestCase):
         with self.assertRaises(exception_type):
             parse_schema(schema_content)
 
+    def test_parse_rule_names_matching_keywords(self):
+        schema_content = (
+            'schema {\n'
+            '    required str\n'
+            '    optional int optional\n'
+            '    str list(str) required  # comment\n'
+            '}\n'
+        )
+
+        instructions = parse_schema(schema_content)
+        rules = instructions.root.rules
+
+        self.assertEqual(['required', 'optional', 'str'],
+                         [rule.name for rule in rules])
+        self.assertEqual([True, False, True],
+                         [rule.is_required for rule in rules])
+        self.assertEqual(SchemaTypes.LIST, rules[2].rtype.schema_type)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,156 @@
+"""Test cases for the persistent schema cache
+
+Test cases:
+    * `test_schema_cache_with_invalid_cache_dir` tests that the cache
+       cannot be created without a cache directory
+    * `test_parse_yamlator_schema_saves_to_cache` tests that parsing a
+       schema with a cache directory writes an entry to the cache
+    * `test_parse_yamlator_schema_loads_from_cache` tests that an unchanged
+       schema is loaded from the cache without being parsed again
+    * `test_parse_yamlator_schema_with_changed_closure` tests that the
+       cache entry is not used if the schema or an imported schema changed
+    * `test_schema_cache_with_unreadable_entry` tests that an entry that
+       cannot be read is treated as a cache miss
+    * `test_schema_cache_with_deleted_import` tests that an entry is not used
+       when a file it depends on no longer exists
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.parser import parse_yamlator_schema
+from yamlator.parser import set_schema_cache_size
+from yamlator.parser.cache import DEFAULT_SCHEMA_CACHE_SIZE
+from yamlator.parser.cache import SchemaFileCache
+from yamlator.types import SchemaTypes
+
+
+_PARSE_SCHEMA = 'yamlator.parser.loaders.parse_schema'
+
+_BASE_SCHEMA = '''
+ruleset User {
+    name str
+}
+'''
+
+_ROOT_SCHEMA = '''
+import User from "base.ys"
+
+schema {
+    user User
+}
+'''
+
+
+class TestSchemaFileCache(unittest.TestCase):
+    """Tests the persistent schema cache"""
+
+    def setUp(self):
+        # Import statements are resolved relative to the schema path
+        self.tmp_dir = os.path.relpath(tempfile.mkdtemp())
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.root_path = os.path.join(self.tmp_dir, 'root.ys')
+        self.base_path = os.path.join(self.tmp_dir, 'base.ys')
+
+        self._write(self.root_path, _ROOT_SCHEMA)
+        self._write(self.base_path, _BASE_SCHEMA)
+
+        # Schemas loaded from the in-memory cache would bypass the
+        # persistent cache that is being tested
+        set_schema_cache_size(0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        set_schema_cache_size(DEFAULT_SCHEMA_CACHE_SIZE)
+
+    @staticmethod
+    def _write(path: str, content: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    @parameterized.expand([
+        ('with_none_cache_dir', None),
+        ('with_empty_cache_dir', ''),
+    ])
+    def test_schema_cache_with_invalid_cache_dir(self, name: str,
+                                                 cache_dir: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            SchemaFileCache(cache_dir)
+
+    def test_parse_yamlator_schema_saves_to_cache(self):
+        schema = parse_yamlator_schema(self.root_path, self.cache_dir)
+
+        cached_schema = SchemaFileCache(self.cache_dir).load(self.root_path)
+        self.assertIsNotNone(cached_schema)
+        self.assertEqual(list(schema.rulesets), list(cached_schema.rulesets))
+
+    def test_parse_yamlator_schema_loads_from_cache(self):
+        parse_yamlator_schema(self.root_path, self.cache_dir)
+
+        with patch(_PARSE_SCHEMA) as mock_parse_schema:
+            schema = parse_yamlator_schema(self.root_path, self.cache_dir)
+            mock_parse_schema.assert_not_called()
+
+        user_rule = schema.root.rules[0]
+        self.assertEqual('user', user_rule.name)
+        self.assertEqual(SchemaTypes.RULESET, user_rule.rtype.schema_type)
+        self.assertIn('User', schema.rulesets)
+
+    @parameterized.expand([
+        ('with_changed_root_schema', 'root.ys',
+            _ROOT_SCHEMA.replace('user User', 'user User optional')),
+        ('with_changed_imported_schema', 'base.ys',
+            _BASE_SCHEMA.replace('name str', 'name int')),
+    ])
+    def test_parse_yamlator_schema_with_changed_closure(self, name: str,
+                                                        filename: str,
+                                                        content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        parse_yamlator_schema(self.root_path, self.cache_dir)
+        self._write(os.path.join(self.tmp_dir, filename), content)
+
+        expected_schema = parse_yamlator_schema(self.root_path)
+        schema = parse_yamlator_schema(self.root_path, self.cache_dir)
+
+        expected_rules = [(rule.name, rule.rtype.schema_type, rule.is_required)
+                          for rule in expected_schema.rulesets['User'].rules]
+        actual_rules = [(rule.name, rule.rtype.schema_type, rule.is_required)
+                        for rule in schema.rulesets['User'].rules]
+        self.assertEqual(expected_rules, actual_rules)
+        self.assertEqual(expected_schema.root.rules[0].is_required,
+                         schema.root.rules[0].is_required)
+
+    def test_schema_cache_with_unreadable_entry(self):
+        schema_cache = SchemaFileCache(self.cache_dir)
+        parse_yamlator_schema(self.root_path, self.cache_dir)
+
+        # pylint: disable=protected-access
+        entry_path = schema_cache._entry_path(self.root_path)
+        with open(entry_path, 'wb') as f:
+            f.write(b'not a cached schema')
+
+        self.assertIsNone(schema_cache.load(self.root_path))
+        schema = parse_yamlator_schema(self.root_path, self.cache_dir)
+        self.assertIn('User', schema.rulesets)
+
+    def test_schema_cache_with_deleted_import(self):
+        parse_yamlator_schema(self.root_path, self.cache_dir)
+        os.remove(self.base_path)
+
+        self.assertIsNone(SchemaFileCache(self.cache_dir).load(self.root_path))
+        with self.assertRaises(FileNotFoundError):
+            parse_yamlator_schema(self.root_path, self.cache_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
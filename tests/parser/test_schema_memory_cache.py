@@ -0,0 +1,222 @@
+"""Test cases for the in-memory schema caches
+
+Test cases:
+    * `test_lru_cache_evicts_least_recently_used` tests that the least
+       recently used entry is evicted once the cache is full
+    * `test_lru_cache_with_invalid_maxsize` tests that the cache cannot
+       be given a negative or non-integer size
+    * `test_lru_cache_with_stale_entry` tests that an entry rejected by
+       the validation function is removed and counted as a miss
+    * `test_parse_schema_uses_content_cache` tests that parsing the same
+       content twice only parses the content once
+    * `test_parse_schema_returns_independent_copies` tests that changes to
+       a parsed schema do not affect later calls with the same content
+    * `test_parse_yamlator_schema_uses_file_cache` tests that an unchanged
+       schema file is not parsed again
+    * `test_parse_yamlator_schema_with_modified_file` tests that a schema
+       is parsed again when a file in the import closure is modified
+    * `test_parse_yamlator_schema_with_file_modified_after_read` tests that
+       a schema is parsed again when a file is modified after it was read
+    * `test_parse_yamlator_schema_does_not_read_files_again` tests that the
+       files are not read again to cache the schema
+    * `test_clear_schema_cache` tests that clearing the caches removes all
+       the entries and resets the statistics
+    * `test_set_schema_cache_size_to_zero` tests that a size of 0 disables
+       the in-memory caches
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.parser import parse_schema
+from yamlator.parser import parse_yamlator_schema
+from yamlator.parser import clear_schema_cache
+from yamlator.parser import schema_cache_info
+from yamlator.parser import set_schema_cache_size
+from yamlator.parser.core import _parse_schema_content
+from yamlator.parser.loaders import load_schema
+from yamlator.parser.cache import LRUCache
+from yamlator.parser.cache import DEFAULT_SCHEMA_CACHE_SIZE
+
+
+_PARSE_CONTENT = 'yamlator.parser.core._parse_schema_content'
+_LOADER_PARSE_SCHEMA = 'yamlator.parser.loaders.parse_schema'
+_LOADER_LOAD_SCHEMA = 'yamlator.parser.loaders.load_schema'
+_HASH_FILE = 'yamlator.parser.cache._hash_file'
+
+_SCHEMA_CONTENT = 'schema {\n    message str\n}\n'
+
+_BASE_SCHEMA = '''
+ruleset User {
+    name str
+}
+'''
+
+_ROOT_SCHEMA = '''
+import User from "base.ys"
+
+schema {
+    user User
+}
+'''
+
+
+class TestLRUCache(unittest.TestCase):
+    """Tests the LRU cache used by the in-memory schema caches"""
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # Accessing `a` makes `b` the least recently used entry
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertEqual((3, 1, 2, 2), tuple(cache.info()))
+
+    @parameterized.expand([
+        ('with_negative_maxsize', -1),
+        ('with_none_maxsize', None),
+        ('with_str_maxsize', '10'),
+    ])
+    def test_lru_cache_with_invalid_maxsize(self, name: str, maxsize):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize)
+
+    def test_lru_cache_with_stale_entry(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+
+        self.assertIsNone(cache.get('a', lambda value: False))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual((0, 2, 2, 0), tuple(cache.info()))
+
+
+class TestSchemaMemoryCache(unittest.TestCase):
+    """Tests the in-memory schema caches used by the parser and loaders"""
+
+    def setUp(self):
+        clear_schema_cache()
+
+        # Import statements are resolved relative to the schema path
+        self.tmp_dir = os.path.relpath(tempfile.mkdtemp())
+        self.root_path = os.path.join(self.tmp_dir, 'root.ys')
+        self.base_path = os.path.join(self.tmp_dir, 'base.ys')
+
+        self._write(self.root_path, _ROOT_SCHEMA)
+        self._write(self.base_path, _BASE_SCHEMA)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        set_schema_cache_size(DEFAULT_SCHEMA_CACHE_SIZE)
+        clear_schema_cache()
+
+    @staticmethod
+    def _write(path: str, content: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def test_parse_schema_uses_content_cache(self):
+        with patch(_PARSE_CONTENT, wraps=_parse_schema_content) as mock_parse:
+            parse_schema(_SCHEMA_CONTENT)
+            parse_schema(_SCHEMA_CONTENT)
+            self.assertEqual(1, mock_parse.call_count)
+
+        self.assertEqual((1, 1), schema_cache_info().contents[:2])
+
+    def test_parse_schema_returns_independent_copies(self):
+        first_schema = parse_schema(_SCHEMA_CONTENT)
+        first_schema.root.rules.clear()
+
+        second_schema = parse_schema(_SCHEMA_CONTENT)
+        self.assertIsNot(first_schema, second_schema)
+        self.assertEqual('message', second_schema.root.rules[0].name)
+
+    def test_parse_yamlator_schema_uses_file_cache(self):
+        first_schema = parse_yamlator_schema(self.root_path)
+
+        with patch(_LOADER_PARSE_SCHEMA) as mock_parse_schema:
+            second_schema = parse_yamlator_schema(self.root_path)
+            mock_parse_schema.assert_not_called()
+
+        self.assertIs(first_schema, second_schema)
+        self.assertEqual((1, 1), schema_cache_info().files[:2])
+
+    @parameterized.expand([
+        ('with_modified_root_schema', 'root.ys'),
+        ('with_modified_imported_schema', 'base.ys'),
+    ])
+    def test_parse_yamlator_schema_with_modified_file(self, name: str,
+                                                      filename: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        first_schema = parse_yamlator_schema(self.root_path)
+
+        path = os.path.join(self.tmp_dir, filename)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        second_schema = parse_yamlator_schema(self.root_path)
+        self.assertIsNot(first_schema, second_schema)
+
+    def test_parse_yamlator_schema_with_file_modified_after_read(self):
+        def load_and_modify_schema(schema_path: str) -> str:
+            content = load_schema(schema_path)
+            if schema_path == self.base_path:
+                stat = os.stat(schema_path)
+                os.utime(schema_path, ns=(stat.st_atime_ns,
+                                          stat.st_mtime_ns + 1000))
+            return content
+
+        with patch(_LOADER_LOAD_SCHEMA, side_effect=load_and_modify_schema):
+            first_schema = parse_yamlator_schema(self.root_path)
+
+        second_schema = parse_yamlator_schema(self.root_path)
+        self.assertIsNot(first_schema, second_schema)
+
+    def test_parse_yamlator_schema_does_not_read_files_again(self):
+        with patch(_LOADER_LOAD_SCHEMA, wraps=load_schema) as mock_load, \
+                patch(_HASH_FILE) as mock_hash_file:
+            parse_yamlator_schema(self.root_path)
+            mock_hash_file.assert_not_called()
+            self.assertEqual(2, mock_load.call_count)
+
+        self.assertEqual(1, schema_cache_info().files.currsize)
+
+    def test_clear_schema_cache(self):
+        parse_yamlator_schema(self.root_path)
+        parse_yamlator_schema(self.root_path)
+        clear_schema_cache()
+
+        info = schema_cache_info()
+        self.assertEqual((0, 0, DEFAULT_SCHEMA_CACHE_SIZE, 0),
+                         tuple(info.files))
+        self.assertEqual((0, 0, DEFAULT_SCHEMA_CACHE_SIZE, 0),
+                         tuple(info.contents))
+
+    def test_set_schema_cache_size_to_zero(self):
+        set_schema_cache_size(0)
+
+        first_schema = parse_yamlator_schema(self.root_path)
+        second_schema = parse_yamlator_schema(self.root_path)
+
+        self.assertIsNot(first_schema, second_schema)
+        self.assertEqual(0, schema_cache_info().files.currsize)
+        self.assertEqual(0, schema_cache_info().contents.currsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+"""Test cases for the shared schema parser
+
+Test cases:
+    * `test_get_schema_parser_returns_same_instance` tests that the parser
+       is only built once and reused on subsequent calls
+    * `test_reset_schema_parser_rebuilds_parser` tests that resetting the
+       parser forces a new parser to be built
+    * `test_get_schema_parser_from_multiple_threads` tests that concurrent
+       calls only build a single parser
+    * `test_parse_schema_uses_shared_parser` tests that `parse_schema` does
+       not rebuild the parser on each call
+    * `test_parse_schema_does_not_share_seen_constructs` tests that the
+       constructs seen in one schema are not used when parsing another
+    * `test_get_schema_parser_loads_artifact` tests that the parser is
+       loaded from the precompiled artifact without using the grammar
+    * `test_get_schema_parser_without_usable_artifact` tests that the parser
+       is built from the grammar when the artifact is missing, stale or
+       cannot be read
+    * `test_get_schema_parser_when_artifact_cannot_be_loaded` tests that
+       the parser is built from the grammar when the installed version of
+       Lark cannot load the artifact
+"""
+
+
+import os
+import tempfile
+import threading
+import unittest
+
+from parameterized import parameterized
+
+from unittest.mock import patch
+
+from yamlator.parser import parse_schema
+from yamlator.parser import get_schema_parser
+from yamlator.parser import reset_schema_parser
+from yamlator.parser import clear_schema_cache
+from yamlator.parser.core import Lark
+from yamlator.parser.core import build_schema_parser_artifact
+from yamlator.parser.core import _create_schema_parser
+from yamlator.types import SchemaTypes
+
+
+_CREATE_PARSER = 'yamlator.parser.core._create_schema_parser'
+_PARSER_ARTIFACT = 'yamlator.parser.core._PARSER_ARTIFACT'
+_GRAMMAR_HASH = 'yamlator.parser.core._hash_grammar_file'
+_LOAD_FROM_DICT = 'yamlator.parser.core.Lark._load_from_dict'
+
+
+class TestSchemaParser(unittest.TestCase):
+    """Tests the functions that manage the shared schema parser"""
+
+    def setUp(self):
+        reset_schema_parser()
+        clear_schema_cache()
+
+    def tearDown(self):
+        reset_schema_parser()
+        clear_schema_cache()
+
+    def test_get_schema_parser_returns_same_instance(self):
+        first_parser = get_schema_parser()
+        second_parser = get_schema_parser()
+
+        self.assertIsNotNone(first_parser)
+        self.assertIs(first_parser, second_parser)
+
+    def test_reset_schema_parser_rebuilds_parser(self):
+        first_parser = get_schema_parser()
+        reset_schema_parser()
+        second_parser = get_schema_parser()
+
+        self.assertIsNot(first_parser, second_parser)
+
+    def test_get_schema_parser_from_multiple_threads(self):
+        thread_count = 8
+        parsers = []
+        barrier = threading.Barrier(thread_count)
+
+        def fetch_parser():
+            barrier.wait()
+            parsers.append(get_schema_parser())
+
+        with patch(_CREATE_PARSER, wraps=_create_schema_parser) as mock_create:
+            threads = [threading.Thread(target=fetch_parser)
+                       for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(1, mock_create.call_count)
+
+        self.assertEqual(thread_count, len(parsers))
+        self.assertTrue(all(p is parsers[0] for p in parsers))
+
+    def test_parse_schema_uses_shared_parser(self):
+        with patch(_CREATE_PARSER, wraps=_create_schema_parser) as mock_create:
+            parse_schema('schema {\n    message str\n}\n')
+            parse_schema('schema {\n    count int\n}\n')
+            self.assertEqual(1, mock_create.call_count)
+
+    def test_parse_schema_does_not_share_seen_constructs(self):
+        parse_schema('ruleset Details {\n    name str\n}\n')
+        schema = parse_schema('schema {\n    details Details\n}\n')
+
+        details_rule = schema.root.rules[0]
+        self.assertEqual(SchemaTypes.UNKNOWN, details_rule.rtype.schema_type)
+        self.assertEqual(1, len(schema.unknowns_rule_types))
+
+    def test_get_schema_parser_loads_artifact(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path = os.path.join(tmp_dir, 'grammar.lark.pickle')
+            build_schema_parser_artifact(artifact_path)
+
+            with patch(_PARSER_ARTIFACT, artifact_path), \
+                    patch.object(Lark, 'open') as mock_open:
+                schema = parse_schema('schema {\n    message str\n}\n')
+                mock_open.assert_not_called()
+
+        self.assertEqual('message', schema.root.rules[0].name)
+
+    @parameterized.expand([
+        ('missing_artifact', False, None),
+        ('stale_artifact', True, 'outdated-grammar-hash'),
+        ('unreadable_artifact', False, b'not a parser'),
+    ])
+    def test_get_schema_parser_without_usable_artifact(self, name: str,
+                                                       build_artifact: bool,
+                                                       artifact_content):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path = os.path.join(tmp_dir, 'grammar.lark.pickle')
+            if build_artifact:
+                with patch(_GRAMMAR_HASH, return_value=artifact_content):
+                    build_schema_parser_artifact(artifact_path)
+            elif artifact_content is not None:
+                with open(artifact_path, 'wb') as f:
+                    f.write(artifact_content)
+
+            with patch(_PARSER_ARTIFACT, artifact_path), \
+                    patch.object(Lark, 'open', wraps=Lark.open) as mock_open:
+                schema = parse_schema('schema {\n    message str\n}\n')
+                self.assertEqual(1, mock_open.call_count)
+
+        self.assertEqual('message', schema.root.rules[0].name)
+
+    def test_get_schema_parser_when_artifact_cannot_be_loaded(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path = os.path.join(tmp_dir, 'grammar.lark.pickle')
+            build_schema_parser_artifact(artifact_path)
+
+            with patch(_PARSER_ARTIFACT, artifact_path), \
+                    patch(_LOAD_FROM_DICT, side_effect=AttributeError), \
+                    patch.object(Lark, 'open', wraps=Lark.open) as mock_open:
+                schema = parse_schema('schema {\n    message str\n}\n')
+                self.assertEqual(1, mock_open.call_count)
+
+        self.assertEqual('message', schema.root.rules[0].name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,10 @@
 Test cases:
     * `test_yaml_file_invalid_filename` tests loading the YAML file with a range
        of invalid arguments
-    * `test_load_yaml_file` tests loading a valid YAML file
+    * `test_yaml_file_invalid_loader` tests loading the YAML file with
+       a loader that is not supported
+    * `test_load_yaml_file` tests loading a valid YAML file with
+       different loaders
 """
 
 import unittest
@@ -30,14 +33,21 @@ class TestLoadYamlFile(unittest.TestCase):
         with self.assertRaises(expected_exception):
             load_yaml_file(filename)
 
+    def test_yaml_file_invalid_loader(self):
+        with self.assertRaises(ValueError):
+            load_yaml_file(constants.VALID_YAML_DATA, 'unknown')
+
     @parameterized.expand([
-        ('with_a_valid_yaml_file', constants.VALID_YAML_DATA)
+        ('with_a_valid_yaml_file', constants.VALID_YAML_DATA),
+        ('with_the_python_loader', constants.VALID_YAML_DATA, 'python'),
+        ('with_minimal_types', constants.VALID_YAML_DATA, 'auto', True)
     ])
-    def test_load_yaml_file(self, name: str, filename: str):
+    def test_load_yaml_file(self, name: str, filename: str,
+                            loader: str = 'auto', minimal: bool = False):
         # Unused by test case, however is required by the parameterized library
         del name
 
-        results = load_yaml_file(filename)
+        results = load_yaml_file(filename, loader, minimal)
         self.assertIsNotNone(results)
 
 
@@ -0,0 +1,139 @@
+"""Test cases for selecting the YAML loader and loading YAML data
+
+Test cases:
+    * `test_get_yaml_loader` tests the loader class that is selected for
+       each loader name
+    * `test_get_yaml_loader_with_libyaml` tests that the C loaders are
+       selected when PyYAML has been built with libyaml
+    * `test_get_yaml_loader_with_invalid_loader` tests that an unsupported
+       loader raises a `ValueError`
+    * `test_load_yaml_with_minimal_types` tests that the minimal loaders
+       only construct the types Yamlator can validate
+    * `test_load_yaml_with_standard_types` tests that the safe loaders
+       construct the standard YAML types
+    * `test_load_yaml_rejects_python_tags` tests that the safe loaders do
+       not construct Python objects
+    * `test_loaders_load_the_same_data` tests that the C and Python
+       loaders load the same data
+    * `test_load_yaml_documents` tests that each document in a stream
+       is loaded in turn
+"""
+
+import datetime
+import unittest
+
+import yaml
+
+from parameterized import parameterized
+
+from yamlator.yaml_loader import CMinimalLoader
+from yamlator.yaml_loader import MinimalLoader
+from yamlator.yaml_loader import get_yaml_loader
+from yamlator.yaml_loader import load_yaml
+from yamlator.yaml_loader import load_yaml_documents
+
+_LOADERS = ['python']
+if yaml.__with_libyaml__:
+    _LOADERS.append('c')
+
+_TAGGED_YAML = '''
+created: 2024-01-01
+tags: !!set {a, b}
+command: !!python/object/apply:os.system ['echo']
+custom: !custom 5
+defaults: &defaults
+    port: 80
+server:
+    <<: *defaults
+    host: localhost
+'''
+
+_DATA_YAML = '''
+name: test
+count: 10
+ratio: 1.5
+enabled: yes
+missing: null
+items:
+    - 1
+    - two
+    - {three: 3}
+'''
+
+
+class TestYamlLoader(unittest.TestCase):
+    """Test cases for the YAML loaders"""
+
+    @parameterized.expand([
+        ('with_python_loader', 'python', False, yaml.SafeLoader),
+        ('with_minimal_python_loader', 'python', True, MinimalLoader),
+    ])
+    def test_get_yaml_loader(self, name: str, loader: str, minimal: bool,
+                             expected_loader: type):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        self.assertIs(expected_loader, get_yaml_loader(loader, minimal))
+
+    @unittest.skipUnless(yaml.__with_libyaml__, 'requires libyaml')
+    def test_get_yaml_loader_with_libyaml(self):
+        self.assertIs(yaml.CSafeLoader, get_yaml_loader('auto'))
+        self.assertIs(yaml.CSafeLoader, get_yaml_loader('c'))
+        self.assertIs(CMinimalLoader, get_yaml_loader('auto', True))
+        self.assertIs(CMinimalLoader, get_yaml_loader('c', True))
+
+    @parameterized.expand([
+        ('with_none_loader', None),
+        ('with_unknown_loader', 'unknown'),
+        ('with_upper_case_loader', 'C'),
+    ])
+    def test_get_yaml_loader_with_invalid_loader(self, name: str,
+                                                 loader: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            get_yaml_loader(loader)
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_load_yaml_with_minimal_types(self, loader: str):
+        data = load_yaml(_TAGGED_YAML, loader, minimal=True)
+
+        self.assertEqual('2024-01-01', data['created'])
+        self.assertEqual({'a': None, 'b': None}, data['tags'])
+        self.assertEqual(['echo'], data['command'])
+        self.assertEqual('5', data['custom'])
+        self.assertEqual({'port': 80, 'host': 'localhost'}, data['server'])
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_load_yaml_with_standard_types(self, loader: str):
+        data = load_yaml('created: 2024-01-01', loader)
+        self.assertEqual(datetime.date(2024, 1, 1), data['created'])
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_load_yaml_rejects_python_tags(self, loader: str):
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            load_yaml(_TAGGED_YAML, loader)
+
+    @parameterized.expand([
+        ('with_standard_types', False),
+        ('with_minimal_types', True),
+    ])
+    @unittest.skipUnless(yaml.__with_libyaml__, 'requires libyaml')
+    def test_loaders_load_the_same_data(self, name: str, minimal: bool):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        expected = load_yaml(_DATA_YAML, 'python', minimal)
+        self.assertEqual(expected, load_yaml(_DATA_YAML, 'c', minimal))
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_load_yaml_documents(self, loader: str):
+        documents = load_yaml_documents('a: 1\n---\n---\nb: [2]\n', loader)
+
+        self.assertEqual({'a': 1}, next(documents))
+        self.assertEqual([None, {'b': [2]}], list(documents))
+
+
+if __name__ == '__main__':
+    unittest.main()
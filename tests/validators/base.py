@@ -1,10 +1,38 @@
-"""Contains the base test case class for testing any of the validators"""
+"""Contains the base test case class for testing any of the validators
+and the helpers that are shared by the validator tests"""
 
 import unittest
 
 from collections import deque
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
 from yamlator.types import RuleType
 from yamlator.types import SchemaTypes
+from yamlator.violations import Violation
+
+
+class ReadCountingList(list):
+    """A list that counts the number of items that are read"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = 0
+
+    def __iter__(self):
+        for item in super().__iter__():
+            self.reads += 1
+            yield item
+
+
+def describe_violations(violations: Iterable[Violation]) -> List[Tuple]:
+    """Describes each violation as a tuple of its type, key, parent,
+    message and document, so the violations detected by different
+    validators can be compared
+    """
+    return [(type(v).__name__, str(v.key), str(v.parent), v.message,
+             v.document) for v in violations]
 
 
 class BaseValidatorTest(unittest.TestCase):
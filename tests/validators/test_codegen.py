@@ -0,0 +1,167 @@
+"""Test cases for the generated schema validators
+
+Test cases:
+    * `test_codegen_with_none_schema` tests that a validator cannot be
+       generated without a schema
+    * `test_generate_validator_source` tests that a function is generated
+       for the entry point and each ruleset used by the schema
+    * `test_compile_schema_validator_is_cached` tests that the generated
+       validator is cached on the schema
+    * `test_compiled_validators_are_not_pickled` tests that pickling a
+       schema does not include the generated validator
+    * `test_compile_schema_validator_with_deeply_nested_types` tests that
+       types nested deeper than Python allows blocks to be nested can
+       still be validated
+    * `test_compile_schema_validator_with_malicious_names` tests that the
+       names of enums and rulesets are not executed as code
+"""
+
+import ast
+import pickle
+import sys
+import unittest
+
+from parameterized import parameterized
+
+from yamlator.types import EnumItem
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import UnionRuleType
+from yamlator.types import YamlatorEnum
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.validators.codegen import CODEGEN_ENGINE
+from yamlator.validators.codegen import compile_schema_validator
+from yamlator.validators.codegen import generate_validator_source
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import CHAIN_ENGINE
+
+
+def create_schema() -> YamlatorSchema:
+    person_type = RuleType(SchemaTypes.RULESET, lookup='Person')
+    person_ruleset = YamlatorRuleset('Person', [
+        Rule('name', RuleType(SchemaTypes.STR), True),
+        Rule('friends',
+             RuleType(SchemaTypes.LIST, sub_type=person_type), False),
+    ])
+
+    return YamlatorSchema(
+        root=YamlatorRuleset('main', [
+            Rule('person', person_type, True),
+            Rule('unused', RuleType(SchemaTypes.ANY), False),
+        ]),
+        rulesets={
+            'Person': person_ruleset,
+            'Unused': YamlatorRuleset('Unused', [])
+        },
+        enums={}
+    )
+
+
+class TestCodegen(unittest.TestCase):
+    """Tests generating Python validator functions for a schema"""
+
+    @parameterized.expand([
+        ('generate_validator_source', generate_validator_source),
+        ('compile_schema_validator', compile_schema_validator),
+    ])
+    def test_codegen_with_none_schema(self, name: str, func):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            func(None)
+
+    def test_generate_validator_source(self):
+        source = generate_validator_source(create_schema())
+
+        # The recursive ruleset only generates a single function and
+        # rulesets that are not referenced are not generated
+        self.assertEqual(2, source.count('def '))
+        self.assertIn('name should be of type str', source)
+        self.assertNotIn('unused', source)
+
+    def test_compile_schema_validator_is_cached(self):
+        schema = create_schema()
+        validator = compile_schema_validator(schema)
+
+        self.assertIs(validator, compile_schema_validator(schema))
+        self.assertIs(validator, schema.compiled_validators[CODEGEN_ENGINE])
+
+    def test_compiled_validators_are_not_pickled(self):
+        schema = create_schema()
+        compile_schema_validator(schema)
+
+        loaded_schema = pickle.loads(pickle.dumps(schema))
+        self.assertEqual({}, loaded_schema.compiled_validators)
+        self.assertEqual(['name', 'friends'],
+                         [rule.name
+                          for rule in loaded_schema.rulesets['Person'].rules])
+
+    def test_compile_schema_validator_with_deeply_nested_types(self):
+        depth = 30
+        rtype = RuleType(SchemaTypes.INT)
+        data = 'not an int'
+        for _ in range(depth):
+            rtype = RuleType(SchemaTypes.LIST, sub_type=rtype)
+            data = [data]
+
+        schema = YamlatorSchema(
+            root=YamlatorRuleset('main', [Rule('values', rtype, True)]),
+            rulesets={},
+            enums={}
+        )
+
+        expected = validate_yaml({'values': data}, schema, CHAIN_ENGINE)
+        actual = validate_yaml({'values': data}, schema, CODEGEN_ENGINE)
+        self.assertEqual([v.message for v in expected],
+                         [v.message for v in actual])
+
+    def test_compile_schema_validator_with_malicious_names(self):
+        # Compiled schemas are loaded from files, so the names can be any
+        # string rather than the names the parser allows
+        marker = 'yamlator_codegen_injected'
+        name = ("E'+str(__import__('sys').modules.setdefault("
+                f"{marker!r}, 1))+'{{}}")
+        enum_type = RuleType(SchemaTypes.ENUM, lookup=name)
+        ruleset_type = RuleType(SchemaTypes.RULESET, lookup=name)
+        schema = YamlatorSchema(
+            root=YamlatorRuleset('main', [
+                Rule('values', RuleType(SchemaTypes.MAP, sub_type=enum_type),
+                     True),
+                Rule('items', RuleType(
+                    SchemaTypes.LIST,
+                    sub_type=UnionRuleType([enum_type, ruleset_type])), True),
+                Rule('ruleset', ruleset_type, True),
+            ]),
+            rulesets={
+                name: YamlatorRuleset(name, [
+                    Rule('kind', enum_type, True),
+                ], is_strict=True)
+            },
+            enums={
+                name: YamlatorEnum(name, {'a': EnumItem('A', 'a')})
+            }
+        )
+        data = {
+            'values': {'x': 'b'},
+            'items': ['b', {'kind': 'b'}],
+            'ruleset': {'kind': 'b', 'other': 1},
+        }
+
+        source = generate_validator_source(schema)
+        expected = validate_yaml(data, schema, CHAIN_ENGINE)
+        actual = validate_yaml(data, schema, CODEGEN_ENGINE)
+
+        self.assertNotIn(marker, sys.modules)
+        names = {node.id for node in ast.walk(ast.parse(source))
+                 if isinstance(node, ast.Name)}
+        self.assertNotIn('__import__', names)
+        self.assertEqual([v.message for v in expected],
+                         [v.message for v in actual])
+        self.assertEqual(5, len(actual))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Test cases for the compiled validator
+
+Test cases:
+    * `test_compiled_validator_with_invalid_args` tests that a schema is
+       required and the engine must be supported
+    * `test_compiled_validator_with_none_data` tests that validating
+       `None` raises a `ValueError`
+    * `test_compiled_validator_matches_validate_yaml` tests that the
+       compiled validator detects the same violations as `validate_yaml`
+    * `test_compiled_validator_with_threads` tests that one compiled
+       validator can be used by multiple threads at the same time
+"""
+
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from parameterized import parameterized
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import ENGINES
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.compiled import CompiledValidator
+
+
+_SCHEMA = '''
+ruleset Address {
+    number union(int, str, Address)
+    street str
+}
+
+ruleset Person {
+    name str
+    age int optional
+    address Address
+}
+
+schema {
+    people list(Person)
+}
+'''
+
+
+def _create_document(index: int) -> dict:
+    people = []
+    for person in range(index % 5):
+        people.append({
+            'name': f'Person {person}' if person % 2 else person,
+            'address': {'number': 1.0 if index % 3 else index}
+        })
+    return {'people': people}
+
+
+class TestCompiledValidator(unittest.TestCase):
+    """Test cases for the compiled validator"""
+
+    def setUp(self):
+        self.schema = parse_schema(_SCHEMA)
+
+    @parameterized.expand([
+        ('none_schema', None, 'plan'),
+        ('invalid_engine', parse_schema(_SCHEMA), 'invalid'),
+    ])
+    def test_compiled_validator_with_invalid_args(self, name, schema, engine):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            yamlator.compile(schema, engine)
+
+    def test_compiled_validator_with_none_data(self):
+        validator = yamlator.compile(self.schema)
+        with self.assertRaises(ValueError):
+            validator.validate(None)
+
+    def test_compiled_validator_matches_validate_yaml(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                validator = yamlator.compile(self.schema, engine)
+                self.assertIsInstance(validator, CompiledValidator)
+                self.assertEqual(engine, validator.engine)
+
+                for index in range(10):
+                    data = _create_document(index)
+                    expected = validate_yaml(data, self.schema, engine)
+                    actual = validator.validate(data)
+                    self.assertEqual(_messages(expected), _messages(actual))
+
+    def test_compiled_validator_with_threads(self):
+        documents = [_create_document(index) for index in range(200)]
+        expected = [_messages(validate_yaml(data, self.schema))
+                    for data in documents]
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                validator = yamlator.compile(self.schema, engine)
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = executor.map(validator.validate, documents)
+                    actual = [_messages(result) for result in results]
+                self.assertEqual(expected, actual)
+
+
+def _messages(violations) -> list:
+    return [violation.message for violation in violations]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Test cases for the dispatch validator
+
+Test cases:
+    * `test_dispatch_validator_with_none_schema` tests that a validator
+       cannot be created without a schema
+    * `test_dispatch_validator_type_checks` tests that the exact type
+       checks accept the same data as `isinstance`, including a `bool`
+       as an `int` and subclasses of the built in types
+    * `test_dispatch_validator_reuse` tests that a dispatch validator
+       can validate multiple documents
+"""
+
+import unittest
+
+from collections import OrderedDict
+from parameterized import parameterized
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import CHAIN_ENGINE
+from yamlator.validators.dispatch import DispatchValidator
+from yamlator.validators.dispatch import DISPATCH_ENGINE
+
+from .base import ReadCountingList
+
+
+_SCHEMA = '''
+ruleset Point {
+    x int
+}
+
+schema {
+    value int optional
+    flag bool optional
+    ratio float optional
+    name str optional
+    items list(int) optional
+    values map(str) optional
+    point Point optional
+    points list(Point) optional
+}
+'''
+
+
+class _Name(str):
+    """A subclass of `str` to test the subclass type checks"""
+
+
+class TestDispatchValidator(unittest.TestCase):
+    """Test cases for the dispatch validator"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = parse_schema(_SCHEMA)
+
+    def test_dispatch_validator_with_none_schema(self):
+        with self.assertRaises(ValueError):
+            DispatchValidator(None)
+
+    @parameterized.expand([
+        ('bool_as_int', {'value': True}, 0),
+        ('int_as_bool', {'flag': 1}, 1),
+        ('int_as_float', {'ratio': 1}, 1),
+        ('bool_as_float', {'ratio': False}, 1),
+        ('str_subclass', {'name': _Name('a')}, 0),
+        ('list_subclass', {'items': ReadCountingList([1, True, 'x'])}, 1),
+        ('bools_in_int_list', {'items': [True, False, 1.0]}, 1),
+        ('ordered_dict_map', {'values': OrderedDict(a='a', b=1)}, 1),
+        ('ordered_dict_ruleset', {'point': OrderedDict(x='x')}, 1),
+        ('ordered_dict_list_items', {'points': [OrderedDict(x=1), 1]}, 1),
+    ])
+    def test_dispatch_validator_type_checks(self, name: str, data: dict,
+                                            expected_violation_count: int):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        violations = validate_yaml(data, self.schema, engine=DISPATCH_ENGINE)
+        expected = validate_yaml(data, self.schema, engine=CHAIN_ENGINE)
+
+        self.assertEqual(expected_violation_count, len(violations))
+        self.assertEqual([v.message for v in expected],
+                         [v.message for v in violations])
+
+    def test_dispatch_validator_reuse(self):
+        validator = DispatchValidator(self.schema)
+
+        self.assertEqual(1, len(validator.validate({'value': 'a'})))
+        self.assertEqual(0, len(validator.validate({'value': 1})))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+"""Test cases for checking whether YAML data is valid without detecting
+the violations
+
+Test cases:
+    * `test_is_valid_with_none_args` tests that the data and the schema
+       are required
+    * `test_is_valid_matches_validate_yaml` tests that `is_valid` only
+       returns `True` when `validate_yaml` does not detect any violations
+    * `test_is_valid_with_keyless_schema` tests a schema that validates
+       the root of the data with a keyless rule
+    * `test_is_valid_with_recursive_ruleset` tests that a ruleset that
+       references itself can be checked
+    * `test_is_valid_does_not_create_violations` tests that no violations
+       are created while the data is checked
+    * `test_is_valid_stops_at_first_failure` tests that the check stops
+       at the first part of the data that does not match the schema
+    * `test_compiled_validator_is_valid` tests that a compiled validator
+       can check whether data is valid
+    * `test_predicate_is_cached` tests that the predicate is compiled
+       once for each schema
+"""
+
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.violations import Violation
+from yamlator.validators.core import is_valid
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.predicate import compile_schema_predicate
+
+from .base import ReadCountingList
+
+
+_SCHEMA = r'''
+enum Status {
+    SUCCESS = "success"
+    ERROR = 1
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]$") optional
+}
+
+strict ruleset Person {
+    name str
+    age int optional
+    status Status optional
+    address Address optional
+    tags list(str) optional
+    scores map(float) optional
+}
+
+ruleset Node {
+    value int
+    children list(Node) optional
+}
+
+ruleset Missing {
+    item Unknown optional
+}
+
+schema {
+    message str
+    count int optional
+    flag bool optional
+    people list(Person) optional
+    grid list(list(int)) optional
+    maps list(map(str)) optional
+    lookup map(Person) optional
+    nested map(map(int)) optional
+    choice union(Person, list(int), Status, regex("^id-"), map(str)) optional
+    anything any optional
+    tree Node optional
+    missing Missing optional
+}
+'''
+
+_STRICT_SCHEMA = '''
+strict schema {
+    name str
+    age int optional
+}
+'''
+
+_KEYLESS_SCHEMA = '''
+ruleset Item {
+    id int
+}
+
+schema {
+    !!yamlator list(Item)
+}
+'''
+
+_PERSON = {'name': 'Jane', 'age': 30, 'status': 'success'}
+
+
+class TestIsValid(unittest.TestCase):
+    """Test cases for checking whether YAML data is valid"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = parse_schema(_SCHEMA)
+        cls.strict_schema = parse_schema(_STRICT_SCHEMA)
+        cls.keyless_schema = parse_schema(_KEYLESS_SCHEMA)
+
+    @parameterized.expand([
+        ('none_data', None, parse_schema(_SCHEMA)),
+        ('none_schema', {}, None),
+    ])
+    def test_is_valid_with_none_args(self, name: str, data: dict, schema):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            is_valid(data, schema)
+
+    @parameterized.expand([
+        ('empty_data', {}),
+        ('valid_message', {'message': 'hello'}),
+        ('missing_required_field', {'count': 1}),
+        ('none_required_field', {'message': None}),
+        ('bool_as_int', {'message': 'a', 'count': True}),
+        ('invalid_builtin', {'message': 'a', 'flag': 1}),
+        ('valid_people', {'message': 'a', 'people': [_PERSON, _PERSON]}),
+        ('strict_ruleset_field', {'message': 'a',
+                                  'people': [{'name': 'a', 'extra': 1}]}),
+        ('person_not_a_map', {'message': 'a', 'people': ['a']}),
+        ('people_not_a_list', {'message': 'a', 'people': {}}),
+        ('invalid_enum', {'message': 'a',
+                          'people': [{'name': 'a', 'status': 'x'}]}),
+        ('enum_list_value', {'message': 'a',
+                             'people': [{'name': 'a', 'status': []}]}),
+        ('valid_address', {'message': 'a', 'people': [{
+            'name': 'a',
+            'address': {'number': '1a', 'street': 's', 'postcode': 'AB1'}
+        }]}),
+        ('invalid_regex', {'message': 'a', 'people': [{
+            'name': 'a',
+            'address': {'number': 1, 'street': 's', 'postcode': 'ab'}
+        }]}),
+        ('regex_not_a_str', {'message': 'a', 'people': [{
+            'name': 'a',
+            'address': {'number': 1, 'street': 's', 'postcode': 1}
+        }]}),
+        ('invalid_union_in_ruleset', {'message': 'a', 'people': [{
+            'name': 'a', 'address': {'number': 1.5, 'street': 's'}
+        }]}),
+        ('valid_grid', {'message': 'a', 'grid': [[1, 2], [3]]}),
+        ('invalid_grid', {'message': 'a', 'grid': [[1, 'a'], 3]}),
+        ('valid_maps', {'message': 'a', 'maps': [{'a': 'b'}]}),
+        ('maps_with_map_values', {'message': 'a', 'maps': [{'a': {}}]}),
+        ('valid_lookup', {'message': 'a', 'lookup': {'a': _PERSON}}),
+        ('invalid_lookup', {'message': 'a', 'lookup': {'a': 1}}),
+        ('valid_nested', {'message': 'a', 'nested': {'a': {'b': 1}}}),
+        ('invalid_nested', {'message': 'a', 'nested': {'a': {'b': 'c'}}}),
+        ('union_person', {'message': 'a', 'choice': _PERSON}),
+        ('union_list', {'message': 'a', 'choice': [1, 2]}),
+        ('union_enum', {'message': 'a', 'choice': 1}),
+        ('union_regex', {'message': 'a', 'choice': 'id-1'}),
+        ('union_map', {'message': 'a', 'choice': {'a': 'b'}}),
+        ('union_no_match', {'message': 'a', 'choice': 1.5}),
+        ('union_list_no_match', {'message': 'a', 'choice': ['a']}),
+        ('any_type', {'message': 'a', 'anything': object()}),
+        ('valid_tree', {'message': 'a', 'tree': {
+            'value': 1, 'children': [{'value': 2, 'children': []}]
+        }}),
+        ('invalid_tree', {'message': 'a', 'tree': {
+            'value': 1, 'children': [{'value': 2, 'children': [{}]}]
+        }}),
+        ('missing_ruleset', {'message': 'a', 'missing': {'item': 1}}),
+    ])
+    def test_is_valid_matches_validate_yaml(self, name: str, data: dict):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        for schema in (self.schema, self.strict_schema):
+            expected = len(validate_yaml(data, schema)) == 0
+            self.assertEqual(expected, is_valid(data, schema))
+
+    @parameterized.expand([
+        ('valid_items', [{'id': 1}, {'id': 2}], True),
+        ('invalid_item', [{'id': 1}, {'id': 'a'}], False),
+        ('not_a_list', {'id': 1}, False),
+        ('empty_list', [], True),
+    ])
+    def test_is_valid_with_keyless_schema(self, name: str, data,
+                                          expected: bool):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        self.assertEqual(expected, is_valid(data, self.keyless_schema))
+        self.assertEqual(expected,
+                         len(validate_yaml(data, self.keyless_schema)) == 0)
+
+    def test_is_valid_with_recursive_ruleset(self):
+        node_type = RuleType(SchemaTypes.RULESET, lookup='Node')
+        children_type = RuleType(SchemaTypes.LIST, sub_type=node_type)
+        node_ruleset = YamlatorRuleset('Node', [
+            Rule('value', RuleType(SchemaTypes.INT), True),
+            Rule('children', children_type, False)
+        ])
+        schema = YamlatorSchema(
+            root=YamlatorRuleset('main', [Rule('tree', node_type, True)]),
+            rulesets={'Node': node_ruleset},
+            enums={}
+        )
+
+        tree = {'value': 0, 'children': []}
+        for value in range(1, 50):
+            tree = {'value': value, 'children': [tree]}
+        self.assertTrue(is_valid({'tree': tree}, schema))
+
+        tree['children'].append({'value': 'a'})
+        self.assertFalse(is_valid({'tree': tree}, schema))
+
+    def test_is_valid_does_not_create_violations(self):
+        data = {'count': 'a', 'people': [{'name': 1, 'extra': 1}],
+                'choice': 1.5}
+
+        with patch.object(Violation, '__init__') as mock_init:
+            self.assertFalse(is_valid(data, self.schema))
+            self.assertFalse(yamlator.compile(self.schema).is_valid(data))
+            mock_init.assert_not_called()
+
+    def test_is_valid_stops_at_first_failure(self):
+        items = ReadCountingList([[1], ['a']] + [[1, 2]] * 1000)
+        data = {'message': 'a', 'grid': items}
+
+        self.assertFalse(is_valid(data, self.schema))
+        self.assertEqual(2, items.reads)
+
+    def test_compiled_validator_is_valid(self):
+        validator = yamlator.compile(self.schema)
+
+        self.assertTrue(validator.is_valid({'message': 'a'}))
+        self.assertFalse(validator.is_valid({'message': 1}))
+        with self.assertRaises(ValueError):
+            validator.is_valid(None)
+
+    def test_predicate_is_cached(self):
+        schema = parse_schema(_SCHEMA)
+
+        predicate = compile_schema_predicate(schema)
+        self.assertIs(predicate, compile_schema_predicate(schema))
+
+        with self.assertRaises(ValueError):
+            compile_schema_predicate(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+"""Test cases for loading YAML documents for a schema, only constructing
+the values the schema validates
+
+Test cases:
+    * `test_load_yaml_for_schema_with_none_args` tests that the stream and
+       the schema are required
+    * `test_load_yaml_for_schema_with_invalid_loader` tests that an
+       unsupported loader raises a `ValueError`
+    * `test_validate_lazy_data_matches_validate_yaml` tests that validating
+       the loaded data detects the same violations, in the same order, as
+       validating the document loaded by `yaml.safe_load`
+    * `test_unvalidated_values_are_skipped` tests that the maps and lists
+       that the schema does not inspect are loaded as `SKIPPED`
+    * `test_validated_values_are_loaded` tests that the values the schema
+       validates are loaded in the same way as `yaml.safe_load`
+    * `test_skipped_values_are_not_constructed` tests that the maps and
+       lists that are skipped are not constructed
+    * `test_load_yaml_for_schema_with_invalid_document` tests that the
+       same errors are raised as loading the document
+    * `test_load_yaml_for_schema_with_empty_stream` tests that `None` is
+       loaded when the stream does not contain a document
+"""
+
+import textwrap
+import unittest
+
+from typing import Type
+from unittest.mock import patch
+from parameterized import parameterized
+
+import yaml
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.lazy import SKIPPED
+from yamlator.validators.lazy import load_yaml_for_schema
+
+from .base import describe_violations
+
+
+_LOADERS = ['python']
+if yaml.__with_libyaml__:
+    _LOADERS.append('c')
+
+_SCHEMA = r'''
+enum Status {
+    SUCCESS = "success"
+    ERROR = 1
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]$") optional
+}
+
+strict ruleset Person {
+    name str
+    age int optional
+    status Status optional
+    address Address optional
+    tags list(str) optional
+    scores map(float) optional
+    extra any optional
+}
+
+ruleset Node {
+    value int
+    children list(Node) optional
+}
+
+schema {
+    message str
+    count int optional
+    people list(Person) optional
+    grid list(list(int)) optional
+    lookup map(Person) optional
+    tree Node optional
+    value union(int, list(str), Address) optional
+    payload any
+}
+'''
+
+_KEYLESS_SCHEMA = '''
+ruleset Item {
+    name str
+}
+
+schema {
+    !!yamlator list(Item)
+}
+'''
+
+
+class TestLazyLoader(unittest.TestCase):
+    """Test cases for loading YAML documents for a schema"""
+
+    @parameterized.expand([
+        ('with_none_stream', None, _SCHEMA),
+        ('with_none_schema', 'message: hello', None),
+    ])
+    def test_load_yaml_for_schema_with_none_args(self, name: str,
+                                                 stream: str,
+                                                 schema_content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = None
+        if schema_content is not None:
+            schema = parse_schema(schema_content)
+
+        with self.assertRaises(ValueError):
+            load_yaml_for_schema(stream, schema)
+
+    def test_load_yaml_for_schema_with_invalid_loader(self):
+        with self.assertRaises(ValueError):
+            load_yaml_for_schema('message: hello', parse_schema(_SCHEMA),
+                                 loader='unknown')
+
+    @parameterized.expand([
+        ('with_valid_document', 'message: hello\npayload: {a: 1}\n'),
+        ('with_missing_fields', 'count: 1\nunknown: [1, 2]\n'),
+        ('with_null_any_field', 'message: hello\npayload: ~\n'),
+        ('with_aliased_null_any_field', '''
+            message: &empty ~
+            payload: *empty
+        '''),
+        ('with_wrong_types', '''
+            message: [1]
+            count: {a: 1}
+            payload: 1
+            people: {name: a}
+            grid: [[1, a], 2]
+            tree: [1]
+        '''),
+        ('with_people', '''
+            message: hello
+            payload: [1, 2]
+            people:
+              - name: one
+                age: not an int
+                status: [unknown]
+                address: {number: [1], street: 2, postcode: AB, x: [1]}
+                tags: [a, 1, {b: 2}]
+                scores: {a: 1.5, b: no}
+                extra: {deep: [1, 2, {x: y}]}
+              - name: two
+                other: {field: 1}
+              - not a person
+        '''),
+        ('with_recursive_ruleset', '''
+            message: hello
+            payload: {}
+            tree:
+              value: 1
+              children:
+                - value: two
+                  other: [1]
+                - children: [{value: 3}, {value: x, children: 1}]
+        '''),
+        ('with_unions', '''
+            message: hello
+            payload: {}
+            value: {number: 1, street: high street}
+            lookup:
+              first: {name: one, address: {number: [a], street: b}}
+        '''),
+        ('with_anchors_in_skipped_values', '''
+            message: hello
+            payload: {inner: &person {name: 1, age: a}, name: &name 2}
+            people: [*person, {name: *name}]
+            lookup: {first: *person}
+        '''),
+        ('with_merge_keys', '''
+            message: hello
+            payload: {base: &base {name: one, age: 1}}
+            people:
+              - <<: *base
+                status: 1
+              - <<: [*base, {tags: [1], other: 1}]
+                name: two
+                age: x
+                <<: {address: {street: 1}}
+        '''),
+        ('with_duplicate_keys', 'message: 1\npayload: 1\nmessage: hello\n'),
+        ('with_value_key', 'message: hello\npayload: 1\n=: {a: 1}\n'),
+        ('with_tagged_collections', '''
+            message: hello
+            payload: !!set {a}
+            people: !!set {a, b}
+            grid: !!omap [{a: 1}]
+            value: !!set {c}
+        '''),
+        ('with_timestamps', 'message: 2024-01-01\npayload: 2024-01-01\n'),
+        ('with_keyless_schema', '[{name: 1}, {}, 2, {name: a, b: [1]}]',
+         _KEYLESS_SCHEMA),
+        ('with_keyless_map_root', '{name: a}', _KEYLESS_SCHEMA),
+    ])
+    def test_validate_lazy_data_matches_validate_yaml(
+            self, name: str, document: str, schema_content: str = _SCHEMA):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        document = textwrap.dedent(document)
+        schema = parse_schema(schema_content)
+        expected = validate_yaml(yaml.safe_load(document), schema)
+        expected = describe_violations(expected)
+
+        for loader in _LOADERS:
+            with self.subTest(loader=loader):
+                data = load_yaml_for_schema(document, schema, loader)
+                violations = validate_yaml(data, schema)
+                self.assertEqual(expected, describe_violations(violations))
+
+    def test_unvalidated_values_are_skipped(self):
+        document = textwrap.dedent('''\
+            message: hello
+            payload: {a: [1, 2]}
+            unknown: [1, 2]
+            scalar: 1
+            people:
+              - name: one
+                extra: [1]
+                other: {b: 2}
+            value: 3
+        ''')
+
+        data = load_yaml_for_schema(document, parse_schema(_SCHEMA))
+
+        self.assertEqual({
+            'message': 'hello',
+            'payload': SKIPPED,
+            'unknown': SKIPPED,
+            'scalar': 1,
+            'people': [{'name': 'one', 'extra': SKIPPED, 'other': SKIPPED}],
+            'value': 3,
+        }, data)
+        self.assertEqual('SKIPPED', repr(SKIPPED))
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_validated_values_are_loaded(self, loader: str):
+        document = textwrap.dedent('''\
+            message: hello
+            payload: ~
+            grid: [[1, 2], [3]]
+            people:
+              - &person {name: one, tags: [a], scores: {x: 1.5}}
+              - <<: *person
+                name: two
+            value: [a, b]
+        ''')
+
+        data = load_yaml_for_schema(document, parse_schema(_SCHEMA), loader)
+        self.assertEqual(yaml.safe_load(document), data)
+
+    def test_skipped_values_are_not_constructed(self):
+        document = 'message: hello\npayload: {a: [1, 2], b: {c: d}}\n'
+        schema = parse_schema(_SCHEMA)
+
+        with patch('yaml.constructor.SafeConstructor.construct_yaml_map'
+                   ) as mock_construct_map, \
+                patch('yaml.constructor.SafeConstructor.construct_yaml_seq'
+                      ) as mock_construct_seq:
+            data = load_yaml_for_schema(document, schema, 'python')
+
+        self.assertEqual({'message': 'hello', 'payload': SKIPPED}, data)
+        mock_construct_map.assert_not_called()
+        mock_construct_seq.assert_not_called()
+        self.assertIs(yamlator.load_yaml_for_schema, load_yaml_for_schema)
+
+    @parameterized.expand([
+        ('with_two_documents', 'message: a\n---\nmessage: b\n',
+         yaml.composer.ComposerError),
+        ('with_undefined_alias', 'message: *missing\n',
+         yaml.composer.ComposerError),
+        ('with_unhashable_key', 'message: a\n? [1]\n: 2\n',
+         yaml.constructor.ConstructorError),
+        ('with_invalid_merge', 'people: [{<<: 1}]\n',
+         yaml.constructor.ConstructorError),
+    ])
+    def test_load_yaml_for_schema_with_invalid_document(
+            self, name: str, document: str,
+            expected_exception: Type[Exception]):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(expected_exception):
+            load_yaml_for_schema(document, parse_schema(_SCHEMA))
+
+    def test_load_yaml_for_schema_with_empty_stream(self):
+        self.assertIsNone(load_yaml_for_schema('', parse_schema(_SCHEMA)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Test cases for limiting the number of violations that are detected
+
+Test cases:
+    * `test_max_violations` tests that each engine stops after the maximum
+       number of violations and returns the first violations in the data
+    * `test_max_violations_with_union` tests that the violations of each
+       type in a union are not counted towards the maximum
+    * `test_max_violations_stops_traversal` tests that the validation
+       stops as soon as the maximum number of violations is reached
+    * `test_max_violations_with_invalid_value` tests that the maximum
+       must be a positive integer
+    * `test_compiled_validator_max_violations` tests that a compiled
+       validator can limit the number of violations
+"""
+
+import unittest
+
+from parameterized import parameterized
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import ENGINES
+from yamlator.validators.core import validate_yaml
+
+from .base import ReadCountingList
+
+
+_SCHEMA = '''
+ruleset Item {
+    id int
+    name str
+    tags list(str) optional
+}
+
+ruleset Group {
+    items list(Item)
+}
+
+schema {
+    name str
+    groups map(Group)
+    choice union(Item, list(int), int) optional
+}
+'''
+
+_DATA = {
+    'groups': {
+        'a': {'items': [{'id': 'x'}, {'id': 1, 'name': 'b', 'tags': [1, 2]}]},
+        'b': {'items': [1, {'name': 2}]},
+        'c': []
+    },
+    'choice': 'x'
+}
+
+
+class TestMaxViolations(unittest.TestCase):
+    """Test cases for limiting the number of violations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = parse_schema(_SCHEMA)
+
+    def test_max_violations(self):
+        for engine in ENGINES:
+            all_violations = validate_yaml(_DATA, self.schema, engine)
+            expected = [v.message for v in all_violations]
+
+            for max_violations in range(1, len(expected) + 2):
+                with self.subTest(engine=engine, max_violations=max_violations):
+                    violations = validate_yaml(_DATA, self.schema, engine,
+                                               max_violations=max_violations)
+                    actual = [v.message for v in violations]
+                    self.assertEqual(expected[:max_violations], actual)
+
+    @parameterized.expand([
+        ('with_matching_type', {'name': 'a', 'groups': {},
+                                'choice': [1, 2, 3]}, []),
+        ('with_no_matching_type', {'name': 'a', 'groups': {},
+                                   'choice': ['a', 'b', 'c']},
+         ['choice did not match union types: Item, int, list(int)']),
+    ])
+    def test_max_violations_with_union(self, name: str, data: dict,
+                                       expected: list):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                violations = validate_yaml(data, self.schema, engine,
+                                           max_violations=1)
+                self.assertEqual(expected, [v.message for v in violations])
+
+    def test_max_violations_stops_traversal(self):
+        schema = parse_schema('schema {\n    values list(list(int))\n}\n')
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                items = ReadCountingList(['a'] * 1000)
+                data = {'values': [items]}
+
+                violations = validate_yaml(data, schema, engine,
+                                           max_violations=3)
+                self.assertEqual(3, len(violations))
+                self.assertEqual(3, items.reads)
+
+    @parameterized.expand([
+        ('zero', 0),
+        ('negative', -1),
+        ('string', '1'),
+        ('bool', True),
+    ])
+    def test_max_violations_with_invalid_value(self, name: str,
+                                               max_violations):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            validate_yaml(_DATA, self.schema, max_violations=max_violations)
+
+        with self.assertRaises(ValueError):
+            yamlator.compile(self.schema).validate(
+                _DATA, max_violations=max_violations)
+
+    def test_compiled_validator_max_violations(self):
+        validator = yamlator.compile(self.schema)
+
+        self.assertEqual(2, len(validator.validate(_DATA, max_violations=2)))
+        self.assertEqual(len(validate_yaml(_DATA, self.schema)),
+                         len(validator.validate(_DATA)))
+
+
+if __name__ == '__main__':
+    unittest.main()
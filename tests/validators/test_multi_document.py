@@ -0,0 +1,151 @@
+"""Test cases for validating each document in a YAML stream
+
+Test cases:
+    * `test_validate_yaml_stream_with_none_args` tests that the stream and
+       the schema are required
+    * `test_validate_yaml_stream_with_invalid_loader` tests that an
+       unsupported loader raises a `ValueError`
+    * `test_validate_yaml_stream` tests that the violations of each
+       document are the same as validating the document on its own and
+       are tagged with the index of the document
+    * `test_documents_are_validated_in_turn` tests that the violations of
+       a document are yielded before the next document has been read
+    * `test_validate_yaml_stream_with_invalid_document` tests that a
+       document that cannot be parsed raises an error once the documents
+       before it have been validated
+"""
+
+import io
+import unittest
+
+from parameterized import parameterized
+
+import yaml
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.documents import validate_yaml_stream
+
+from .base import describe_violations
+
+
+_LOADERS = ['python']
+if yaml.__with_libyaml__:
+    _LOADERS.append('c')
+
+_SCHEMA = '''
+ruleset Metadata {
+    name str
+    labels map(str) optional
+}
+
+strict schema {
+    kind str
+    metadata Metadata
+    replicas int optional
+}
+'''
+
+
+class TestMultiDocument(unittest.TestCase):
+    """Test cases for validating the documents of a YAML stream"""
+
+    @parameterized.expand([
+        ('with_none_stream', None, _SCHEMA),
+        ('with_none_schema', 'kind: Service', None),
+    ])
+    def test_validate_yaml_stream_with_none_args(self, name: str,
+                                                 stream: str,
+                                                 schema_content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = None
+        if schema_content is not None:
+            schema = parse_schema(schema_content)
+
+        with self.assertRaises(ValueError):
+            validate_yaml_stream(stream, schema)
+
+    def test_validate_yaml_stream_with_invalid_loader(self):
+        with self.assertRaises(ValueError):
+            validate_yaml_stream('kind: Service', parse_schema(_SCHEMA),
+                                 loader='unknown')
+
+    @parameterized.expand([
+        ('with_empty_stream', []),
+        ('with_single_document', [
+            'kind: Service\nmetadata: {name: a}\n',
+        ]),
+        ('with_valid_documents', [
+            'kind: Service\nmetadata: {name: a}\n',
+            'kind: Deployment\nmetadata: {name: b}\nreplicas: 2\n',
+        ]),
+        ('with_invalid_documents', [
+            'kind: Service\nmetadata: {name: a, labels: {app: 1}}\n',
+            'kind: Deployment\nmetadata: {name: b}\n',
+            'metadata: 1\nreplicas: two\nstatus: ok\n',
+        ]),
+        ('with_empty_documents', [
+            'kind: 1\nmetadata: {name: a}\n',
+            '',
+            '# only a comment\n',
+            'kind: Service\n',
+        ]),
+        ('with_aliases_in_each_document', [
+            'kind: &kind Service\nmetadata: {name: *kind}\n',
+            'kind: &kind 1\nmetadata: {name: *kind}\n',
+        ]),
+    ])
+    def test_validate_yaml_stream(self, name: str, documents: list):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_schema(_SCHEMA)
+        stream = '---\n'.join(documents)
+
+        expected = []
+        for index, data in enumerate(yaml.safe_load_all(stream)):
+            if data is None:
+                continue
+
+            for violation in validate_yaml(data, schema):
+                violation.document = index
+                expected.append(violation)
+
+        for loader in _LOADERS:
+            with self.subTest(loader=loader):
+                violations = validate_yaml_stream(stream, schema, loader)
+                self.assertEqual(describe_violations(expected),
+                                 describe_violations(violations))
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_documents_are_validated_in_turn(self, loader: str):
+        labels = ''.join(f'    label{idx}: value\n' for idx in range(50000))
+        stream = io.StringIO('kind: 1\nmetadata: {name: a}\n---\n'
+                             f'kind: Service\nmetadata:\n  name: b\n'
+                             f'  labels:\n{labels}')
+
+        violations = validate_yaml_stream(stream, parse_schema(_SCHEMA),
+                                          loader)
+        violation = next(violations)
+        violations.close()
+
+        self.assertEqual((0, 'kind'), (violation.document, violation.key))
+        self.assertLess(stream.tell(), len(stream.getvalue()) // 2)
+
+    def test_validate_yaml_stream_with_invalid_document(self):
+        stream = 'kind: 1\nmetadata: {name: a}\n---\nkind: [Service\n'
+
+        violations = validate_yaml_stream(stream, parse_schema(_SCHEMA))
+
+        self.assertEqual('kind', next(violations).key)
+        with self.assertRaises(yaml.YAMLError):
+            next(violations)
+        self.assertIs(yamlator.validate_yaml_stream, validate_yaml_stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,309 @@
+"""Test cases for validating the nodes composed by the YAML parser
+
+Test cases:
+    * `test_validate_yaml_nodes_with_none_args` tests that the stream and
+       the schema are required
+    * `test_validate_yaml_nodes_with_invalid_args` tests that an
+       unsupported loader or maximum number of violations raises
+       a `ValueError`
+    * `test_validate_yaml_nodes_matches_validate_yaml` tests that the
+       same violations are detected, in the same order, as validating
+       the loaded document
+    * `test_validate_yaml_nodes_with_keyless_schema` tests a schema that
+       validates the root of the document with a keyless rule
+    * `test_validate_yaml_nodes_with_invalid_document` tests that an
+       empty document, many documents and unhashable keys raise the same
+       errors as loading the document
+    * `test_violation_locations` tests that each violation is given the
+       line and column of the value it was detected for
+    * `test_validate_yaml_nodes_with_max_violations` tests that the
+       validation stops once the maximum number of violations is detected
+    * `test_unvalidated_values_are_not_constructed` tests that the values
+       that the schema does not validate are not constructed
+"""
+
+import textwrap
+import unittest
+
+from typing import Type
+from unittest.mock import patch
+from parameterized import parameterized
+
+import yaml
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.nodes import validate_yaml_nodes
+
+from .base import describe_violations
+
+
+_LOADERS = ['python']
+if yaml.__with_libyaml__:
+    _LOADERS.append('c')
+
+_SCHEMA = r'''
+enum Status {
+    SUCCESS = "success"
+    ERROR = 1
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]$") optional
+}
+
+strict ruleset Person {
+    name str
+    age int optional
+    status Status optional
+    address Address optional
+    tags list(str) optional
+    scores map(float) optional
+    extra any optional
+}
+
+ruleset Node {
+    value int
+    children list(Node) optional
+}
+
+strict schema {
+    message str
+    count int optional
+    people list(Person) optional
+    grid list(list(int)) optional
+    lookup map(Person) optional
+    nested map(map(int)) optional
+    tree Node optional
+    value union(int, list(str), Address) optional
+    payload any optional
+}
+'''
+
+_KEYLESS_SCHEMA = '''
+ruleset Item {
+    name str
+}
+
+schema {
+    !!yamlator list(Item)
+}
+'''
+
+
+class TestNodeMode(unittest.TestCase):
+    """Test cases for validating the nodes of YAML documents"""
+
+    @parameterized.expand([
+        ('with_none_stream', None, _SCHEMA),
+        ('with_none_schema', 'message: hello', None),
+    ])
+    def test_validate_yaml_nodes_with_none_args(self, name: str,
+                                                stream: str,
+                                                schema_content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = None
+        if schema_content is not None:
+            schema = parse_schema(schema_content)
+
+        with self.assertRaises(ValueError):
+            validate_yaml_nodes(stream, schema)
+
+    @parameterized.expand([
+        ('with_invalid_loader', 'unknown', None),
+        ('with_zero_max_violations', 'auto', 0),
+    ])
+    def test_validate_yaml_nodes_with_invalid_args(self, name: str,
+                                                   loader: str,
+                                                   max_violations: int):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(ValueError):
+            validate_yaml_nodes('message: hello', parse_schema(_SCHEMA),
+                                loader=loader, max_violations=max_violations)
+
+    @parameterized.expand([
+        ('with_valid_document', 'message: hello\ncount: 1\n'),
+        ('with_missing_required_field', 'count: 1\n'),
+        ('with_null_required_field', 'message: ~\n'),
+        ('with_extra_fields', 'message: hello\nunknown: [1, 2]\nother: 1\n'),
+        ('with_wrong_types', 'message: [1]\ncount: {a: 1}\n'
+                             'people: {name: a}\ngrid: [[1, a], 2]\n'),
+        ('with_people', '''
+            message: hello
+            people:
+              - name: one
+                age: not an int
+                status: unknown
+                address: {number: [1], street: 2, postcode: AB}
+                tags: [a, 1, {b: 2}]
+                scores: {a: 1.5, b: no}
+                extra: {deep: [1, 2, {x: y}]}
+              - name: two
+                other: field
+              - not a person
+        '''),
+        ('with_nested_maps', '''
+            message: hello
+            lookup:
+              first: {name: one, status: 1}
+              second: {age: 2}
+            nested:
+              a: {x: 1, y: two}
+              b: [1, 2]
+              1: {z: 3.5}
+        '''),
+        ('with_recursive_ruleset', '''
+            message: hello
+            tree:
+              value: 1
+              children:
+                - value: two
+                - children: [{value: 3}, {value: x, children: 1}]
+        '''),
+        ('with_unions', '''
+            message: hello
+            value: {number: 1, street: high street}
+            people:
+              - name: one
+                address: {number: [a], street: high street}
+        '''),
+        ('with_anchors_and_aliases', '''
+            message: &message hello
+            payload: {inner: &person {name: 1, age: a}}
+            people: [*person, {name: *message}]
+            lookup: {first: *person}
+        '''),
+        ('with_merge_keys', '''
+            message: hello
+            payload: {base: &base {name: one, age: 1}}
+            people:
+              - <<: *base
+                status: 1
+              - <<: [*base, {tags: [1]}]
+                name: two
+                age: x
+        '''),
+        ('with_duplicate_keys', 'message: 1\ncount: a\nmessage: hello\n'),
+        ('with_tagged_collections', '''
+            message: hello
+            people: !!set {a, b}
+            grid: !!omap [{a: 1}]
+            value: !!set {c}
+        '''),
+        ('with_timestamps', 'message: 2024-01-01\ncount: 2024-01-01\n'),
+        ('with_value_key', 'message: hello\n=: 1\n&key <<: {count: a}\n'),
+        ('with_flow_style', '{message: hello, people: [{name: a, age: x}]}'),
+    ])
+    def test_validate_yaml_nodes_matches_validate_yaml(self, name: str,
+                                                       document: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        document = textwrap.dedent(document)
+        schema = parse_schema(_SCHEMA)
+        expected = validate_yaml(yaml.safe_load(document), schema)
+        expected = describe_violations(expected)
+
+        for loader in _LOADERS:
+            with self.subTest(loader=loader):
+                violations = validate_yaml_nodes(document, schema, loader)
+                self.assertEqual(expected, describe_violations(violations))
+
+    @parameterized.expand([
+        ('with_valid_items', '[{name: a}, {name: b}]', 0),
+        ('with_invalid_items', '[{name: 1}, {}, 2]', 3),
+        ('with_map_root', '{name: a}', 1),
+        ('with_scalar_root', 'name', 1),
+    ])
+    def test_validate_yaml_nodes_with_keyless_schema(self, name: str,
+                                                     document: str,
+                                                     expected_count: int):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_schema(_KEYLESS_SCHEMA)
+        expected = validate_yaml(yaml.safe_load(document), schema)
+        expected = describe_violations(expected)
+        violations = describe_violations(validate_yaml_nodes(document, schema))
+
+        self.assertEqual(expected_count, len(violations))
+        self.assertEqual(expected, violations)
+
+    @parameterized.expand([
+        ('with_empty_stream', '', ValueError),
+        ('with_null_document', '~', ValueError),
+        ('with_two_documents', 'message: a\n---\nmessage: b\n',
+         yaml.composer.ComposerError),
+        ('with_unhashable_key', 'message: a\n? [1]\n: 2\n',
+         yaml.constructor.ConstructorError),
+    ])
+    def test_validate_yaml_nodes_with_invalid_document(
+            self, name: str, document: str,
+            expected_exception: Type[Exception]):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        with self.assertRaises(expected_exception):
+            validate_yaml_nodes(document, parse_schema(_SCHEMA))
+
+    def test_violation_locations(self):
+        document = textwrap.dedent('''\
+            count: one
+            unknown: 1
+            people:
+              - name: a
+                tags: [x, 2]
+              - age: 3
+        ''')
+
+        violations = validate_yaml_nodes(document, parse_schema(_SCHEMA))
+        locations = [(v.key, v.line, v.column) for v in violations]
+
+        self.assertEqual([
+            ('SCHEMA', 2, 1),
+            ('message', 1, 1),
+            ('count', 1, 8),
+            ('tags[1]', 5, 15),
+            ('name', 6, 5),
+        ], locations)
+
+    def test_validate_yaml_nodes_with_max_violations(self):
+        document = 'message: 1\ncount: a\ngrid: 1\n'
+
+        violations = validate_yaml_nodes(document, parse_schema(_SCHEMA),
+                                         max_violations=2)
+
+        self.assertEqual(['message', 'count'], [v.key for v in violations])
+
+    def test_unvalidated_values_are_not_constructed(self):
+        document = textwrap.dedent('''\
+            message: hello
+            payload: {a: [1, 2], b: {c: d}}
+            people:
+              - name: one
+                extra: [1, {x: y}]
+        ''')
+        schema = parse_schema(_SCHEMA)
+
+        with patch('yaml.constructor.SafeConstructor.construct_yaml_map'
+                   ) as mock_construct_map, \
+                patch('yaml.constructor.SafeConstructor.construct_yaml_seq'
+                      ) as mock_construct_seq:
+            violations = validate_yaml_nodes(document, schema, 'python')
+
+        self.assertEqual(0, len(violations))
+        mock_construct_map.assert_not_called()
+        mock_construct_seq.assert_not_called()
+        self.assertIs(yamlator.validate_yaml_nodes, validate_yaml_nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
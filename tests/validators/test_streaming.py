@@ -0,0 +1,304 @@
+"""Test cases for validating YAML documents from the events of the
+YAML parser
+
+Test cases:
+    * `test_validate_yaml_events_with_none_args` tests that the stream and
+       the schema are required
+    * `test_validate_yaml_events_with_invalid_loader` tests that an
+       unsupported loader raises a `ValueError`
+    * `test_validate_yaml_events_matches_validate_yaml` tests that the
+       same violations are detected as validating the loaded document
+    * `test_validate_yaml_events_with_keyless_schema` tests a schema that
+       validates the root of the document with a keyless rule
+    * `test_validate_yaml_events_with_empty_document` tests that a stream
+       without a document raises a `ValueError`
+    * `test_validate_yaml_events_with_many_documents` tests that a stream
+       with more than one document raises a `ComposerError`
+    * `test_violations_are_yielded_while_parsing` tests that a violation
+       is yielded before the rest of the document has been read
+    * `test_any_values_are_not_loaded` tests that maps and lists with the
+       any type are not loaded
+    * `test_streaming_validator_is_cached` tests that the streaming
+       validator is compiled once for each schema
+"""
+
+import io
+import textwrap
+import unittest
+
+from typing import Type
+from unittest.mock import patch
+from parameterized import parameterized
+
+import yaml
+
+import yamlator
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.streaming import compile_streaming_validator
+from yamlator.validators.streaming import validate_yaml_events
+
+from .base import describe_violations
+
+
+_LOADERS = ['python']
+if yaml.__with_libyaml__:
+    _LOADERS.append('c')
+
+_SCHEMA = r'''
+enum Status {
+    SUCCESS = "success"
+    ERROR = 1
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]$") optional
+}
+
+strict ruleset Person {
+    name str
+    age int optional
+    status Status optional
+    address Address optional
+    tags list(str) optional
+    scores map(float) optional
+    extra any optional
+}
+
+ruleset Node {
+    value int
+    children list(Node) optional
+}
+
+strict schema {
+    message str
+    count int optional
+    people list(Person) optional
+    grid list(list(int)) optional
+    lookup map(Person) optional
+    nested map(map(int)) optional
+    tree Node optional
+    value union(int, list(str), Address) optional
+    payload any optional
+}
+'''
+
+_KEYLESS_SCHEMA = '''
+ruleset Item {
+    name str
+}
+
+schema {
+    !!yamlator list(Item)
+}
+'''
+
+
+class TestStreaming(unittest.TestCase):
+    """Test cases for validating YAML documents from parser events"""
+
+    @parameterized.expand([
+        ('with_none_stream', None, _SCHEMA),
+        ('with_none_schema', 'message: hello', None),
+    ])
+    def test_validate_yaml_events_with_none_args(self, name: str,
+                                                 stream: str,
+                                                 schema_content: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = None
+        if schema_content is not None:
+            schema = parse_schema(schema_content)
+
+        with self.assertRaises(ValueError):
+            validate_yaml_events(stream, schema)
+
+    def test_validate_yaml_events_with_invalid_loader(self):
+        with self.assertRaises(ValueError):
+            validate_yaml_events('message: hello', parse_schema(_SCHEMA),
+                                 loader='unknown')
+
+    @parameterized.expand([
+        ('with_valid_document', 'message: hello\ncount: 1\n'),
+        ('with_missing_required_field', 'count: 1\n'),
+        ('with_null_required_field', 'message: ~\n'),
+        ('with_extra_field', 'message: hello\nunknown: [1, 2]\n'),
+        ('with_wrong_types', 'message: [1]\ncount: {a: 1}\n'
+                             'people: {name: a}\ngrid: [[1, a], 2]\n'),
+        ('with_people', '''
+            message: hello
+            people:
+              - name: one
+                age: not an int
+                status: unknown
+                address: {number: [1], street: 2, postcode: AB}
+                tags: [a, 1, {b: 2}]
+                scores: {a: 1.5, b: no}
+                extra: {deep: [1, 2, {x: y}]}
+              - name: two
+                other: field
+              - not a person
+        '''),
+        ('with_nested_maps', '''
+            message: hello
+            lookup:
+              first: {name: one, status: 1}
+              second: {age: 2}
+            nested:
+              a: {x: 1, y: two}
+              b: [1, 2]
+              1: {z: 3.5}
+        '''),
+        ('with_recursive_ruleset', '''
+            message: hello
+            tree:
+              value: 1
+              children:
+                - value: two
+                - children: [{value: 3}, {value: x, children: 1}]
+        '''),
+        ('with_unions', '''
+            message: hello
+            value: {number: 1, street: high street}
+            people:
+              - name: one
+                address: {number: [a], street: high street}
+        '''),
+        ('with_invalid_union', 'message: hello\nvalue: [1, 2]\n'),
+        ('with_anchors_and_aliases', '''
+            message: &message hello
+            payload: {inner: &person {name: 1, age: a}}
+            people: [*person, {name: *message}]
+            lookup: {first: *person}
+        '''),
+        ('with_merge_keys', '''
+            message: hello
+            payload: {base: &base {name: one, age: 1}}
+            people:
+              - <<: *base
+                status: 1
+              - <<: [*base, {tags: [1]}]
+                name: two
+        '''),
+        ('with_tagged_collections', '''
+            message: hello
+            people: !!set {a, b}
+            grid: !!omap [{a: 1}]
+            value: !!set {c}
+        '''),
+        ('with_timestamps', 'message: 2024-01-01\ncount: 2024-01-01\n'),
+        ('with_value_key', 'message: hello\n=: 1\n&key <<: {count: a}\n'),
+        ('with_flow_style', '{message: hello, people: [{name: a, age: x}]}'),
+    ])
+    def test_validate_yaml_events_matches_validate_yaml(self, name: str,
+                                                        document: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        document = textwrap.dedent(document)
+        schema = parse_schema(_SCHEMA)
+        expected = validate_yaml(yaml.safe_load(document), schema)
+
+        # The violations of the fields are detected in the order
+        # of the document, rather than the order of the rules
+        for loader in _LOADERS:
+            with self.subTest(loader=loader):
+                violations = validate_yaml_events(document, schema, loader)
+                self.assertEqual(sorted(describe_violations(expected)),
+                                 sorted(describe_violations(violations)))
+
+    @parameterized.expand([
+        ('with_valid_items', '[{name: a}, {name: b}]', 0),
+        ('with_invalid_items', '[{name: 1}, {}, 2]', 3),
+        ('with_map_root', '{name: a}', 1),
+        ('with_scalar_root', 'name', 1),
+    ])
+    def test_validate_yaml_events_with_keyless_schema(self, name: str,
+                                                      document: str,
+                                                      expected_count: int):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_schema(_KEYLESS_SCHEMA)
+        expected = validate_yaml(yaml.safe_load(document), schema)
+        violations = validate_yaml_events(document, schema)
+
+        expected = sorted(describe_violations(expected))
+        violations = sorted(describe_violations(violations))
+
+        self.assertEqual(expected_count, len(violations))
+        self.assertEqual(expected, violations)
+
+    @parameterized.expand([
+        ('with_empty_stream', ''),
+        ('with_comment', '# only a comment\n'),
+        ('with_null_document', '~'),
+    ])
+    def test_validate_yaml_events_with_empty_document(self, name: str,
+                                                      document: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        violations = validate_yaml_events(document, parse_schema(_SCHEMA))
+        with self.assertRaises(ValueError):
+            list(violations)
+
+    @parameterized.expand([
+        ('with_two_documents', 'message: a\n---\nmessage: b\n',
+         yaml.composer.ComposerError),
+        ('with_undefined_alias', 'message: *missing\n',
+         yaml.composer.ComposerError),
+    ])
+    def test_validate_yaml_events_with_many_documents(
+            self, name: str, document: str,
+            expected_exception: Type[Exception]):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        violations = validate_yaml_events(document, parse_schema(_SCHEMA))
+        with self.assertRaises(expected_exception):
+            list(violations)
+
+    @parameterized.expand([(loader,) for loader in _LOADERS])
+    def test_violations_are_yielded_while_parsing(self, loader: str):
+        people = ''.join(f'  - name: person {idx}\n' for idx in range(50000))
+        document = io.StringIO(f'count: not an int\npeople:\n{people}'
+                               f'message: hello\n')
+
+        violations = validate_yaml_events(document, parse_schema(_SCHEMA),
+                                          loader)
+        violation = next(violations)
+        violations.close()
+
+        self.assertEqual('count', violation.key)
+        self.assertLess(document.tell(), len(document.getvalue()) // 2)
+
+    def test_any_values_are_not_loaded(self):
+        document = 'message: hello\npayload: {a: [1, 2], b: {c: d}}\n'
+        schema = parse_schema(_SCHEMA)
+
+        with patch('yaml.constructor.SafeConstructor.construct_yaml_map'
+                   ) as mock_construct_map, \
+                patch('yaml.constructor.SafeConstructor.construct_yaml_seq'
+                      ) as mock_construct_seq:
+            violations = list(validate_yaml_events(document, schema,
+                                                   'python'))
+
+        self.assertEqual([], violations)
+        mock_construct_map.assert_not_called()
+        mock_construct_seq.assert_not_called()
+
+    def test_streaming_validator_is_cached(self):
+        schema = parse_schema(_SCHEMA)
+        validator = compile_streaming_validator(schema)
+
+        self.assertIs(validator, compile_streaming_validator(schema))
+        self.assertIs(yamlator.validate_yaml_events, validate_yaml_events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Test cases for unions of rulesets that are discriminated by a field
+
+Test cases:
+    * `test_find_discriminator` tests the field that is found to
+       discriminate the rulesets in a union
+    * `test_discriminated_union_validates_one_ruleset` tests that only
+       the ruleset selected by the field is validated
+    * `test_discriminated_union_violations` tests that the violations
+       are the same as validating every ruleset in the union
+"""
+
+import unittest
+
+from parameterized import parameterized
+
+from yamlator.parser import parse_schema
+from yamlator.validators.core import ENGINES
+from yamlator.validators.core import is_valid
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.resolution import find_discriminator
+
+
+_SCHEMA = '''
+enum DeploymentKind {
+    DEPLOYMENT = "Deployment"
+}
+
+enum ServiceKind {
+    SERVICE = "Service"
+}
+
+enum JobKind {
+    JOB = "Job"
+    CRON_JOB = "CronJob"
+}
+
+ruleset Deployment {
+    kind DeploymentKind
+    replicas int
+}
+
+ruleset Service {
+    kind ServiceKind
+    port int
+}
+
+ruleset Job {
+    kind JobKind
+    schedule str optional
+    command str
+}
+
+schema {
+    resources list(union(Deployment, Service, Job, str))
+}
+'''
+
+
+class _Resource(dict):
+    """A dict that records the keys that are read with `get`"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = set()
+
+    def get(self, key, default=None):
+        self.reads.add(key)
+        return super().get(key, default)
+
+
+def _create_schema(kind_types: tuple, is_required: bool = True) -> str:
+    optional = '' if is_required else ' optional'
+    first, second = kind_types
+    return f'''
+enum First {{
+    A = "a"
+    B = "b"
+}}
+
+enum Second {{
+    B = "b"
+    C = "c"
+}}
+
+enum Third {{
+    C = "c"
+}}
+
+ruleset Aa {{
+    kind {first}{optional}
+    name str
+}}
+
+ruleset Bb {{
+    kind {second}
+    name str
+}}
+
+schema {{
+    value union(int, Aa, Bb)
+}}
+'''
+
+
+class TestUnionDiscriminator(unittest.TestCase):
+    """Test cases for unions of rulesets that are discriminated by a field"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = parse_schema(_SCHEMA)
+
+    @parameterized.expand([
+        ('with_disjoint_enums', ('First', 'Third'), True,
+         ('kind', {'a': 1, 'b': 1, 'c': 2})),
+        ('with_shared_enum_values', ('First', 'Second'), True, None),
+        ('with_optional_field', ('First', 'Third'), False, None),
+        ('with_field_not_an_enum', ('str', 'Third'), True, None),
+        ('with_missing_enum', ('Missing', 'Third'), True, None),
+    ])
+    def test_find_discriminator(self, name: str, kind_types: tuple,
+                                is_required: bool, expected: tuple):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_schema(_create_schema(kind_types, is_required))
+        rtype = schema.root.rules[0].rtype
+
+        discriminator = find_discriminator(rtype.sub_types,
+                                           schema.rulesets, schema.enums)
+        self.assertEqual(expected, discriminator)
+
+    @parameterized.expand([
+        ('deployment', {'kind': 'Deployment', 'replicas': 1}, {'replicas'}),
+        ('service', {'kind': 'Service', 'port': 80}, {'port'}),
+        ('cron_job', {'kind': 'CronJob', 'command': 'a'},
+         {'schedule', 'command'}),
+    ])
+    def test_discriminated_union_validates_one_ruleset(self, name: str,
+                                                       data: dict,
+                                                       expected_reads: set):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                resource = _Resource(data)
+                violations = validate_yaml({'resources': [resource]},
+                                           self.schema, engine)
+                self.assertEqual(0, len(violations))
+                self.assertEqual({'kind'} | expected_reads, resource.reads)
+
+        resource = _Resource(data)
+        self.assertTrue(is_valid({'resources': [resource]}, self.schema))
+        self.assertEqual({'kind'} | expected_reads, resource.reads)
+
+    @parameterized.expand([
+        ('with_invalid_field', {'kind': 'Service', 'port': 'a'}),
+        ('with_unknown_kind', {'kind': 'Pod', 'port': 80}),
+        ('with_missing_kind', {'port': 80}),
+        ('with_kind_of_other_ruleset', {'kind': 'Job', 'replicas': 1}),
+        ('with_unhashable_kind', {'kind': ['Job'], 'command': 'a'}),
+        ('with_str', 'resource'),
+        ('with_int', 1),
+    ])
+    def test_discriminated_union_violations(self, name: str, data):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        yaml_data = {'resources': [data]}
+        expected = [(v.key, v.message)
+                    for v in validate_yaml(yaml_data, self.schema, 'chain')]
+
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                violations = validate_yaml(yaml_data, self.schema, engine)
+                self.assertEqual(expected,
+                                 [(v.key, v.message) for v in violations])
+
+        self.assertEqual(len(expected) == 0,
+                         is_valid(yaml_data, self.schema))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Test cases for validating unions with each validation engine
+
+Test cases:
+    * `test_union_stops_at_first_match` tests that the types in a union
+       are not validated after one of them matches the data
+    * `test_union_type_names_are_created_once` tests that the names of
+       the types in a union are not created for every item in a list
+    * `test_union_message_order` tests that the types in the message are
+       ordered by the number of violations each type detected
+"""
+
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.parser import parse_schema
+from yamlator.types import RuleType
+from yamlator.validators.core import ENGINES
+from yamlator.validators.core import validate_yaml
+
+from .base import ReadCountingList
+
+
+_SCHEMA = '''
+ruleset Point {
+    x int
+    y int
+}
+
+schema {
+    values union(list(int), list(str), Point) optional
+    items list(union(int, Point, list(str))) optional
+}
+'''
+
+
+class TestUnionTypes(unittest.TestCase):
+    """Test cases for validating unions"""
+
+    @parameterized.expand([(engine,) for engine in ENGINES])
+    def test_union_stops_at_first_match(self, engine: str):
+        items = ReadCountingList(range(100))
+        violations = validate_yaml({'values': items}, parse_schema(_SCHEMA),
+                                   engine)
+
+        self.assertEqual(0, len(violations))
+        self.assertEqual(100, items.reads)
+
+    @parameterized.expand([(engine,) for engine in ENGINES])
+    def test_union_type_names_are_created_once(self, engine: str):
+        schema = parse_schema(_SCHEMA)
+        data = {'items': [1.5] * 100}
+
+        with patch.object(RuleType, '__str__', autospec=True,
+                          side_effect=lambda rtype: 'type') as mock_str:
+            violations = validate_yaml(data, schema, engine)
+            self.assertEqual(100, len(violations))
+            self.assertLessEqual(mock_str.call_count, 6)
+
+    @parameterized.expand([
+        ('with_invalid_point', {'items': [{'x': 'a', 'y': 'b'}]},
+         'items[0] did not match union types: int, list(str), Point'),
+        ('with_invalid_list', {'items': [['a', 1, 2]]},
+         'items[0] did not match union types: int, Point, list(str)'),
+        ('with_mixed_list', {'values': [1, 'a', 'b']},
+         'values did not match union types: list(str), Point, list(int)'),
+        ('with_equal_counts', {'values': {'x': 1}},
+         'values did not match union types: list(int), list(str), Point'),
+    ])
+    def test_union_message_order(self, name: str, data: dict,
+                                 expected_message: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = parse_schema(_SCHEMA)
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                violations = validate_yaml(data, schema, engine)
+                self.assertEqual([expected_message],
+                                 [v.message for v in violations])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,11 +5,20 @@ Test cases:
     validator.
     * `test_union_validation_without_sub_validators` to validate
      the validation process is halted when a validator is not provided
+    * `test_union_validators_do_not_share_sub_validators` tests that the
+     sub validators set on one union validator are not used by another
+    * `test_union_validation_with_violation_budget` tests that the
+     violations of the types that do not match are not added to a
+     violation budget
+    * `test_union_validation_with_sub_validator_error` tests that the sub
+     type violations are discarded when a sub validator raises an error
 """
 
 import unittest
 import typing
 
+from collections import deque
+
 from parameterized import parameterized
 from .base import BaseValidatorTest
 
@@ -18,6 +27,7 @@ from yamlator.types import RuleType
 from yamlator.types import UnionRuleType
 from yamlator.types import SchemaTypes
 from yamlator.violations import TypeViolation
+from yamlator.violations import ViolationBudget
 from yamlator.validators import UnionValidator
 from yamlator.validators.base_validator import Validator
 
@@ -39,6 +49,19 @@ class DummyValidator(Validator):
         self._violations.append(violation)
 
 
+class ErrorValidator(Validator):
+    """Validator that adds a violation and then raises an error"""
+    def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
+                 is_required: bool = False) -> None:
+        # Not used by the ErrorValidator
+        del data
+        del is_required
+        del rtype
+
+        self._violations.append(TypeViolation(key, parent, 'Invalid type'))
+        raise RuntimeError('Failed to validate the data')
+
+
 class TestUnionValidator(BaseValidatorTest):
     """Test cases for the Union Validator"""
 
@@ -72,7 +95,7 @@ class TestUnionValidator(BaseValidatorTest):
         self.assertEqual(expected_violation_count, actual_violation_count)
 
     def _set_sub_type_validators(self, validator: UnionValidator):
-        dummy_validator = DummyValidator(self.violations)
+        dummy_validator = DummyValidator(validator.sub_type_violations)
 
         validator.set_enum_validator(dummy_validator)
         validator.set_list_validator(dummy_validator)
@@ -111,6 +134,52 @@ class TestUnionValidator(BaseValidatorTest):
         actual_violation_count = len(self.violations)
         self.assertEqual(expected_violation_count, actual_violation_count)
 
+    def test_union_validators_do_not_share_sub_validators(self):
+        validator = UnionValidator(self.violations)
+        self._set_sub_type_validators(validator)
+
+        other_violations = deque()
+        other_validator = UnionValidator(other_violations)
+
+        rtype = UnionRuleType([
+            RuleType(SchemaTypes.RULESET, lookup='test'),
+            RuleType(SchemaTypes.STR)
+        ])
+        other_validator.validate(self.key, 1.23, self.parent, rtype)
+
+        self.assertEqual(0, len(self.violations))
+        self.assertEqual(0, len(other_violations))
+
+    def test_union_validation_with_violation_budget(self):
+        violations = ViolationBudget(1)
+        validator = UnionValidator(violations)
+        self._set_sub_type_validators(validator)
+
+        rtype = UnionRuleType([
+            RuleType(SchemaTypes.RULESET, lookup='test'),
+            RuleType(SchemaTypes.LIST, sub_type=RuleType(SchemaTypes.INT)),
+            RuleType(SchemaTypes.FLOAT)
+        ])
+        validator.validate(self.key, 1.23, self.parent, rtype)
+
+        self.assertEqual(0, len(violations))
+        self.assertEqual(0, len(validator.sub_type_violations))
+
+    def test_union_validation_with_sub_validator_error(self):
+        validator = UnionValidator(self.violations)
+        validator.set_ruleset_validator(
+            ErrorValidator(validator.sub_type_violations))
+
+        rtype = UnionRuleType([
+            RuleType(SchemaTypes.RULESET, lookup='test'),
+            RuleType(SchemaTypes.STR)
+        ])
+        with self.assertRaises(RuntimeError):
+            validator.validate(self.key, 1.23, self.parent, rtype)
+
+        self.assertEqual(0, len(self.violations))
+        self.assertEqual(0, len(validator.sub_type_violations))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,8 @@ Test cases:
     * `test_validator_invalid_parameters` tests the validate yaml function
        with a range of invalid arguments
     * `test_validator` tests the validate yaml function with a variety of
-       different schemas and data to verify the validation process
+       different schemas and data to verify the validation process of
+       each validation engine
 """
 
 
@@ -21,6 +22,7 @@ from yamlator.types import YamlatorRuleset
 from yamlator.types import YamlatorSchema
 from yamlator.types import SchemaTypes
 from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import ENGINES
 
 
 def create_empty_schema() -> YamlatorSchema:
@@ -192,8 +194,10 @@ class TestWrangleData(unittest.TestCase):
         # Unused by test case, however is required by the parameterized library
         del name
 
-        violations = validate_yaml(data, schema)
-        self.assertEqual(expected_violations_count, len(violations))
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                violations = validate_yaml(data, schema, engine=engine)
+                self.assertEqual(expected_violations_count, len(violations))
 
 
 if __name__ == '__main__':
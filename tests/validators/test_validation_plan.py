@@ -0,0 +1,252 @@
+"""Test cases for the validation plan
+
+Test cases:
+    * `test_validation_plan_with_none_schema` tests that a plan cannot
+       be compiled without a schema
+    * `test_validate_yaml_with_invalid_engine` tests that an unsupported
+       engine raises a `ValueError`
+    * `test_validation_plan_matches_chain` tests that the plan, the
+       generated validators and the validator chain detect the same
+       violations in the same order
+    * `test_validation_plan_with_recursive_ruleset` tests that a ruleset
+       that references itself can be compiled and validated
+    * `test_validation_plan_reuse` tests that a compiled plan can validate
+       multiple documents
+    * `test_compile_validation_plan_is_cached` tests that the plan is
+       compiled once for each schema
+"""
+
+import unittest
+
+from unittest.mock import patch
+from parameterized import parameterized
+
+from yamlator.parser import parse_schema
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.validators.core import validate_yaml
+from yamlator.validators.core import CHAIN_ENGINE
+from yamlator.validators.core import CODEGEN_ENGINE
+from yamlator.validators.core import DISPATCH_ENGINE
+from yamlator.validators.core import PLAN_ENGINE
+from yamlator.validators.plan import ValidationPlan
+from yamlator.validators.plan import compile_validation_plan
+
+from .base import describe_violations
+
+
+_VALIDATION_PLAN = 'yamlator.validators.plan.ValidationPlan'
+
+_SCHEMA = r'''
+enum Status {
+    SUCCESS = "success"
+    ERROR = 1
+}
+
+ruleset Address {
+    number union(int, str)
+    street str
+    postcode regex("^[A-Z]{2}[0-9]$") optional
+}
+
+strict ruleset Person {
+    name str
+    age int optional
+    status Status optional
+    address Address optional
+    tags list(str) optional
+    scores map(float) optional
+}
+
+ruleset Node {
+    value int
+    children list(Node) optional
+}
+
+ruleset Missing {
+    item Unknown optional
+}
+
+schema {
+    message str
+    count int optional
+    flag bool optional
+    people list(Person) optional
+    grid list(list(int)) optional
+    maps list(map(str)) optional
+    lookup map(Person) optional
+    nested map(map(int)) optional
+    choice union(Person, list(int), Status, regex("^id-"), map(str)) optional
+    anything any optional
+    tree Node optional
+}
+'''
+
+_STRICT_SCHEMA = '''
+strict schema {
+    name str
+    age int optional
+}
+'''
+
+_KEYLESS_SCHEMA = '''
+ruleset Item {
+    id int
+}
+
+schema {
+    !!yamlator list(Item)
+}
+'''
+
+_VALID_PERSON = {'name': 'Jane', 'age': 30, 'status': 'success'}
+
+
+class TestValidationPlan(unittest.TestCase):
+    """Tests the validation plan produces the same violations
+    as the validator chain
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.schema = parse_schema(_SCHEMA)
+        cls.strict_schema = parse_schema(_STRICT_SCHEMA)
+        cls.keyless_schema = parse_schema(_KEYLESS_SCHEMA)
+
+    def test_validation_plan_with_none_schema(self):
+        with self.assertRaises(ValueError):
+            compile_validation_plan(None)
+
+    def test_validate_yaml_with_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            validate_yaml({}, self.schema, engine='unknown')
+
+    @parameterized.expand([
+        ('with_valid_data', 'schema', {'message': 'hello', 'count': 1}),
+        ('with_missing_required', 'schema', {'count': 1}),
+        ('with_wrong_types', 'schema', {
+            'message': 1, 'count': 'one', 'flag': 0
+        }),
+        ('with_bool_as_int', 'schema', {'message': 'a', 'count': True}),
+        ('with_people', 'schema', {
+            'message': 'a',
+            'people': [
+                _VALID_PERSON,
+                {'age': 'old', 'extra': 1, 'other': 2},
+                {'name': 'Joe', 'status': 'unknown', 'tags': ['a', 2]},
+                {'name': 'Ann', 'address': {'number': 1.5, 'street': 2}},
+                {'name': 'Bob', 'address': {
+                    'number': '12a', 'street': 'a', 'postcode': 'ab1'
+                }},
+                {'name': 'Sam', 'address': {'postcode': 3}},
+                {'name': 'Al', 'scores': {'a': 1.0, 'b': 'x'}},
+                None,
+                'person',
+            ]
+        }),
+        ('with_people_not_list', 'schema', {'message': 'a', 'people': {}}),
+        ('with_grid', 'schema', {
+            'message': 'a', 'grid': [[1, 2], ['x', None], 3, [True]]
+        }),
+        ('with_list_of_maps', 'schema', {
+            'message': 'a', 'maps': [{'a': 1}, [], 'x', {}]
+        }),
+        ('with_lookup', 'schema', {
+            'message': 'a', 'lookup': {'a': _VALID_PERSON, 'b': 1, 'c': {}}
+        }),
+        ('with_nested_map', 'schema', {
+            'message': 'a', 'nested': {'a': {'b': 1, 'c': 'x'}, 'd': 2}
+        }),
+        ('with_union_ruleset', 'schema', {
+            'message': 'a', 'choice': _VALID_PERSON
+        }),
+        ('with_union_list', 'schema', {'message': 'a', 'choice': [1, 2]}),
+        ('with_union_enum', 'schema', {'message': 'a', 'choice': 1}),
+        ('with_union_regex', 'schema', {'message': 'a', 'choice': 'id-1'}),
+        ('with_union_invalid_list', 'schema', {
+            'message': 'a', 'choice': [1, 'x']
+        }),
+        ('with_union_invalid_str', 'schema', {
+            'message': 'a', 'choice': 'failed'
+        }),
+        ('with_union_invalid_type', 'schema', {
+            'message': 'a', 'choice': 1.5
+        }),
+        ('with_any', 'schema', {'message': 'a', 'anything': [None, {}]}),
+        ('with_recursive_ruleset', 'schema', {
+            'message': 'a',
+            'tree': {
+                'value': 1,
+                'children': [
+                    {'value': 2},
+                    {'value': 'x', 'children': [{'children': []}]},
+                    3
+                ]
+            }
+        }),
+        ('with_strict_schema', 'strict_schema', {
+            'name': 'a', 'extra': 1, 'other': 2
+        }),
+        ('with_valid_strict_schema', 'strict_schema', {'name': 'a'}),
+        ('with_keyless_schema', 'keyless_schema', [
+            {'id': 1}, {'id': 'x'}, {}, 'item'
+        ]),
+        ('with_keyless_schema_wrong_type', 'keyless_schema', {'id': 1}),
+    ])
+    def test_validation_plan_matches_chain(self, name: str, schema_name: str,
+                                           data):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        schema = getattr(self, schema_name)
+        expected = validate_yaml(data, schema, engine=CHAIN_ENGINE)
+
+        for engine in (PLAN_ENGINE, CODEGEN_ENGINE, DISPATCH_ENGINE):
+            with self.subTest(engine=engine):
+                actual = validate_yaml(data, schema, engine=engine)
+                self.assertEqual(describe_violations(expected),
+                                 describe_violations(actual))
+
+    def test_validation_plan_with_recursive_ruleset(self):
+        node_type = RuleType(SchemaTypes.RULESET, lookup='Node')
+        children_type = RuleType(SchemaTypes.LIST, sub_type=node_type)
+        node_ruleset = YamlatorRuleset('Node', [
+            Rule('value', RuleType(SchemaTypes.INT), True),
+            Rule('children', children_type, False)
+        ])
+        schema = YamlatorSchema(
+            root=YamlatorRuleset('main', [Rule('tree', node_type, True)]),
+            rulesets={'Node': node_ruleset},
+            enums={}
+        )
+
+        tree = {'value': 1, 'children': []}
+        for _ in range(50):
+            tree = {'value': 'x', 'children': [tree]}
+
+        violations = compile_validation_plan(schema).validate({'tree': tree})
+        self.assertEqual(50, len(violations))
+
+    def test_validation_plan_reuse(self):
+        plan = ValidationPlan(self.schema)
+
+        self.assertEqual(1, len(plan.validate({'count': 1})))
+        self.assertEqual(0, len(plan.validate({'message': 'a'})))
+
+    def test_compile_validation_plan_is_cached(self):
+        schema = parse_schema(_SCHEMA)
+        plan = compile_validation_plan(schema)
+
+        self.assertIs(plan, compile_validation_plan(schema))
+        self.assertIs(plan, schema.compiled_validators[PLAN_ENGINE])
+
+        with patch(_VALIDATION_PLAN) as mock_plan:
+            validate_yaml({'message': 'a'}, schema)
+            mock_plan.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,9 +6,12 @@ Test Cases:
        successfully generated
     * `test_violation_json_encoder_raises_type_error` tests the JSON
        encoder with objects that are not support
+    * `test_violation_json_encoder_with_location` tests that the line,
+       column and document are only encoded when they are known
 """
 
 
+import json
 import unittest
 
 from typing import Any
@@ -74,6 +77,27 @@ class TestViolationJSONEncoder(unittest.TestCase):
         with self.assertRaises(TypeError):
             encoder.encode(data)
 
+    @parameterized.expand([
+        ('with_unknown_location', None, None, None, {}),
+        ('with_location', 3, 5, None, {'line': 3, 'column': 5}),
+        ('with_document', None, None, 0, {'document': 0}),
+    ])
+    def test_violation_json_encoder_with_location(self, name: str, line: int,
+                                                  column: int, document: int,
+                                                  expected_location: dict):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        violation = RequiredViolation('data', '-')
+        violation.line = line
+        violation.column = column
+        violation.document = document
+
+        encoded = json.loads(ViolationJSONEncoder().encode(violation))
+        location = {k: v for k, v in encoded.items()
+                    if k in ('line', 'column', 'document')}
+        self.assertEqual(expected_location, location)
+
 
 if __name__ == 'main':
     unittest.main()
@@ -0,0 +1,89 @@
+"""Test cases for the violation classes
+
+Test Cases:
+    * `test_violation_message` tests that the message of each violation
+       is created from the fields of the violation
+    * `test_violation_message_is_cached` tests that the message is only
+       created the first time it is accessed
+    * `test_violation_without_dict` tests that the violations do not
+       have a `__dict__`, so they use less memory
+    * `test_violation_pickle` tests that a violation can be pickled
+"""
+
+import pickle
+import unittest
+
+from parameterized import parameterized
+
+from yamlator.violations import BuiltInTypeViolation
+from yamlator.violations import RegexTypeViolation
+from yamlator.violations import RequiredViolation
+from yamlator.violations import RulesetTypeViolation
+from yamlator.violations import TypeViolation
+from yamlator.violations import Violation
+from yamlator.violations import StrictRulesetViolation
+from yamlator.violations import StrictEntryPointViolation
+
+_VIOLATIONS = [
+    ('required', RequiredViolation('name', '-'), 'name is missing'),
+    ('type_with_message', TypeViolation('name', '-', 'Invalid name'),
+     'Invalid name'),
+    ('type_with_expected_type',
+     TypeViolation('name', '-', expected_type='str'),
+     'name should be of type str'),
+    ('builtin_type', BuiltInTypeViolation('name', '-', int),
+     'name is expected to be an int'),
+    ('ruleset_type', RulesetTypeViolation('person', '-'),
+     'person should be a ruleset'),
+    ('regex_type', RegexTypeViolation('id', '-', 'abc', '^id-'),
+     'abc does not match regex "^id-"'),
+    ('strict_ruleset', StrictRulesetViolation('person', '-', 'age', 'Person'),
+     'age is not expected in ruleset Person'),
+    ('strict_entry_point', StrictEntryPointViolation('SCHEMA', '-', 'age'),
+     'age is not expected in the schema block'),
+]
+
+
+class TestViolations(unittest.TestCase):
+    """Test cases for the violation classes"""
+
+    @parameterized.expand(_VIOLATIONS)
+    def test_violation_message(self, name: str, violation: Violation,
+                               expected_message: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        self.assertEqual(expected_message, violation.message)
+
+    def test_violation_message_is_cached(self):
+        violation = TypeViolation('name', '-', expected_type='str')
+
+        self.assertIs(violation.message, violation.message)
+
+        violation.message = 'Updated message'
+        self.assertEqual('Updated message', violation.message)
+
+    @parameterized.expand(_VIOLATIONS)
+    def test_violation_without_dict(self, name: str, violation: Violation,
+                                    expected_message: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+        del expected_message
+
+        self.assertFalse(hasattr(violation, '__dict__'))
+
+    @parameterized.expand(_VIOLATIONS)
+    def test_violation_pickle(self, name: str, violation: Violation,
+                              expected_message: str):
+        # Unused by test case, however is required by the parameterized library
+        del name
+
+        loaded_violation = pickle.loads(pickle.dumps(violation))
+        self.assertIs(type(violation), type(loaded_violation))
+        self.assertEqual(violation.key, loaded_violation.key)
+        self.assertEqual(violation.parent, loaded_violation.parent)
+        self.assertEqual(expected_message, loaded_violation.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,47 @@
-"""Shortcuts for accessing common Yamlator functions"""
+"""Shortcuts for accessing common Yamlator functions
 
-from yamlator.validators.core import validate_yaml
-from yamlator.cmd import validate_yaml_data_from_file
+The functions are imported when they are first used, so importing
+`yamlator` does not import the schema parser or the command line
+"""
+
+from typing import TYPE_CHECKING
+from yamlator.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from yamlator.validators.core import validate_yaml
+    from yamlator.validators.core import is_valid
+    from yamlator.validators.streaming import validate_yaml_events
+    from yamlator.validators.nodes import validate_yaml_nodes
+    from yamlator.validators.documents import validate_yaml_stream
+    from yamlator.validators.lazy import load_yaml_for_schema
+    from yamlator.cmd.core import validate_yaml_data_from_file
+    from yamlator.compiled_schema import load_compiled_schema
+    # pylint: disable-next=redefined-builtin
+    from yamlator.validators.compiled import compile
+    from yamlator.validators.compiled import CompiledValidator
 
 __all__ = [
     'validate_yaml',
-    'validate_yaml_data_from_file'
+    'is_valid',
+    'validate_yaml_events',
+    'validate_yaml_nodes',
+    'validate_yaml_stream',
+    'load_yaml_for_schema',
+    'validate_yaml_data_from_file',
+    'load_compiled_schema',
+    'compile',
+    'CompiledValidator'
 ]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'validate_yaml': 'yamlator.validators.core',
+    'is_valid': 'yamlator.validators.core',
+    'validate_yaml_events': 'yamlator.validators.streaming',
+    'validate_yaml_nodes': 'yamlator.validators.nodes',
+    'validate_yaml_stream': 'yamlator.validators.documents',
+    'load_yaml_for_schema': 'yamlator.validators.lazy',
+    'validate_yaml_data_from_file': 'yamlator.cmd.core',
+    'load_compiled_schema': 'yamlator.compiled_schema',
+    'compile': 'yamlator.validators.compiled',
+    'CompiledValidator': 'yamlator.validators.compiled',
+})
@@ -2,6 +2,7 @@
 
 from yamlator.cmd.core import main
 from yamlator.cmd.core import validate_yaml_data_from_file
+from yamlator.cmd.core import compile_schema_file
 from yamlator.cmd.core import display_violations
 from yamlator.cmd.core import DisplayMethod
 
@@ -9,6 +10,7 @@ from yamlator.cmd.core import DisplayMethod
 __all__ = [
     'main',
     'validate_yaml_data_from_file',
+    'compile_schema_file',
     'display_violations',
     'DisplayMethod'
 ]
@@ -1,41 +1,92 @@
-"""Handles the command line utility functions and entry point"""
+"""Handles the command line utility functions and entry point
 
+The schema parser, `argparse` and the output modules are imported when
+they are needed, so they are not imported when a compiled schema is used
+or when only the functions in this module are imported
+"""
+
+import os
+import sys
 import enum
-import argparse
 
+from collections import deque
 from typing import Iterator
+from typing import List
 
 from yamlator.utils import load_yaml_file
-from yamlator.parser import SchemaSyntaxError
-from yamlator.parser import parse_yamlator_schema
+from yamlator.parser.cache import default_schema_cache_dir
 from yamlator.validators.core import validate_yaml
+from yamlator.compiled_schema import COMPILED_SCHEMA_EXTENSION
+from yamlator.compiled_schema import is_compiled_schema_filename
+from yamlator.compiled_schema import load_compiled_schema
+from yamlator.compiled_schema import write_compiled_schema
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
 
+from yamlator.exceptions import MaxViolationsReachedError
 from yamlator.exceptions import SchemaParseError
 from yamlator.exceptions import ConstructNotFoundError
 from yamlator.exceptions import InvalidSchemaFilenameError
 from yamlator.exceptions import CycleDependencyError
+from yamlator.exceptions import InvalidCompiledSchemaError
+from yamlator.exceptions import SchemaSyntaxError
 from yamlator.violations import Violation
+from yamlator.violations import ViolationBudget
 
+from yamlator.cmd import outputs
 from yamlator.cmd.outputs import SuccessCode
-from yamlator.cmd.outputs import JSONOutput
-from yamlator.cmd.outputs import TableOutput
-from yamlator.cmd.outputs import YAMLOutput
 
 
-def main() -> int:
+_COMPILE_COMMAND = 'compile'
+
+# The modes that a YAML file can be validated with. The load mode loads the
+# whole file before it is validated, the streaming mode validates the events
+# of the parser, the nodes mode validates the composed nodes, the multi-doc
+# mode validates each document in the file and the lazy mode only constructs
+# the values that the schema validates
+LOAD_MODE = 'load'
+STREAMING_MODE = 'streaming'
+NODES_MODE = 'nodes'
+MULTI_DOC_MODE = 'multi-doc'
+LAZY_MODE = 'lazy'
+VALIDATION_MODES = (LOAD_MODE, STREAMING_MODE, NODES_MODE, MULTI_DOC_MODE,
+                    LAZY_MODE)
+
+
+def main(argv: List[str] = None) -> int:
     """Entry point into the Yamlator CLI
 
+    Args:
+        argv (List[str], optional): The command line arguments. By default
+            `None` is used, which reads the arguments from `sys.argv`
+
     Returns:
         A status code where 0 = success and -1 = error
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] == _COMPILE_COMMAND:
+        return _compile_main(argv[1:])
+
     parser = _create_args_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     violations = []
 
+    max_violations = args.max_violations
+    if args.fail_fast:
+        max_violations = 1
+
     try:
         violations = validate_yaml_data_from_file(
             yaml_filepath=args.file,
-            schema_filepath=args.ruleset_schema
+            schema_filepath=args.ruleset_schema,
+            schema_cache_dir=args.schema_cache,
+            schema_workers=args.schema_workers,
+            max_violations=max_violations,
+            loader=args.loader,
+            minimal_types=args.minimal_types,
+            mode=args.mode
         )
     except SchemaParseError as ex:
         print(f'Error when parsing schema: {ex}')
@@ -52,6 +103,9 @@ def main() -> int:
     except CycleDependencyError as ex:
         print(f'Cycle Detected Error: {ex}')
         return SuccessCode.ERR
+    except InvalidCompiledSchemaError as ex:
+        print(f'Error when loading compiled schema: {ex}')
+        return SuccessCode.ERR
     except ValueError as ex:
         print(ex)
         return SuccessCode.ERR
@@ -60,10 +114,58 @@ def main() -> int:
     return display_violations(violations, display_method)
 
 
+def _compile_main(argv: List[str]) -> int:
+    parser = _create_compile_args_parser()
+    args = parser.parse_args(argv)
+
+    output_filepath = args.output
+    if output_filepath is None:
+        output_filepath = _create_compiled_filename(args.schema)
+
+    try:
+        compile_schema_file(
+            schema_filepath=args.schema,
+            output_filepath=output_filepath,
+            schema_cache_dir=args.schema_cache,
+            schema_workers=args.schema_workers
+        )
+    except SchemaParseError as ex:
+        print(f'Error when parsing schema: {ex}')
+        return SuccessCode.ERR
+    except SchemaSyntaxError as ex:
+        print(ex)
+        return SuccessCode.ERR
+    except InvalidSchemaFilenameError as ex:
+        print(ex)
+        return SuccessCode.ERR
+    except CycleDependencyError as ex:
+        print(f'Cycle Detected Error: {ex}')
+        return SuccessCode.ERR
+    except OSError as ex:
+        print(ex)
+        return SuccessCode.ERR
+    except ValueError as ex:
+        print(ex)
+        return SuccessCode.ERR
+
+    print(f'Compiled {args.schema} to {output_filepath}')
+    return SuccessCode.SUCCESS
+
+
+def _create_compiled_filename(schema_filepath: str) -> str:
+    root, _ = os.path.splitext(schema_filepath)
+    return root + COMPILED_SCHEMA_EXTENSION
+
+
 def _create_args_parser():
     description = 'Yamlator is a CLI tool that allows a YAML file to be \
                   validated using a lightweight schema language'
 
+    # pylint: disable=import-outside-toplevel
+    import argparse
+    from yamlator.yaml_loader import AUTO_LOADER
+    from yamlator.yaml_loader import YAML_LOADERS
+
     parser = argparse.ArgumentParser(prog='yamlator', description=description)
     parser.add_argument('file', type=str,
                         help='The YAML file to be validated')
@@ -71,22 +173,155 @@ def _create_args_parser():
     parser.add_argument('-s', '--schema', type=str, required=True,
                         dest='ruleset_schema',
                         help='The schama that will be used to \
-                        validate the YAML file')
+                        validate the YAML file. Either a .ys schema \
+                        or a .ysc compiled schema')
 
     parser.add_argument('-o', '--output', type=str, required=False,
                         default='table', choices=['table', 'json', 'yaml'],
                         help='Defines the format that will be displayed \
                         for the violations')
+
+    parser.add_argument('--schema-cache', type=str, required=False,
+                        nargs='?', const=default_schema_cache_dir(),
+                        default=None, metavar='DIR', dest='schema_cache',
+                        help='Cache the parsed schema in DIR so it can be \
+                        reused until the schema or its imports change. \
+                        Defaults to ~/.cache/yamlator when DIR is omitted')
+
+    parser.add_argument('--schema-workers', type=int, required=False,
+                        default=None, metavar='N', dest='schema_workers',
+                        help='The number of processes used to load the \
+                        files imported by the schema')
+
+    violation_limits = parser.add_mutually_exclusive_group()
+    violation_limits.add_argument('--max-violations', type=int,
+                                  required=False, default=None, metavar='N',
+                                  dest='max_violations',
+                                  help='Stop validating the YAML file once \
+                                  N violations have been detected')
+
+    violation_limits.add_argument('--fail-fast', action='store_true',
+                                  dest='fail_fast',
+                                  help='Stop validating the YAML file at \
+                                  the first violation. The same as \
+                                  --max-violations 1')
+
+    parser.add_argument('--loader', type=str, required=False,
+                        default=AUTO_LOADER, choices=YAML_LOADERS,
+                        help='The parser used to load the YAML file. \
+                        Defaults to auto, which uses the libyaml parser \
+                        when it is available')
+
+    parser.add_argument('--minimal-types', action='store_true',
+                        dest='minimal_types',
+                        help='Only construct the types that can be \
+                        validated. Timestamps and tagged values are \
+                        loaded as the strings, lists and maps they are \
+                        written as')
+
+    validation_modes = parser.add_mutually_exclusive_group()
+    parser.set_defaults(mode=LOAD_MODE)
+    validation_modes.add_argument('--streaming', action='store_const',
+                                  dest='mode', const=STREAMING_MODE,
+                                  help='Validate the YAML file as it is \
+                                  parsed without loading the whole file, \
+                                  so the memory used does not grow with \
+                                  the size of the file')
+
+    validation_modes.add_argument('--node-mode', action='store_const',
+                                  dest='mode', const=NODES_MODE,
+                                  help='Validate the nodes composed by the \
+                                  YAML parser, which only constructs the \
+                                  values that are validated and reports \
+                                  the line and column of each violation')
+
+    validation_modes.add_argument('--multi-doc', action='store_const',
+                                  dest='mode', const=MULTI_DOC_MODE,
+                                  help='Validate each document in a YAML \
+                                  file that contains many documents \
+                                  separated by ---. The documents are \
+                                  loaded and validated one at a time')
+
+    validation_modes.add_argument('--lazy-load', action='store_const',
+                                  dest='mode', const=LAZY_MODE,
+                                  help='Only construct the values that the \
+                                  schema validates when the YAML file is \
+                                  loaded. Maps and lists with the any type \
+                                  and unknown fields are parsed past')
+    return parser
+
+
+def _create_compile_args_parser():
+    description = 'Compiles a Yamlator schema and the schemas it imports \
+                  into a single file that can be loaded without parsing'
+
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(prog='yamlator compile',
+                                     description=description)
+    parser.add_argument('schema', type=str,
+                        help='The schema file to compile')
+
+    parser.add_argument('-o', '--output', type=str, required=False,
+                        default=None,
+                        help='The path of the compiled schema. Defaults \
+                        to the schema path with the .ysc extension')
+
+    parser.add_argument('--schema-cache', type=str, required=False,
+                        nargs='?', const=default_schema_cache_dir(),
+                        default=None, metavar='DIR', dest='schema_cache',
+                        help='Cache the parsed schema in DIR so it can be \
+                        reused until the schema or its imports change. \
+                        Defaults to ~/.cache/yamlator when DIR is omitted')
+
+    parser.add_argument('--schema-workers', type=int, required=False,
+                        default=None, metavar='N', dest='schema_workers',
+                        help='The number of processes used to load the \
+                        files imported by the schema')
     return parser
 
 
 def validate_yaml_data_from_file(yaml_filepath: str,
-                                 schema_filepath: str) -> Iterator[Violation]:
+                                 schema_filepath: str,
+                                 schema_cache_dir: str = None,
+                                 schema_workers: int = None,
+                                 max_violations: int = None,
+                                 *,
+                                 loader: str = 'auto',
+                                 minimal_types: bool = False,
+                                 mode: str = LOAD_MODE
+                                 ) -> Iterator[Violation]:
     """Validate a YAML file with a schema file
 
     Args:
         yaml_filepath   (str): The path to the YAML data file
         schema_filepath (str): The path to the schema file
+        schema_cache_dir (str, optional): The directory used to cache
+            the parsed schema. By default `None` is used, which disables
+            the cache
+        schema_workers (int, optional): The number of processes used to
+            load the files imported by the schema. By default `None` is
+            used, which loads the files one at a time
+        max_violations (int, optional): The maximum number of violations
+            to detect before the validation is stopped. By default `None`
+            is used, which detects all the violations
+        loader (str, optional): The loader used to load the YAML file,
+            one of `'auto'`, `'c'` or `'python'`. By default `'auto'` is
+            used, which uses the C loader when PyYAML has been built with
+            libyaml
+        minimal_types (bool, optional): Only construct the types that
+            Yamlator can validate when the YAML file is loaded. By default
+            `False` is used, which constructs all the standard YAML types
+        mode (str, optional): How the YAML file is validated, one of
+            `'load'`, `'streaming'`, `'nodes'`, `'multi-doc'` or `'lazy'`.
+            By default `'load'` is used, which loads the whole file before
+            it is validated. `'streaming'` validates the events of the YAML
+            parser, and the violations are detected in the order they are
+            found in the file. `'nodes'` validates the nodes composed by the
+            YAML parser and detects the line and column of each violation.
+            `'multi-doc'` validates each document in the file and sets the
+            index of the document on each violation. `'lazy'` only
+            constructs the values that the schema validates
 
     Returns:
         A Iterator collection of `yamlator.violations.Violation` objects
@@ -94,20 +329,153 @@ def validate_yaml_data_from_file(yaml_filepath: str,
         the schema
 
     Raises:
-        ValueError: If either argument is `None` or an empty string
+        ValueError: If either argument is `None` or an empty string, or
+        `max_violations` is not a positive integer, or the loader is not
+        supported, or the mode is not supported
         FileNotFoundError: If either argument cannot be found on the file system
         InvalidSchemaFilenameError: If `schema_filepath` does not have
-        a valid filename that ends with the `.ys` extension.
+        a valid filename that ends with the `.ys` or `.ysc` extension.
+        SchemaParseError: If there was an error parsing the schema, e.g
+            syntax error or a type that was not found
+        InvalidCompiledSchemaError: If the compiled schema cannot be loaded
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f'mode should be one of {", ".join(VALIDATION_MODES)} '
+                         f'but got {mode}')
+
+    if mode in (STREAMING_MODE, MULTI_DOC_MODE):
+        instructions = _load_schema_file(schema_filepath, schema_cache_dir,
+                                         schema_workers)
+        return _stream_yaml_file(yaml_filepath, instructions, max_violations,
+                                 loader, minimal_types,
+                                 multi_doc=mode == MULTI_DOC_MODE)
+
+    if mode == NODES_MODE:
+        instructions = _load_schema_file(schema_filepath, schema_cache_dir,
+                                         schema_workers)
+        return _validate_yaml_file_nodes(yaml_filepath, instructions,
+                                         max_violations, loader,
+                                         minimal_types)
+
+    if mode == LAZY_MODE:
+        instructions = _load_schema_file(schema_filepath, schema_cache_dir,
+                                         schema_workers)
+        yaml_data = _load_yaml_file_for_schema(yaml_filepath, instructions,
+                                               loader, minimal_types)
+        return validate_yaml(yaml_data, instructions,
+                             max_violations=max_violations)
+
+    yaml_data = load_yaml_file(yaml_filepath, loader, minimal_types)
+    instructions = _load_schema_file(schema_filepath, schema_cache_dir,
+                                     schema_workers)
+    return validate_yaml(yaml_data, instructions,
+                         max_violations=max_violations)
+
+
+def _stream_yaml_file(yaml_filepath: str, schema: YamlatorSchema,
+                      max_violations: int, loader: str,
+                      minimal_types: bool, *, multi_doc: bool) -> deque:
+    _check_yaml_filepath(yaml_filepath)
+
+    # pylint: disable=import-outside-toplevel
+    from yamlator.validators.documents import validate_yaml_stream
+    from yamlator.validators.streaming import validate_yaml_events
+
+    validate = validate_yaml_stream if multi_doc else validate_yaml_events
+    violations = deque()
+    if max_violations is not None:
+        violations = ViolationBudget(max_violations)
+
+    with open(yaml_filepath, 'r', encoding='utf-8') as f:
+        try:
+            for violation in validate(f, schema, loader, minimal_types):
+                violations.append(violation)
+        except MaxViolationsReachedError:
+            # The validation was stopped because the maximum
+            # number of violations was detected
+            pass
+    return violations
+
+
+def _validate_yaml_file_nodes(yaml_filepath: str, schema: YamlatorSchema,
+                              max_violations: int, loader: str,
+                              minimal_types: bool) -> deque:
+    _check_yaml_filepath(yaml_filepath)
+
+    # pylint: disable=import-outside-toplevel
+    from yamlator.validators.nodes import validate_yaml_nodes
+
+    with open(yaml_filepath, 'r', encoding='utf-8') as f:
+        return validate_yaml_nodes(f, schema, loader, minimal_types,
+                                   max_violations)
+
+
+def _load_yaml_file_for_schema(yaml_filepath: str, schema: YamlatorSchema,
+                               loader: str, minimal_types: bool) -> Data:
+    _check_yaml_filepath(yaml_filepath)
+
+    # pylint: disable=import-outside-toplevel
+    from yamlator.validators.lazy import load_yaml_for_schema
+
+    with open(yaml_filepath, 'r', encoding='utf-8') as f:
+        return load_yaml_for_schema(f, schema, loader, minimal_types)
+
+
+def _check_yaml_filepath(yaml_filepath: str) -> None:
+    if yaml_filepath is None:
+        raise ValueError('filename cannot be None')
+
+    if len(yaml_filepath) == 0:
+        raise ValueError('filename cannot be an empty string')
+
+
+def compile_schema_file(schema_filepath: str, output_filepath: str,
+                        schema_cache_dir: str = None,
+                        schema_workers: int = None) -> YamlatorSchema:
+    """Compile a schema file and the schemas it imports into a compiled
+    schema file, which can be loaded with
+    `yamlator.compiled_schema.load_compiled_schema`
+
+    Args:
+        schema_filepath (str): The path to the schema file
+        output_filepath (str): The path the compiled schema is written to
+        schema_cache_dir (str, optional): The directory used to cache
+            the parsed schema. By default `None` is used, which disables
+            the cache
+        schema_workers (int, optional): The number of processes used to
+            load the files imported by the schema. By default `None` is
+            used, which loads the files one at a time
+
+    Returns:
+        The `yamlator.types.YamlatorSchema` that was compiled
+
+    Raises:
+        ValueError: If either path is `None` or an empty string
+        FileNotFoundError: If the schema cannot be found on the file system
+        InvalidSchemaFilenameError: If `schema_filepath` does not have
+        a valid filename that ends with the `.ys` or `.ysc` extension.
         SchemaParseError: If there was an error parsing the schema, e.g
             syntax error or a type that was not found
     """
-    yaml_data = load_yaml_file(yaml_filepath)
-    instructions = None
+    schema = _load_schema_file(schema_filepath, schema_cache_dir,
+                               schema_workers)
+    write_compiled_schema(schema, output_filepath)
+    return schema
+
+
+def _load_schema_file(schema_filepath: str, schema_cache_dir: str,
+                      schema_workers: int) -> YamlatorSchema:
+    if is_compiled_schema_filename(schema_filepath):
+        return load_compiled_schema(schema_filepath)
+
+    # pylint: disable=import-outside-toplevel
+    from yamlator.parser.loaders import parse_yamlator_schema
+
     try:
-        instructions = parse_yamlator_schema(schema_filepath)
+        return parse_yamlator_schema(schema_filepath, schema_cache_dir,
+                                     schema_workers)
     except ConstructNotFoundError as ex:
         raise SchemaParseError(ex) from ex
-    return validate_yaml(yaml_data, instructions)
 
 
 class DisplayMethod(enum.Enum):
@@ -143,10 +511,11 @@ def display_violations(violations: Iterator[Violation],
         raise ValueError('method should not be None')
 
     strategies = {
-        DisplayMethod.JSON: JSONOutput,
-        DisplayMethod.TABLE: TableOutput,
-        DisplayMethod.YAML: YAMLOutput,
+        DisplayMethod.JSON: 'JSONOutput',
+        DisplayMethod.TABLE: 'TableOutput',
+        DisplayMethod.YAML: 'YAMLOutput',
     }
 
-    display_option = strategies.get(method, TableOutput)
+    # Only the output that is used is imported
+    display_option = getattr(outputs, strategies.get(method, 'TableOutput'))
     return display_option.display(violations)
@@ -1,9 +1,17 @@
-"""Shortcuts for accessing display options"""
+"""Shortcuts for accessing display options
 
+The output classes are imported when they are first used, so only
+the output that is displayed is imported
+"""
+
+from typing import TYPE_CHECKING
 from yamlator.cmd.outputs.base import SuccessCode
-from yamlator.cmd.outputs.json_output import JSONOutput
-from yamlator.cmd.outputs.table_output import TableOutput
-from yamlator.cmd.outputs.yaml_output import YAMLOutput
+from yamlator.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from yamlator.cmd.outputs.json_output import JSONOutput
+    from yamlator.cmd.outputs.table_output import TableOutput
+    from yamlator.cmd.outputs.yaml_output import YAMLOutput
 
 
 __all__ = [
@@ -12,3 +20,9 @@ __all__ = [
     'TableOutput',
     'YAMLOutput',
 ]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'JSONOutput': 'yamlator.cmd.outputs.json_output',
+    'TableOutput': 'yamlator.cmd.outputs.table_output',
+    'YAMLOutput': 'yamlator.cmd.outputs.yaml_output',
+})
@@ -35,14 +35,42 @@ class TableOutput(ViolationOutput):
         if not has_violations:
             return SuccessCode.SUCCESS
 
+        # The line of each violation is only known
+        # when the YAML nodes have been validated
+        has_lines = any(violation.line is not None
+                        for violation in violations)
+        line_title = 'Line' if has_lines else ''
+        line_width = 11 if has_lines else 0
+
+        # The document of each violation is only known when
+        # the documents of a YAML stream have been validated
+        has_documents = any(violation.document is not None
+                            for violation in violations)
+        document_title = 'Document' if has_documents else ''
+        document_width = 10 if has_documents else 0
+
         parent_title = 'Parent Key'
         key_title = 'Key'
         violation_title = 'Violation'
         message_title = 'Message'
-        print(f'\n{parent_title:<30} {key_title:<20} {violation_title:<15} {message_title:<20}')  # nopep8 pylint: disable=C0301
+        print(f'\n{document_title:<{document_width}}{line_title:<{line_width}}{parent_title:<30} {key_title:<20} {violation_title:<15} {message_title:<20}')  # nopep8 pylint: disable=C0301
 
         print('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
         for violation in violations:
-            print(f'{violation.parent:<30} {violation.key:<20} {violation.violation_type:<15} {violation.message:<20}')  # nopep8 pylint: disable=C0301
+            document = _document(violation)
+            location = _location(violation) if has_lines else ''
+            print(f'{document:<{document_width}}{location:<{line_width}}{violation.parent:<30} {violation.key:<20} {violation.violation_type:<15} {violation.message:<20}')  # nopep8 pylint: disable=C0301
         print('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
         return SuccessCode.ERR
+
+
+def _document(violation: Violation) -> str:
+    if violation.document is None:
+        return ''
+    return str(violation.document)
+
+
+def _location(violation: Violation) -> str:
+    if violation.line is None:
+        return ''
+    return f'{violation.line}:{violation.column}'
@@ -9,14 +9,6 @@ from yamlator.violations import Violation
 from yamlator.cmd.outputs.base import SuccessCode
 from yamlator.cmd.outputs.base import ViolationOutput
 
-from yamlator.violations import RequiredViolation
-from yamlator.violations import TypeViolation
-from yamlator.violations import BuiltInTypeViolation
-from yamlator.violations import RulesetTypeViolation
-from yamlator.violations import RegexTypeViolation
-from yamlator.violations import StrictRulesetViolation
-from yamlator.violations import StrictEntryPointViolation
-
 
 class YAMLOutput(ViolationOutput):
     """Display violations as YAML"""
@@ -54,16 +46,11 @@ class YAMLOutput(ViolationOutput):
 
     @staticmethod
     def _set_up_dumper() -> None:
-        yaml.add_representer(deque, YAMLOutput._deque_dumper)
-        yaml.add_representer(RequiredViolation, YAMLOutput._violation_dumper)
-        yaml.add_representer(TypeViolation, YAMLOutput._violation_dumper)
-        yaml.add_representer(BuiltInTypeViolation, YAMLOutput._violation_dumper)
-        yaml.add_representer(RulesetTypeViolation, YAMLOutput._violation_dumper)
-        yaml.add_representer(RegexTypeViolation, YAMLOutput._violation_dumper)
-        yaml.add_representer(StrictRulesetViolation,
-                             YAMLOutput._violation_dumper)
-        yaml.add_representer(StrictEntryPointViolation,
-                             YAMLOutput._violation_dumper)
+        yaml.add_multi_representer(deque, YAMLOutput._deque_dumper)
+
+        # Handles every subclass of violation, since the messages
+        # of the violations are created when they are dumped
+        yaml.add_multi_representer(Violation, YAMLOutput._violation_dumper)
 
     @staticmethod
     def _deque_dumper(dumper: yaml.Dumper, data: deque) -> yaml.SequenceNode:
@@ -78,4 +65,9 @@ class YAMLOutput(ViolationOutput):
             'message': data.message,
             'violationType': data.violation_type
         }
+        if data.document is not None:
+            data_dict['document'] = data.document
+        if data.line is not None:
+            data_dict['line'] = data.line
+            data_dict['column'] = data.column
         return dumper.represent_dict(data_dict)
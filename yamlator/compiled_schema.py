@@ -0,0 +1,238 @@
+"""Reads and writes compiled Yamlator schemas.
+
+A compiled schema contains a fully resolved `yamlator.types.YamlatorSchema`,
+where the imports and ruleset inheritance have already been resolved, stored
+as versioned JSON. Loading a compiled schema only depends on the Yamlator
+types, so a schema can be loaded without the schema parser.
+"""
+
+import re
+import json
+
+from typing import Any
+from typing import Dict
+
+from yamlator.types import EnumItem
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import UnionRuleType
+from yamlator.types import YamlatorEnum
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.exceptions import InvalidCompiledSchemaError
+
+COMPILED_SCHEMA_EXTENSION = '.ysc'
+
+# Bumped whenever the structure of the compiled schema changes
+_COMPILED_SCHEMA_FORMAT = 'yamlator-compiled-schema'
+_COMPILED_SCHEMA_VERSION = 1
+
+
+def dump_compiled_schema(schema: YamlatorSchema) -> str:
+    """Converts a schema into the compiled schema format
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The fully resolved schema
+
+    Returns:
+        A string containing the compiled schema
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    compiled_schema = {
+        'format': _COMPILED_SCHEMA_FORMAT,
+        'version': _COMPILED_SCHEMA_VERSION,
+        'root': _dump_ruleset(schema.root),
+        'rulesets': {name: _dump_ruleset(ruleset)
+                     for name, ruleset in schema.rulesets.items()},
+        'enums': {name: _dump_enum(enum)
+                  for name, enum in schema.enums.items()}
+    }
+    return json.dumps(compiled_schema, separators=(',', ':'))
+
+
+def write_compiled_schema(schema: YamlatorSchema, filename: str) -> None:
+    """Writes a schema to a file in the compiled schema format
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The fully resolved schema
+        filename (str): The path of the file to write the schema to
+
+    Raises:
+        ValueError: If the `schema` or `filename` parameters are `None`
+            or `filename` is an empty string
+    """
+    if not filename:
+        raise ValueError('filename should be a non-empty string')
+
+    content = dump_compiled_schema(schema)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def parse_compiled_schema(content: str) -> YamlatorSchema:
+    """Builds a schema from the content of a compiled schema
+
+    Args:
+        content (str): The content of a compiled schema
+
+    Returns:
+        The `yamlator.types.YamlatorSchema` stored in the compiled schema
+
+    Raises:
+        ValueError: If the `content` parameter is `None`
+
+        yamlator.exceptions.InvalidCompiledSchemaError: If the content
+            is not a compiled schema or was compiled with an unsupported
+            version of the format
+    """
+    if content is None:
+        raise ValueError('content should not be None')
+
+    try:
+        compiled_schema = json.loads(content)
+    except ValueError as ex:
+        raise InvalidCompiledSchemaError('content is not valid JSON') from ex
+
+    if not isinstance(compiled_schema, dict) or \
+            compiled_schema.get('format') != _COMPILED_SCHEMA_FORMAT:
+        raise InvalidCompiledSchemaError('content is not a compiled schema')
+
+    version = compiled_schema.get('version')
+    if version != _COMPILED_SCHEMA_VERSION:
+        raise InvalidCompiledSchemaError(
+            f'version {version} of the compiled schema format is not '
+            f'supported, expected version {_COMPILED_SCHEMA_VERSION}')
+
+    try:
+        root = _load_ruleset(compiled_schema['root'])
+        rulesets = {name: _load_ruleset(ruleset) for name, ruleset
+                    in compiled_schema['rulesets'].items()}
+        enums = {name: _load_enum(name, enum) for name, enum
+                 in compiled_schema['enums'].items()}
+    except (KeyError, TypeError, AttributeError, re.error) as ex:
+        raise InvalidCompiledSchemaError(
+            f'compiled schema is missing or has an invalid field: {ex}'
+        ) from ex
+    return YamlatorSchema(root, rulesets, enums)
+
+
+def load_compiled_schema(filename: str) -> YamlatorSchema:
+    """Loads a compiled schema from the file system
+
+    Args:
+        filename (str): The path to the compiled schema file
+
+    Returns:
+        The `yamlator.types.YamlatorSchema` stored in the compiled schema
+
+    Raises:
+        ValueError: If `filename` is `None` or an empty string
+
+        FileNotFoundError: If the file cannot be found
+
+        yamlator.exceptions.InvalidCompiledSchemaError: If the file
+            is not a compiled schema or was compiled with an unsupported
+            version of the format
+    """
+    if filename is None:
+        raise ValueError('filename cannot be None')
+
+    if len(filename) == 0:
+        raise ValueError('filename cannot be an empty string')
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        return parse_compiled_schema(f.read())
+
+
+def is_compiled_schema_filename(filename: str) -> bool:
+    """Checks if a filename has the compiled schema extension
+
+    Args:
+        filename (str): The filename to check
+
+    Returns:
+        True if the filename ends with `.ysc`, otherwise False
+    """
+    return bool(filename) and filename.endswith(COMPILED_SCHEMA_EXTENSION)
+
+
+def _dump_ruleset(ruleset: YamlatorRuleset) -> Dict[str, Any]:
+    rules = [{
+        'name': rule.name,
+        'type': _dump_rule_type(rule.rtype),
+        'required': rule.is_required
+    } for rule in ruleset.rules]
+
+    parent = None
+    if ruleset.parent is not None:
+        parent = _dump_rule_type(ruleset.parent)
+
+    return {
+        'name': ruleset.name,
+        'rules': rules,
+        'strict': ruleset.is_strict,
+        'parent': parent
+    }
+
+
+def _dump_rule_type(rtype: RuleType) -> Dict[str, Any]:
+    dumped_type = {'type': rtype.schema_type.name}
+
+    if rtype.schema_type == SchemaTypes.UNION:
+        dumped_type['sub_types'] = [_dump_rule_type(sub_type)
+                                    for sub_type in rtype.sub_types]
+        return dumped_type
+
+    if rtype.lookup is not None:
+        dumped_type['lookup'] = rtype.lookup
+
+    if rtype.sub_type is not None:
+        dumped_type['sub_type'] = _dump_rule_type(rtype.sub_type)
+
+    if rtype.regex is not None:
+        dumped_type['regex'] = rtype.regex.pattern
+    return dumped_type
+
+
+def _dump_enum(enum: YamlatorEnum) -> Dict[str, Any]:
+    items = [[item.name, item.value] for item in enum.items.values()]
+    return {'items': items}
+
+
+def _load_ruleset(ruleset: Dict[str, Any]) -> YamlatorRuleset:
+    rules = [Rule(rule['name'], _load_rule_type(rule['type']),
+                  rule['required'])
+             for rule in ruleset['rules']]
+
+    parent = None
+    if ruleset['parent'] is not None:
+        parent = _load_rule_type(ruleset['parent'])
+    return YamlatorRuleset(ruleset['name'], rules, ruleset['strict'], parent)
+
+
+def _load_rule_type(rtype: Dict[str, Any]) -> RuleType:
+    schema_type = SchemaTypes[rtype['type']]
+
+    if schema_type == SchemaTypes.UNION:
+        sub_types = [_load_rule_type(sub_type)
+                     for sub_type in rtype['sub_types']]
+        return UnionRuleType(sub_types)
+
+    sub_type = rtype.get('sub_type')
+    if sub_type is not None:
+        sub_type = _load_rule_type(sub_type)
+
+    return RuleType(schema_type, lookup=rtype.get('lookup'),
+                    sub_type=sub_type, regex=rtype.get('regex'))
+
+
+def _load_enum(name: str, enum: Dict[str, Any]) -> YamlatorEnum:
+    items = {value: EnumItem(item_name, value)
+             for item_name, value in enum['items']}
+    return YamlatorEnum(name, items)
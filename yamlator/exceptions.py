@@ -49,3 +49,52 @@ class CycleDependencyError(RuntimeError):
     a dependency chain
     """
     pass
+
+
+class InvalidCompiledSchemaError(RuntimeError):
+    """When a compiled schema cannot be loaded because the content
+    is not a compiled schema or the format version is not supported
+    """
+    pass
+
+
+class MaxViolationsReachedError(RuntimeError):
+    """Raised by a `yamlator.violations.ViolationBudget` when the maximum
+    number of violations has been reached, which stops the validation
+    """
+
+    def __init__(self, max_violations: int):
+        """MaxViolationsReachedError init
+
+        Args:
+            max_violations (int): The maximum number of violations
+        """
+        message = f'The maximum of {max_violations} violations was reached'
+        super().__init__(message)
+
+
+class SchemaSyntaxError(SyntaxError):
+    """A generic syntax error in the schema content"""
+
+    label = None
+
+    def __str__(self) -> str:
+        context, line, column, *_ = self.args
+        if self.label is None:
+            return f'Error on line {line}, column {column}.\n\n{context}'
+        return f'{self.label} at line {line}, column {column}.\n\n{context}'
+
+
+class MalformedRulesetNameError(SchemaSyntaxError):
+    """Indicates an error in the ruleset name"""
+    label = 'Invalid ruleset name'
+
+
+class MalformedEnumNameError(SchemaSyntaxError):
+    """Indicates an error in the enum name"""
+    label = 'Invalid enum name'
+
+
+class MissingRulesError(SchemaSyntaxError):
+    """Indicates that a ruleset or schema block is missing rules"""
+    label = 'Missing rules'
@@ -0,0 +1,56 @@
+"""Utilities for importing the attributes of a package when they are
+first used, so importing a package does not import every module it
+provides shortcuts for
+"""
+
+import sys
+import importlib
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+def lazy_attributes(package_name: str, attributes: Dict[str, str]
+                    ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Creates the module level `__getattr__` and `__dir__` functions that
+    import an attribute from its module the first time it is accessed
+
+    Args:
+        package_name (str): The name of the package the attributes
+            are accessed from
+
+        attributes (dict): The name of the module that defines each
+            attribute, keyed by the name of the attribute
+
+    Returns:
+        A tuple containing the `__getattr__` and `__dir__` functions
+        for the package
+    """
+    package = sys.modules[package_name]
+
+    def get_attribute(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f'module {package_name!r} has no attribute {name!r}')
+
+        value = getattr(importlib.import_module(module_name), name)
+
+        # Store the attribute on the package so that
+        # it is only imported the first time it is used
+        setattr(package, name, value)
+        return value
+
+    def list_attributes() -> List[str]:
+        return sorted(set(vars(package)) | set(attributes))
+
+    # Module level `__getattr__` functions are not supported before
+    # Python 3.7, so the attributes are imported straight away
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            get_attribute(name)
+
+    return get_attribute, list_attributes
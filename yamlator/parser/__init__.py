@@ -1,23 +1,56 @@
 """Module that contains utility functions and exceptions for parsing a
 Yamlator schemas
+
+The functions are imported when they are first used, so importing the
+schema cache functions does not import the parser
 """
 
-from .core import parse_schema
-from .core import SchemaTransformer
-from .core import SchemaSyntaxError
-from .core import MissingRulesError
-from .core import MalformedRulesetNameError
-from .core import MalformedEnumNameError
-from .core import SchemaParseError
-from .loaders import parse_yamlator_schema
+from typing import TYPE_CHECKING
+from yamlator.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from yamlator.parser.core import parse_schema
+    from yamlator.parser.core import get_schema_parser
+    from yamlator.parser.core import reset_schema_parser
+    from yamlator.parser.core import SchemaTransformer
+    from yamlator.exceptions import SchemaSyntaxError
+    from yamlator.exceptions import MissingRulesError
+    from yamlator.exceptions import SchemaParseError
+    from yamlator.exceptions import MalformedRulesetNameError
+    from yamlator.exceptions import MalformedEnumNameError
+    from yamlator.parser.loaders import parse_yamlator_schema
+    from yamlator.parser.cache import clear_schema_cache
+    from yamlator.parser.cache import set_schema_cache_size
+    from yamlator.parser.cache import schema_cache_info
 
 __all__ = [
     'parse_schema',
+    'get_schema_parser',
+    'reset_schema_parser',
     'SchemaTransformer',
     'SchemaSyntaxError',
     'MissingRulesError',
     'SchemaParseError',
     'MalformedRulesetNameError',
     'MalformedEnumNameError',
-    'parse_yamlator_schema'
+    'parse_yamlator_schema',
+    'clear_schema_cache',
+    'set_schema_cache_size',
+    'schema_cache_info'
 ]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'parse_schema': 'yamlator.parser.core',
+    'get_schema_parser': 'yamlator.parser.core',
+    'reset_schema_parser': 'yamlator.parser.core',
+    'SchemaTransformer': 'yamlator.parser.core',
+    'SchemaSyntaxError': 'yamlator.exceptions',
+    'MissingRulesError': 'yamlator.exceptions',
+    'SchemaParseError': 'yamlator.exceptions',
+    'MalformedRulesetNameError': 'yamlator.exceptions',
+    'MalformedEnumNameError': 'yamlator.exceptions',
+    'parse_yamlator_schema': 'yamlator.parser.loaders',
+    'clear_schema_cache': 'yamlator.parser.cache',
+    'set_schema_cache_size': 'yamlator.parser.cache',
+    'schema_cache_info': 'yamlator.parser.cache',
+})
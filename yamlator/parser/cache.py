@@ -0,0 +1,377 @@
+"""Maintains the in-memory and persistent caches of Yamlator schemas"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+
+from typing import Any
+from typing import Dict
+from typing import Callable
+from typing import Tuple
+from collections import OrderedDict
+from collections import namedtuple
+
+from yamlator.types import YamlatorSchema
+
+
+# Bumped whenever the structure of the cached objects changes
+# so that entries written by older versions are ignored
+_CACHE_FORMAT_VERSION = 1
+_CACHE_ENTRY_EXTENSION = '.pickle'
+
+DEFAULT_SCHEMA_CACHE_SIZE = 128
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+SchemaCacheInfo = namedtuple('SchemaCacheInfo', ['files', 'contents'])
+
+
+def default_schema_cache_dir() -> str:
+    """Fetches the default directory for the schema cache. This will be
+    `$XDG_CACHE_HOME/yamlator` if the variable is set, otherwise
+    `~/.cache/yamlator`
+
+    Returns:
+        A string of the path to the default cache directory
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'yamlator')
+
+
+def hash_schema_content(schema_content: str) -> str:
+    """Hashes the content of a schema file
+
+    Args:
+        schema_content (str): The content of a schema file
+
+    Returns:
+        A Md5 hash of the schema content
+    """
+    return hashlib.md5(schema_content.encode('utf-8')).hexdigest()
+
+
+class SchemaFileCache:
+    """Stores fully resolved schemas on the file system so that a schema
+    can be loaded without being parsed again. Each entry records the
+    content hash of the schema file and every file it imports. An entry
+    is only used when all of those files are unchanged
+
+    __Note__: Entries are stored with `pickle`, so the cache directory
+    should only be writable by the user running Yamlator
+    """
+
+    def __init__(self, cache_dir: str):
+        """SchemaFileCache init
+
+        Args:
+            cache_dir (str): The directory that the cache entries are
+                stored in. The directory is created if it does not exist
+
+        Raises:
+            ValueError: If `cache_dir` is `None` or an empty string
+        """
+        if not cache_dir:
+            raise ValueError('cache_dir should be a non-empty string')
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def load(self, schema_path: str) -> YamlatorSchema:
+        """Loads a schema from the cache
+
+        Args:
+            schema_path (str): The path to the root schema file
+
+        Returns:
+            The cached `yamlator.types.YamlatorSchema` or `None` if the
+            schema is not cached or any file it depends on has changed
+        """
+        entry_path = self._entry_path(schema_path)
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # A corrupt or incompatible entry is treated as a cache miss
+            return None
+
+        if entry.get('version') != _CACHE_FORMAT_VERSION:
+            return None
+
+        for path, content_hash in entry['sources'].items():
+            if _hash_file(path) != content_hash:
+                return None
+        return entry['schema']
+
+    def save(self, schema_path: str, schema: YamlatorSchema,
+             sources: Dict[str, str]) -> None:
+        """Saves a fully resolved schema in the cache. Failing to write
+        to the cache will not raise an exception since the schema can
+        still be loaded from the schema files
+
+        Args:
+            schema_path (str): The path to the root schema file
+
+            schema (yamlator.types.YamlatorSchema): The resolved schema
+
+            sources (dict): The content hash of every file that was loaded
+                to build the schema, keyed by the absolute path of the file
+        """
+        entry = {
+            'version': _CACHE_FORMAT_VERSION,
+            'sources': sources,
+            'schema': schema
+        }
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+
+            # Write to a temporary file first so that a concurrent
+            # run never reads a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(schema_path))
+        except (OSError, pickle.PicklingError):
+            pass
+
+    def _entry_path(self, schema_path: str) -> str:
+        path = os.path.abspath(schema_path).encode('utf-8')
+        entry_name = hashlib.sha256(path).hexdigest()
+        return os.path.join(self._cache_dir,
+                            entry_name + _CACHE_ENTRY_EXTENSION)
+
+
+def _hash_file(path: str) -> str:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return hash_schema_content(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class LRUCache:
+    """A thread safe, bounded cache that evicts the least recently
+    used entry once the maximum size has been reached
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SCHEMA_CACHE_SIZE):
+        """LRUCache init
+
+        Args:
+            maxsize (int, optional): The maximum number of entries. A
+                `maxsize` of 0 disables the cache
+
+        Raises:
+            ValueError: If `maxsize` is negative
+        """
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = _validate_maxsize(maxsize)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        maxsize = _validate_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: str, is_valid: Callable[[Any], bool] = None) -> Any:
+        """Fetches an entry from the cache and marks it as the most
+        recently used entry
+
+        Args:
+            key (str): The key of the entry
+
+            is_valid (Callable, optional): A function that is given the
+                cached value and returns `False` if the value is stale.
+                Stale entries are removed and counted as a miss
+
+        Returns:
+            The cached value or `None` if the key is not in the cache
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None and is_valid is not None \
+                    and not is_valid(value):
+                del self._entries[key]
+                value = None
+
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Adds an entry to the cache, evicting the least recently
+        used entry if the cache is full
+
+        Args:
+            key (str): The key of the entry
+            value (Any): The value to cache, which cannot be `None`
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Fetches the cache statistics
+
+        Returns:
+            A `CacheInfo` with the number of hits and misses, the maximum
+            size and the current number of entries
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses,
+                             self._maxsize, len(self._entries))
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+def _validate_maxsize(maxsize: int) -> int:
+    if not isinstance(maxsize, int) or maxsize < 0:
+        raise ValueError('maxsize should be a non-negative integer')
+    return maxsize
+
+
+# Fully resolved schemas keyed by the absolute path of the root schema.
+# Each entry stores the file stamps of every file in the import closure
+schema_file_cache = LRUCache()
+
+# Pickled results of `parse_schema` keyed by the hash of the schema content
+schema_content_cache = LRUCache()
+
+
+def fetch_cached_schema(schema_path: str) -> YamlatorSchema:
+    """Fetches a fully resolved schema from the in-memory schema cache
+
+    Args:
+        schema_path (str): The path to the root schema file
+
+    Returns:
+        The cached `yamlator.types.YamlatorSchema` or `None` if the schema
+        is not cached or the modification time or size of any file in its
+        import closure has changed
+    """
+    def has_unchanged_files(entry) -> bool:
+        stamps, _ = entry
+        return _fetch_file_stamps(stamps) == stamps
+
+    entry = schema_file_cache.get(os.path.abspath(schema_path),
+                                  has_unchanged_files)
+    if entry is None:
+        return None
+    _, schema = entry
+    return schema
+
+
+def cache_schema(schema_path: str, schema: YamlatorSchema,
+                 stamps: Dict[str, Tuple[int, int]]) -> None:
+    """Adds a fully resolved schema to the in-memory schema cache
+
+    Args:
+        schema_path (str): The path to the root schema file
+
+        schema (yamlator.types.YamlatorSchema): The resolved schema
+
+        stamps (dict): The file stamp of every file that was loaded to
+            build the schema, keyed by the absolute path of the file. Each
+            stamp should be fetched with `fetch_file_stamp` before the file
+            is read, so a file that changes after it was read does not
+            match its stamp. A stamp of `None` prevents the schema from
+            being cached
+    """
+    if schema_file_cache.maxsize == 0:
+        return
+
+    if None in stamps.values():
+        return
+    schema_file_cache.put(os.path.abspath(schema_path), (stamps, schema))
+
+
+def fetch_file_stamp(path: str) -> Tuple[int, int]:
+    """Fetches the stamp of a file, which is used to detect that a file
+    has changed without reading it
+
+    Args:
+        path (str): The path to the file
+
+    Returns:
+        A tuple of the modification time in nanoseconds and the size of
+        the file or `None` if the file cannot be accessed
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _fetch_file_stamps(paths) -> Dict[str, Tuple[int, int]]:
+    stamps = {}
+    for path in paths:
+        stamp = fetch_file_stamp(path)
+        if stamp is None:
+            return None
+        stamps[path] = stamp
+    return stamps
+
+
+def clear_schema_cache() -> None:
+    """Removes every schema from the in-memory schema caches and resets
+    the cache statistics. The persistent schema cache is not affected
+    """
+    schema_file_cache.clear()
+    schema_content_cache.clear()
+
+
+def set_schema_cache_size(maxsize: int) -> None:
+    """Sets the maximum number of entries in each in-memory schema cache.
+    Existing entries are evicted if the cache exceeds the new size
+
+    Args:
+        maxsize (int): The maximum number of entries. A `maxsize` of 0
+            disables the in-memory schema caches
+
+    Raises:
+        ValueError: If `maxsize` is not a non-negative integer
+    """
+    schema_file_cache.maxsize = maxsize
+    schema_content_cache.maxsize = maxsize
+
+
+def schema_cache_info() -> SchemaCacheInfo:
+    """Fetches the statistics of the in-memory schema caches
+
+    Returns:
+        A `SchemaCacheInfo` where `files` contains the statistics for the
+        schemas loaded from a file path and `contents` contains the
+        statistics for the schemas parsed from the schema content
+    """
+    return SchemaCacheInfo(schema_file_cache.info(),
+                           schema_content_cache.info())
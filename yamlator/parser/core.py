@@ -1,19 +1,23 @@
 """Maintains the parser transformers"""
 
+import io
 import re
 import os
 import enum
+import pickle
+import hashlib
+import threading
 
 from pathlib import Path
 from typing import Iterator
 from typing import Any
 
 from lark import Lark
+from lark import __version__ as lark_version
 from lark import v_args
 from lark import Transformer
 from lark import Token
 from lark import UnexpectedInput
-from lark.exceptions import VisitError
 
 from yamlator.types import Rule
 from yamlator.types import ContainerTypes
@@ -29,13 +33,135 @@ from yamlator.types import ImportedType
 from yamlator.types import ImportStatement
 from yamlator.exceptions import NestedUnionError
 from yamlator.exceptions import SchemaParseError
+from yamlator.exceptions import SchemaSyntaxError
+from yamlator.exceptions import MalformedRulesetNameError
+from yamlator.exceptions import MalformedEnumNameError
+from yamlator.exceptions import MissingRulesError
+from yamlator.parser.cache import schema_content_cache
+from yamlator.parser.cache import hash_schema_content
 
 
 _package_dir = Path(__file__).parent.parent.absolute()
 _GRAMMAR_FILE = os.path.join(_package_dir, 'grammar/grammar.lark')
 
+# A precompiled parser built from the grammar file. This is generated when
+# the package is built and allows the parser to be created without
+# having to analyse the grammar
+_PARSER_ARTIFACT = os.path.join(_package_dir, 'grammar/grammar.lark.pickle')
+
 _QUOTES_REGEX = re.compile(r'\"|\'')
 
+# The Lark parser is expensive to build since the grammar has to be read
+# and analysed, so a single instance is lazily created and shared by
+# every call to `parse_schema`
+_schema_parser = None
+_schema_parser_lock = threading.Lock()
+
+
+def get_schema_parser() -> Lark:
+    """Fetches the Lark parser used to parse Yamlator schemas. The parser
+    is built on first use and the same instance is returned for every
+    subsequent call, including calls from different threads
+
+    Returns:
+        A `lark.Lark` parser that has been built from the Yamlator grammar
+    """
+    global _schema_parser
+
+    parser = _schema_parser
+    if parser is not None:
+        return parser
+
+    with _schema_parser_lock:
+        if _schema_parser is None:
+            _schema_parser = _create_schema_parser()
+        return _schema_parser
+
+
+def reset_schema_parser() -> None:
+    """Discards the shared Lark parser so that the next call to
+    `get_schema_parser` rebuilds it from the grammar file
+    """
+    global _schema_parser
+
+    with _schema_parser_lock:
+        _schema_parser = None
+
+
+def build_schema_parser_artifact(artifact_path: str = _PARSER_ARTIFACT) -> str:
+    """Builds the parser from the grammar file and saves it as a
+    precompiled artifact that `get_schema_parser` can load without
+    analysing the grammar. The artifact records the grammar it was
+    built from so a stale artifact is ignored
+
+    Args:
+        artifact_path (str, optional): The path to write the artifact to.
+            Defaults to the artifact path in the Yamlator package
+
+    Returns:
+        The path the artifact was written to
+    """
+    parser = Lark.open(_GRAMMAR_FILE, parser='lalr')
+
+    serialized_parser = io.BytesIO()
+    parser.save(serialized_parser)
+
+    artifact = {
+        'grammar_hash': _hash_grammar_file(),
+        'lark_version': lark_version,
+        'parser': serialized_parser.getvalue()
+    }
+
+    with open(artifact_path, 'wb') as f:
+        pickle.dump(artifact, f)
+    return artifact_path
+
+
+def _create_schema_parser() -> Lark:
+    parser = _load_schema_parser_artifact(_PARSER_ARTIFACT)
+    if parser is not None:
+        return parser
+
+    return Lark.open(_GRAMMAR_FILE, parser='lalr',
+                     transformer=SchemaTransformer())
+
+
+def _load_schema_parser_artifact(artifact_path: str) -> Lark:
+    try:
+        with open(artifact_path, 'rb') as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:  # pylint: disable=broad-except
+        # An unreadable artifact is ignored since the
+        # parser can still be built from the grammar
+        return None
+
+    is_stale = (artifact.get('grammar_hash') != _hash_grammar_file()) or \
+        (artifact.get('lark_version') != lark_version)
+    if is_stale:
+        return None
+
+    # `Lark.load` does not accept any options, so the transformer is
+    # passed in the same way Lark loads its own cached parsers. This is
+    # not part of the public Lark API, so the major version of Lark is
+    # pinned in `setup.py` and the parser is built from the grammar if
+    # the artifact cannot be loaded by the installed version of Lark
+    try:
+        serialized_parser = pickle.loads(artifact['parser'])
+        return Lark._load_from_dict(  # pylint: disable=protected-access
+            serialized_parser['data'],
+            serialized_parser['memo'],
+            transformer=SchemaTransformer()
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _hash_grammar_file() -> str:
+    with open(_GRAMMAR_FILE, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
 
 def parse_schema(schema_content: str) -> PartiallyLoadedYamlatorSchema:
     """Parses a schema into a set of instructions that can be
@@ -59,14 +185,38 @@ def parse_schema(schema_content: str) -> PartiallyLoadedYamlatorSchema:
     if schema_content is None:
         raise ValueError('schema_content should not be None')
 
-    lark_parser = Lark.open(_GRAMMAR_FILE)
-    transformer = SchemaTransformer()
+    if not isinstance(schema_content, str):
+        return _parse_schema_content(schema_content)
+
+    content_hash = hash_schema_content(schema_content)
+    cached_schema = schema_content_cache.get(content_hash)
+    if cached_schema is not None:
+        # The loaders resolve imported types in place, so each
+        # call is given its own copy of the parsed schema
+        return pickle.loads(cached_schema)
+
+    schema = _parse_schema_content(schema_content)
+    if schema_content_cache.maxsize > 0:
+        schema_content_cache.put(
+            content_hash,
+            pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    return schema
+
+
+def _parse_schema_content(schema_content: str
+                          ) -> PartiallyLoadedYamlatorSchema:
+    lark_parser = get_schema_parser()
+
+    # The transformer is run by Lark as the schema is parsed, so its
+    # state needs to be cleared before the parse begins
+    transformer: SchemaTransformer = lark_parser.options.transformer
+    transformer.reset()
 
     try:
-        tokens = lark_parser.parse(schema_content)
-        return transformer.transform(tokens)
-    except VisitError as ve:
-        raise SchemaParseError(ve.orig_exc) from ve
+        return lark_parser.parse(schema_content)
+    except NestedUnionError as ex:
+        raise SchemaParseError(ex) from ex
     except UnexpectedInput as u:
         _handle_syntax_errors(u, lark_parser, schema_content)
 
@@ -80,17 +230,45 @@ class SchemaTransformer(Transformer):
     E.g the method `required_rule` corresponds to the following rule
     in the grammar:
 
-    required_rule: rule_name type "required" NEW_LINES
-                 | rule_name type NEW_LINES
+    required_rule: rule_name type "required" _RULE_END
+                 | rule_name type _RULE_END
+
+    The transformer is shared by every parse made with the shared
+    schema parser, so the state collected whilst parsing is stored
+    per thread and is cleared with `reset`
     """
 
     def __init__(self, visit_tokens: bool = True) -> None:
         super().__init__(visit_tokens)
+        self._state = threading.local()
+
+    def reset(self) -> None:
+        """Clears the state collected whilst parsing a schema"""
 
         # Used to track previously seen enums or rulesets to dynamically
         # determine the type of the rule is a enum or ruleset
-        self.seen_constructs = {}
-        self.unknown_types = []
+        self._state.seen_constructs = {}
+        self._state.unknown_types = []
+
+    @property
+    def seen_constructs(self) -> dict:
+        if not hasattr(self._state, 'seen_constructs'):
+            self.reset()
+        return self._state.seen_constructs
+
+    @seen_constructs.setter
+    def seen_constructs(self, value: dict) -> None:
+        self._state.seen_constructs = value
+
+    @property
+    def unknown_types(self) -> list:
+        if not hasattr(self._state, 'unknown_types'):
+            self.reset()
+        return self._state.unknown_types
+
+    @unknown_types.setter
+    def unknown_types(self, value: list) -> None:
+        self._state.unknown_types = value
 
     def rule_name(self, tokens: Iterator[Token]) -> Token:
         """Processes the rule name by removing any quotes"""
@@ -385,51 +563,40 @@ class _ImportInstructionHandler(_InstructionHandler):
         self.imports.extend(instruction.imports)
 
 
-class SchemaSyntaxError(SyntaxError):
-    """A generic syntax error in the schema content"""
-
-    label = None
-
-    def __str__(self) -> str:
-        context, line, column, *_ = self.args
-        if self.label is None:
-            return f'Error on line {line}, column {column}.\n\n{context}'
-        return f'{self.label} at line {line}, column {column}.\n\n{context}'
-
-
-class MalformedRulesetNameError(SchemaSyntaxError):
-    """Indicates an error in the ruleset name"""
-    label = 'Invalid ruleset name'
-
-
-class MalformedEnumNameError(SchemaSyntaxError):
-    """Indicates an error in the enum name"""
-    label = 'Invalid enum name'
-
-
-class MissingRulesError(SchemaSyntaxError):
-    """Indicates that a ruleset or schema block is missing rules"""
-    label = 'Missing rules'
+# The LALR parser state depends on whether the error occurred in the first
+# construct of the schema or after another construct, so each example
+# is also matched after a preceding construct
+_PRECEDING_CONSTRUCT = 'schema {\n    message str\n}\n'
+
+_SYNTAX_ERROR_EXAMPLES = {
+    MalformedRulesetNameError: [
+        'ruleset foo',
+        'ruleset 1234Foo',
+        'ruleset FOO',
+    ],
+    MalformedEnumNameError: [
+        'enum foo',
+        'enum 1234Foo',
+        'enum FOO',
+    ],
+    MissingRulesError: [
+        'ruleset Foo {}',
+        'schema {}'
+    ]
+}
 
 
 def _handle_syntax_errors(u: UnexpectedInput, parser: Lark,
                           content: str) -> None:
-    exc_class = u.match_examples(parser.parse, {
-        MalformedRulesetNameError: [
-            'ruleset foo',
-            'ruleset 1234Foo',
-            'ruleset FOO',
-        ],
-        MalformedEnumNameError: [
-            'enum foo',
-            'enum 1234Foo',
-            'enum FOO',
-        ],
-        MissingRulesError: [
-            'ruleset Foo {}',
-            'schema {}'
+    examples = {
+        exc_class: [
+            *examples,
+            *[_PRECEDING_CONSTRUCT + example for example in examples]
         ]
-    }, use_accepts=True)
+        for exc_class, examples in _SYNTAX_ERROR_EXAMPLES.items()
+    }
+
+    exc_class = u.match_examples(parser.parse, examples, use_accepts=True)
     if not exc_class:
         raise SchemaSyntaxError(u.get_context(content), u.line, u.column)
     raise exc_class(u.get_context(content), u.line, u.column)
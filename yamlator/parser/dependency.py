@@ -1,22 +1,42 @@
 """Utilties for managing dependencies in Yamlator"""
 
-import copy
 import hashlib
-from collections import defaultdict
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+from typing import Iterator
+from typing import Mapping
 
 
 class DependencyManager:
     """Tracks and detects dependencies between objects by representing
-    data as a Md5 hash. Once a node has been added, a depth first search
-    is executed against all nodes to detect a cycle
+    data as a Md5 hash. The nodes are kept in a topological order that is
+    updated as each child is added, which allows a cycle to be detected
+    by only searching the part of the graph affected by the new child
     """
 
     def __init__(self) -> None:
-        self._graph = {}
+        # The graph only contains the nodes that have been added or have
+        # children, and shares the lists of children with `_children`
+        self._graph: Dict[str, List[str]] = {}
+
+        # The children and parents of every node, including the nodes
+        # that have only been added as a child
+        self._children: Dict[str, List[str]] = {}
+        self._parents: Dict[str, List[str]] = {}
+
+        # The position of each node in the topological order along with
+        # the first and last positions that have been used
+        self._order: Dict[str, int] = {}
+        self._first = 0
+        self._last = -1
+        self._has_cycle = False
 
     @property
-    def graph(self) -> dict:
-        return copy.deepcopy(self._graph)
+    def graph(self) -> Mapping[str, Tuple[str, ...]]:
+        return GraphView(self._graph)
 
     def add(self, node: str) -> str:
         """Add a new node to the graph. The contents of the parameter
@@ -24,7 +44,8 @@ class DependencyManager:
 
         Args:
             node (str): A string that contains the content or represents
-                an item that needs to be tracked for a cycle
+                an item that needs to be tracked for a cycle. Adding a node
+                that already exists keeps its existing children
 
         Return:
             A Md5 hash of the content provided in the `node` parameter
@@ -32,7 +53,8 @@ class DependencyManager:
         md5 = hashlib.md5(node.encode('utf-8'))
         digest = md5.hexdigest()
 
-        self._graph[digest] = []
+        self._add_node(digest)
+        self._graph.setdefault(digest, self._children[digest])
         return digest
 
     def add_child(self, parent_hash: str, child_hash: str) -> bool:
@@ -45,10 +67,22 @@ class DependencyManager:
         Returns:
             True to indicate that the function completed successfully
         """
-        if not self._graph.get(parent_hash):
-            self._graph[parent_hash] = []
-
-        self._graph[parent_hash].append(child_hash)
+        # New nodes are added to the end of the order, which is already
+        # valid for a new child. A new parent has no other edges so it can
+        # be moved to the start to avoid reordering the graph
+        if self._add_node(parent_hash):
+            self._first -= 1
+            self._order[parent_hash] = self._first
+        self._add_node(child_hash)
+        self._graph.setdefault(parent_hash, self._children[parent_hash])
+
+        self._children[parent_hash].append(child_hash)
+        self._parents[child_hash].append(parent_hash)
+
+        # Once a cycle exists the nodes can no longer be ordered and
+        # the graph will always contain the cycle
+        if not self._has_cycle:
+            self._has_cycle = not self._reorder(parent_hash, child_hash)
         return True
 
     def has_cycle(self) -> bool:
@@ -58,27 +92,78 @@ class DependencyManager:
             A boolean to indicate if a cycle is present. True indicates
             a cycle was detected, False indicates no cycle is present
         """
-        visited = defaultdict(bool)
-        rec_stack = defaultdict(bool)
-
-        for node in self._graph:
-            if not visited[node]:
-                if self._detect_cycle(node, visited, rec_stack):
-                    return True
-        return False
-
-    def _detect_cycle(self, curr_node: str, visited: dict,
-                      rec_stack: dict) -> bool:
-        visited[curr_node] = True
-        rec_stack[curr_node] = True
-
-        parent_node = self._graph.get(curr_node, [])
-        for child_node in parent_node:
-            if not visited[child_node]:
-                if self._detect_cycle(child_node, visited, rec_stack):
-                    return True
-            elif rec_stack[child_node]:
-                return True
-
-        rec_stack[curr_node] = False
-        return False
+        return self._has_cycle
+
+    def _add_node(self, node: str) -> bool:
+        if node in self._order:
+            return False
+
+        self._last += 1
+        self._order[node] = self._last
+        self._children[node] = []
+        self._parents[node] = []
+        return True
+
+    def _reorder(self, parent: str, child: str) -> bool:
+        # Based on the dynamic topological sort algorithm by Pearce and
+        # Kelly. Only the nodes positioned between the child and the parent
+        # need to be searched and moved to keep the order valid
+        lower_bound = self._order[child]
+        upper_bound = self._order[parent]
+        if lower_bound > upper_bound:
+            return True
+
+        # Reaching the parent from the child means the new edge closes
+        # a cycle, including when the parent and child are the same node
+        forward = self._search(child, self._children,
+                               lambda position: position <= upper_bound)
+        if parent in forward:
+            return False
+
+        backward = self._search(parent, self._parents,
+                                lambda position: position >= lower_bound)
+
+        # The ancestors of the parent are placed before the descendants
+        # of the child using the positions that both sets already hold
+        nodes = sorted(backward, key=self._order.get)
+        nodes.extend(sorted(forward, key=self._order.get))
+        positions = sorted(self._order[node] for node in nodes)
+        for node, position in zip(nodes, positions):
+            self._order[node] = position
+        return True
+
+    def _search(self, start: str, edges: Dict[str, List[str]],
+                in_bounds: Callable[[int], bool]) -> List[str]:
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for next_node in edges[node]:
+                if next_node in visited:
+                    continue
+
+                if not in_bounds(self._order[next_node]):
+                    continue
+
+                visited.add(next_node)
+                stack.append(next_node)
+        return list(visited)
+
+
+class GraphView(Mapping):
+    """A read-only view of the nodes and their children in a
+    `DependencyManager`. The view reflects any nodes that are added
+    after the view was created
+    """
+
+    def __init__(self, graph: Dict[str, List[str]]):
+        self._graph = graph
+
+    def __getitem__(self, node: str) -> Tuple[str, ...]:
+        return tuple(self._graph[node])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        return len(self._graph)
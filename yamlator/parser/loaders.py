@@ -7,6 +7,10 @@ import os
 
 from typing import Dict
 from typing import List
+from typing import Set
+from typing import Tuple
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 
 from yamlator.utils import load_schema
 from yamlator.types import RuleType
@@ -18,22 +22,45 @@ from yamlator.types import PartiallyLoadedYamlatorSchema
 from yamlator.exceptions import ConstructNotFoundError
 from yamlator.exceptions import CycleDependencyError
 from yamlator.parser.core import parse_schema
+from yamlator.parser.core import get_schema_parser
+from yamlator.parser.cache import SchemaFileCache
+from yamlator.parser.cache import cache_schema
+from yamlator.parser.cache import fetch_cached_schema
+from yamlator.parser.cache import fetch_file_stamp
+from yamlator.parser.cache import set_schema_cache_size
 from yamlator.parser.dependency import DependencyManager
 
 
 _SLASHES_REGEX = re.compile(r'(?:\\{1}|\/{1})')
 
+# Each parsed schema is pickled and sent back from the worker processes,
+# so a level of imports is only loaded by the pool when it has enough
+# files to cover the cost of starting the pool and sending the schemas
+_MIN_PARALLEL_FILES = 8
 
-def parse_yamlator_schema(schema_path: str) -> YamlatorSchema:
+
+def parse_yamlator_schema(schema_path: str, cache_dir: str = None,
+                          workers: int = None) -> YamlatorSchema:
     """Parses a Yamlator schema from a given path on the file system
 
     Args:
         schema_path (str): The file path to the schema file
 
+        cache_dir (str, optional): A directory used to cache the fully
+            resolved schema. The cached schema is reused until the schema
+            file or any file it imports changes. By default `None` is
+            used, which disables the cache
+
+        workers (int, optional): The number of processes used to load the
+            imported schema files concurrently. By default `None` is used,
+            which loads the imported schema files one at a time
+
     Returns:
         A `yamlator.types.YamlatorSchema` object that contains
         the contents of the schema file in a format that can
-        be processed by Yamlator
+        be processed by Yamlator. Schemas are kept in an in-memory
+        cache, so repeated calls with an unchanged schema file return
+        the same object, which should not be modified
 
     Raises:
         ValueError: If the schema path is `None`, not a string
@@ -51,14 +78,46 @@ def parse_yamlator_schema(schema_path: str) -> YamlatorSchema:
     if (schema_path is None) or (not isinstance(schema_path, str)):
         raise ValueError('Expected parameter schema_path to be a string')
 
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError('Expected parameter workers to be a positive integer')
+
+    schema = fetch_cached_schema(schema_path)
+    if schema is not None:
+        return schema
+
+    schema_cache = None
+    if cache_dir is not None:
+        schema_cache = SchemaFileCache(cache_dir)
+        schema = schema_cache.load(schema_path)
+        if schema is not None:
+            return schema
+
+    # The stamp of each file is fetched before the file is read, so the
+    # cached schema is not used if a file changes after it has been read
+    stamp = fetch_file_stamp(schema_path)
     schema_content = load_schema(schema_path)
 
     dependencies = DependencyManager()
     schema_hash = dependencies.add(schema_content)
+    sources = {os.path.abspath(schema_path): schema_hash}
+    stamps = {os.path.abspath(schema_path): stamp}
 
     schema = parse_schema(schema_content)
     context = fetch_schema_path(schema_path)
-    schema = load_schema_imports(schema, context, schema_hash, dependencies)
+
+    prefetched_schemas = None
+    if workers is not None and workers > 1:
+        prefetched_schemas = prefetch_schema_imports(schema, context, workers)
+
+    schema = load_schema_imports(schema, context, schema_hash, dependencies,
+                                 sources,
+                                 prefetched_schemas=prefetched_schemas,
+                                 stamps=stamps)
+
+    if schema_cache is not None:
+        schema_cache.save(schema_path, schema, sources)
+
+    cache_schema(schema_path, schema, stamps)
     return schema
 
 
@@ -91,7 +150,12 @@ def fetch_schema_path(schema_path: str) -> str:
 def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
                         schema_path: str,
                         parent_hash: str,
-                        dependencies: DependencyManager) -> YamlatorSchema:
+                        dependencies: DependencyManager,
+                        sources: Dict[str, str] = None,
+                        loaded_schemas: dict = None,
+                        prefetched_schemas: dict = None,
+                        stamps: Dict[str, Tuple[int, int]] = None
+                        ) -> YamlatorSchema:
     """Loads all import statements that have been defined in a Yamlator
     schema file. This function will automatically load any subsequent import
     statements from child schema files
@@ -109,6 +173,26 @@ def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
             class that represents dependencies as a graph which can
             be used to detect cycles
 
+        sources (dict, optional): If provided, the content hash of every
+            imported schema file is added to this dictionary and keyed by
+            the absolute path of the file
+
+        loaded_schemas (dict, optional): A registry of the child schemas
+            that have already been loaded, keyed by the normalised absolute
+            path of the schema file. A schema file that is imported more
+            than once is only loaded and resolved once. If not provided, a
+            new registry is used
+
+        prefetched_schemas (dict, optional): Schema files that have already
+            been read and parsed by `prefetch_schema_imports`. Any schema
+            file that is not in this dictionary is read and parsed when
+            it is imported
+
+        stamps (dict, optional): If provided, the stamp of every imported
+            schema file is added to this dictionary and keyed by the
+            absolute path of the file. The stamp is fetched with
+            `yamlator.parser.cache.fetch_file_stamp` before the file is read
+
     Returns:
         A `yamlator.types.YamlatorSchema` object that has all the types
         resolved
@@ -142,6 +226,9 @@ def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
     if not isinstance(loaded_schema, PartiallyLoadedYamlatorSchema):
         raise TypeError('Expected schema to be yamlator.types.PartiallyLoadedYamlatorSchema')  # nopep8 pylint: disable=C0301
 
+    if loaded_schemas is None:
+        loaded_schemas = {}
+
     import_statements = loaded_schema.imports
     root_rulesets = loaded_schema.rulesets
     root_enums = loaded_schema.enums
@@ -149,7 +236,9 @@ def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
     for path, resource_type in import_statements.items():
         full_path = os.path.join(schema_path, path)
 
-        schema = _load_child_schema(full_path, parent_hash, dependencies)
+        schema = _load_child_schema(full_path, parent_hash, dependencies,
+                                    sources, loaded_schemas,
+                                    prefetched_schemas, stamps)
 
         imported_rulesets = schema.rulesets
         imported_enums = schema.enums
@@ -180,9 +269,37 @@ def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
 
 
 def _load_child_schema(schema_path: str, parent_hash: str,
-                       dependencies: DependencyManager) -> YamlatorSchema:
-    schema_content = load_schema(schema_path)
+                       dependencies: DependencyManager,
+                       sources: Dict[str, str],
+                       loaded_schemas: dict,
+                       prefetched_schemas: dict,
+                       stamps: Dict[str, Tuple[int, int]]) -> YamlatorSchema:
+    registry_key = _create_registry_key(schema_path)
+
+    # A schema that has been fully resolved cannot lead back to a schema
+    # that is still being loaded, so it can be shared without checking for
+    # a cycle. Schemas that are still being loaded are not in the registry
+    loaded_schema = loaded_schemas.get(registry_key)
+    if loaded_schema is not None:
+        schema_hash, schema = loaded_schema
+        dependencies.add_child(parent_hash, schema_hash)
+        return schema
+
+    prefetched_schema = None
+    if prefetched_schemas:
+        prefetched_schema = prefetched_schemas.pop(registry_key, None)
+
+    if prefetched_schema is not None:
+        schema_content, parsed_schema, stamp = prefetched_schema
+    else:
+        stamp = fetch_file_stamp(schema_path)
+        schema_content, parsed_schema = load_schema(schema_path), None
+
     schema_hash = dependencies.add(schema_content)
+    if sources is not None:
+        sources[os.path.abspath(schema_path)] = schema_hash
+    if stamps is not None:
+        stamps[os.path.abspath(schema_path)] = stamp
 
     dependencies.add_child(parent_hash, schema_hash)
 
@@ -190,14 +307,134 @@ def _load_child_schema(schema_path: str, parent_hash: str,
         message = f'A cycle was detected when loading {schema_path}'
         raise CycleDependencyError(message)
 
-    parsed_schema = parse_schema(schema_content)
+    if parsed_schema is None:
+        parsed_schema = parse_schema(schema_content)
 
     context = fetch_schema_path(schema_path)
-    schema = load_schema_imports(parsed_schema, context,
-                                 parent_hash, dependencies)
+    schema = load_schema_imports(parsed_schema, context, schema_hash,
+                                 dependencies, sources, loaded_schemas,
+                                 prefetched_schemas, stamps)
+
+    loaded_schemas[registry_key] = (schema_hash, schema)
     return schema
 
 
+def prefetch_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
+                            schema_path: str, workers: int) -> dict:
+    """Reads and parses every schema file in the import graph of a schema
+    using a pool of processes. The graph is loaded one level at a time,
+    where all the files imported by the current level are loaded together.
+    A level with too few files to benefit from the pool is loaded in this
+    process and the pool never has more processes than there are CPUs
+
+    The imports are not resolved, so the result should be passed to
+    `load_schema_imports`, which resolves the imports in the same order
+    as when the files are loaded one at a time. A file that cannot be read
+    or parsed is left out, so that the error is raised by
+    `load_schema_imports` when the file is imported
+
+    Args:
+        loaded_schema (yamlator.types.PartiallyLoadedYamlatorSchema): The
+            parsed schema that contains the import statements to load
+
+        schema_path (str): The path that contains the Yamlator schema file
+
+        workers (int): The maximum number of processes used to load
+            the schema files
+
+    Returns:
+        A dictionary where the key is the normalised absolute path of the
+        schema file and the value is a tuple of the file content, the
+        parsed schema and the stamp of the file before it was read
+    """
+    # More processes than CPUs only adds the cost of starting them
+    workers = min(workers, os.cpu_count() or 1)
+
+    prefetched_schemas = {}
+    seen = set()
+    pending = _fetch_import_paths(loaded_schema, schema_path)
+
+    executor = None
+    try:
+        while pending:
+            level = []
+            for path in pending:
+                registry_key = _create_registry_key(path)
+                if registry_key not in seen:
+                    seen.add(registry_key)
+                    level.append((registry_key, path))
+
+            is_parallel = workers > 1 and len(level) >= _MIN_PARALLEL_FILES
+            if is_parallel and executor is None:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_initialize_worker)
+
+            paths = [path for _, path in level]
+            results = _read_and_parse_schemas(
+                paths, executor if is_parallel else None)
+
+            pending = []
+            for (registry_key, path), result in zip(level, results):
+                if result is None:
+                    continue
+
+                prefetched_schemas[registry_key] = result
+                _, parsed_schema, _ = result
+                pending.extend(_fetch_import_paths(parsed_schema,
+                                                   fetch_schema_path(path)))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return prefetched_schemas
+
+
+def _initialize_worker() -> None:
+    # The schemas parsed by a worker are sent back to the main process,
+    # so caching them in the worker would only pickle each schema again
+    set_schema_cache_size(0)
+
+    # The parser is loaded before the worker is given a file, which uses
+    # the precompiled parser artifact if it exists
+    get_schema_parser()
+
+
+def _read_and_parse_schemas(paths: List[str],
+                            executor: ProcessPoolExecutor = None) -> list:
+    if executor is not None:
+        futures = [executor.submit(_read_and_parse_schema, path)
+                   for path in paths]
+        loaders = [future.result for future in futures]
+    else:
+        loaders = [partial(_read_and_parse_schema, path) for path in paths]
+
+    results = []
+    for load in loaders:
+        try:
+            results.append(load())
+        except Exception:  # pylint: disable=broad-except
+            # The schema file is loaded again when it is imported
+            # so the error is raised in the expected order
+            results.append(None)
+    return results
+
+
+def _read_and_parse_schema(schema_path: str
+                           ) -> Tuple[str, PartiallyLoadedYamlatorSchema,
+                                      Tuple[int, int]]:
+    stamp = fetch_file_stamp(schema_path)
+    schema_content = load_schema(schema_path)
+    return schema_content, parse_schema(schema_content), stamp
+
+
+def _fetch_import_paths(loaded_schema: PartiallyLoadedYamlatorSchema,
+                        schema_path: str) -> List[str]:
+    return [os.path.join(schema_path, path) for path in loaded_schema.imports]
+
+
+def _create_registry_key(schema_path: str) -> str:
+    return os.path.normcase(os.path.abspath(schema_path))
+
+
 def map_imported_resource(namespace: str, resource_type: str,
                           resource_lookup: dict,
                           imported_resources: dict) -> dict:
@@ -345,13 +582,10 @@ def resolve_ruleset_inheritance(rulesets: Dict[str, YamlatorRuleset]) -> dict:
         raise TypeError(
             'Parameter rulesets cannot be None should be a dictionary')
 
-    updated_rulesets = {}
-
     dependencies_mgmr = DependencyManager()
     for key, ruleset in rulesets.items():
         parent = ruleset.parent
         if not parent:
-            updated_rulesets[key] = ruleset
             continue
 
         if rulesets.get(parent.lookup) is None:
@@ -363,50 +597,69 @@ def resolve_ruleset_inheritance(rulesets: Dict[str, YamlatorRuleset]) -> dict:
         msg = 'Detected cycle when resolving inheritance chain'
         raise CycleDependencyError(msg)
 
-    dependencies = dependencies_mgmr.graph
-    for node in dependencies:
-        if updated_rulesets.get(node) is not None:
-            continue
-
-        stack = [(node, None)]
-        while len(stack) > 0:
-            curr_node, curr_ruleset = stack.pop()
-
-            if curr_ruleset is not None:
-                parent_node, _ = stack.pop()
-                parent_ruleset = rulesets[parent_node]
-                updated_rulesets[parent_node] = _merge_rulesets(parent_ruleset,
-                                                                curr_ruleset)
-                if len(stack) > 1:
-                    stack.append((parent_node, updated_rulesets[parent_node]))
-                continue
-
-            if updated_rulesets.get(curr_node) is not None:
-                stack.append((curr_node, updated_rulesets[curr_node]))
-                continue
-
-            stack.append((curr_node, None))
-            stack.append((dependencies[curr_node][0], None))
-
-    return updated_rulesets
+    # Each ruleset is merged once with its resolved parent, starting from
+    # the rulesets that do not have a parent. The rule names of each
+    # resolved ruleset are kept so overridden rules can be detected
+    # without walking the inheritance chain
+    resolved_rulesets = {}
+    resolved_rule_names = {}
+    for key in rulesets:
+        unresolved = []
+        curr_key = key
+        while curr_key not in resolved_rulesets:
+            ruleset = rulesets[curr_key]
+            if not ruleset.parent:
+                resolved_rulesets[curr_key] = ruleset
+                resolved_rule_names[curr_key] = {
+                    rule.name for rule in ruleset.rules}
+                break
+            unresolved.append(curr_key)
+            curr_key = ruleset.parent.lookup
+
+        for child_key in reversed(unresolved):
+            parent_key = rulesets[child_key].parent.lookup
+            merged_ruleset, rule_names = _merge_rulesets(
+                rulesets[child_key], resolved_rulesets[parent_key],
+                resolved_rule_names[parent_key])
+            resolved_rulesets[child_key] = merged_ruleset
+            resolved_rule_names[child_key] = rule_names
+
+    return {key: resolved_rulesets[key] for key in rulesets}
 
 
 def _merge_rulesets(ruleset: YamlatorRuleset,
-                    dependent_ruleset: YamlatorRuleset) -> YamlatorRuleset:
-    base_rules = ruleset.rules.copy()
-    dependent_rules = dependent_ruleset.rules.copy()
-
-    # Index the rules in the base and dependent rulesets to make it
-    # easier to merge the different rules together
-    base_rules_index = {rule.name: rule for rule in base_rules}
-    dependent_rules_index = {rule.name: rule for rule in dependent_rules}
-
-    # Merged the 2 rule lists together. If a rule name is present
-    # in both then the base rules will be prioritized since it assumed
-    # it is being overridden
-    merged_rules = list({**dependent_rules_index, **base_rules_index}.values())
-    return YamlatorRuleset(
+                    dependent_ruleset: YamlatorRuleset,
+                    dependent_rule_names: Set[str]
+                    ) -> Tuple[YamlatorRuleset, Set[str]]:
+    base_rules = ruleset.rules
+    dependent_rules = dependent_ruleset.rules
+
+    # The rule names are only unique if neither ruleset has duplicate
+    # rule names and the child does not override any of the parent rules
+    rule_names = dependent_rule_names.union(rule.name for rule in base_rules)
+    can_append_rules = (
+        len(rule_names) == len(dependent_rules) + len(base_rules))
+
+    if can_append_rules:
+        # The child only adds new rules, so the parent rules are kept and
+        # the child rules are added after them. Merged rulesets store the
+        # rules as a tuple, which is shared with a child that has no rules
+        merged_rules = tuple(dependent_rules) + tuple(base_rules)
+    else:
+        # Index the rules in the base and dependent rulesets to make it
+        # easier to merge the different rules together
+        base_rules_index = {rule.name: rule for rule in base_rules}
+        dependent_rules_index = {rule.name: rule for rule in dependent_rules}
+
+        # Merged the 2 rule lists together. If a rule name is present
+        # in both then the base rules will be prioritized since it assumed
+        # it is being overridden
+        merged_rules = tuple(
+            {**dependent_rules_index, **base_rules_index}.values())
+
+    merged_ruleset = YamlatorRuleset(
         name=ruleset.name,
         rules=merged_rules,
         is_strict=ruleset.is_strict
     )
+    return merged_ruleset, rule_names
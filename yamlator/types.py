@@ -36,6 +36,19 @@ class SchemaTypes(enum.Enum):
     UNKNOWN = enum.auto()
 
 
+# The names of the types that do not depend on the rule type. The
+# names of lists and maps are formatted with the name of the sub type
+_TYPE_NAMES = {
+    SchemaTypes.INT: 'int',
+    SchemaTypes.STR: 'str',
+    SchemaTypes.FLOAT: 'float',
+    SchemaTypes.LIST: 'list({})',
+    SchemaTypes.MAP: 'map({})',
+    SchemaTypes.BOOL: 'bool',
+    SchemaTypes.ANY: 'any',
+}
+
+
 class RuleType:
     """Represents a rule's data type that is defined in the Yamlator schema
 
@@ -115,28 +128,24 @@ class RuleType:
         return self._regex
 
     def __str__(self) -> str:
-        types = {
-            SchemaTypes.REGEX: f'Regex({self._raw_regex})',
-            SchemaTypes.RULESET: self.lookup,
-            SchemaTypes.ENUM: self.lookup,
-            SchemaTypes.INT: 'int',
-            SchemaTypes.STR: 'str',
-            SchemaTypes.FLOAT: 'float',
-            SchemaTypes.LIST: 'list({})',
-            SchemaTypes.MAP: 'map({})',
-            SchemaTypes.BOOL: 'bool',
-            SchemaTypes.ANY: 'any',
-            SchemaTypes.UNKNOWN: f'unknown({self.lookup})'
-        }
-
-        type_str = types[self.schema_type]
+        type_str = self._type_name()
         sub_type = self.sub_type
         while sub_type is not None:
-            sub_type_str = types[sub_type.schema_type]
-            type_str = type_str.format(sub_type_str)
+            type_str = type_str.format(sub_type._type_name())
             sub_type = sub_type.sub_type
         return type_str
 
+    def _type_name(self) -> str:
+        if self.schema_type == SchemaTypes.REGEX:
+            return f'Regex({self._raw_regex})'
+
+        if self.schema_type in (SchemaTypes.RULESET, SchemaTypes.ENUM):
+            return self.lookup
+
+        if self.schema_type == SchemaTypes.UNKNOWN:
+            return f'unknown({self.lookup})'
+        return _TYPE_NAMES[self.schema_type]
+
     def __repr__(self) -> str:
         if self.schema_type == SchemaTypes.RULESET:
             repr_template = '{}(type=ruleset, lookup={}, sub_type={})'
@@ -442,6 +451,10 @@ class YamlatorSchema:
         enums (dict): A lookup to the enum objects that were defined
             in the schema file. The key will be the enum name and the value
             will be a `yamlator.types.YamlatorEnum` object
+
+        compiled_validators (dict): Validators that have been compiled from
+            the schema, keyed by the name of the validation engine. Compiled
+            validators are not copied or pickled with the schema
     """
 
     def __init__(self, root: YamlatorRuleset, rulesets: dict,  enums: dict):
@@ -462,6 +475,22 @@ class YamlatorSchema:
         self._root = root
         self._enums = enums
         self._rulesets = rulesets
+        self._compiled_validators = {}
+
+    @property
+    def compiled_validators(self) -> dict:
+        return self._compiled_validators
+
+    def __getstate__(self) -> dict:
+        # Compiled validators contain generated functions that cannot
+        # be pickled and can be compiled again from the schema
+        state = self.__dict__.copy()
+        state['_compiled_validators'] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_compiled_validators', {})
 
     @property
     def root(self):
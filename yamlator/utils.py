@@ -1,7 +1,6 @@
 """Utility functions to handle loading YAML files and Yamlator schemas"""
 
 
-import yaml
 import re
 
 from typing import Any
@@ -46,18 +45,28 @@ def is_keyless_rule(rule: Rule) -> bool:
     return rule.name == KEYLESS_RULE_DIRECTIVE
 
 
-def load_yaml_file(filename: str) -> Any:
+def load_yaml_file(filename: str, loader: str = 'auto',
+                   minimal: bool = False) -> Any:
     """Load a YAML file from the file system and convert it
     into a data structure Python can process
 
     Args:
         filename (str): The path to the YAML file
 
+        loader (str, optional): The loader used to load the file, one of
+            `'auto'`, `'c'` or `'python'`. By default `'auto'` is used,
+            which uses the C loader when PyYAML has been built with libyaml
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate. Timestamps and values with other tags are loaded
+            as the string, list or map they are written as
+
     Returns:
         The YAML file in a data structure that Python can process
 
     Raises:
-        ValueError: If the filename parameter is None or an empty string
+        ValueError: If the filename parameter is None or an empty string,
+            or the loader is not supported
         FileNotFoundError: If the file specified in filename does not exist
     """
     if filename is None:
@@ -66,8 +75,13 @@ def load_yaml_file(filename: str) -> Any:
     if len(filename) == 0:
         raise ValueError('filename cannot be an empty string')
 
+    # PyYAML is imported here so that validating data that has
+    # already been loaded does not import it
+    # pylint: disable-next=import-outside-toplevel
+    from yamlator.yaml_loader import load_yaml
+
     with open(filename, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=yaml.Loader)
+        return load_yaml(f, loader, minimal)
 
 
 def load_schema(filename: str) -> str:
@@ -56,6 +56,7 @@ class Validator:
                 is_required=is_required
             )
 
-    def _add_type_violation(self, key: str, parent: str, message: str) -> None:
-        violation = TypeViolation(key, parent, message)
+    def _add_type_violation(self, key: str, parent: str, message: str = None,
+                            expected_type: str = None) -> None:
+        violation = TypeViolation(key, parent, message, expected_type)
         self._violations.append(violation)
@@ -54,8 +54,8 @@ class BuiltInTypeValidator(Validator):
             return
 
         if not isinstance(data, buildin_type.type):
-            message = f'{key} should be of type {buildin_type.friendly_name}'
-            self._add_type_violation(key, parent, message)
+            self._add_type_violation(key, parent,
+                                     expected_type=buildin_type.friendly_name)
             return
 
         super().validate(key, data, parent, rtype, is_required)
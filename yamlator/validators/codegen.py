@@ -0,0 +1,458 @@
+"""Generates specialised Python validator functions for a Yamlator schema.
+
+A function is generated for each ruleset and for the entry point of the
+schema. Field names, type checks and messages are written into the
+generated source as constants, while enum values, regex objects and the
+fields of strict rulesets are bound to the generated module. Names
+from the schema are only written into the source as string literals
+created with `repr`, since compiled schemas can be loaded from
+untrusted files. The source
+is compiled with `compile` and the entry point function is cached on the
+schema, so each schema is only generated once.
+
+The generated validators produce the same violations, in the same order,
+as the validator chain.
+"""
+
+from collections import deque
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.utils import is_keyless_rule
+from yamlator.violations import RegexTypeViolation
+from yamlator.violations import RequiredViolation
+from yamlator.violations import RulesetTypeViolation
+from yamlator.violations import StrictEntryPointViolation
+from yamlator.violations import StrictRulesetViolation
+from yamlator.violations import TypeViolation
+from yamlator.validators.predicate import PredicateCompiler
+from yamlator.validators.predicate import accept_any
+from yamlator.validators.resolution import BUILTIN_HANDLER
+from yamlator.validators.resolution import BUILTIN_TYPES
+from yamlator.validators.resolution import ENUM_HANDLER
+from yamlator.validators.resolution import LIST_HANDLER
+from yamlator.validators.resolution import MAP_HANDLER
+from yamlator.validators.resolution import REGEX_HANDLER
+from yamlator.validators.resolution import RULESET_HANDLER
+from yamlator.validators.resolution import UNION_HANDLER
+from yamlator.validators.resolution import order_union_types
+from yamlator.validators.resolution import resolve_handler
+from yamlator.validators.resolution import resolve_list_item_level
+from yamlator.validators.plan import compile_validation_plan
+
+CODEGEN_ENGINE = 'codegen'
+
+_ENTRY_POINT_NAME = 'validate_schema'
+_SOURCE_FILENAME = '<yamlator-codegen>'
+_INDENT = '    '
+
+# The names available to every generated module
+_GLOBALS = {
+    'deque': deque,
+    'order_union_types': order_union_types,
+    'RegexTypeViolation': RegexTypeViolation,
+    'RequiredViolation': RequiredViolation,
+    'RulesetTypeViolation': RulesetTypeViolation,
+    'StrictEntryPointViolation': StrictEntryPointViolation,
+    'StrictRulesetViolation': StrictRulesetViolation,
+    'TypeViolation': TypeViolation,
+}
+
+SchemaValidator = Callable[[Data, deque], deque]
+
+
+class _SourceGenerator:
+    """Generates the source of the validator functions for a schema"""
+
+    def __init__(self, schema: YamlatorSchema):
+        self._rulesets = schema.rulesets
+        self._enums = schema.enums
+        self._root = schema.root
+        self._predicates = PredicateCompiler(schema)
+
+        self.constants: Dict[str, Any] = {}
+        self._functions: List[List[str]] = []
+        self._ruleset_functions: Dict[str, str] = {}
+        self._pending_rulesets: List[tuple] = []
+        self._names = 0
+
+        # The name of the deque the emitted statements add violations to
+        self._violations = 'violations'
+
+    def generate(self) -> str:
+        self._generate_entry_point()
+
+        # Rulesets are generated after the function that references them
+        # so that recursive rulesets only generate a single function
+        while self._pending_rulesets:
+            function_name, ruleset = self._pending_rulesets.pop(0)
+            self._generate_ruleset(function_name, ruleset)
+
+        return '\n\n'.join('\n'.join(lines) for lines in self._functions)
+
+    def _new_name(self, prefix: str) -> str:
+        self._names += 1
+        return f'_{prefix}{self._names}'
+
+    def _add_constant(self, prefix: str, value: Any) -> str:
+        name = self._new_name(prefix)
+        self.constants[name] = value
+        return name
+
+    def _generate_entry_point(self) -> None:
+        lines = [f'def {_ENTRY_POINT_NAME}(data, violations):']
+        rules = self._root.rules
+
+        if len(rules) == 1 and is_keyless_rule(rules[0]):
+            rule = rules[0]
+            self._emit_rule(lines, 1, rule.name, rule.is_required,
+                            rule.rtype, 'data', repr('-'))
+            lines.append(f'{_INDENT}return violations')
+            self._functions.append(lines)
+            return
+
+        if rules and self._root.is_strict:
+            fields = self._add_constant(
+                'fields', frozenset(rule.name for rule in rules))
+            lines.extend([
+                f'{_INDENT}for field in set(data.keys()) - {fields}:',
+                f'{_INDENT * 2}violations.append(StrictEntryPointViolation('
+                f"key='SCHEMA', parent='-', field=field))",
+            ])
+
+        for rule in rules:
+            value = self._new_name('value')
+            self._emit_rule(lines, 1, rule.name, rule.is_required,
+                            rule.rtype, value, repr('-'),
+                            fetch=f'data.get({rule.name!r}, None)')
+
+        lines.append(f'{_INDENT}return violations')
+        self._functions.append(lines)
+
+    def _generate_ruleset(self, function_name: str,
+                          ruleset: YamlatorRuleset) -> None:
+        lines = [
+            f'def {function_name}(key, data, parent, violations):',
+            f'{_INDENT}if not isinstance(data, dict):',
+            f'{_INDENT * 2}violations.append('
+            'RulesetTypeViolation(key, parent))',
+            f'{_INDENT * 2}return',
+        ]
+
+        if ruleset.is_strict:
+            fields = self._add_constant(
+                'fields', frozenset(rule.name for rule in ruleset.rules))
+            lines.extend([
+                f'{_INDENT}for field in set(data.keys()) - {fields}:',
+                f'{_INDENT * 2}violations.append(StrictRulesetViolation('
+                f'key, parent, field, {ruleset.name!r}))',
+            ])
+
+        for rule in ruleset.rules:
+            value = self._new_name('value')
+            self._emit_rule(lines, 1, rule.name, rule.is_required,
+                            rule.rtype, value, 'key',
+                            fetch=f'data.get({rule.name!r}, None)')
+
+        self._functions.append(lines)
+
+    def _ruleset_function(self, lookup: str) -> str:
+        function_name = self._ruleset_functions.get(lookup)
+        if function_name is not None:
+            return function_name
+
+        default_missing_ruleset = YamlatorRuleset(lookup, [])
+        ruleset = self._rulesets.get(lookup, default_missing_ruleset)
+
+        function_name = self._new_name('validate_ruleset')
+        self._ruleset_functions[lookup] = function_name
+        self._pending_rulesets.append((function_name, ruleset))
+        return function_name
+
+    def _emit_rule(self, lines: List[str], depth: int, name: str,
+                   is_required: bool, rtype: RuleType, data: str,
+                   parent: str, fetch: str = None) -> None:
+        indent = _INDENT * depth
+        body = []
+        self._emit_type(body, depth + 1, rtype, MAP_HANDLER, repr(name),
+                        name, data, parent)
+
+        # Optional rules that accept any data do not need to be fetched
+        if fetch is not None and (body or is_required):
+            lines.append(f'{indent}{data} = {fetch}')
+
+        if not is_required:
+            if body:
+                lines.append(f'{indent}if {data} is not None:')
+                lines.extend(body)
+            return
+
+        lines.extend([
+            f'{indent}if {data} is None:',
+            f'{indent}{_INDENT}violations.append('
+            f'RequiredViolation({name!r}, {parent}))',
+        ])
+        if body:
+            lines.append(f'{indent}else:')
+            lines.extend(body)
+
+    def _emit_type(self, lines: List[str], depth: int, rtype: RuleType,
+                   level: int, key: str, key_value: str, data: str,
+                   parent: str) -> None:
+        """Emits the statements that validate `data` against `rtype`. The
+        `key` is the expression for the key and `key_value` is the value of
+        the key if it is known when the source is generated, otherwise `None`
+        """
+        handler = resolve_handler(rtype, level)
+        indent = _INDENT * depth
+
+        def message(suffix: str) -> str:
+            # The suffix can contain names from the schema, so it is
+            # always written into the source as a literal with `repr`
+            if key_value is not None:
+                return repr(f'{key_value}{suffix}')
+            return f"'{{}}{{}}'.format({key}, {suffix!r})"
+
+        def type_violation(suffix: str) -> str:
+            return (f'{self._violations}.append(TypeViolation('
+                    f'{key}, {parent}, {message(suffix)}))')
+
+        def expected_type_violation(type_name: str) -> str:
+            # Messages for keys that are only known at runtime are
+            # created from the expected type when they are read
+            if key_value is not None:
+                return type_violation(f' should be of type {type_name}')
+            return (f'{self._violations}.append(TypeViolation('
+                    f'{key}, {parent}, expected_type={type_name!r}))')
+
+        if handler == MAP_HANDLER:
+            child_key = self._new_name('key')
+            child_data = self._new_name('item')
+            body = []
+            self._emit_type(body, depth + 2, rtype.sub_type, MAP_HANDLER,
+                            child_key, None, child_data, key)
+            lines.extend([
+                f'{indent}if not isinstance({data}, dict):',
+                f'{indent}{_INDENT}{expected_type_violation("map")}',
+            ])
+            if body:
+                lines.extend([
+                    f'{indent}else:',
+                    f'{indent}{_INDENT}for {child_key}, {child_data} '
+                    f'in {data}.items():',
+                ])
+                lines.extend(body)
+            return
+
+        if handler == RULESET_HANDLER:
+            function_name = self._ruleset_function(rtype.lookup)
+            lines.append(f'{indent}{function_name}('
+                         f'{key}, {data}, {parent}, {self._violations})')
+            return
+
+        if handler == LIST_HANDLER:
+            self._emit_list(lines, depth, rtype.sub_type, key,
+                            data, expected_type_violation('list'))
+            return
+
+        if handler == ENUM_HANDLER:
+            target_enum = self._enums.get(rtype.lookup)
+            items = target_enum.items if target_enum is not None else {}
+            items_name = self._add_constant('enum', items)
+            suffix = f' does not match any value in enum {rtype.lookup}'
+            lines.extend([
+                f'{indent}if not (isinstance({data}, (str, float, int)) '
+                f'and {items_name}.get({data}) is not None):',
+                f'{indent}{_INDENT}{type_violation(suffix)}',
+            ])
+            return
+
+        if handler == REGEX_HANDLER:
+            regex = self._add_constant('regex', rtype.regex)
+            lines.extend([
+                f'{indent}if not isinstance({data}, str):',
+                f'{indent}{_INDENT}{expected_type_violation("str")}',
+                f'{indent}elif not {regex}.search({data}):',
+                f'{indent}{_INDENT}{self._violations}.append('
+                f'RegexTypeViolation({key}, {parent}, {data}, {regex}))',
+            ])
+            return
+
+        if handler == BUILTIN_HANDLER:
+            data_type, friendly_name = BUILTIN_TYPES[rtype.schema_type]
+            lines.extend([
+                f'{indent}if not isinstance({data}, {data_type.__name__}):',
+                f'{indent}{_INDENT}{expected_type_violation(friendly_name)}',
+            ])
+            return
+
+        if handler == UNION_HANDLER:
+            self._emit_union(lines, depth, rtype.sub_types, key, key_value,
+                             data, parent, message)
+
+        # Any types and types that are not handled accept all data
+
+    def _emit_list(self, lines: List[str], depth: int, sub_type: RuleType,
+                   key: str, data: str, type_violation: str) -> None:
+        indent = _INDENT * depth
+        index = self._new_name('index')
+        item = self._new_name('item')
+        item_key = self._new_name('key')
+
+        body = []
+        self._emit_type(body, depth + 2, sub_type,
+                        resolve_list_item_level(sub_type), item_key,
+                        None, item, key)
+
+        lines.extend([
+            f'{indent}if not isinstance({data}, list):',
+            f'{indent}{_INDENT}{type_violation}',
+        ])
+        if not body:
+            return
+
+        lines.extend([
+            f'{indent}else:',
+            f'{indent}{_INDENT}for {index}, {item} in enumerate({data}):',
+            f'{indent}{_INDENT * 2}{item_key} = '
+            f"'{{}}[{{}}]'.format({key}, {index})",
+        ])
+        lines.extend(body)
+
+    def _emit_union(self, lines: List[str], depth: int,
+                    sub_types: List[RuleType], key: str, key_value: str,
+                    data: str, parent: str,
+                    message: Callable[[str], str]) -> None:
+        indent = _INDENT * depth
+        body_indent = _INDENT * (depth + 1)
+
+        checks = []
+        for sub_type in sub_types:
+            if resolve_handler(sub_type, MAP_HANDLER) == BUILTIN_HANDLER:
+                data_type, _ = BUILTIN_TYPES[sub_type.schema_type]
+                checks.append(f'isinstance({data}, {data_type.__name__})')
+                continue
+
+            predicate = self._predicates.compile_type(sub_type, MAP_HANDLER)
+            if predicate is accept_any:
+                # A type that accepts any data always matches the union
+                return
+            checks.append(f'{self._add_constant("predicate", predicate)}'
+                          f'({data})')
+
+        lines.append(f'{indent}if not ({" or ".join(checks)}):')
+
+        # The violations of each type are only counted to order the types
+        # in the message, in the same way as `union_violation`
+        violations = self._violations
+        self._violations = self._new_name('scratch')
+        lines.append(f'{body_indent}{self._violations} = deque()')
+
+        counts = []
+        for sub_type in sub_types:
+            count = self._new_name('count')
+            counts.append((count, str(sub_type)))
+
+            if resolve_handler(sub_type, MAP_HANDLER) == BUILTIN_HANDLER:
+                # A built in type detects a single violation
+                lines.append(f'{body_indent}{count} = 1')
+                continue
+
+            self._emit_type(lines, depth + 1, sub_type, MAP_HANDLER, key,
+                            key_value, data, parent)
+            lines.extend([
+                f'{body_indent}{count} = len({self._violations})',
+                f'{body_indent}{self._violations}.clear()',
+            ])
+        self._violations = violations
+
+        union_counts = ', '.join(count for count, _ in counts)
+        names = self._add_constant('names', [name for _, name in counts])
+        expected_types = self._new_name('expected_types')
+        suffix = ' did not match union types: '
+        if key_value is not None:
+            union_message = f'{message(suffix)} + {expected_types}'
+        else:
+            union_message = f"'{{}}{{}}{{}}'.format({key}, {suffix!r}, " \
+                            f'{expected_types})'
+
+        lines.extend([
+            f'{body_indent}{expected_types} = order_union_types('
+            f'{names}, [{union_counts}])',
+            f'{body_indent}{self._violations}.append(TypeViolation('
+            f'{key}, {parent}, {union_message}))',
+        ])
+
+
+def generate_validator_source(schema: YamlatorSchema) -> str:
+    """Generates the Python source of the validator functions for a schema.
+    This is useful to inspect the code that `compile_schema_validator`
+    will compile
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to generate
+            the validator functions for
+
+    Returns:
+        A string containing the source of the generated functions
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+    return _SourceGenerator(schema).generate()
+
+
+def compile_schema_validator(schema: YamlatorSchema) -> SchemaValidator:
+    """Generates and compiles a validator function for a schema. The
+    compiled function is cached on the schema so subsequent calls with
+    the same schema object return the same function
+
+    __Note__: Changes made to the rules of a schema after the validator
+    has been compiled are not reflected by the compiled validator
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to compile
+
+    Returns:
+        A function that accepts the YAML data and a deque, and returns the
+        deque after adding any violations that were detected
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    validator = schema.compiled_validators.get(CODEGEN_ENGINE)
+    if validator is not None:
+        return validator
+
+    generator = _SourceGenerator(schema)
+    source = generator.generate()
+
+    try:
+        code = compile(source, _SOURCE_FILENAME, 'exec')
+    except (SyntaxError, RecursionError):
+        # Python limits how deeply blocks can be nested, which can be
+        # exceeded by deeply nested types. The validation plan produces
+        # the same violations and does not have this limit
+        code = None
+
+    if code is None:
+        validator = compile_validation_plan(schema).validate
+    else:
+        namespace = dict(_GLOBALS)
+        namespace.update(generator.constants)
+        exec(code, namespace)  # pylint: disable=exec-used
+        validator = namespace[_ENTRY_POINT_NAME]
+
+    schema.compiled_validators[CODEGEN_ENGINE] = validator
+    return validator
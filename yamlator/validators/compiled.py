@@ -0,0 +1,182 @@
+"""A reusable validator that is compiled once from a schema and can be
+used to validate many documents, including from multiple threads
+"""
+
+from collections import deque
+from typing import Callable
+
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
+from yamlator.exceptions import MaxViolationsReachedError
+from yamlator.validators.core import ENGINES
+from yamlator.validators.core import PLAN_ENGINE
+from yamlator.validators.core import create_validators_chain
+from yamlator.validators.core import create_violations
+from yamlator.validators.plan import compile_validation_plan
+from yamlator.validators.codegen import CODEGEN_ENGINE
+from yamlator.validators.codegen import compile_schema_validator
+from yamlator.validators.dispatch import DispatchValidator
+from yamlator.validators.dispatch import DISPATCH_ENGINE
+from yamlator.validators.predicate import compile_schema_predicate
+
+_DEFAULT_KEY = '-'
+
+
+class ValidationContext:
+    """Holds the state of a single call to `CompiledValidator.validate`.
+    A new context is created for every call, so the compiled validator
+    itself is never changed while it validates data
+
+    Attributes:
+        violations (collections.deque): The violations that have been
+            detected in the data
+    """
+
+    def __init__(self, max_violations: int = None) -> None:
+        """ValidationContext init
+
+        Args:
+            max_violations (int, optional): The maximum number of
+                violations to detect before the validation is stopped
+
+        Raises:
+            ValueError: If `max_violations` is not a positive integer
+        """
+        self.violations = create_violations(max_violations)
+
+
+_ValidateFunction = Callable[[Data, ValidationContext], None]
+
+
+class CompiledValidator:
+    """Validates YAML data against a schema that has been compiled once.
+    A compiled validator keeps the state of each validation in a
+    `ValidationContext`, so one instance can be shared by many threads
+    """
+
+    def __init__(self, schema: YamlatorSchema,
+                 engine: str = PLAN_ENGINE) -> None:
+        """CompiledValidator init
+
+        Args:
+            schema (yamlator.types.YamlatorSchema): The schema to validate
+                the data against
+
+            engine (str, optional): The engine used to validate the data,
+                one of `'plan'`, `'codegen'`, `'dispatch'` or `'chain'`
+
+        Raises:
+            ValueError: If the `schema` parameter is `None` or the `engine`
+                is not supported
+        """
+        if schema is None:
+            raise ValueError('schema should not be None')
+
+        if engine not in ENGINES:
+            raise ValueError(f'engine should be one of {", ".join(ENGINES)} '
+                             f'but got {engine}')
+
+        self._schema = schema
+        self._engine = engine
+        self._validate = _compile(schema, engine)
+        self._is_valid = compile_schema_predicate(schema)
+
+    @property
+    def schema(self) -> YamlatorSchema:
+        return self._schema
+
+    @property
+    def engine(self) -> str:
+        return self._engine
+
+    def validate(self, yaml_data: Data, max_violations: int = None) -> deque:
+        """Validate YAML data against the compiled schema
+
+        Args:
+            yaml_data (yamlator.types.Data): The YAML data to validate
+
+            max_violations (int, optional): The maximum number of violations
+                to detect. The validation stops as soon as this number of
+                violations has been detected
+
+        Returns:
+            A deque that contains the violations that were detected in the data
+
+        Raises:
+            ValueError: If the `yaml_data` parameter is `None` or
+                `max_violations` is not a positive integer
+        """
+        if yaml_data is None:
+            raise ValueError('yaml_data should not be None')
+
+        context = ValidationContext(max_violations)
+        try:
+            self._validate(yaml_data, context)
+        except MaxViolationsReachedError:
+            # The validation was stopped because the maximum
+            # number of violations was detected
+            pass
+        return context.violations
+
+    def is_valid(self, yaml_data: Data) -> bool:
+        """Check whether YAML data is valid against the compiled schema.
+        The check stops at the first part of the data that does not match
+        the schema and does not create any violations
+
+        Args:
+            yaml_data (yamlator.types.Data): The YAML data to check
+
+        Returns:
+            `True` if `validate` would not detect any violations in the
+            data, otherwise `False`
+
+        Raises:
+            ValueError: If the `yaml_data` parameter is `None`
+        """
+        if yaml_data is None:
+            raise ValueError('yaml_data should not be None')
+        return self._is_valid(yaml_data)
+
+
+def compile(schema: YamlatorSchema,  # pylint: disable=redefined-builtin
+            engine: str = PLAN_ENGINE) -> CompiledValidator:
+    """Compile a schema into a validator that can be reused to validate
+    many documents. The validator can be used by multiple threads at once
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to compile
+
+        engine (str, optional): The engine used to validate the data,
+            one of `'plan'`, `'codegen'`, `'dispatch'` or `'chain'`
+
+    Returns:
+        A `CompiledValidator` for the schema
+
+    Raises:
+        ValueError: If the `schema` parameter is `None` or the `engine`
+            is not supported
+    """
+    return CompiledValidator(schema, engine)
+
+
+def _compile(schema: YamlatorSchema, engine: str) -> _ValidateFunction:
+    if engine == PLAN_ENGINE:
+        plan = compile_validation_plan(schema)
+        return lambda data, context: plan.validate(data, context.violations)
+
+    if engine == CODEGEN_ENGINE:
+        validator = compile_schema_validator(schema)
+        return lambda data, context: validator(data, context.violations)
+
+    if engine == DISPATCH_ENGINE:
+        dispatch = DispatchValidator(schema)
+        return lambda data, context: dispatch.validate(data,
+                                                       context.violations)
+
+    def validate_chain(data: Data, context: ValidationContext) -> None:
+        # The validators in the chain add violations to the deque they are
+        # created with, so the chain is created for each validation
+        validators = create_validators_chain(schema, context.violations)
+        validators.validate(_DEFAULT_KEY, data, _DEFAULT_KEY, None)
+
+    return validate_chain
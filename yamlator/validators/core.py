@@ -3,7 +3,11 @@ validator handler chian.
 """
 
 from collections import deque
+from functools import partial
+from typing import Tuple
 from yamlator.types import YamlatorSchema
+from yamlator.exceptions import MaxViolationsReachedError
+from yamlator.violations import ViolationBudget
 
 from yamlator.validators import AnyTypeValidator
 from yamlator.validators import BuiltInTypeValidator
@@ -17,9 +21,26 @@ from yamlator.validators import RulesetValidator
 from yamlator.validators import EntryPointValidator
 from yamlator.validators import UnionValidator
 from yamlator.validators.base_validator import Validator
-
-
-def validate_yaml(yaml_data: dict, schema: YamlatorSchema) -> deque:
+from yamlator.validators.plan import compile_validation_plan
+from yamlator.validators.plan import PLAN_ENGINE
+from yamlator.validators.codegen import compile_schema_validator
+from yamlator.validators.codegen import CODEGEN_ENGINE
+from yamlator.validators.dispatch import DispatchValidator
+from yamlator.validators.dispatch import DISPATCH_ENGINE
+from yamlator.validators.predicate import compile_schema_predicate
+
+# The validation engines that can be used by `validate_yaml`. The plan
+# engine compiles the schema into a flat validation plan, the codegen
+# engine generates Python functions for the schema, the dispatch engine
+# looks up the handler for each rule type in a table and the chain engine
+# passes the data through the chain of validators
+CHAIN_ENGINE = 'chain'
+ENGINES = (PLAN_ENGINE, CODEGEN_ENGINE, DISPATCH_ENGINE, CHAIN_ENGINE)
+
+
+def validate_yaml(yaml_data: dict, schema: YamlatorSchema,
+                  engine: str = PLAN_ENGINE,
+                  max_violations: int = None) -> deque:
     """Validate YAML data by comparing the data against a set of instructions.
     Any violations will be collected and returned in a `deque`
 
@@ -28,12 +49,23 @@ def validate_yaml(yaml_data: dict, schema: YamlatorSchema) -> deque:
         contains a root key
         schema (dict): Contains the enums and rulesets that will be
         used to validate the YAML data
+        engine (str, optional): The engine used to validate the data, one
+        of `'plan'`, `'codegen'`, `'dispatch'` or `'chain'`. All the engines
+        detect the same violations. The `'codegen'` engine caches the
+        generated validator on the schema, which is the fastest option when
+        the same schema is used to validate many documents
+        max_violations (int, optional): The maximum number of violations to
+        detect. The validation stops as soon as this number of violations
+        has been detected. If `None` is provided, all the violations in the
+        data are detected
 
     Returns:
         A deque that contains the violations that were detected in the data
 
     Raises:
-        ValueError: When the parameters `yaml_data` or `instructions` are `None`
+        ValueError: When the parameters `yaml_data` or `instructions` are
+        `None`, the `engine` is not supported or `max_violations` is not a
+        positive integer
     """
     if yaml_data is None:
         raise ValueError('yaml_data should not be None')
@@ -41,22 +73,121 @@ def validate_yaml(yaml_data: dict, schema: YamlatorSchema) -> deque:
     if schema is None:
         raise ValueError('instructions should not be None')
 
-    default_key = '-'
-    violations = deque()
+    if engine not in ENGINES:
+        raise ValueError(f'engine should be one of {", ".join(ENGINES)} '
+                         f'but got {engine}')
+
+    violations = create_violations(max_violations)
+    try:
+        _validate(yaml_data, schema, engine, violations)
+    except MaxViolationsReachedError:
+        # The validation was stopped because the maximum
+        # number of violations was detected
+        pass
+    return violations
+
+
+def is_valid(yaml_data: dict, schema: YamlatorSchema) -> bool:
+    """Check whether YAML data is valid against a schema. The check stops
+    at the first part of the data that does not match the schema, and no
+    violations are created, so it is faster than `validate_yaml` when only
+    the result is needed
+
+    Args:
+        yaml_data    (dict): The YAML data to check. Assumes the YAML
+        contains a root key
+        schema (dict): Contains the enums and rulesets that will be
+        used to check the YAML data
+
+    Returns:
+        `True` if `validate_yaml` would not detect any violations in
+        the data, otherwise `False`
+
+    Raises:
+        ValueError: When the parameters `yaml_data` or `instructions` are
+        `None`
+    """
+    if yaml_data is None:
+        raise ValueError('yaml_data should not be None')
+
+    if schema is None:
+        raise ValueError('instructions should not be None')
+
+    return compile_schema_predicate(schema)(yaml_data)
+
+
+def create_violations(max_violations: int = None) -> deque:
+    """Create the deque that the detected violations are added to
+
+    Args:
+        max_violations (int, optional): The maximum number of violations to
+        detect. If `None` is provided, the number of violations is not
+        limited
+
+    Returns:
+        A deque, or a `ViolationBudget` if `max_violations` is provided
+
+    Raises:
+        ValueError: If `max_violations` is not a positive integer
+    """
+    if max_violations is None:
+        return deque()
+    return ViolationBudget(max_violations)
 
-    validators = _create_validators_chain(schema, violations)
+
+def _validate(yaml_data: dict, schema: YamlatorSchema, engine: str,
+              violations: deque) -> None:
+    if engine == PLAN_ENGINE:
+        compile_validation_plan(schema).validate(yaml_data, violations)
+        return
+
+    if engine == CODEGEN_ENGINE:
+        compile_schema_validator(schema)(yaml_data, violations)
+        return
+
+    if engine == DISPATCH_ENGINE:
+        DispatchValidator(schema).validate(yaml_data, violations)
+        return
+
+    default_key = '-'
+    validators = create_validators_chain(schema, violations)
     validators.validate(default_key, yaml_data, default_key, None)
 
-    return violations
 
+def create_validators_chain(instructions: YamlatorSchema,
+                            violations: deque) -> Validator:
+    """Create the chain of validators for a schema. Each validator in the
+    chain adds the violations it detects to the deque it is created with
 
-def _create_validators_chain(instructions: YamlatorSchema,
-                             violations: deque) -> Validator:
+    Args:
+        instructions (yamlator.types.YamlatorSchema): The schema the chain
+        validates the data against
+        violations (collections.deque): The deque that the detected
+        violations are added to
+
+    Returns:
+        The validator at the start of the chain
+    """
+    root = EntryPointValidator(violations, instructions.root)
+    optional_validator, _ = _create_rule_validators(instructions, violations)
+    root.set_next_validator(optional_validator)
+    return root
+
+
+def _create_sub_type_validator(instructions: YamlatorSchema,
+                               violations: deque) -> Validator:
+    # Each validator passes the types it does not handle to the next
+    # validator, so the types in a union are validated from the first
+    # validator that checks the type of the data
+    _, map_validator = _create_rule_validators(instructions, violations)
+    return map_validator
+
+
+def _create_rule_validators(instructions: YamlatorSchema,
+                            violations: deque) -> Tuple[Validator, Validator]:
     ruleset_lookups = instructions.rulesets
     enum_looksups = instructions.enums
-    entry_point = instructions.root
 
-    root = EntryPointValidator(violations, entry_point)
     optional_validator = OptionalValidator(violations)
     any_type_validator = AnyTypeValidator(violations)
     required_validator = RequiredValidator(violations)
@@ -68,7 +199,6 @@ def _create_validators_chain(instructions: YamlatorSchema,
     regex_validator = RegexValidator(violations)
     union_validator = UnionValidator(violations)
 
-    root.set_next_validator(optional_validator)
     optional_validator.set_next_validator(required_validator)
     required_validator.set_next_validator(map_validator)
     map_validator.set_next_validator(ruleset_validator)
@@ -85,10 +215,10 @@ def _create_validators_chain(instructions: YamlatorSchema,
 
     type_validator.set_next_validator(union_validator)
 
-    union_validator.set_list_validator(list_validator)
-    union_validator.set_ruleset_validator(ruleset_validator)
-    union_validator.set_regex_validator(regex_validator)
-    union_validator.set_enum_validator(enum_validator)
-    union_validator.set_map_validator(map_validator)
+    # The types in a union are validated by a separate chain that adds
+    # its violations to the sub type violations of the union validator
+    union_validator.set_sub_type_chain_factory(
+        partial(_create_sub_type_validator, instructions))
+    union_validator.set_schema_lookups(ruleset_lookups, enum_looksups)
 
-    return root
+    return optional_validator, map_validator
@@ -0,0 +1,324 @@
+"""Validates YAML data with a dispatch table keyed on the schema types.
+
+The validator chain passes every data node through each validator until
+one of them handles the rule type, forwarding all of the arguments at
+each step. The dispatch validator instead looks up the handler for a
+rule type in a single table and calls it directly. Built in types are
+checked against the exact type of the data first, with `isinstance` only
+used for subclasses, so a `bool` is still accepted as an `int`.
+
+The dispatch validator produces the same violations, in the same order,
+as the validator chain.
+"""
+
+# The exact type of the data is compared before `isinstance` is used
+# pylint: disable=unidiomatic-typecheck
+
+from collections import deque
+from collections import namedtuple
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.utils import is_keyless_rule
+from yamlator.violations import RegexTypeViolation
+from yamlator.violations import RequiredViolation
+from yamlator.violations import RulesetTypeViolation
+from yamlator.violations import StrictEntryPointViolation
+from yamlator.violations import StrictRulesetViolation
+from yamlator.violations import TypeViolation
+from yamlator.validators.predicate import PredicateCompiler
+from yamlator.validators.resolution import MAP_HANDLER
+from yamlator.validators.resolution import union_violation
+
+DISPATCH_ENGINE = 'dispatch'
+
+# The exact types that are accepted by each built in type. A `bool` is a
+# subclass of `int`, so it is accepted as an `int` by `isinstance`
+_BUILTIN_TYPES = {
+    SchemaTypes.INT: (int, 'int', frozenset((int, bool))),
+    SchemaTypes.STR: (str, 'str', frozenset((str,))),
+    SchemaTypes.FLOAT: (float, 'float', frozenset((float,))),
+    SchemaTypes.LIST: (list, 'list', frozenset((list,))),
+    SchemaTypes.MAP: (dict, 'map', frozenset((dict,))),
+    SchemaTypes.BOOL: (bool, 'bool', frozenset((bool,))),
+}
+
+_ENUM_TYPES = (str, float, int)
+_ENUM_EXACT_TYPES = frozenset((str, float, int, bool))
+
+_Handler = Callable[[str, Data, str, RuleType, deque], None]
+
+
+def _is_dict(data: Data) -> bool:
+    return type(data) is dict or isinstance(data, dict)
+
+
+def _is_list(data: Data) -> bool:
+    return type(data) is list or isinstance(data, list)
+
+
+# A ruleset with the handler of each rule resolved from the dispatch table
+_Ruleset = namedtuple('Ruleset', ['name', 'is_strict', 'fields', 'rules'])
+_Rule = Tuple[str, bool, RuleType, _Handler]
+
+# A union with the predicate, handler and name of each type resolved. The
+# rule type is kept so the id the union is looked up with is not reused
+_Union = namedtuple('Union', ['rtype', 'predicates', 'handlers', 'names'])
+
+
+def _validate_rule(rule: _Rule, data: Data, parent: str,
+                   violations: deque) -> None:
+    name, is_required, rtype, handler = rule
+    if data is None:
+        if is_required:
+            violations.append(RequiredViolation(name, parent))
+        return
+    handler(name, data, parent, rtype, violations)
+
+
+def _ignore(key: str, data: Data, parent: str, rtype: RuleType,
+            violations: deque) -> None:
+    # Any types and types that are not handled accept all data
+    del key, data, parent, rtype, violations
+
+
+def _validate_regex(key: str, data: Data, parent: str, rtype: RuleType,
+                    violations: deque) -> None:
+    if type(data) is not str and not isinstance(data, str):
+        violations.append(TypeViolation(key, parent, expected_type='str'))
+        return
+
+    if not rtype.regex.search(data):
+        violation = RegexTypeViolation(key, parent, data, rtype.regex)
+        violations.append(violation)
+
+
+def _validate_builtin(key: str, data: Data, parent: str, rtype: RuleType,
+                      violations: deque) -> None:
+    data_type, friendly_name, exact_types = _BUILTIN_TYPES[rtype.schema_type]
+    if type(data) in exact_types or isinstance(data, data_type):
+        return
+
+    violations.append(TypeViolation(key, parent,
+                                    expected_type=friendly_name))
+
+
+class DispatchValidator:
+    """Validates YAML data against a schema by dispatching each rule
+    type to its handler
+    """
+
+    def __init__(self, schema: YamlatorSchema):
+        """DispatchValidator init
+
+        Args:
+            schema (yamlator.types.YamlatorSchema): The schema to validate
+                the data against
+
+        Raises:
+            ValueError: If the `schema` parameter is `None`
+        """
+        if schema is None:
+            raise ValueError('schema should not be None')
+
+        self._enum_items = {name: enum.items
+                            for name, enum in schema.enums.items()}
+
+        self._dispatch: Dict[SchemaTypes, _Handler] = {
+            SchemaTypes.MAP: self._validate_map,
+            SchemaTypes.RULESET: self._validate_ruleset,
+            SchemaTypes.LIST: self._validate_list,
+            SchemaTypes.ENUM: self._validate_enum,
+            SchemaTypes.REGEX: _validate_regex,
+            SchemaTypes.INT: _validate_builtin,
+            SchemaTypes.STR: _validate_builtin,
+            SchemaTypes.FLOAT: _validate_builtin,
+            SchemaTypes.BOOL: _validate_builtin,
+            SchemaTypes.UNION: self._validate_union,
+        }
+
+        # The items in a list are validated from the list validator in
+        # the chain, so a map item is only checked as a built in type
+        self._item_dispatch = dict(self._dispatch)
+        self._item_dispatch[SchemaTypes.MAP] = _validate_builtin
+
+        # The handler for each rule is looked up once, rather than
+        # every time the rule is applied to the data
+        self._predicates = PredicateCompiler(schema)
+        self._unions: Dict[int, _Union] = {}
+        self._root = self._resolve_ruleset(schema.root)
+        self._rulesets = {name: self._resolve_ruleset(ruleset)
+                          for name, ruleset in schema.rulesets.items()}
+        self._keyless_rule = None
+        if len(schema.root.rules) == 1 and \
+                is_keyless_rule(schema.root.rules[0]):
+            self._keyless_rule = self._root.rules[0]
+
+    def validate(self, yaml_data: Data, violations: deque = None) -> deque:
+        """Validate YAML data against the schema
+
+        Args:
+            yaml_data (yamlator.types.Data): The YAML data to validate
+
+            violations (collections.deque, optional): The deque that
+                detected violations are added to. If `None` is provided
+                then a new deque is created
+
+        Returns:
+            A deque that contains the violations that were detected
+        """
+        if violations is None:
+            violations = deque()
+
+        parent = '-'
+        if self._keyless_rule is not None:
+            _validate_rule(self._keyless_rule, yaml_data, parent, violations)
+            return violations
+
+        root = self._root
+        if not root.rules:
+            return violations
+
+        if root.is_strict:
+            for field in set(yaml_data.keys()) - root.fields:
+                violation = StrictEntryPointViolation(key='SCHEMA',
+                                                      parent=parent,
+                                                      field=field)
+                violations.append(violation)
+
+        for rule in root.rules:
+            _validate_rule(rule, yaml_data.get(rule[0], None), parent,
+                           violations)
+        return violations
+
+    def _resolve_ruleset(self, ruleset: YamlatorRuleset) -> _Ruleset:
+        rules = [(rule.name, rule.is_required, rule.rtype,
+                  self._dispatch.get(rule.rtype.schema_type, _ignore))
+                 for rule in ruleset.rules]
+        fields = frozenset(rule.name for rule in ruleset.rules)
+        for rule in ruleset.rules:
+            self._resolve_unions(rule.rtype)
+        return _Ruleset(ruleset.name, ruleset.is_strict, fields, rules)
+
+    def _resolve_unions(self, rtype: RuleType) -> None:
+        while rtype is not None:
+            if rtype.schema_type == SchemaTypes.UNION:
+                self._resolve_union(rtype)
+            rtype = rtype.sub_type
+
+    def _resolve_union(self, rtype: RuleType) -> None:
+        if id(rtype) in self._unions:
+            return
+
+        sub_types: List[RuleType] = rtype.sub_types
+        self._unions[id(rtype)] = _Union(
+            rtype,
+            [self._predicates.compile_type(sub_type, MAP_HANDLER)
+             for sub_type in sub_types],
+            [self._dispatch.get(sub_type.schema_type, _ignore)
+             for sub_type in sub_types],
+            [str(sub_type) for sub_type in sub_types]
+        )
+        for sub_type in sub_types:
+            self._resolve_unions(sub_type)
+
+    def _validate_map(self, key: str, data: Data, parent: str,
+                      rtype: RuleType, violations: deque) -> None:
+        if not _is_dict(data):
+            violations.append(TypeViolation(key, parent,
+                                            expected_type='map'))
+            return
+
+        sub_type = rtype.sub_type
+        handler = self._dispatch.get(sub_type.schema_type, _ignore)
+        if handler is _validate_builtin:
+            # Resolve the built in type once for all the values
+            data_type, friendly_name, exact_types = \
+                _BUILTIN_TYPES[sub_type.schema_type]
+            for child_key, value in data.items():
+                if type(value) not in exact_types and \
+                        not isinstance(value, data_type):
+                    violations.append(TypeViolation(
+                        child_key, key, expected_type=friendly_name))
+            return
+
+        for child_key, value in data.items():
+            handler(child_key, value, key, sub_type, violations)
+
+    def _validate_ruleset(self, key: str, data: Data, parent: str,
+                          rtype: RuleType, violations: deque) -> None:
+        if not _is_dict(data):
+            violations.append(RulesetTypeViolation(key, parent))
+            return
+
+        ruleset = self._rulesets.get(rtype.lookup)
+        if ruleset is None:
+            return
+
+        if ruleset.is_strict:
+            for field in set(data.keys()) - ruleset.fields:
+                violation = StrictRulesetViolation(key, parent, field,
+                                                   ruleset.name)
+                violations.append(violation)
+
+        for rule in ruleset.rules:
+            _validate_rule(rule, data.get(rule[0], None), key, violations)
+
+    def _validate_list(self, key: str, data: Data, parent: str,
+                       rtype: RuleType, violations: deque) -> None:
+        if not _is_list(data):
+            violations.append(TypeViolation(key, parent,
+                                            expected_type='list'))
+            return
+
+        sub_type = rtype.sub_type
+        handler = self._item_dispatch.get(sub_type.schema_type, _ignore)
+        if handler is _validate_builtin:
+            # Resolve the built in type once for all the items and only
+            # create the key of an item when a violation is detected
+            data_type, friendly_name, exact_types = \
+                _BUILTIN_TYPES[sub_type.schema_type]
+            for idx, item in enumerate(data):
+                if type(item) not in exact_types and \
+                        not isinstance(item, data_type):
+                    violations.append(TypeViolation(
+                        f'{key}[{idx}]', key, expected_type=friendly_name))
+            return
+
+        for idx, item in enumerate(data):
+            handler(f'{key}[{idx}]', item, key, sub_type, violations)
+
+    def _validate_enum(self, key: str, data: Data, parent: str,
+                       rtype: RuleType, violations: deque) -> None:
+        items = self._enum_items.get(rtype.lookup)
+        is_enum_type = type(data) in _ENUM_EXACT_TYPES or \
+            isinstance(data, _ENUM_TYPES)
+        if is_enum_type and items is not None and \
+                items.get(data) is not None:
+            return
+
+        message = f'{key} does not match any value in enum {rtype.lookup}'
+        violations.append(TypeViolation(key, parent, message))
+
+    def _validate_union(self, key: str, data: Data, parent: str,
+                        rtype: RuleType, violations: deque) -> None:
+        union = self._unions[id(rtype)]
+
+        for predicate in union.predicates:
+            if predicate(data):
+                return
+
+        handlers = union.handlers
+        sub_types = rtype.sub_types
+        violations.append(union_violation(
+            key, parent, union.names,
+            lambda index, scratch: handlers[index](key, data, parent,
+                                                   sub_types[index],
+                                                   scratch)))
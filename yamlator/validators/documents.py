@@ -0,0 +1,79 @@
+"""Validates each document in a YAML stream that contains many documents,
+such as a bundle of manifests separated by `---`.
+
+The documents are loaded and validated one at a time, and each document
+is released before the next one is loaded, so the memory used is bounded
+by the size of the largest document rather than the size of the stream.
+"""
+
+from typing import IO
+from typing import Iterator
+from typing import Union
+
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
+from yamlator.violations import Violation
+from yamlator.yaml_loader import AUTO_LOADER
+from yamlator.yaml_loader import load_yaml_documents
+from yamlator.validators.plan import ValidationPlan
+from yamlator.validators.plan import compile_validation_plan
+
+
+def validate_yaml_stream(stream: Union[str, IO], schema: YamlatorSchema,
+                         loader: str = AUTO_LOADER,
+                         minimal: bool = False) -> Iterator[Violation]:
+    """Validate each document in a YAML stream against a schema. The
+    documents are loaded, validated and released in turn, and the
+    violations of each document are yielded once it has been validated
+
+    Empty documents, such as a `---` at the end of the stream, are
+    skipped, but are still counted by the index of the documents
+
+    Args:
+        stream (str | IO): The YAML documents or a file that contains them
+
+        schema (yamlator.types.YamlatorSchema): The schema used to
+            validate each document
+
+        loader (str, optional): The loader used to parse the documents,
+            one of `'auto'`, `'c'` or `'python'`. By default `'auto'` is
+            used, which uses the C parser when PyYAML has been built with
+            libyaml
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+    Returns:
+        A generator that yields the violations of each document. The
+        `document` attribute of each violation is the index of the
+        document it was detected in, starting at 0
+
+    Raises:
+        ValueError: If the `stream` or `schema` parameters are `None`, or
+            the loader is not supported
+    """
+    if stream is None:
+        raise ValueError('stream should not be None')
+
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    plan = compile_validation_plan(schema)
+    documents = load_yaml_documents(stream, loader, minimal)
+    return _validate_documents(documents, plan)
+
+
+def _validate_documents(documents: Iterator[Data],
+                        plan: ValidationPlan) -> Iterator[Violation]:
+    for index, data in enumerate(documents):
+        if data is None:
+            continue
+
+        violations = plan.validate(data)
+
+        # Only the violations are kept once the document has been
+        # validated, so the document can be released
+        del data
+        for violation in violations:
+            violation.document = index
+            yield violation
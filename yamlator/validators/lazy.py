@@ -0,0 +1,287 @@
+"""Loads a YAML document for a Yamlator schema, only constructing the
+values that the schema validates.
+
+Loading a document with PyYAML constructs a Python object for every value
+in it, including maps and lists with the `any` type and the fields of a
+ruleset that are not in the ruleset, which are never inspected by the
+validators. The schema guided loader reads the events of the parser and
+walks the compiled schema alongside them, so when a map or list will not
+be inspected, the parser is moved past it without composing or
+constructing it, and `SKIPPED` is loaded in its place. Maps and lists
+that are only checked for their type are loaded as an empty dict or list.
+
+Scalars are always constructed, since a field with a null value is
+treated as missing. Unions, collections with tags such as `!!set`,
+anchored nodes and the values of `<<` merge keys are constructed in full.
+
+Validating the loaded data detects the same violations, in the same
+order, as validating the document loaded by `yaml.safe_load`.
+"""
+
+import collections.abc
+
+from typing import IO
+from typing import Iterator
+from typing import Tuple
+from typing import Union
+
+from yaml.composer import ComposerError
+from yaml.constructor import ConstructorError
+from yaml.events import AliasEvent
+from yaml.events import CollectionEndEvent
+from yaml.events import CollectionStartEvent
+from yaml.events import MappingStartEvent
+from yaml.events import StreamEndEvent
+from yaml.nodes import MappingNode
+from yaml.nodes import ScalarNode
+
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
+from yamlator.yaml_loader import AUTO_LOADER
+from yamlator.yaml_loader import get_yaml_loader
+from yamlator.validators.plan import PlanNode
+from yamlator.validators.streaming import ListStreamNode
+from yamlator.validators.streaming import MapStreamNode
+from yamlator.validators.streaming import RulesetStreamNode
+from yamlator.validators.streaming import StreamNode
+from yamlator.validators.streaming import StreamingValidator
+from yamlator.validators.streaming import _EventValidator
+from yamlator.validators.streaming import _MAP_TAG
+from yamlator.validators.streaming import _MERGE_KEY
+from yamlator.validators.streaming import _MERGE_TAG
+from yamlator.validators.streaming import _SHALLOW
+from yamlator.validators.streaming import _SKIPPED
+from yamlator.validators.streaming import compile_streaming_validator
+
+
+class SkippedValue:
+    """The value that is loaded in place of a map or list that the schema
+    does not validate
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'SKIPPED'
+
+
+SKIPPED = SkippedValue()
+
+# Loads the values that are not validated by the schema
+_SKIPPED_NODE = StreamNode(PlanNode(), _SKIPPED)
+
+
+class _SchemaLoader:
+    """Loads a document from the events of the parser, only constructing
+    the values that the compiled schema validates
+    """
+
+    def __init__(self, yaml_loader):
+        self._loader = yaml_loader
+        self._events = _EventValidator(yaml_loader)
+
+    def load_single_document(self, validator: StreamingValidator) -> Data:
+        """Load the single document in the stream
+
+        Args:
+            validator (yamlator.validators.streaming.StreamingValidator):
+                The compiled schema
+
+        Returns:
+            The data of the document, or `None` if the stream does not
+            contain a document
+
+        Raises:
+            yaml.composer.ComposerError: If the stream contains more than
+                one document
+        """
+        yaml_loader = self._loader
+        yaml_loader.get_event()
+        if yaml_loader.check_event(StreamEndEvent):
+            yaml_loader.get_event()
+            return None
+
+        document = yaml_loader.get_event()
+        data = self._load_document(validator)
+        yaml_loader.get_event()
+
+        if not yaml_loader.check_event(StreamEndEvent):
+            event = yaml_loader.get_event()
+            raise ComposerError('expected a single document in the stream',
+                                document.start_mark,
+                                'but found another document',
+                                event.start_mark)
+        yaml_loader.get_event()
+        return data
+
+    def _load_document(self, validator: StreamingValidator) -> Data:
+        event = self._events.next_event()
+        if not validator.has_rules:
+            return self.load(_SKIPPED_NODE, event)
+
+        if validator.keyless_rule is not None:
+            _, rule_node = validator.entry_point.rules[validator.keyless_rule]
+            return self.load(rule_node, event)
+
+        if self._events.is_streamed(event) and \
+                isinstance(event, MappingStartEvent):
+            return self._load_mapping(validator.entry_point, event)
+        return self._events.load(event)
+
+    def load(self, node: StreamNode, event) -> Data:
+        """Load a value from the event that starts it
+
+        Args:
+            node (StreamNode): The node that validates the value
+
+            event (yaml.events.Event): The event that starts the value
+
+        Returns:
+            The data of the value
+        """
+        events = self._events
+        if node.is_skipped:
+            return self._skip(event)
+
+        if not events.is_streamed(event):
+            return events.load(event)
+
+        is_mapping = isinstance(event, MappingStartEvent)
+        if is_mapping and isinstance(node, (MapStreamNode,
+                                            RulesetStreamNode)):
+            return self._load_mapping(node, event)
+
+        if not is_mapping and isinstance(node, ListStreamNode):
+            item_node = node.item_node
+            data = []
+            item_event = events.next_event()
+            while not isinstance(item_event, CollectionEndEvent):
+                data.append(self.load(item_node, item_event))
+                item_event = events.next_event()
+            return data
+
+        if node.collections == _SHALLOW:
+            events.skip(event)
+            return {} if is_mapping else []
+        return events.load(event)
+
+    def _skip(self, event) -> Data:
+        # Scalars are still constructed, since a
+        # null value is treated as a missing field
+        events = self._events
+        if isinstance(event, CollectionStartEvent):
+            events.skip(event)
+            return SKIPPED
+
+        if isinstance(event, AliasEvent) and \
+                not isinstance(events.compose(event), ScalarNode):
+            return SKIPPED
+        return events.load(event)
+
+    def _load_mapping(self, node: StreamNode, event) -> dict:
+        # The values of merge keys are added before the other fields of
+        # the map, in the same way as the constructor
+        events = self._events
+        merged = []
+        fields = []
+
+        key_event = events.next_event()
+        while not isinstance(key_event, CollectionEndEvent):
+            key = events.read_key(key_event)
+            value_event = events.next_event()
+            if key is _MERGE_KEY:
+                merged.extend(self._read_merge(event, value_event))
+            else:
+                _check_hashable(key, event, key_event)
+                value_node = _value_node(node, key)
+                fields.append((key, self.load(value_node, value_event)))
+            key_event = events.next_event()
+
+        data = {}
+        for key, value in merged:
+            data[key] = value
+
+        for key, value in fields:
+            data[key] = value
+        return data
+
+    def _read_merge(self, event, value_event) -> Iterator[Tuple[Data, Data]]:
+        events = self._events
+        merge_key = ScalarNode(_MERGE_TAG, '<<')
+        value_node = events.compose(value_event)
+
+        # The constructor flattens the merged maps into the order
+        # that the fields are added to the map
+        mapping = MappingNode(_MAP_TAG, [(merge_key, value_node)],
+                              event.start_mark)
+        self._loader.flatten_mapping(mapping)
+        for key_node, merged_value_node in mapping.value:
+            key = events.construct(key_node)
+            _check_hashable(key, event, key_node)
+            yield key, events.construct(merged_value_node)
+
+
+def _value_node(node: StreamNode, key: Data) -> StreamNode:
+    if isinstance(node, MapStreamNode):
+        return node.value_node
+
+    rule = node.rules.get(key)
+    if rule is None:
+        return _SKIPPED_NODE
+    _, rule_node = rule
+    return rule_node
+
+
+def _check_hashable(key: Data, event, key_event) -> None:
+    if not isinstance(key, collections.abc.Hashable):
+        raise ConstructorError('while constructing a mapping',
+                               event.start_mark, 'found unhashable key',
+                               key_event.start_mark)
+
+
+def load_yaml_for_schema(stream: Union[str, IO], schema: YamlatorSchema,
+                         loader: str = AUTO_LOADER,
+                         minimal: bool = False) -> Data:
+    """Load a YAML document, only constructing the values that a schema
+    validates. Maps and lists that the schema does not inspect, such as
+    values with the `any` type or the fields of a ruleset that are not
+    in the ruleset, are parsed past without being constructed and are
+    loaded as `SKIPPED`
+
+    __Note__: Since the values that are skipped are not constructed, a
+    value with a tag that cannot be constructed does not raise an error
+    when it is skipped
+
+    Args:
+        stream (str | IO): The YAML document or a file that contains it
+
+        schema (yamlator.types.YamlatorSchema): The schema that the
+            document will be validated against
+
+        loader (str, optional): The loader used to parse the document, one
+            of `'auto'`, `'c'` or `'python'`. By default `'auto'` is used,
+            which uses the C parser when PyYAML has been built with libyaml
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+    Returns:
+        The data of the document, which can be validated against the
+        schema with `validate_yaml`, or `None` if the stream does not
+        contain a document
+
+    Raises:
+        ValueError: If the `stream` or `schema` parameters are `None` or
+            the loader is not supported
+        yaml.composer.ComposerError: If the stream contains more than
+            one document
+    """
+    if stream is None:
+        raise ValueError('stream should not be None')
+
+    validator = compile_streaming_validator(schema)
+    yaml_loader = get_yaml_loader(loader, minimal)(stream)
+    try:
+        return _SchemaLoader(yaml_loader).load_single_document(validator)
+    finally:
+        yaml_loader.dispose()
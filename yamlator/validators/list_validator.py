@@ -42,8 +42,7 @@ class ListValidator(Validator):
             return
 
         if not is_list_data:
-            message = f'{key} should be of type list'
-            self._add_type_violation(key, parent, message)
+            self._add_type_violation(key, parent, expected_type='list')
             return
 
         for idx, item in enumerate(data):
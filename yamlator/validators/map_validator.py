@@ -30,8 +30,7 @@ class MapValidator(Validator):
             return
 
         if not is_map_data:
-            message = f'{key} should be of type map'
-            self._add_type_violation(key, parent, message)
+            self._add_type_violation(key, parent, expected_type='map')
             return
 
         for child_key, value in data.items():
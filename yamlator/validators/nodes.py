@@ -0,0 +1,283 @@
+"""Validates the node graph composed by the YAML parser against a Yamlator
+schema, without constructing the Python objects of the whole document.
+
+Loading a document constructs a Python object for every value in it,
+including the values that the schema does not validate. The composed
+nodes of the document are validated instead, so a scalar is only
+constructed when its rule type validates it, and maps and lists with
+the `any` type, or that are only checked for their type, are not
+constructed at all.
+
+Each node keeps the position it was parsed from, so every violation is
+given the line and column of the value it was detected for, without
+parsing the document again.
+
+The violations are the same, and in the same order, as the violations
+detected by `validate_yaml` for the loaded document.
+"""
+
+from collections import deque
+from typing import Dict
+from typing import IO
+from typing import Tuple
+from typing import Union
+
+from yaml.constructor import ConstructorError
+from yaml.nodes import MappingNode
+from yaml.nodes import Node
+from yaml.nodes import ScalarNode
+from yaml.nodes import SequenceNode
+
+from yamlator.exceptions import MaxViolationsReachedError
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
+from yamlator.violations import RequiredViolation
+from yamlator.violations import Violation
+from yamlator.violations import ViolationBudget
+from yamlator.yaml_loader import AUTO_LOADER
+from yamlator.yaml_loader import get_yaml_loader
+from yamlator.validators.plan import PlanNode
+from yamlator.validators.streaming import ListStreamNode
+from yamlator.validators.streaming import MapStreamNode
+from yamlator.validators.streaming import RulesetStreamNode
+from yamlator.validators.streaming import StreamNode
+from yamlator.validators.streaming import StreamingValidator
+from yamlator.validators.streaming import _MAP_TAG
+from yamlator.validators.streaming import _MERGE_TAG
+from yamlator.validators.streaming import _SEQ_TAG
+from yamlator.validators.streaming import _SHALLOW
+from yamlator.validators.streaming import _SKIPPED
+from yamlator.validators.streaming import _VALUE_TAG
+from yamlator.validators.streaming import _scalar_constructors
+from yamlator.validators.streaming import compile_streaming_validator
+
+# Marks that the value of a node has not been constructed
+_NOT_CONSTRUCTED = object()
+
+_Items = Dict[Data, Tuple[Node, Node]]
+
+
+class _NodeValidator:
+    """Validates the composed nodes of a document"""
+
+    def __init__(self, yaml_loader, violations: deque):
+        self._loader = yaml_loader
+        self._violations = violations
+        self._scratch = deque()
+        self._constructors = _scalar_constructors(yaml_loader)
+
+    def validate(self, validator: StreamingValidator, node: Node) -> None:
+        """Validate the root node of a document
+
+        Args:
+            validator (yamlator.validators.streaming.StreamingValidator):
+                The compiled schema
+
+            node (yaml.nodes.Node): The root node of the document
+
+        Raises:
+            ValueError: If the document is null
+        """
+        if not validator.has_rules:
+            return
+
+        if validator.keyless_rule is None and _is_map(node):
+            self._validate_ruleset(validator.entry_point, node, '-', '-')
+            return
+
+        data = _NOT_CONSTRUCTED
+        if isinstance(node, ScalarNode) or validator.keyless_rule is None:
+            data = self._construct(node)
+            if data is None:
+                raise ValueError('yaml_data should not be None')
+
+        if validator.keyless_rule is None:
+            self._validate_data(validator.plan, data, node)
+            return
+
+        _, rule_node = validator.entry_point.rules[validator.keyless_rule]
+        self._validate_node(rule_node, node, validator.keyless_rule, '-',
+                            data)
+
+    def _validate_node(self, stream_node: StreamNode, node: Node, key: Data,
+                       parent: str, data: Data = _NOT_CONSTRUCTED) -> None:
+        if _is_map(node):
+            if isinstance(stream_node, MapStreamNode):
+                value_node = stream_node.value_node
+                for child_key, (_, child) in self._items(node).items():
+                    self._validate_node(value_node, child, child_key, key)
+                return
+
+            if isinstance(stream_node, RulesetStreamNode):
+                self._validate_ruleset(stream_node, node, key, parent)
+                return
+            placeholder = {}
+        elif _is_list(node):
+            if isinstance(stream_node, ListStreamNode):
+                item_node = stream_node.item_node
+                for idx, item in enumerate(node.value):
+                    self._validate_node(item_node, item, f'{key}[{idx}]',
+                                        key)
+                return
+            placeholder = []
+        else:
+            # Scalars and collections with tags are validated as the
+            # objects they are constructed as
+            if stream_node.is_skipped:
+                return
+
+            if data is _NOT_CONSTRUCTED:
+                data = self._construct(node)
+            self._validate_rule_type(stream_node.plan, key, data, parent,
+                                     node)
+            return
+
+        if stream_node.collections == _SKIPPED:
+            return
+
+        if stream_node.collections != _SHALLOW:
+            placeholder = self._construct(node)
+        self._validate_rule_type(stream_node.plan, key, placeholder, parent,
+                                 node)
+
+    def _validate_ruleset(self, stream_node: RulesetStreamNode,
+                          node: MappingNode, key: str, parent: str) -> None:
+        items = self._items(node)
+        if stream_node.is_strict:
+            for field in set(items.keys()) - stream_node.fields:
+                key_node, _ = items[field]
+                violation = stream_node.strict_violation(key, parent, field)
+                self._add(violation, key_node)
+
+        for name, (is_required, rule_node) in stream_node.rules.items():
+            item = items.get(name)
+            value_node = item[1] if item is not None else None
+
+            # A field with a null value is treated as missing
+            data = _NOT_CONSTRUCTED
+            if isinstance(value_node, ScalarNode):
+                data = self._construct(value_node)
+
+            if value_node is None or data is None:
+                if is_required:
+                    self._add(RequiredViolation(name, key), node)
+                continue
+            self._validate_node(rule_node, value_node, name, key, data)
+
+    def _validate_rule_type(self, plan: PlanNode, key: Data, data: Data,
+                            parent: str, node: Node) -> None:
+        plan.validate(key, data, parent, self._scratch)
+        self._add_scratch(node)
+
+    def _validate_data(self, plan, data: Data, node: Node) -> None:
+        plan.validate(data, self._scratch)
+        self._add_scratch(node)
+
+    def _add_scratch(self, node: Node) -> None:
+        # The violations are detected in a scratch deque so that the
+        # line and column are set before they are added, since adding
+        # a violation can stop the validation
+        scratch = self._scratch
+        while scratch:
+            self._add(scratch.popleft(), node)
+
+    def _add(self, violation: Violation, node: Node) -> None:
+        mark = node.start_mark
+        violation.line = mark.line + 1
+        violation.column = mark.column + 1
+        self._violations.append(violation)
+
+    def _items(self, node: MappingNode) -> _Items:
+        # The keys and values are collected in the same way as the
+        # constructor, so merged keys are added before the keys of the
+        # map, `=` keys are loaded as strings and the last value of a
+        # key that is repeated is used
+        for key_node, _ in node.value:
+            if key_node.tag in (_MERGE_TAG, _VALUE_TAG):
+                self._loader.flatten_mapping(node)
+                break
+
+        items = {}
+        for key_node, value_node in node.value:
+            child_key = self._construct(key_node)
+            try:
+                items[child_key] = (key_node, value_node)
+            except TypeError as ex:
+                raise ConstructorError('while constructing a mapping',
+                                       node.start_mark,
+                                       'found unhashable key',
+                                       key_node.start_mark) from ex
+        return items
+
+    def _construct(self, node: Node) -> Data:
+        if isinstance(node, ScalarNode):
+            constructor = self._constructors.get(node.tag)
+            if constructor is not None:
+                return constructor(self._loader, node)
+        return self._loader.construct_document(node)
+
+
+def _is_map(node: Node) -> bool:
+    return isinstance(node, MappingNode) and node.tag == _MAP_TAG
+
+
+def _is_list(node: Node) -> bool:
+    return isinstance(node, SequenceNode) and node.tag == _SEQ_TAG
+
+
+def validate_yaml_nodes(stream: Union[str, IO], schema: YamlatorSchema,
+                        loader: str = AUTO_LOADER, minimal: bool = False,
+                        max_violations: int = None) -> deque:
+    """Validate a YAML document against a schema from the nodes composed
+    by the YAML parser. Values are only constructed when the schema
+    validates them, and each violation is given the line and column of
+    the value it was detected for
+
+    Args:
+        stream (str | IO): The YAML document or a file that contains it
+
+        schema (yamlator.types.YamlatorSchema): The schema used to
+            validate the document
+
+        loader (str, optional): The loader used to parse the document, one
+            of `'auto'`, `'c'` or `'python'`. By default `'auto'` is used,
+            which uses the C parser when PyYAML has been built with libyaml
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+        max_violations (int, optional): The maximum number of violations to
+            detect. If `None` is provided, all the violations in the
+            document are detected
+
+    Returns:
+        A deque that contains the violations that were detected in the
+        document, in the same order as `validate_yaml`
+
+    Raises:
+        ValueError: If the `stream` or `schema` parameters are `None`, the
+            loader is not supported, `max_violations` is not a positive
+            integer or the stream does not contain a document
+    """
+    if stream is None:
+        raise ValueError('stream should not be None')
+
+    validator = compile_streaming_validator(schema)
+    violations = deque()
+    if max_violations is not None:
+        violations = ViolationBudget(max_violations)
+
+    yaml_loader = get_yaml_loader(loader, minimal)(stream)
+    try:
+        node = yaml_loader.get_single_node()
+        if node is None:
+            raise ValueError('yaml_data should not be None')
+
+        _NodeValidator(yaml_loader, violations).validate(validator, node)
+    except MaxViolationsReachedError:
+        # The validation was stopped because the maximum
+        # number of violations was detected
+        pass
+    finally:
+        yaml_loader.dispose()
+    return violations
@@ -0,0 +1,387 @@
+"""Compiles a Yamlator schema into a flat validation plan.
+
+The validator chain passes every data node through each validator until
+one of them handles the rule type. The plan instead resolves the rule
+types once, when the schema is compiled, into nodes that directly
+validate the data they are given. Lookups for rulesets, enums and regex
+rules are resolved at the same time so that validating the data does not
+need to reference the schema.
+
+The plan produces the same violations, in the same order, as the
+validator chain.
+"""
+
+from collections import deque
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.utils import is_keyless_rule
+from yamlator.violations import RegexTypeViolation
+from yamlator.violations import RequiredViolation
+from yamlator.violations import RulesetTypeViolation
+from yamlator.violations import StrictEntryPointViolation
+from yamlator.violations import StrictRulesetViolation
+from yamlator.violations import TypeViolation
+from yamlator.validators.predicate import Predicate
+from yamlator.validators.predicate import PredicateCompiler
+from yamlator.validators.resolution import BUILTIN_HANDLER
+from yamlator.validators.resolution import BUILTIN_TYPES
+from yamlator.validators.resolution import ENUM_HANDLER
+from yamlator.validators.resolution import LIST_HANDLER
+from yamlator.validators.resolution import MAP_HANDLER
+from yamlator.validators.resolution import REGEX_HANDLER
+from yamlator.validators.resolution import RULESET_HANDLER
+from yamlator.validators.resolution import UNION_HANDLER
+from yamlator.validators.resolution import resolve_handler
+from yamlator.validators.resolution import resolve_list_item_level
+from yamlator.validators.resolution import union_violation
+
+PLAN_ENGINE = 'plan'
+
+
+class PlanNode:
+    """Base node in a validation plan. The base node accepts any data
+    and is used for rule types that are not validated
+    """
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        """Validate the data against the node
+
+        Args:
+            key (str): The data field name
+            data (yamlator.types.Data): The data to validate
+            parent (str): The parent key of the data
+            violations (collections.deque): The deque that any detected
+                violations are added to
+        """
+
+
+class MapNode(PlanNode):
+    """Validates a map and each of the values in the map"""
+
+    def __init__(self, value_node: PlanNode):
+        self._value_node = value_node
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if not isinstance(data, dict):
+            violations.append(TypeViolation(key, parent,
+                                            expected_type='map'))
+            return
+
+        value_node = self._value_node
+        for child_key, value in data.items():
+            value_node.validate(child_key, value, key, violations)
+
+
+class RulesetNode(PlanNode):
+    """Validates a map against the rules of a ruleset"""
+
+    def __init__(self, ruleset: YamlatorRuleset):
+        self._name = ruleset.name
+        self._is_strict = ruleset.is_strict
+        self._fields = frozenset(rule.name for rule in ruleset.rules)
+
+        # Set once the nodes for each rule have been compiled, which
+        # allows a ruleset to reference itself
+        self.rules: List[Tuple[str, bool, PlanNode]] = []
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if not isinstance(data, dict):
+            violations.append(RulesetTypeViolation(key, parent))
+            return
+
+        if self._is_strict:
+            for field in set(data.keys()) - self._fields:
+                violation = StrictRulesetViolation(key, parent, field,
+                                                   self._name)
+                violations.append(violation)
+
+        for name, is_required, node in self.rules:
+            sub_data = data.get(name, None)
+            if sub_data is None:
+                if is_required:
+                    violations.append(RequiredViolation(name, key))
+                continue
+            node.validate(name, sub_data, key, violations)
+
+
+class ListNode(PlanNode):
+    """Validates a list and each of the items in the list"""
+
+    def __init__(self, item_node: PlanNode):
+        self._item_node = item_node
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if not isinstance(data, list):
+            violations.append(TypeViolation(key, parent,
+                                            expected_type='list'))
+            return
+
+        item_node = self._item_node
+        for idx, item in enumerate(data):
+            item_node.validate(f'{key}[{idx}]', item, key, violations)
+
+
+class EnumNode(PlanNode):
+    """Validates that the data matches a value in an enum"""
+
+    def __init__(self, enum_name: str, items: dict):
+        self._enum_name = enum_name
+        self._items = items
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if isinstance(data, (str, float, int)) \
+                and self._items.get(data) is not None:
+            return
+
+        message = f'{key} does not match any value in enum {self._enum_name}'
+        violations.append(TypeViolation(key, parent, message))
+
+
+class RegexNode(PlanNode):
+    """Validates that the data is a string that matches a regex"""
+
+    def __init__(self, regex):
+        self._regex = regex
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if not isinstance(data, str):
+            violations.append(TypeViolation(key, parent,
+                                            expected_type='str'))
+            return
+
+        if not self._regex.search(data):
+            violation = RegexTypeViolation(key, parent, data, self._regex)
+            violations.append(violation)
+
+
+class BuiltInTypeNode(PlanNode):
+    """Validates that the data is an instance of a built in type"""
+
+    def __init__(self, data_type: type, friendly_name: str):
+        self._data_type = data_type
+        self._friendly_name = friendly_name
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        if not isinstance(data, self._data_type):
+            violations.append(TypeViolation(
+                key, parent, expected_type=self._friendly_name))
+
+
+class UnionNode(PlanNode):
+    """Validates the data against each type in a union. A single
+    violation is added if the data does not match any of the types
+    """
+
+    def __init__(self, sub_types: List[Tuple[str, PlanNode, Predicate]]):
+        self._names = [name for name, _, _ in sub_types]
+        self._nodes = [node for _, node, _ in sub_types]
+        self._predicates = [predicate for _, _, predicate in sub_types]
+
+    def validate(self, key: str, data: Data, parent: str,
+                 violations: deque) -> None:
+        # The data is checked against each type until one of them
+        # matches, which does not create any violations
+        for predicate in self._predicates:
+            if predicate(data):
+                return
+
+        nodes = self._nodes
+        violations.append(union_violation(
+            key, parent, self._names,
+            lambda index, scratch: nodes[index].validate(key, data, parent,
+                                                         scratch)))
+
+
+class ValidationPlan:
+    """A compiled Yamlator schema that validates data without
+    referencing the schema
+    """
+
+    def __init__(self, schema: YamlatorSchema):
+        """ValidationPlan init
+
+        Args:
+            schema (yamlator.types.YamlatorSchema): The schema to compile
+
+        Raises:
+            ValueError: If the `schema` parameter is `None`
+        """
+        if schema is None:
+            raise ValueError('schema should not be None')
+
+        compiler = PlanCompiler(schema)
+        root = schema.root
+
+        self._is_strict = root.is_strict
+        self._fields = frozenset(rule.name for rule in root.rules)
+        self._keyless_rule = None
+        self._rules = [compiler.compile_rule(rule.name, rule.is_required,
+                                             rule.rtype)
+                       for rule in root.rules]
+
+        if len(root.rules) == 1 and is_keyless_rule(root.rules[0]):
+            self._keyless_rule = self._rules[0]
+
+    def validate(self, yaml_data: Data, violations: deque = None) -> deque:
+        """Validate YAML data against the compiled schema
+
+        Args:
+            yaml_data (yamlator.types.Data): The YAML data to validate
+
+            violations (collections.deque, optional): The deque that
+                detected violations are added to. If `None` is provided
+                then a new deque is created
+
+        Returns:
+            A deque that contains the violations that were detected
+        """
+        if violations is None:
+            violations = deque()
+
+        parent = '-'
+        if self._keyless_rule is not None:
+            _validate_rule(self._keyless_rule, yaml_data, parent, violations)
+            return violations
+
+        if not self._rules:
+            return violations
+
+        if self._is_strict:
+            for field in set(yaml_data.keys()) - self._fields:
+                violation = StrictEntryPointViolation(key='SCHEMA',
+                                                      parent=parent,
+                                                      field=field)
+                violations.append(violation)
+
+        for rule in self._rules:
+            sub_data = yaml_data.get(rule[0], None)
+            _validate_rule(rule, sub_data, parent, violations)
+        return violations
+
+
+def _validate_rule(rule: Tuple[str, bool, PlanNode], data: Data,
+                   parent: str, violations: deque) -> None:
+    name, is_required, node = rule
+    if data is None:
+        if is_required:
+            violations.append(RequiredViolation(name, parent))
+        return
+    node.validate(name, data, parent, violations)
+
+
+class PlanCompiler:
+    """Compiles the rule types of a schema into plan nodes"""
+
+    def __init__(self, schema: YamlatorSchema):
+        self._rulesets = schema.rulesets
+        self._enums = schema.enums
+        self._predicates = PredicateCompiler(schema)
+        self._ruleset_nodes: Dict[str, RulesetNode] = {}
+        self._enum_nodes: Dict[str, EnumNode] = {}
+
+    def compile_rule(self, name: str, is_required: bool,
+                     rtype: RuleType) -> Tuple[str, bool, PlanNode]:
+        return (name, is_required, self.compile_type(rtype, MAP_HANDLER))
+
+    def compile_type(self, rtype: RuleType, level: int) -> PlanNode:
+        handler = resolve_handler(rtype, level)
+        if handler == MAP_HANDLER:
+            return MapNode(self.compile_type(rtype.sub_type, MAP_HANDLER))
+
+        if handler == RULESET_HANDLER:
+            return self._compile_ruleset(rtype.lookup)
+
+        if handler == LIST_HANDLER:
+            return self._compile_list(rtype.sub_type)
+
+        if handler == ENUM_HANDLER:
+            return self._compile_enum(rtype.lookup)
+
+        if handler == REGEX_HANDLER:
+            return RegexNode(rtype.regex)
+
+        if handler == BUILTIN_HANDLER:
+            return BuiltInTypeNode(*BUILTIN_TYPES[rtype.schema_type])
+
+        if handler == UNION_HANDLER:
+            return self._compile_union(rtype.sub_types)
+
+        # Any types and types that are not handled accept all data
+        return PlanNode()
+
+    def _compile_ruleset(self, lookup: str) -> RulesetNode:
+        node = self._ruleset_nodes.get(lookup)
+        if node is not None:
+            return node
+
+        default_missing_ruleset = YamlatorRuleset(lookup, [])
+        ruleset = self._rulesets.get(lookup, default_missing_ruleset)
+
+        node = RulesetNode(ruleset)
+        self._ruleset_nodes[lookup] = node
+        node.rules = [self.compile_rule(rule.name, rule.is_required,
+                                        rule.rtype)
+                      for rule in ruleset.rules]
+        return node
+
+    def _compile_list(self, sub_type: RuleType) -> ListNode:
+        level = resolve_list_item_level(sub_type)
+        return ListNode(self.compile_type(sub_type, level))
+
+    def _compile_enum(self, lookup: str) -> EnumNode:
+        node = self._enum_nodes.get(lookup)
+        if node is not None:
+            return node
+
+        target_enum = self._enums.get(lookup)
+        items = target_enum.items if target_enum is not None else {}
+        node = EnumNode(lookup, items)
+        self._enum_nodes[lookup] = node
+        return node
+
+    def _compile_union(self, sub_types: List[RuleType]) -> UnionNode:
+        # Each type in the union is validated from the validator that
+        # handles that type, which is the same as starting from the map
+        # validator for all the types a union can contain
+        predicates = self._predicates
+        compiled_sub_types = [(str(sub_type),
+                               self.compile_type(sub_type, MAP_HANDLER),
+                               predicates.compile_type(sub_type, MAP_HANDLER))
+                              for sub_type in sub_types]
+        return UnionNode(compiled_sub_types)
+
+
+def compile_validation_plan(schema: YamlatorSchema) -> ValidationPlan:
+    """Compile a schema into a validation plan. The plan is cached on the
+    schema, so it is only compiled once for each schema
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to compile
+
+    Returns:
+        A `ValidationPlan` that can validate YAML data against the schema
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    plan = schema.compiled_validators.get(PLAN_ENGINE)
+    if plan is None:
+        plan = ValidationPlan(schema)
+        schema.compiled_validators[PLAN_ENGINE] = plan
+    return plan
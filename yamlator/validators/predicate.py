@@ -0,0 +1,311 @@
+"""Compiles a Yamlator schema into a predicate that reports whether YAML
+data is valid without detecting the violations.
+
+A validation engine creates a violation, with the keys and messages that
+describe it, for every part of the data that does not match the schema.
+A predicate only needs to know whether any part of the data does not
+match, so it returns `False` as soon as the first mismatch is found. No
+violations, keys or deques are created while the data is checked.
+
+A predicate is compiled into nested functions in the same way as the
+validation plan and returns `True` if, and only if, the validation
+engines do not detect any violations in the data.
+
+A union of rulesets that each require the same field, with an enum type
+whose values are not used by the enums of the other rulesets, can only
+be matched by the ruleset whose enum contains the value of the field.
+The rulesets are indexed by the values of their enums, so only one of
+them is checked instead of every ruleset in the union.
+"""
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.utils import is_keyless_rule
+from yamlator.validators.resolution import BUILTIN_HANDLER
+from yamlator.validators.resolution import BUILTIN_TYPES
+from yamlator.validators.resolution import ENUM_HANDLER
+from yamlator.validators.resolution import LIST_HANDLER
+from yamlator.validators.resolution import MAP_HANDLER
+from yamlator.validators.resolution import REGEX_HANDLER
+from yamlator.validators.resolution import RULESET_HANDLER
+from yamlator.validators.resolution import UNION_HANDLER
+from yamlator.validators.resolution import find_discriminator
+from yamlator.validators.resolution import resolve_handler
+from yamlator.validators.resolution import resolve_list_item_level
+
+# The key the compiled predicate is cached with on the schema
+PREDICATE_KEY = 'predicate'
+
+_ENUM_TYPES = (str, float, int)
+
+Predicate = Callable[[Data], bool]
+_Rule = Tuple[str, bool, Predicate]
+
+
+def accept_any(data: Data) -> bool:
+    """The predicate for any types and the types that are not handled,
+    which accept all data
+    """
+    del data
+    return True
+
+
+def _is_valid_rule(rule: _Rule, data: Data) -> bool:
+    _, is_required, predicate = rule
+    if data is None:
+        return not is_required
+    return predicate(data)
+
+
+class PredicateCompiler:
+    """Compiles the rule types of a schema into predicates"""
+
+    def __init__(self, schema: YamlatorSchema):
+        self._rulesets = schema.rulesets
+        self._enums = schema.enums
+        self._ruleset_predicates: Dict[str, Predicate] = {}
+
+    def compile_rule(self, name: str, is_required: bool,
+                     rtype: RuleType) -> _Rule:
+        return (name, is_required, self.compile_type(rtype, MAP_HANDLER))
+
+    def compile_type(self, rtype: RuleType, level: int) -> Predicate:
+        handler = resolve_handler(rtype, level)
+        if handler == MAP_HANDLER:
+            return self._compile_map(rtype.sub_type)
+
+        if handler == RULESET_HANDLER:
+            return self._compile_ruleset(rtype.lookup)
+
+        if handler == LIST_HANDLER:
+            return self._compile_list(rtype.sub_type)
+
+        if handler == ENUM_HANDLER:
+            return self._compile_enum(rtype.lookup)
+
+        if handler == REGEX_HANDLER:
+            return _compile_regex(rtype.regex)
+
+        if handler == BUILTIN_HANDLER:
+            data_type, _ = BUILTIN_TYPES[rtype.schema_type]
+            return lambda data: isinstance(data, data_type)
+
+        if handler == UNION_HANDLER:
+            return self._compile_union(rtype.sub_types)
+
+        return accept_any
+
+    def _compile_map(self, sub_type: RuleType) -> Predicate:
+        if resolve_handler(sub_type, MAP_HANDLER) == BUILTIN_HANDLER:
+            value_type, _ = BUILTIN_TYPES[sub_type.schema_type]
+
+            def is_valid_builtin_map(data: Data) -> bool:
+                if not isinstance(data, dict):
+                    return False
+                for value in data.values():
+                    if not isinstance(value, value_type):
+                        return False
+                return True
+            return is_valid_builtin_map
+
+        value_predicate = self.compile_type(sub_type, MAP_HANDLER)
+
+        def is_valid_map(data: Data) -> bool:
+            if not isinstance(data, dict):
+                return False
+            for value in data.values():
+                if not value_predicate(value):
+                    return False
+            return True
+        return is_valid_map
+
+    def _compile_ruleset(self, lookup: str) -> Predicate:
+        predicate = self._ruleset_predicates.get(lookup)
+        if predicate is not None:
+            return predicate
+
+        default_missing_ruleset = YamlatorRuleset(lookup, [])
+        ruleset = self._rulesets.get(lookup, default_missing_ruleset)
+
+        is_strict = ruleset.is_strict
+        fields = frozenset(rule.name for rule in ruleset.rules)
+
+        # Filled once the predicate has been cached, which allows
+        # a ruleset to reference itself
+        rules: List[_Rule] = []
+
+        def is_valid_ruleset(data: Data) -> bool:
+            if not isinstance(data, dict):
+                return False
+
+            if is_strict:
+                for field in data:
+                    if field not in fields:
+                        return False
+
+            for name, is_required, rule_predicate in rules:
+                sub_data = data.get(name, None)
+                if sub_data is None:
+                    if is_required:
+                        return False
+                elif not rule_predicate(sub_data):
+                    return False
+            return True
+
+        self._ruleset_predicates[lookup] = is_valid_ruleset
+        rules.extend(self.compile_rule(rule.name, rule.is_required,
+                                       rule.rtype)
+                     for rule in ruleset.rules)
+        return is_valid_ruleset
+
+    def _compile_list(self, sub_type: RuleType) -> Predicate:
+        level = resolve_list_item_level(sub_type)
+        if resolve_handler(sub_type, level) == BUILTIN_HANDLER:
+            item_type, _ = BUILTIN_TYPES[sub_type.schema_type]
+
+            def is_valid_builtin_list(data: Data) -> bool:
+                if not isinstance(data, list):
+                    return False
+                for item in data:
+                    if not isinstance(item, item_type):
+                        return False
+                return True
+            return is_valid_builtin_list
+
+        item_predicate = self.compile_type(sub_type, level)
+
+        def is_valid_list(data: Data) -> bool:
+            if not isinstance(data, list):
+                return False
+            for item in data:
+                if not item_predicate(item):
+                    return False
+            return True
+        return is_valid_list
+
+    def _compile_enum(self, lookup: str) -> Predicate:
+        target_enum = self._enums.get(lookup)
+        items = target_enum.items if target_enum is not None else {}
+
+        def is_valid_enum(data: Data) -> bool:
+            return isinstance(data, _ENUM_TYPES) \
+                and items.get(data) is not None
+        return is_valid_enum
+
+    def _compile_union(self, sub_types: List[RuleType]) -> Predicate:
+        predicates = [self.compile_type(sub_type, MAP_HANDLER)
+                      for sub_type in sub_types]
+        if accept_any in predicates:
+            return accept_any
+
+        discriminator = find_discriminator(sub_types, self._rulesets,
+                                           self._enums)
+        if discriminator is None:
+            def is_valid_union(data: Data) -> bool:
+                for predicate in predicates:
+                    if predicate(data):
+                        return True
+                return False
+            return is_valid_union
+
+        field, index = discriminator
+        ruleset_predicates = {value: predicates[position]
+                              for value, position in index.items()}
+        indexed = set(index.values())
+        other_predicates = [predicate
+                            for position, predicate in enumerate(predicates)
+                            if position not in indexed]
+
+        def is_valid_discriminated_union(data: Data) -> bool:
+            # Only the ruleset that the value of the field is indexed by
+            # can match the data, all the other rulesets would detect an
+            # enum or required violation for the field
+            if isinstance(data, dict):
+                value = data.get(field, None)
+                if isinstance(value, _ENUM_TYPES):
+                    predicate = ruleset_predicates.get(value)
+                    if predicate is not None and predicate(data):
+                        return True
+
+            for predicate in other_predicates:
+                if predicate(data):
+                    return True
+            return False
+        return is_valid_discriminated_union
+
+
+def _compile_regex(regex) -> Predicate:
+    search = regex.search
+
+    def is_valid_regex(data: Data) -> bool:
+        return isinstance(data, str) and search(data) is not None
+    return is_valid_regex
+
+
+def _compile_entry_point(schema: YamlatorSchema) -> Predicate:
+    compiler = PredicateCompiler(schema)
+    root = schema.root
+
+    rules = [compiler.compile_rule(rule.name, rule.is_required, rule.rtype)
+             for rule in root.rules]
+
+    if len(root.rules) == 1 and is_keyless_rule(root.rules[0]):
+        keyless_rule = rules[0]
+        return lambda data: _is_valid_rule(keyless_rule, data)
+
+    if not rules:
+        return accept_any
+
+    is_strict = root.is_strict
+    fields = frozenset(rule.name for rule in root.rules)
+
+    def is_valid_schema(data: Data) -> bool:
+        if is_strict:
+            for field in data.keys():
+                if field not in fields:
+                    return False
+
+        for name, is_required, predicate in rules:
+            sub_data = data.get(name, None)
+            if sub_data is None:
+                if is_required:
+                    return False
+            elif not predicate(sub_data):
+                return False
+        return True
+    return is_valid_schema
+
+
+def compile_schema_predicate(schema: YamlatorSchema) -> Predicate:
+    """Compiles a predicate that checks whether YAML data is valid against
+    a schema. The compiled predicate is cached on the schema so subsequent
+    calls with the same schema object return the same predicate
+
+    __Note__: Changes made to the rules of a schema after the predicate
+    has been compiled are not reflected by the compiled predicate
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to compile
+
+    Returns:
+        A function that accepts the YAML data and returns `True` if the
+        data does not contain any violations, otherwise `False`
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    predicate = schema.compiled_validators.get(PREDICATE_KEY)
+    if predicate is None:
+        predicate = _compile_entry_point(schema)
+        schema.compiled_validators[PREDICATE_KEY] = predicate
+    return predicate
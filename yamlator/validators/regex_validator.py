@@ -33,8 +33,7 @@ class RegexValidator(Validator):
             return
 
         if not isinstance(data, str):
-            message = f'{key} should be of type str'
-            self._add_type_violation(key, parent, message)
+            self._add_type_violation(key, parent, expected_type='str')
             return
 
         if not rtype.regex.search(data):
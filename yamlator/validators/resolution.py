@@ -0,0 +1,223 @@
+"""Resolves which validator in the validator chain handles a rule type.
+The compiled validation engines and predicates use the resolved handlers
+so that they validate each rule type the same way as the chain.
+
+Also finds the field that discriminates the rulesets in a union, which
+allows a union to only validate the ruleset that can match the data, and
+creates the violation for data that does not match any type in a union
+"""
+
+from collections import deque
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamlator.types import Data
+from yamlator.types import EnumItem
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorEnum
+from yamlator.types import YamlatorRuleset
+from yamlator.violations import TypeViolation
+
+
+# The order that the validator chain attempts to handle a rule type. A
+# rule type can only be handled by a validator at or after the position
+# that the chain was entered from. For example, the items in a list are
+# validated from the list validator, so a map is only checked as a
+# built in type rather than validating each of its values
+MAP_HANDLER = 0
+RULESET_HANDLER = 1
+LIST_HANDLER = 2
+ENUM_HANDLER = 3
+ANY_HANDLER = 4
+REGEX_HANDLER = 5
+BUILTIN_HANDLER = 6
+UNION_HANDLER = 7
+
+_HANDLERS = {
+    SchemaTypes.MAP: (MAP_HANDLER, BUILTIN_HANDLER),
+    SchemaTypes.RULESET: (RULESET_HANDLER,),
+    SchemaTypes.LIST: (LIST_HANDLER, BUILTIN_HANDLER),
+    SchemaTypes.ENUM: (ENUM_HANDLER,),
+    SchemaTypes.ANY: (ANY_HANDLER,),
+    SchemaTypes.REGEX: (REGEX_HANDLER,),
+    SchemaTypes.INT: (BUILTIN_HANDLER,),
+    SchemaTypes.STR: (BUILTIN_HANDLER,),
+    SchemaTypes.FLOAT: (BUILTIN_HANDLER,),
+    SchemaTypes.BOOL: (BUILTIN_HANDLER,),
+    SchemaTypes.UNION: (UNION_HANDLER,),
+}
+
+BUILTIN_TYPES = {
+    SchemaTypes.INT: (int, 'int'),
+    SchemaTypes.STR: (str, 'str'),
+    SchemaTypes.FLOAT: (float, 'float'),
+    SchemaTypes.LIST: (list, 'list'),
+    SchemaTypes.MAP: (dict, 'map'),
+    SchemaTypes.BOOL: (bool, 'bool'),
+}
+
+
+def resolve_handler(rtype: RuleType, level: int) -> int:
+    """Resolves the validator that handles a rule type when the validator
+    chain is entered at `level`
+
+    Args:
+        rtype (yamlator.types.RuleType): The rule type to resolve
+
+        level (int): The handler the chain is entered from, such as
+            `MAP_HANDLER` for the rules of a ruleset
+
+    Returns:
+        The handler of the rule type, or `None` if the rule type is not
+        handled, in which case it accepts all data
+    """
+    for handler in _HANDLERS.get(rtype.schema_type, ()):
+        if handler >= level:
+            return handler
+    return None
+
+
+def resolve_list_item_level(sub_type: RuleType) -> int:
+    """Resolves the level that the items of a list are validated from.
+    Rulesets are not handled by the list validator, so items that are
+    rulesets are validated from the ruleset validator instead
+
+    Args:
+        sub_type (yamlator.types.RuleType): The type of the items
+
+    Returns:
+        The level to resolve the handler of the items with
+    """
+    if sub_type.schema_type == SchemaTypes.RULESET:
+        return RULESET_HANDLER
+    return LIST_HANDLER
+
+
+def order_union_types(names: List[str], counts: List[int]) -> str:
+    """Orders the names of the types in a union by the number of
+    violations that each type detected, keeping the order of the union
+    for types with the same number of violations
+
+    Args:
+        names (List[str]): The names of the types in the union
+
+        counts (List[int]): The number of violations detected by each type
+
+    Returns:
+        The names of the types, separated by commas
+    """
+    ordered = sorted(zip(counts, range(len(names))))
+    return ', '.join([names[index] for _, index in ordered])
+
+
+def union_violation(key: str, parent: str, names: List[str],
+                    validate_type: Callable[[int, deque], None]
+                    ) -> TypeViolation:
+    """Creates the violation for data that does not match any of the types
+    in a union. The types in the message are ordered by the number of
+    violations they detect, so each type is validated into a scratch deque
+    that is separate from the violations, and does not count towards a
+    violation budget
+
+    Args:
+        key (str): The data field name
+
+        parent (str): The parent key of the data
+
+        names (List[str]): The names of the types in the union
+
+        validate_type (Callable[[int, collections.deque], None]): Validates
+            the data against the type at a position in the union, adding
+            the detected violations to the deque
+
+    Returns:
+        A `TypeViolation` that lists the types in the union
+    """
+    scratch = deque()
+    counts = []
+    for index in range(len(names)):
+        validate_type(index, scratch)
+        counts.append(len(scratch))
+        scratch.clear()
+
+    expected_types = order_union_types(names, counts)
+    message = f'{key} did not match union types: {expected_types}'
+    return TypeViolation(key, parent, message)
+
+
+def find_discriminator(sub_types: List[RuleType],
+                       rulesets: Dict[str, YamlatorRuleset],
+                       enums: Dict[str, YamlatorEnum]
+                       ) -> Tuple[str, Dict[Data, int]]:
+    """Finds a field that discriminates the rulesets in a union. The field
+    must be required by every ruleset in the union and have an enum type,
+    and no value can be in the enums of more than one ruleset
+
+    Args:
+        sub_types (List[yamlator.types.RuleType]): The types in the union
+
+        rulesets (dict): The rulesets in the schema, keyed by their name
+
+        enums (dict): The enums in the schema, keyed by their name
+
+    Returns:
+        A tuple containing the name of the field and a dict of the
+        position of each ruleset in the union, keyed by the values of its
+        enum. If the union does not have a discriminator, `None` is returned
+    """
+    branches = []
+    for position, sub_type in enumerate(sub_types):
+        if sub_type.schema_type != SchemaTypes.RULESET:
+            continue
+
+        ruleset = rulesets.get(sub_type.lookup)
+        if ruleset is None:
+            return None
+        branches.append((position, ruleset))
+
+    if len(branches) < 2:
+        return None
+
+    _, first_ruleset = branches[0]
+    for rule in first_ruleset.rules:
+        index = _index_discriminator(rule.name, branches, enums)
+        if index is not None:
+            return rule.name, index
+    return None
+
+
+def _index_discriminator(field: str,
+                         branches: List[Tuple[int, YamlatorRuleset]],
+                         enums: Dict[str, YamlatorEnum]) -> Dict[Data, int]:
+    index = {}
+    for position, ruleset in branches:
+        items = _discriminator_items(field, ruleset, enums)
+        if items is None:
+            return None
+
+        for value in items:
+            # A value that is in more than one enum can
+            # match more than one of the rulesets
+            if value in index:
+                return None
+            index[value] = position
+    return index
+
+
+def _discriminator_items(field: str, ruleset: YamlatorRuleset,
+                         enums: Dict[str, YamlatorEnum]
+                         ) -> Dict[Data, EnumItem]:
+    for rule in ruleset.rules:
+        if rule.name != field:
+            continue
+
+        if not rule.is_required or \
+                rule.rtype.schema_type != SchemaTypes.ENUM:
+            return None
+
+        target_enum = enums.get(rule.rtype.lookup)
+        return target_enum.items if target_enum is not None else None
+    return None
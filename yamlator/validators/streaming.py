@@ -0,0 +1,829 @@
+"""Validates YAML data against a Yamlator schema from the events of the
+YAML parser, without loading the whole document.
+
+`validate_yaml` needs the document to be loaded into Python objects before
+it can be validated, so the memory used grows with the size of the
+document. The streaming validator instead reads the events of the parser
+and walks the schema alongside them. Only the maps and lists from the root
+of the document to the current event are kept on a stack, and each
+violation is yielded as soon as it is detected, so the memory used is
+bounded by how deeply the document is nested.
+
+Scalars are loaded one at a time and validated with the validation plan.
+Maps and lists are streamed when the rule type validates their contents,
+otherwise the parser is moved past them without loading them. The values
+of unions, collections with tags such as `!!set` and anchored nodes are
+loaded and validated with the validation plan, so only those values are
+held in memory while they are validated.
+
+The streaming validator detects the same violations as `validate_yaml`,
+with the following differences:
+
+* Violations are yielded in the order they are found in the document. The
+  violations for a missing required field are yielded when the end of the
+  map is reached
+* A key that is used more than once in the same map, including keys added
+  with a `<<` merge key, is validated every time it is used
+"""
+
+from collections import deque
+from typing import Dict
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from yaml.composer import ComposerError
+from yaml.constructor import ConstructorError
+from yaml.events import AliasEvent
+from yaml.events import CollectionEndEvent
+from yaml.events import CollectionStartEvent
+from yaml.events import MappingStartEvent
+from yaml.events import ScalarEvent
+from yaml.events import SequenceStartEvent
+from yaml.events import StreamEndEvent
+from yaml.nodes import MappingNode
+from yaml.nodes import Node
+from yaml.nodes import ScalarNode
+from yaml.nodes import SequenceNode
+
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.utils import is_keyless_rule
+from yamlator.violations import RequiredViolation
+from yamlator.violations import StrictEntryPointViolation
+from yamlator.violations import StrictRulesetViolation
+from yamlator.violations import Violation
+from yamlator.yaml_loader import AUTO_LOADER
+from yamlator.yaml_loader import get_yaml_loader
+from yamlator.validators.plan import PlanNode
+from yamlator.validators.plan import PlanCompiler
+from yamlator.validators.plan import compile_validation_plan
+from yamlator.validators.resolution import BUILTIN_HANDLER
+from yamlator.validators.resolution import ENUM_HANDLER
+from yamlator.validators.resolution import LIST_HANDLER
+from yamlator.validators.resolution import MAP_HANDLER
+from yamlator.validators.resolution import REGEX_HANDLER
+from yamlator.validators.resolution import RULESET_HANDLER
+from yamlator.validators.resolution import UNION_HANDLER
+from yamlator.validators.resolution import resolve_handler
+from yamlator.validators.resolution import resolve_list_item_level
+
+# The key the compiled streaming validator is cached with on the schema
+STREAMING_KEY = 'streaming'
+
+_MAP_TAG = 'tag:yaml.org,2002:map'
+_SEQ_TAG = 'tag:yaml.org,2002:seq'
+_MERGE_TAG = 'tag:yaml.org,2002:merge'
+_VALUE_TAG = 'tag:yaml.org,2002:value'
+_STR_TAG = 'tag:yaml.org,2002:str'
+
+# Collections with these tags are loaded as a dict or a list, so they
+# can be streamed. The `!` tag is the non-specific tag, which is
+# resolved in the same way as an untagged node
+_STREAMED_TAGS = frozenset((None, '!', _MAP_TAG, _SEQ_TAG))
+
+# Scalars with these tags are created directly by their constructor
+_SCALAR_TAGS = frozenset((
+    'tag:yaml.org,2002:null',
+    'tag:yaml.org,2002:bool',
+    'tag:yaml.org,2002:int',
+    'tag:yaml.org,2002:float',
+    'tag:yaml.org,2002:str',
+    'tag:yaml.org,2002:timestamp',
+))
+
+# How a node validates a map or list it cannot stream. A skipped
+# collection is not validated, a shallow collection is only validated
+# as an empty dict or list, since the rule type only checks the type of
+# the data, and a loaded collection is loaded and then validated
+_SKIPPED = 0
+_SHALLOW = 1
+_LOADED = 2
+
+# Marks that a map is waiting for the next key or for the values of a
+# merge key, rather than for a value
+_NO_KEY = object()
+_MERGE_KEY = object()
+
+_Rule = Tuple[bool, 'StreamNode']
+
+
+def _scalar_constructors(yaml_loader) -> dict:
+    return {tag: constructor for tag, constructor
+            in yaml_loader.yaml_constructors.items()
+            if tag in _SCALAR_TAGS}
+
+
+class StreamNode:
+    """Validates scalars, and the maps and lists that are not streamed,
+    with the validation plan
+    """
+
+    def __init__(self, plan: PlanNode, collections: int = _LOADED):
+        self.plan = plan
+        self.collections = collections
+        self.is_skipped = collections == _SKIPPED
+
+    def open(self, validator: '_EventValidator', event: CollectionStartEvent,
+             key: str, parent: str) -> '_Frame':
+        """Validate a map or list from the event that starts it
+
+        Args:
+            validator (_EventValidator): The validator reading the events
+
+            event (yaml.events.CollectionStartEvent): The event that
+                starts the map or list
+
+            key (str): The data field name
+
+            parent (str): The parent key of the data
+
+        Returns:
+            The frame that validates the contents of the map or list as
+            they are read, or `None` if the map or list has been validated
+        """
+        if self.collections == _LOADED:
+            data = validator.load(event)
+            self.plan.validate(key, data, parent, validator.violations)
+            return None
+
+        if self.collections == _SHALLOW:
+            placeholder = {} if isinstance(event, MappingStartEvent) else []
+            self.plan.validate(key, placeholder, parent,
+                               validator.violations)
+        validator.skip(event)
+        return None
+
+
+class MapStreamNode(StreamNode):
+    """Streams the values of a map"""
+
+    def __init__(self, plan: PlanNode, value_node: StreamNode):
+        super().__init__(plan, _SHALLOW)
+        self.value_node = value_node
+
+    def open(self, validator: '_EventValidator', event: CollectionStartEvent,
+             key: str, parent: str) -> '_Frame':
+        if isinstance(event, MappingStartEvent):
+            return _MapFrame(self.value_node, key)
+        return super().open(validator, event, key, parent)
+
+
+class RulesetStreamNode(StreamNode):
+    """Streams the fields of a map against the rules of a ruleset"""
+
+    def __init__(self, plan: PlanNode, ruleset: YamlatorRuleset):
+        super().__init__(plan, _SHALLOW)
+        self.name = ruleset.name
+        self.is_strict = ruleset.is_strict
+
+        # Set once the nodes for each rule have been compiled, which
+        # allows a ruleset to reference itself
+        self.rules: Dict[str, _Rule] = {}
+        self.required: List[str] = []
+        self.fields = frozenset()
+
+    def open(self, validator: '_EventValidator', event: CollectionStartEvent,
+             key: str, parent: str) -> '_Frame':
+        if isinstance(event, MappingStartEvent):
+            return _RulesetFrame(self, key, parent)
+        return super().open(validator, event, key, parent)
+
+    def strict_violation(self, key: str, parent: str,
+                         field: Data) -> Violation:
+        """Create the violation for a field that is not in the ruleset
+
+        Args:
+            key (str): The data field name of the map
+
+            parent (str): The parent key of the map
+
+            field (yamlator.types.Data): The field that is not in the
+                ruleset
+
+        Returns:
+            The violation for the field
+        """
+        return StrictRulesetViolation(key, parent, field, self.name)
+
+
+class EntryPointStreamNode(RulesetStreamNode):
+    """Streams the fields of the root of a document against the rules
+    in the schema block
+    """
+
+    def strict_violation(self, key: str, parent: str,
+                         field: Data) -> Violation:
+        return StrictEntryPointViolation(key='SCHEMA', parent=parent,
+                                         field=field)
+
+
+class ListStreamNode(StreamNode):
+    """Streams the items of a list"""
+
+    def __init__(self, plan: PlanNode, item_node: StreamNode):
+        super().__init__(plan, _SHALLOW)
+        self.item_node = item_node
+
+    def open(self, validator: '_EventValidator', event: CollectionStartEvent,
+             key: str, parent: str) -> '_Frame':
+        if isinstance(event, SequenceStartEvent):
+            return _ListFrame(self.item_node, key)
+        return super().open(validator, event, key, parent)
+
+
+class _Frame:
+    """Validates the contents of a map or list as they are read"""
+
+    def child(self, validator: '_EventValidator', event) -> '_Frame':
+        """Validate the next event in the map or list"""
+
+    def close(self, validator: '_EventValidator') -> None:
+        """Finish validating the map or list once the end is read"""
+
+
+class _ListFrame(_Frame):
+    """Validates each item in a list"""
+
+    def __init__(self, item_node: StreamNode, key: str):
+        self._item_node = item_node
+        self._key = key
+        self._index = 0
+
+    def child(self, validator: '_EventValidator', event) -> _Frame:
+        item_key = f'{self._key}[{self._index}]'
+        self._index += 1
+        return validator.validate_value(self._item_node, event, item_key,
+                                        self._key)
+
+
+class _MappingFrame(_Frame):
+    """Reads the keys and values of a map"""
+
+    def __init__(self, key: str):
+        self._key = key
+        self._child_key = _NO_KEY
+
+    def child(self, validator: '_EventValidator', event) -> _Frame:
+        if self._child_key is _NO_KEY:
+            self._child_key = validator.read_key(event)
+            return None
+
+        child_key = self._child_key
+        self._child_key = _NO_KEY
+        if child_key is not _MERGE_KEY:
+            return self.value(validator, child_key, event)
+
+        for merged_key, data in validator.read_merge(event):
+            self.loaded_value(validator, merged_key, data)
+        return None
+
+    def value(self, validator: '_EventValidator', child_key: Data,
+              event) -> _Frame:
+        """Validate the value of a key from the event that starts it"""
+
+    def loaded_value(self, validator: '_EventValidator', child_key: Data,
+                     data: Data) -> None:
+        """Validate a value of a key that has already been loaded"""
+
+
+class _MapFrame(_MappingFrame):
+    """Validates each value in a map"""
+
+    def __init__(self, value_node: StreamNode, key: str):
+        super().__init__(key)
+        self._value_node = value_node
+
+    def value(self, validator: '_EventValidator', child_key: Data,
+              event) -> _Frame:
+        return validator.validate_value(self._value_node, event, child_key,
+                                        self._key)
+
+    def loaded_value(self, validator: '_EventValidator', child_key: Data,
+                     data: Data) -> None:
+        self._value_node.plan.validate(child_key, data, self._key,
+                                       validator.violations)
+
+
+class _RulesetFrame(_MappingFrame):
+    """Validates the fields of a map against the rules of a ruleset"""
+
+    def __init__(self, node: RulesetStreamNode, key: str, parent: str):
+        super().__init__(key)
+        self._node = node
+        self._parent = parent
+        self._present = set()
+
+    def value(self, validator: '_EventValidator', child_key: Data,
+              event) -> _Frame:
+        rule = self._find_rule(validator, child_key)
+        if rule is None:
+            validator.skip(event)
+            return None
+
+        _, rule_node = rule
+        if validator.is_streamed(event):
+            self._present.add(child_key)
+            return rule_node.open(validator, event, child_key, self._key)
+
+        self._validate_rule(validator, child_key, rule_node,
+                            validator.load(event))
+        return None
+
+    def loaded_value(self, validator: '_EventValidator', child_key: Data,
+                     data: Data) -> None:
+        rule = self._find_rule(validator, child_key)
+        if rule is not None:
+            _, rule_node = rule
+            self._validate_rule(validator, child_key, rule_node, data)
+
+    def close(self, validator: '_EventValidator') -> None:
+        for name in self._node.required:
+            if name not in self._present:
+                validator.violations.append(RequiredViolation(name,
+                                                              self._key))
+
+    def _find_rule(self, validator: '_EventValidator',
+                   child_key: Data) -> _Rule:
+        rule = self._node.rules.get(child_key)
+        if rule is None and self._node.is_strict:
+            violation = self._node.strict_violation(self._key, self._parent,
+                                                    child_key)
+            validator.violations.append(violation)
+        return rule
+
+    def _validate_rule(self, validator: '_EventValidator', name: str,
+                       rule_node: StreamNode, data: Data) -> None:
+        # A field with a null value is treated as missing
+        if data is None:
+            return
+
+        self._present.add(name)
+        rule_node.plan.validate(name, data, self._key, validator.violations)
+
+
+class StreamingValidator:
+    """A Yamlator schema compiled into nodes that validate the events of
+    the YAML parser
+    """
+
+    def __init__(self, schema: YamlatorSchema):
+        """StreamingValidator init
+
+        Args:
+            schema (yamlator.types.YamlatorSchema): The schema to compile
+
+        Raises:
+            ValueError: If the `schema` parameter is `None`
+        """
+        if schema is None:
+            raise ValueError('schema should not be None')
+
+        compiler = _StreamCompiler(schema)
+        root = schema.root
+
+        self.plan = compile_validation_plan(schema)
+        self.has_rules = len(root.rules) > 0
+        self.keyless_rule = None
+        self.entry_point = EntryPointStreamNode(PlanNode(), root)
+        compiler.compile_rules(self.entry_point, root.rules)
+
+        if len(root.rules) == 1 and is_keyless_rule(root.rules[0]):
+            self.keyless_rule = root.rules[0].name
+
+    def validate(self, stream: Union[str, IO], loader: str = AUTO_LOADER,
+                 minimal: bool = False) -> Iterator[Violation]:
+        """Validate a YAML document from the events of the YAML parser
+
+        Args:
+            stream (str | IO): The YAML document or a file that contains it
+
+            loader (str, optional): The loader used to parse the document,
+                one of `'auto'`, `'c'` or `'python'`
+
+            minimal (bool, optional): Only construct the types that Yamlator
+                can validate
+
+        Returns:
+            A generator that yields each violation as it is detected
+
+        Raises:
+            ValueError: If the `stream` parameter is `None`, the loader is
+                not supported, or the stream does not contain a document
+        """
+        if stream is None:
+            raise ValueError('stream should not be None')
+
+        yaml_loader = get_yaml_loader(loader, minimal)(stream)
+        return self._validate_stream(yaml_loader)
+
+    def _validate_stream(self, yaml_loader) -> Iterator[Violation]:
+        try:
+            validator = _EventValidator(yaml_loader)
+            yaml_loader.get_event()
+            if yaml_loader.check_event(StreamEndEvent):
+                raise ValueError('yaml_data should not be None')
+
+            document = yaml_loader.get_event()
+            yield from self._validate_document(validator)
+            yaml_loader.get_event()
+
+            if not yaml_loader.check_event(StreamEndEvent):
+                event = yaml_loader.get_event()
+                raise ComposerError('expected a single document in the stream',
+                                    document.start_mark,
+                                    'but found another document',
+                                    event.start_mark)
+        finally:
+            yaml_loader.dispose()
+
+    def _validate_document(self, validator: '_EventValidator'
+                           ) -> Iterator[Violation]:
+        event = validator.next_event()
+        if not self.has_rules:
+            validator.skip(event)
+            return
+
+        if self.keyless_rule is None and validator.is_streamed(event) and \
+                isinstance(event, MappingStartEvent):
+            frame = _RulesetFrame(self.entry_point, '-', '-')
+            yield from validator.walk(frame)
+            return
+
+        if self.keyless_rule is not None and validator.is_streamed(event):
+            _, node = self.entry_point.rules[self.keyless_rule]
+            frame = node.open(validator, event, self.keyless_rule, '-')
+            yield from validator.walk(frame)
+            return
+
+        data = validator.load(event)
+        if data is None:
+            raise ValueError('yaml_data should not be None')
+
+        self.plan.validate(data, validator.violations)
+        yield from validator.violations
+        validator.violations.clear()
+
+
+class _EventValidator:
+    """Reads the events of the YAML parser for a document"""
+
+    def __init__(self, yaml_loader):
+        self.violations = deque()
+        self._loader = yaml_loader
+        self._anchors: Dict[str, Node] = {}
+        self._constructors = _scalar_constructors(yaml_loader)
+
+    def next_event(self):
+        """Read the next event from the parser"""
+        return self._loader.get_event()
+
+    def walk(self, frame: _Frame) -> Iterator[Violation]:
+        """Validate the events of a map or list until the end of it
+
+        Args:
+            frame (_Frame): The frame of the map or list, or `None` if it
+                has already been validated
+
+        Returns:
+            A generator that yields each violation as it is detected
+        """
+        violations = self.violations
+        stack = [frame] if frame is not None else []
+        while True:
+            while violations:
+                yield violations.popleft()
+
+            if not stack:
+                return
+
+            event = self._loader.get_event()
+            if isinstance(event, CollectionEndEvent):
+                stack.pop().close(self)
+                continue
+
+            child = stack[-1].child(self, event)
+            if child is not None:
+                stack.append(child)
+
+    def validate_value(self, node: StreamNode, event, key: Data,
+                       parent: str) -> _Frame:
+        """Validate a value in a map or list from the event that starts it
+
+        Args:
+            node (StreamNode): The node that validates the value
+
+            event (yaml.events.Event): The event that starts the value
+
+            key (yamlator.types.Data): The data field name
+
+            parent (str): The parent key of the data
+
+        Returns:
+            The frame that validates the value if it is streamed,
+            otherwise `None`
+        """
+        if self.is_streamed(event):
+            return node.open(self, event, key, parent)
+
+        if node.is_skipped:
+            self.skip(event)
+            return None
+
+        node.plan.validate(key, self.load(event), parent, self.violations)
+        return None
+
+    def is_streamed(self, event) -> bool:
+        """Check whether a map or list can be streamed, which is when it
+        is loaded as a dict or list and cannot be referenced by an alias
+        """
+        return isinstance(event, CollectionStartEvent) \
+            and event.anchor is None and event.tag in _STREAMED_TAGS
+
+    def read_key(self, event) -> Data:
+        """Load the key in a map from the event that starts it
+
+        Returns:
+            The key, or a marker if the key is a `<<` merge key
+        """
+        if isinstance(event, ScalarEvent) and event.anchor is None:
+            node = self._compose_scalar(event)
+        else:
+            node = self.compose(event)
+
+        if node.tag == _MERGE_TAG:
+            return _MERGE_KEY
+
+        # The constructor loads a `=` key as a string
+        if node.tag == _VALUE_TAG:
+            node.tag = _STR_TAG
+
+        if isinstance(node, ScalarNode):
+            return self._construct_scalar(node)
+        return self.construct(node)
+
+    def read_merge(self, event) -> Iterator[Tuple[Data, Data]]:
+        """Load the keys and values that are merged into a map by the value
+        of a `<<` merge key
+
+        Returns:
+            A generator that yields each key and its value
+
+        Raises:
+            yaml.constructor.ConstructorError: If the value is not a map or
+                a list of maps
+        """
+        value_node = self.compose(event)
+        merged_nodes = [value_node]
+        if isinstance(value_node, SequenceNode):
+            merged_nodes = value_node.value
+
+        for merged_node in merged_nodes:
+            if not isinstance(merged_node, MappingNode):
+                raise ConstructorError('while constructing a mapping',
+                                       event.start_mark,
+                                       'expected a mapping or list of '
+                                       'mappings for merging',
+                                       merged_node.start_mark)
+
+            self._loader.flatten_mapping(merged_node)
+            for key_node, merged_value_node in merged_node.value:
+                yield (self.construct(key_node),
+                       self.construct(merged_value_node))
+
+    def load(self, event) -> Data:
+        """Load a value from the event that starts it"""
+        if isinstance(event, ScalarEvent) and event.anchor is None:
+            return self._construct_scalar(self._compose_scalar(event))
+        return self.construct(self.compose(event))
+
+    def construct(self, node: Node) -> Data:
+        """Construct the Python object of a node"""
+        return self._loader.construct_document(node)
+
+    def _construct_scalar(self, node: ScalarNode) -> Data:
+        constructor = self._constructors.get(node.tag)
+        if constructor is not None:
+            return constructor(self._loader, node)
+        return self.construct(node)
+
+    def skip(self, event) -> None:
+        """Move the parser past a value without loading it. Anchored nodes
+        are still composed, since they can be referenced by an alias
+        """
+        if isinstance(event, AliasEvent):
+            return
+
+        if event.anchor is not None:
+            self.compose(event)
+            return
+
+        depth = 1 if isinstance(event, CollectionStartEvent) else 0
+        while depth:
+            event = self._loader.get_event()
+            if isinstance(event, CollectionEndEvent):
+                depth -= 1
+            elif isinstance(event, AliasEvent):
+                continue
+            elif event.anchor is not None:
+                self.compose(event)
+            elif isinstance(event, CollectionStartEvent):
+                depth += 1
+
+    def compose(self, event) -> Node:
+        """Compose the node that starts with an event, in the same way as
+        the composer of the YAML loader
+
+        Raises:
+            yaml.composer.ComposerError: If an alias references an anchor
+                that has not been defined
+        """
+        if isinstance(event, AliasEvent):
+            node = self._anchors.get(event.anchor)
+            if node is None:
+                raise ComposerError(None, None,
+                                    f'found undefined alias {event.anchor!r}',
+                                    event.start_mark)
+            return node
+
+        if isinstance(event, ScalarEvent):
+            node = self._compose_scalar(event)
+        elif isinstance(event, SequenceStartEvent):
+            node = self._compose_sequence(event)
+        else:
+            node = self._compose_mapping(event)
+        return node
+
+    def _compose_scalar(self, event: ScalarEvent) -> ScalarNode:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = self._loader.resolve(ScalarNode, event.value,
+                                       event.implicit)
+
+        node = ScalarNode(tag, event.value, event.start_mark,
+                          event.end_mark, style=event.style)
+        if event.anchor is not None:
+            self._anchors[event.anchor] = node
+        return node
+
+    def _compose_sequence(self, event: SequenceStartEvent) -> SequenceNode:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = self._loader.resolve(SequenceNode, None, event.implicit)
+
+        node = SequenceNode(tag, [], event.start_mark, None,
+                            flow_style=event.flow_style)
+        if event.anchor is not None:
+            self._anchors[event.anchor] = node
+
+        event = self._loader.get_event()
+        while not isinstance(event, CollectionEndEvent):
+            node.value.append(self.compose(event))
+            event = self._loader.get_event()
+        node.end_mark = event.end_mark
+        return node
+
+    def _compose_mapping(self, event: MappingStartEvent) -> MappingNode:
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = self._loader.resolve(MappingNode, None, event.implicit)
+
+        node = MappingNode(tag, [], event.start_mark, None,
+                           flow_style=event.flow_style)
+        if event.anchor is not None:
+            self._anchors[event.anchor] = node
+
+        event = self._loader.get_event()
+        while not isinstance(event, CollectionEndEvent):
+            key_node = self.compose(event)
+            value_node = self.compose(self._loader.get_event())
+            node.value.append((key_node, value_node))
+            event = self._loader.get_event()
+        node.end_mark = event.end_mark
+        return node
+
+
+class _StreamCompiler:
+    """Compiles the rule types of a schema into stream nodes"""
+
+    def __init__(self, schema: YamlatorSchema):
+        self._rulesets = schema.rulesets
+        self._plans = PlanCompiler(schema)
+        self._ruleset_nodes: Dict[str, RulesetStreamNode] = {}
+
+    def compile_rules(self, node: RulesetStreamNode, rules: list) -> None:
+        for rule in rules:
+            rule_node = self.compile_type(rule.rtype, MAP_HANDLER)
+            node.rules[rule.name] = (rule.is_required, rule_node)
+            if rule.is_required:
+                node.required.append(rule.name)
+        node.fields = frozenset(node.rules)
+
+    def compile_type(self, rtype: RuleType, level: int) -> StreamNode:
+        handler = resolve_handler(rtype, level)
+        if handler == RULESET_HANDLER:
+            return self._compile_ruleset(rtype.lookup)
+
+        plan = self._plans.compile_type(rtype, level)
+        if handler == MAP_HANDLER:
+            return MapStreamNode(plan, self.compile_type(rtype.sub_type,
+                                                         MAP_HANDLER))
+
+        if handler == LIST_HANDLER:
+            return ListStreamNode(plan, self._compile_list_item(
+                rtype.sub_type))
+
+        if handler in (ENUM_HANDLER, REGEX_HANDLER, BUILTIN_HANDLER):
+            return StreamNode(plan, _SHALLOW)
+
+        if handler == UNION_HANDLER:
+            return StreamNode(plan, _LOADED)
+
+        # Any types and types that are not handled accept all data
+        return StreamNode(plan, _SKIPPED)
+
+    def _compile_ruleset(self, lookup: str) -> RulesetStreamNode:
+        node = self._ruleset_nodes.get(lookup)
+        if node is not None:
+            return node
+
+        default_missing_ruleset = YamlatorRuleset(lookup, [])
+        ruleset = self._rulesets.get(lookup, default_missing_ruleset)
+
+        rtype = RuleType(SchemaTypes.RULESET, lookup=lookup)
+        plan = self._plans.compile_type(rtype, RULESET_HANDLER)
+        node = RulesetStreamNode(plan, ruleset)
+        self._ruleset_nodes[lookup] = node
+        self.compile_rules(node, ruleset.rules)
+        return node
+
+    def _compile_list_item(self, sub_type: RuleType) -> StreamNode:
+        return self.compile_type(sub_type, resolve_list_item_level(sub_type))
+
+
+def compile_streaming_validator(schema: YamlatorSchema) -> StreamingValidator:
+    """Compile a schema into a streaming validator. The compiled validator
+    is cached on the schema so subsequent calls with the same schema object
+    return the same validator
+
+    __Note__: Changes made to the rules of a schema after the validator
+    has been compiled are not reflected by the compiled validator
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): The schema to compile
+
+    Returns:
+        A `StreamingValidator` that validates YAML documents against the
+        schema from the events of the YAML parser
+
+    Raises:
+        ValueError: If the `schema` parameter is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    validator = schema.compiled_validators.get(STREAMING_KEY)
+    if validator is None:
+        validator = StreamingValidator(schema)
+        schema.compiled_validators[STREAMING_KEY] = validator
+    return validator
+
+
+def validate_yaml_events(stream: Union[str, IO], schema: YamlatorSchema,
+                         loader: str = AUTO_LOADER,
+                         minimal: bool = False) -> Iterator[Violation]:
+    """Validate a YAML document against a schema from the events of the
+    YAML parser, without loading the whole document. Each violation is
+    yielded as soon as it is detected, so the memory used is bounded by
+    how deeply the document is nested rather than the size of the document
+
+    Args:
+        stream (str | IO): The YAML document or a file that contains it
+
+        schema (yamlator.types.YamlatorSchema): The schema used to
+            validate the document
+
+        loader (str, optional): The loader used to parse the document, one
+            of `'auto'`, `'c'` or `'python'`. By default `'auto'` is used,
+            which uses the C parser when PyYAML has been built with libyaml
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+    Returns:
+        A generator that yields each `yamlator.violations.Violation` that
+        is detected in the document
+
+    Raises:
+        ValueError: If the `stream` or `schema` parameters are `None`, or
+            the loader is not supported. A `ValueError` is also raised
+            while the violations are read if the stream does not contain
+            a document
+    """
+    return compile_streaming_validator(schema).validate(stream, loader,
+                                                        minimal)
@@ -1,19 +1,36 @@
 """Validator for handling the union type"""
 
+from collections import deque
+from collections import namedtuple
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
+
 from yamlator.types import Data
 from yamlator.types import RuleType
 from yamlator.types import UnionRuleType
 from yamlator.types import SchemaTypes
+from yamlator.types import YamlatorEnum
+from yamlator.types import YamlatorRuleset
 from yamlator.violations import TypeViolation
+from yamlator.validators.resolution import find_discriminator
 from .base_validator import Validator
 
-from collections import namedtuple
-
 _SchemaTypeDecoder = namedtuple('SchemaTypeDecoder', ['type', 'friendly_name'])
-_UnionViolation = namedtuple('UnionViolation', ['count', 'type_name'])
+
+# The field that discriminates the rulesets in a union, the position of
+# each ruleset keyed by the values of the field and the positions of the
+# types that are not discriminated by the field
+_Discriminator = namedtuple('Discriminator', ['field', 'index', 'others'])
+_ENUM_TYPES = (str, float, int)
 
 _NO_VIOLATION_COUNT = 0
-_MIN_INDEX = 0
+
+# The types that are validated by the chain created by the sub type chain
+# factory. The other types are checked by the union validator
+_CHAIN_SUB_TYPES = (SchemaTypes.RULESET, SchemaTypes.LIST, SchemaTypes.REGEX,
+                    SchemaTypes.ENUM, SchemaTypes.MAP)
 
 
 class UnionValidator(Validator):
@@ -28,7 +45,61 @@ class UnionValidator(Validator):
         SchemaTypes.BOOL: _SchemaTypeDecoder(bool, 'bool'),
     }
 
-    _sub_type_validators = {}
+    def __init__(self, violations: deque) -> None:
+        """UnionValidator init
+
+        Args:
+            violations (collections.deque): Contains violations that
+                have been detected whilst processing the data
+        """
+        super().__init__(violations)
+
+        # Each instance has its own sub type validators, which add their
+        # violations to a private deque. The violations of the types that
+        # do not match the data are never added to the violations of the
+        # chain, which can be a `ViolationBudget`
+        self._sub_type_validators = {}
+        self._sub_type_violations = deque()
+        self._sub_type_chain_factory = None
+
+        # The names of the types in each union, keyed by the id of the
+        # union type, which are only created once for each union
+        self._type_names = {}
+        self._discriminators = {}
+        self._rulesets = {}
+        self._enums = {}
+
+    def set_schema_lookups(self, rulesets: Dict[str, YamlatorRuleset],
+                           enums: Dict[str, YamlatorEnum]) -> None:
+        """Set the rulesets and enums of the schema, which are used to
+        find a field that discriminates the rulesets in a union
+
+        Args:
+            rulesets (dict): The rulesets in the schema, keyed by their name
+            enums (dict): The enums in the schema, keyed by their name
+        """
+        self._rulesets = rulesets
+        self._enums = enums
+
+    @property
+    def sub_type_violations(self) -> deque:
+        """The deque that the sub type validators should add their
+        violations to
+        """
+        return self._sub_type_violations
+
+    def set_sub_type_chain_factory(
+            self, factory: Callable[[deque], Validator]) -> None:
+        """Set the function that creates the chain of validators used to
+        validate the types in a union. The chain is only created when the
+        first union is validated, since the chain has its own union validator
+
+        Args:
+            factory (Callable): A function that is given the deque that the
+                chain should add its violations to and returns the validator
+                at the start of the chain
+        """
+        self._sub_type_chain_factory = factory
 
     def set_ruleset_validator(self, validator: Validator) -> None:
         self._sub_type_validators[SchemaTypes.RULESET] = validator
@@ -47,12 +118,13 @@ class UnionValidator(Validator):
 
     def validate(self, key: str, data: Data, parent: str, rtype: UnionRuleType,
                  is_required: bool = False) -> None:
-        """Validate the data against all types defined in the union. If one
-        or more types do not match the union, a single `TypeViolation`
-        is raised
+        """Validate the data against the types defined in the union until
+        one of them matches. If none of the types match the data, a single
+        `TypeViolation` is raised
 
         __Note__: Any sub violations raised during the processing of
-        the union type are removed from the final list
+        the union type are added to the sub type violations, so they
+        are never added to the final list
 
         Args:
             key (str): The data field name
@@ -68,57 +140,102 @@ class UnionValidator(Validator):
             super().validate(key, data, parent, rtype, is_required)
             return
 
-        union_violations = []
-        for sub_rule_type in rtype.sub_types:
-
-            validator = self._sub_type_validators.get(sub_rule_type.schema_type)
-            if validator is not None:
-                union_violation = self._handle_sub_type_validation(
-                    validator,
-                    key,
-                    data,
-                    parent,
-                    sub_rule_type,
-                    is_required
-                )
-                union_violations.append(union_violation)
-                continue
-
-            builtin = self._type_lookups[sub_rule_type.schema_type]
-            if not isinstance(data, builtin.type):
-                union_violation = _UnionViolation(1, builtin.friendly_name)
-                union_violations.append(union_violation)
-                continue
-
-            union_violation = _UnionViolation(0, builtin.friendly_name)
-            union_violations.append(union_violation)
-
-        union_violations.sort(key=lambda x: x[0])
-        if union_violations[_MIN_INDEX].count == _NO_VIOLATION_COUNT:
-            return
-
-        expected_types = ', '.join([uv.type_name for uv in union_violations])
+        # The types are validated until one of them matches the data, so
+        # the violation counts are only needed when none of them match
+        sub_types = rtype.sub_types
+        counts = {}
+        for position in self._get_candidate_positions(rtype, data):
+            count = self._count_sub_type_violations(key, data, parent,
+                                                    sub_types[position],
+                                                    is_required)
+            if count == _NO_VIOLATION_COUNT:
+                return
+            counts[position] = count
+
+        # The types that could not match the data are only validated to
+        # order the types in the message by their violation counts
+        for position, sub_rule_type in enumerate(sub_types):
+            if position not in counts:
+                counts[position] = self._count_sub_type_violations(
+                    key, data, parent, sub_rule_type, is_required)
+
+        counts = sorted((count, position)
+                        for position, count in counts.items())
+        type_names = self._get_type_names(rtype)
+        expected_types = ', '.join([type_names[idx] for _, idx in counts])
         message = f'{key} did not match union types: {expected_types}'
         violation = TypeViolation(key, parent, message)
         self._violations.append(violation)
 
+    def _get_candidate_positions(self, rtype: UnionRuleType,
+                                 data: Data) -> Sequence[int]:
+        discriminator = self._get_discriminator(rtype)
+        if discriminator is None:
+            return range(len(rtype.sub_types))
+
+        # Only the ruleset that the value of the field is indexed by can
+        # match the data, all the other rulesets would detect an enum or
+        # required violation for the field
+        if isinstance(data, dict):
+            value = data.get(discriminator.field, None)
+            if isinstance(value, _ENUM_TYPES):
+                position = discriminator.index.get(value)
+                if position is not None:
+                    return [position] + discriminator.others
+        return discriminator.others
+
+    def _get_discriminator(self, rtype: UnionRuleType) -> _Discriminator:
+        if id(rtype) in self._discriminators:
+            return self._discriminators[id(rtype)]
+
+        discriminator = find_discriminator(rtype.sub_types, self._rulesets,
+                                           self._enums)
+        if discriminator is not None:
+            field, index = discriminator
+            indexed = set(index.values())
+            others = [position for position in range(len(rtype.sub_types))
+                      if position not in indexed]
+            discriminator = _Discriminator(field, index, others)
+
+        self._discriminators[id(rtype)] = discriminator
+        return discriminator
+
+    def _get_type_names(self, rtype: UnionRuleType) -> List[str]:
+        type_names = self._type_names.get(id(rtype))
+        if type_names is None:
+            type_names = [str(sub_type) for sub_type in rtype.sub_types]
+            self._type_names[id(rtype)] = type_names
+        return type_names
+
+    def _count_sub_type_violations(self, key: str, data: Data, parent: str,
+                                   rtype: RuleType, is_required: bool) -> int:
+        validator = self._get_sub_type_validator(rtype.schema_type)
+        builtin = self._type_lookups.get(rtype.schema_type)
+        if validator is not None or builtin is None:
+            return self._handle_sub_type_validation(validator, key, data,
+                                                    parent, rtype,
+                                                    is_required)
+
+        if not isinstance(data, builtin.type):
+            return 1
+        return _NO_VIOLATION_COUNT
+
+    def _get_sub_type_validator(self, schema_type: SchemaTypes) -> Validator:
+        if self._sub_type_chain_factory is not None:
+            chain = self._sub_type_chain_factory(self._sub_type_violations)
+            self._sub_type_chain_factory = None
+            for sub_type in _CHAIN_SUB_TYPES:
+                self._sub_type_validators[sub_type] = chain
+        return self._sub_type_validators.get(schema_type)
+
     def _handle_sub_type_validation(self, validator: Validator, key: str,
                                     data: Data, parent: str, rtype: RuleType,
-                                    is_required: bool) -> _UnionViolation:
+                                    is_required: bool) -> int:
         if validator is None:
-            return _UnionViolation(0, str(rtype))
-
-        violation_count = len(self._violations)
-        validator.validate(key, data, parent, rtype, is_required)
-
-        # Remove the violations from the sub validation process
-        # to not pollute the output with all the different violations
-        # from every type defined in the union
-        removed_violations = self._remove_nested_violations(violation_count)
-        return _UnionViolation(removed_violations, str(rtype))
-
-    def _remove_nested_violations(self, initial_count) -> int:
-        diff = len(self._violations) - initial_count
-        for _ in range(0, diff):
-            self._violations.pop()
-        return diff
+            return _NO_VIOLATION_COUNT
+
+        try:
+            validator.validate(key, data, parent, rtype, is_required)
+            return len(self._sub_type_violations)
+        finally:
+            self._sub_type_violations.clear()
@@ -6,6 +6,8 @@ import json
 from collections import deque
 from typing import Any
 
+from yamlator.exceptions import MaxViolationsReachedError
+
 
 class ViolationType(enum.Enum):
     """Represents possible Yamlator violation types"""
@@ -27,25 +29,43 @@ class ViolationJSONEncoder(json.JSONEncoder):
             return list(o)
 
         if issubclass(type(o), Violation):
-            return {
+            data = {
                 'key': o.key,
                 'parent': o.parent,
                 'message': o.message,
                 'violation_type': o.violation_type
             }
+            if o.document is not None:
+                data['document'] = o.document
+            if o.line is not None:
+                data['line'] = o.line
+                data['column'] = o.column
+            return data
         return json.JSONEncoder.default(self, o)
 
 
 class Violation:
-    """Base violation class
+    """Base violation class. A violation stores the fields that describe it
+    and the message is only created the first time it is accessed, since
+    the message of every violation is not always read
 
     Attributes:
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
         violation_type (yamlator.violations.ViolationType): The violation type
+        line    (int): The line in the YAML file where the violation was
+            detected, starting at 1, or `None` if it is not known
+        column  (int): The column in the YAML file where the violation was
+            detected, starting at 1, or `None` if it is not known
+        document (int): The index of the document in a YAML stream that
+            contains the violation, starting at 0, or `None` if the stream
+            was not validated document by document
     """
 
+    __slots__ = ('key', 'parent', '_message', '_violation_type',
+                 'line', 'column', 'document')
+
     def __init__(self, key: str, parent: str, message: str,
                  v_type: ViolationType):
         """Violation init
@@ -53,18 +73,36 @@ class Violation:
         Args:
             key     (str): The field name in the YAML file
             parent  (str): The parent key in the YAML file
-            message (str): The message with violation information
+            message (str): The message with violation information. If
+                `None` is provided the message is created from the fields
+                of the violation when it is first accessed
             v_type  (yamlator.violations.ViolationType): The violation type
         """
         self.key = key
-        self.message = message
         self.parent = parent
+        self._message = message
         self._violation_type = v_type
+        self.line = None
+        self.column = None
+        self.document = None
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._create_message()
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        self._message = message
 
     @property
     def violation_type(self) -> str:
         return self._violation_type.value
 
+    def _create_message(self) -> str:
+        return ''
+
     def __repr__(self) -> str:
         message_template = '{}(parent={}, key={}, message={}'
         return message_template.format(__class__.__name__,
@@ -82,6 +120,8 @@ class RequiredViolation(Violation):
             which is set to `ViolationType.REQUIRED`
     """
 
+    __slots__ = ()
+
     def __init__(self, key: str, parent: str):
         """RequiredViolation init
 
@@ -89,8 +129,10 @@ class RequiredViolation(Violation):
             key     (str):  The key name in the YAML file
             parent  (str):  The parent key in the YAML file
         """
-        message = f'{key} is missing'
-        super().__init__(key, parent, message, ViolationType.REQUIRED)
+        super().__init__(key, parent, None, ViolationType.REQUIRED)
+
+    def _create_message(self) -> str:
+        return f'{self.key} is missing'
 
 
 class TypeViolation(Violation):
@@ -100,20 +142,32 @@ class TypeViolation(Violation):
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
+        expected_type (str): The name of the type the value was expected
+            to be, or `None` if the violation was created with a message
         violation_type (yamlator.violations.ViolationType): The violation type
             which is set to `ViolationType.TYPE`
     """
 
-    def __init__(self, key: str, parent: str, message: str):
+    __slots__ = ('expected_type',)
+
+    def __init__(self, key: str, parent: str, message: str = None,
+                 expected_type: str = None):
         """TypeViolation init
 
         Args:
             key     (str):  The key name in the YAML file
             parent  (str):  The parent key in the YAML file
-            message (str):  The message with information
+            message (str, optional):  The message with information
             regarding the type violation
+            expected_type (str, optional): The name of the type the value
+            was expected to be, which is used to create the message when
+            a message is not provided
         """
         super().__init__(key, parent, message, ViolationType.TYPE)
+        self.expected_type = expected_type
+
+    def _create_message(self) -> str:
+        return f'{self.key} should be of type {self.expected_type}'
 
 
 class BuiltInTypeViolation(TypeViolation):
@@ -124,10 +178,13 @@ class BuiltInTypeViolation(TypeViolation):
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
+        expected_type (str): The name of the expected built in type
         violation_type (yamlator.violations.ViolationType): The violation type
             which is set to `ViolationType.TYPE`
     """
 
+    __slots__ = ()
+
     def __init__(self, key: str, parent: str, expected_type: type):
         """BuiltInTypeViolation init
 
@@ -136,8 +193,10 @@ class BuiltInTypeViolation(TypeViolation):
             parent          (str):  The parent key in the YAML file
             expected_type   (type): The expected build in type for the field
         """
-        message = f'{key} is expected to be an {expected_type.__name__}'
-        super().__init__(key, parent, message)
+        super().__init__(key, parent, expected_type=expected_type.__name__)
+
+    def _create_message(self) -> str:
+        return f'{self.key} is expected to be an {self.expected_type}'
 
 
 class RulesetTypeViolation(TypeViolation):
@@ -151,6 +210,8 @@ class RulesetTypeViolation(TypeViolation):
             which is set to `ViolationType.TYPE`
     """
 
+    __slots__ = ()
+
     def __init__(self, key: str, parent: str):
         """RulesetTypeViolation init
 
@@ -158,8 +219,10 @@ class RulesetTypeViolation(TypeViolation):
             key     (str):  The key name in the YAML file
             parent  (str):  The parent key in the YAML file
         """
-        message = f'{key} should be a ruleset'
-        super().__init__(key, parent, message)
+        super().__init__(key, parent)
+
+    def _create_message(self) -> str:
+        return f'{self.key} should be a ruleset'
 
 
 class RegexTypeViolation(TypeViolation):
@@ -169,10 +232,14 @@ class RegexTypeViolation(TypeViolation):
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
+        data    (str): The string that did not match the regex
+        regex   (str): The regex the string was expected to match
         violation_type (yamlator.violations.ViolationType): The violation type
             which is set to `ViolationType.TYPE`
     """
 
+    __slots__ = ('data', 'regex')
+
     def __init__(self, key: str, parent: str, data: str, regex_str: str):
         """RegexTypeViolation init
 
@@ -182,8 +249,12 @@ class RegexTypeViolation(TypeViolation):
             data        (str):  The string that did not match the regex
             regex_str   (str):  The regex string
         """
-        message = f'{data} does not match regex "{regex_str}"'
-        super().__init__(key, parent, message)
+        super().__init__(key, parent)
+        self.data = data
+        self.regex = regex_str
+
+    def _create_message(self) -> str:
+        return f'{self.data} does not match regex "{self.regex}"'
 
 
 class StrictViolation(Violation):
@@ -197,6 +268,8 @@ class StrictViolation(Violation):
             which is set to `ViolationType.STRICT`
     """
 
+    __slots__ = ()
+
     def __init__(self, key: str, parent: str, message: str):
         """StrictViolation init
 
@@ -216,10 +289,13 @@ class StrictEntryPointViolation(StrictViolation):
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
+        field   (str): The name of the additional field
         violation_type (yamlator.violations.ViolationType): The violation type
             which is set to `ViolationType.STRICT`
     """
 
+    __slots__ = ('field',)
+
     def __init__(self, key: str, parent: str, field: str):
         """StrictEntryPointViolation init
 
@@ -228,8 +304,11 @@ class StrictEntryPointViolation(StrictViolation):
             parent       (str):  The parent key in the YAML file
             field        (str):  The name of the additional field
         """
-        message = f'{field} is not expected in the schema block'
-        super().__init__(key, parent, message)
+        super().__init__(key, parent, None)
+        self.field = field
+
+    def _create_message(self) -> str:
+        return f'{self.field} is not expected in the schema block'
 
 
 class StrictRulesetViolation(StrictViolation):
@@ -240,10 +319,14 @@ class StrictRulesetViolation(StrictViolation):
         key     (str): The name of the field in YAML data structure
         message (str): The violation message
         parent  (str): The parent key that owns the `key`
+        field   (str): The name of the additional field
+        ruleset_name (str): The name of the ruleset
         violation_type (yamlator.violations.ViolationType): The violation type
             which is set to `ViolationType.STRICT`
     """
 
+    __slots__ = ('field', 'ruleset_name')
+
     def __init__(self, key: str, parent: str, field: str, ruleset_name: str):
         """StrictRulesetViolation init
 
@@ -253,5 +336,50 @@ class StrictRulesetViolation(StrictViolation):
             field        (str):  The name of the additional field in the ruleset
             ruleset_name (str):  The name of the ruleset
         """
-        message = f'{field} is not expected in ruleset {ruleset_name}'
-        super().__init__(key, parent, message)
+        super().__init__(key, parent, None)
+        self.field = field
+        self.ruleset_name = ruleset_name
+
+    def _create_message(self) -> str:
+        return f'{self.field} is not expected in ruleset {self.ruleset_name}'
+
+
+class ViolationBudget(deque):
+    """A deque of violations that stops the validation once it contains
+    the maximum number of violations, by raising a
+    `yamlator.exceptions.MaxViolationsReachedError`
+
+    Attributes:
+        max_violations (int): The maximum number of violations
+    """
+
+    def __init__(self, max_violations: int):
+        """ViolationBudget init
+
+        Args:
+            max_violations (int): The maximum number of violations
+
+        Raises:
+            ValueError: If `max_violations` is not a positive integer
+        """
+        if isinstance(max_violations, bool) or \
+                not isinstance(max_violations, int) or max_violations < 1:
+            raise ValueError('max_violations should be a positive integer')
+
+        super().__init__()
+        self.max_violations = max_violations
+
+    # pylint: disable-next=arguments-renamed
+    def append(self, violation: Violation) -> None:
+        """Add a violation to the budget
+
+        Args:
+            violation (yamlator.violations.Violation): The violation to add
+
+        Raises:
+            yamlator.exceptions.MaxViolationsReachedError: If the budget
+                contains the maximum number of violations
+        """
+        super().append(violation)
+        if len(self) >= self.max_violations:
+            raise MaxViolationsReachedError(self.max_violations)
@@ -0,0 +1,200 @@
+"""Selects the PyYAML loader used to load YAML data.
+
+The C loader, which uses libyaml, is used when PyYAML has been built
+with libyaml, otherwise the pure Python loader is used. Both loaders
+only construct the standard YAML types, so loading a file never creates
+arbitrary Python objects.
+
+A minimal loader can also be used, which only constructs the types that
+Yamlator validates: `dict`, `list`, `str`, `int`, `float`, `bool` and
+`None`. Timestamps are not resolved, so they are loaded as strings, and
+values with any other tag, such as `!!set`, `!!binary` or the Python
+tags, are loaded as the map, list or string that they are written as.
+"""
+
+from typing import Any
+from typing import IO
+from typing import Iterator
+from typing import Union
+
+import yaml
+
+from yaml.constructor import SafeConstructor
+from yaml.nodes import MappingNode
+from yaml.nodes import SequenceNode
+from yaml.nodes import Node
+from yaml.resolver import Resolver
+
+AUTO_LOADER = 'auto'
+C_LOADER = 'c'
+PYTHON_LOADER = 'python'
+YAML_LOADERS = (AUTO_LOADER, C_LOADER, PYTHON_LOADER)
+
+_TIMESTAMP_TAG = 'tag:yaml.org,2002:timestamp'
+
+# The tags of the types Yamlator can validate
+_MINIMAL_TAGS = (
+    'tag:yaml.org,2002:null',
+    'tag:yaml.org,2002:bool',
+    'tag:yaml.org,2002:int',
+    'tag:yaml.org,2002:float',
+    'tag:yaml.org,2002:str',
+    'tag:yaml.org,2002:seq',
+    'tag:yaml.org,2002:map',
+)
+
+
+class MinimalResolver(Resolver):
+    """Resolves the tags of plain scalars without resolving timestamps,
+    which are the most expensive scalars to resolve
+    """
+
+    yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers
+                if tag != _TIMESTAMP_TAG]
+        for first, resolvers in Resolver.yaml_implicit_resolvers.items()
+    }
+
+
+class MinimalConstructor(SafeConstructor):
+    """Constructs the types Yamlator can validate. Nodes with any other
+    tag are constructed from the kind of node they are
+    """
+
+    yaml_constructors = {tag: SafeConstructor.yaml_constructors[tag]
+                         for tag in _MINIMAL_TAGS}
+
+    def construct_node_kind(self, node: Node) -> Any:
+        """Construct a node that does not have a minimal tag as
+        a `dict`, `list` or `str`
+
+        Args:
+            node (yaml.nodes.Node): The node to construct
+
+        Returns:
+            A generator that creates the `dict` or `list` of a mapping or
+            sequence node, or the `str` value of a scalar node
+        """
+        if isinstance(node, MappingNode):
+            return self.construct_yaml_map(node)
+
+        if isinstance(node, SequenceNode):
+            return self.construct_yaml_seq(node)
+        return self.construct_scalar(node)
+
+
+MinimalConstructor.add_constructor(None,
+                                   MinimalConstructor.construct_node_kind)
+
+
+# pylint: disable=too-many-ancestors
+class MinimalLoader(yaml.reader.Reader, yaml.scanner.Scanner,
+                    yaml.parser.Parser, yaml.composer.Composer,
+                    MinimalConstructor, MinimalResolver):
+    """Loads YAML data into the types Yamlator can validate with the
+    pure Python parser
+    """
+
+    def __init__(self, stream: Union[str, IO]) -> None:
+        yaml.reader.Reader.__init__(self, stream)
+        yaml.scanner.Scanner.__init__(self)
+        yaml.parser.Parser.__init__(self)
+        yaml.composer.Composer.__init__(self)
+        MinimalConstructor.__init__(self)
+        MinimalResolver.__init__(self)
+
+
+if yaml.__with_libyaml__:
+    class CMinimalLoader(yaml.cyaml.CParser, MinimalConstructor,
+                         MinimalResolver):
+        """Loads YAML data into the types Yamlator can validate with the
+        libyaml parser
+        """
+
+        def __init__(self, stream: Union[str, IO]) -> None:
+            yaml.cyaml.CParser.__init__(self, stream)
+            MinimalConstructor.__init__(self)
+            MinimalResolver.__init__(self)
+else:
+    CMinimalLoader = None  # pylint: disable=invalid-name
+
+
+def get_yaml_loader(loader: str = AUTO_LOADER, minimal: bool = False) -> type:
+    """Get the PyYAML loader class for a loader name
+
+    Args:
+        loader (str, optional): The loader to use, one of `'auto'`, `'c'`
+            or `'python'`. The `'auto'` loader uses the C loader when
+            PyYAML has been built with libyaml, otherwise it uses the
+            Python loader
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate. By default `False` is used, which constructs all
+            the standard YAML types
+
+    Returns:
+        The PyYAML loader class
+
+    Raises:
+        ValueError: If the loader is not supported or the C loader is
+            requested and PyYAML has not been built with libyaml
+    """
+    if loader not in YAML_LOADERS:
+        raise ValueError(f'loader should be one of {", ".join(YAML_LOADERS)} '
+                         f'but got {loader}')
+
+    if loader == C_LOADER and not yaml.__with_libyaml__:
+        raise ValueError('The c loader requires PyYAML to be built with '
+                         'libyaml')
+
+    use_c_loader = loader != PYTHON_LOADER and yaml.__with_libyaml__
+    if minimal:
+        return CMinimalLoader if use_c_loader else MinimalLoader
+    return yaml.CSafeLoader if use_c_loader else yaml.SafeLoader
+
+
+def load_yaml(stream: Union[str, IO], loader: str = AUTO_LOADER,
+              minimal: bool = False) -> Any:
+    """Load YAML data from a string or a file
+
+    Args:
+        stream (str | IO): The YAML data or a file that contains it
+
+        loader (str, optional): The loader to use, one of `'auto'`, `'c'`
+            or `'python'`
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+    Returns:
+        The YAML data in a data structure that Python can process
+
+    Raises:
+        ValueError: If the loader is not supported or the C loader is
+            requested and PyYAML has not been built with libyaml
+    """
+    return yaml.load(stream, Loader=get_yaml_loader(loader, minimal))
+
+
+def load_yaml_documents(stream: Union[str, IO], loader: str = AUTO_LOADER,
+                        minimal: bool = False) -> Iterator[Any]:
+    """Load each document in a YAML stream in turn. A document is only
+    loaded once the previous document has been returned
+
+    Args:
+        stream (str | IO): The YAML documents or a file that contains them
+
+        loader (str, optional): The loader to use, one of `'auto'`, `'c'`
+            or `'python'`
+
+        minimal (bool, optional): Only construct the types that Yamlator
+            can validate
+
+    Returns:
+        A generator that yields the data of each document in the stream
+
+    Raises:
+        ValueError: If the loader is not supported or the C loader is
+            requested and PyYAML has not been built with libyaml
+    """
+    return yaml.load_all(stream, Loader=get_yaml_loader(loader, minimal))